@@ -7,11 +7,12 @@ API v1 라우터
 
 **엔드포인트**:
 - POST /api/v1/backtest: 백테스트 실행 및 필요한 모든 데이터 응답
+- POST /api/v1/optimize: 전략 파라미터 최적화 (그리드/랜덤 탐색)
 - 전략 목록은 프론트엔드에서 관리
 - 주가/환율/뉴스 데이터는 백테스트 응답에 포함
 """
 from fastapi import APIRouter
-from .endpoints import backtest
+from .endpoints import backtest, optimization
 
 api_router = APIRouter()
 
@@ -22,3 +23,9 @@ api_router.include_router(
     tags=["백테스팅"]
 )
 
+# 전략 파라미터 최적화 API
+api_router.include_router(
+    optimization.router,
+    prefix="/optimize",
+    tags=["파라미터 최적화"]
+)
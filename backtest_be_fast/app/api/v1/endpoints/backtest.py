@@ -12,8 +12,9 @@
 **요청 흐름**:
 1. 클라이언트 → FastAPI → 이 엔드포인트
 2. 요청 검증 (Pydantic 모델)
-3. 서비스 레이어 호출
-4. 응답 직렬화 및 반환
+3. 결과 캐시 조회 (종료일이 지난 결정적 요청만)
+4. 서비스 레이어 호출
+5. orjson 응답 인코딩 (FastJSONResponse, jsonable_encoder 미사용), 결과 캐시 저장 및 반환
 
 **에러 처리**:
 - @handle_portfolio_errors 데코레이터로 일관된 에러 응답
@@ -22,6 +23,9 @@
 - app/services/portfolio_service.py: 백테스트 실행
 - app/services/unified_data_service.py: 추가 데이터 수집
 - app/services/news_service.py: 뉴스 데이터 조회
+- app/services/result_cache.py: 전체 응답 결과 캐시
+- app/api/v1/responses.py: FastJSONResponse (orjson 인코딩, Server-Timing payload 시간)
+- app/utils/metrics.py: 추가 데이터 수집 시간 (unified_data 단계)
 
 **연관 컴포넌트**:
 - Backend: app/api/v1/api.py (라우터 등록)
@@ -39,11 +43,14 @@ from datetime import datetime
 
 from ....schemas.schemas import PortfolioBacktestRequest
 from ....services.portfolio_service import PortfolioService
-from ....services.yfinance_db import get_ticker_info_batch_from_db
+from ....repositories.stock_repository import get_stock_repository
 from ....services.unified_data_service import unified_data_service
 from ....services.news_service import news_service
+from ....services.result_cache import backtest_result_cache
 from ....core.exceptions import ValidationError
 from ..decorators import handle_portfolio_errors
+from ..responses import FastJSONResponse
+from ....utils.metrics import span
 
 
 logger = logging.getLogger(__name__)
@@ -59,6 +66,7 @@ unified_data_service.news_service = news_service
 @router.post(
     "",
     status_code=status.HTTP_200_OK,
+    response_class=FastJSONResponse,
     summary="포트폴리오 백테스트 실행",
     description="여러 자산으로 구성된 포트폴리오의 백테스트를 실행하고 모든 필요한 데이터를 한번에 반환합니다."
 )
@@ -81,6 +89,16 @@ async def run_portfolio_backtest(request: PortfolioBacktestRequest):
     - **commission**: 수수료율 (0 ~ 0.1)
     - **rebalance_frequency**: 리밸런싱 주기 (weekly_1, weekly_2, weekly_4, weekly_8, weekly_12, weekly_24, weekly_48, none)
     - **strategy**: 전략명 (기본: buy_and_hold)
+    - **monte_carlo**: 몬테카를로 강건성 시뮬레이션 옵션 (선택, 지정 시 응답에 monte_carlo 추가,
+      시뮬레이션할 수 없으면 백테스트 결과와 함께 monte_carlo.error 반환)
+    
+    **결과 캐시**:
+    - 종료일이 마지막 완결 거래일 이전이고 몬테카를로가 없거나 시드가 지정된 요청은
+      정규화 요청 + 가격 데이터 버전 키로 인코딩된 응답 본문을 캐시 (result_cache_* 설정)
+    
+    **응답 인코딩**:
+    - orjson으로 직접 인코딩 (numpy 배열 지원, NaN/Infinity는 null)
+    - Server-Timing 헤더의 payload 항목에 인코딩 시간(ms) 보고
     
     **응답 형식**:
     ```json
@@ -89,6 +107,7 @@ async def run_portfolio_backtest(request: PortfolioBacktestRequest):
       "data": {
         "portfolio_statistics": { ... },
         "equity_curve": { ... },
+        "monte_carlo": { "daily": { ... }, "trades": { ... } },
         "individual_returns": { ... },
         "stock_data": { "AAPL": [...], "GOOGL": [...] },
         "exchange_rates": [...],
@@ -110,9 +129,7 @@ async def run_portfolio_backtest(request: PortfolioBacktestRequest):
     symbols = list(set(symbols))  # 중복 제거
 
     # 종목 정보 조회 (상장일 확인용) - 배치 조회로 최적화 (N개 쿼리 → 1개 쿼리)
-    ticker_info_dict = await asyncio.to_thread(
-        get_ticker_info_batch_from_db, symbols
-    )
+    ticker_info_dict = await get_stock_repository().get_tickers_info_batch_async(symbols)
 
     validation_errors = []
 
@@ -140,22 +157,35 @@ async def run_portfolio_backtest(request: PortfolioBacktestRequest):
             "\n".join(f"• {err}" for err in validation_errors)
         )
     
-    # 2. 백테스트 실행 (포트폴리오 서비스 위임)
-    backtest_result = await portfolio_service.run_portfolio_backtest(request)
+    # 2. 결과 캐시 조회 (요청 + 가격 데이터 버전이 같으면 이전 응답 재사용)
+    currencies = {symbol: ticker_info_dict.get(symbol, {}).get('currency', 'USD') for symbol in symbols}
+    cache_scope = backtest_result_cache.scope(request, symbols, currencies)
+    if cache_scope is not None:
+        cached_result = await asyncio.to_thread(backtest_result_cache.lookup, request, cache_scope)
+        if cached_result is not None:
+            logger.info(f"백테스트 결과 캐시 적중: {sorted(symbols)} {request.start_date}~{request.end_date}")
+            return FastJSONResponse(cached_result)
+
+    # 3. 백테스트 실행 (포트폴리오 서비스 위임)
+    # 백테스트 중 로드한 가격 데이터는 4단계에서 재사용
+    loaded_price_data = {}
+    backtest_result = await portfolio_service.run_portfolio_backtest(request, loaded_price_data)
     
     if backtest_result.get('status') != 'success':
         return backtest_result
     
-    # 3. 추가 데이터 수집 (데이터 서비스 위임)
-    unified_data = unified_data_service.collect_all_unified_data(
-        symbols=symbols,
-        start_date=request.start_date,
-        end_date=request.end_date,
-        include_news=True,
-        news_display_count=15
-    )
-
-    # 4. S&P 500 벤치마크 통계 계산 및 추가
+    # 4. 추가 데이터 수집 (데이터 서비스 위임, 이벤트 루프 비차단)
+    with span('unified_data'):
+        unified_data = await unified_data_service.collect_all_unified_data_async(
+            symbols=symbols,
+            start_date=request.start_date,
+            end_date=request.end_date,
+            include_news=True,
+            news_display_count=15,
+            preloaded_data=loaded_price_data
+        )
+
+    # 5. S&P 500 벤치마크 통계 계산 및 추가
     sp500_benchmark = unified_data.get('sp500_benchmark', [])
     if sp500_benchmark and len(sp500_benchmark) > 0:
         # S&P 500 수익률 계산
@@ -172,8 +202,13 @@ async def run_portfolio_backtest(request: PortfolioBacktestRequest):
 
             logger.info(f"S&P 500 수익률: {sp500_return:.2f}%, 알파: {strategy_return - sp500_return:.2f}%")
 
-    # 5. 응답 데이터 병합
+    # 6. 응답 데이터 병합
     backtest_result['data'].update(unified_data)
 
-    return backtest_result
+    # 대용량 응답 인코딩은 CPU 작업이므로 이벤트 루프 밖에서 실행
+    response = await asyncio.to_thread(FastJSONResponse, backtest_result)
+    if cache_scope is not None:
+        await asyncio.to_thread(backtest_result_cache.save, request, cache_scope, response.body)
+
+    return response
 
@@ -0,0 +1,111 @@
+"""
+전략 파라미터 최적화 API 엔드포인트
+
+**역할**:
+- 단일 종목/전략의 파라미터 그리드/랜덤 탐색 요청 처리
+- 탐색 중인 작업의 진행률 조회
+- 워크포워드 분석 (구간별 in-sample 최적화 → out-of-sample 검증)
+
+**엔드포인트**:
+- POST /api/v1/optimize: 파라미터 조합 평가 후 순위표 + 히트맵 반환
+- GET /api/v1/optimize/{job_id}/progress: 진행률 조회 (요청 시 job_id 지정 후 폴링)
+- POST /api/v1/optimize/walk-forward: 워크포워드 분석
+
+**에러 처리**:
+- @handle_backtest_errors 데코레이터로 일관된 에러 응답
+
+**의존성**:
+- app/services/optimization_service.py: 조합 생성/평가
+- app/services/walk_forward_service.py: 워크포워드 분석
+
+**연관 컴포넌트**:
+- Backend: app/api/v1/api.py (라우터 등록)
+- Backend: app/schemas/requests.py (OptimizationRequest, WalkForwardRequest)
+"""
+from fastapi import APIRouter, HTTPException, status
+import logging
+
+from ....schemas.requests import OptimizationRequest, WalkForwardRequest
+from ....services.optimization_service import optimization_service
+from ....services.walk_forward_service import walk_forward_service
+from ..decorators import handle_backtest_errors
+
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+
+@router.post(
+    "",
+    status_code=status.HTTP_200_OK,
+    summary="전략 파라미터 최적화",
+    description="같은 가격 데이터로 전략 파라미터 조합을 일괄 평가하고 지표 순위표와 히트맵 행렬을 반환합니다."
+)
+@handle_backtest_errors
+async def run_parameter_optimization(request: OptimizationRequest):
+    """
+    전략 파라미터 최적화 API
+
+    **요청 파라미터** (BacktestRequest 필드 외):
+    - **param_grid**: 파라미터별 후보 값 목록 (예: {"short_window": [5, 10], "long_window": [20, 50]})
+    - **search_mode**: grid(전체 조합) 또는 random(무작위 표본)
+    - **n_samples**: random 모드 표본 수
+    - **rank_by**: 순위 기준 지표 (기본 sharpe_ratio)
+    - **job_id**: 진행률 조회용 작업 ID (생략 시 자동 생성)
+
+    **응답 데이터**:
+    - results: 지표 기준 내림차순 순위표
+    - best: 1위 조합
+    - heatmap: 두 파라미터 축의 지표 행렬
+    """
+    result = await optimization_service.run_optimization(request)
+    return {
+        'status': 'success',
+        'data': result
+    }
+
+
+@router.post(
+    "/walk-forward",
+    status_code=status.HTTP_200_OK,
+    summary="워크포워드 분석",
+    description="구간마다 in-sample 최적화 후 바로 다음 out-of-sample 구간에서 검증하고, 검증 구간 자산 곡선을 이어 붙여 반환합니다."
+)
+@handle_backtest_errors
+async def run_walk_forward_analysis(request: WalkForwardRequest):
+    """
+    워크포워드 분석 API
+
+    **요청 파라미터** (OptimizationRequest 필드 외):
+    - **in_sample_bars**: 최적화 구간 길이 (봉 수)
+    - **out_of_sample_bars**: 검증 구간 길이이자 윈도우 이동 간격 (봉 수)
+    - **anchored**: true면 in-sample 시작을 첫 봉에 고정 (확장 윈도우)
+
+    **응답 데이터**:
+    - windows: 윈도우별 기간, 최적 파라미터, in-sample / out-of-sample 지표
+    - combined: 이어 붙인 out-of-sample 자산 곡선과 합산 지표 (walk_forward_efficiency 포함)
+    """
+    result = await walk_forward_service.run_walk_forward(request)
+    return {
+        'status': 'success',
+        'data': result
+    }
+
+
+@router.get(
+    "/{job_id}/progress",
+    status_code=status.HTTP_200_OK,
+    summary="파라미터 최적화 진행률 조회"
+)
+async def get_optimization_progress(job_id: str):
+    """최적화 작업 진행률 (완료/실패 조합 수, 상태) 조회"""
+    progress = optimization_service.get_progress(job_id)
+    if progress is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"최적화 작업을 찾을 수 없습니다: {job_id}"
+        )
+    return {
+        'status': 'success',
+        'data': progress
+    }
@@ -0,0 +1,54 @@
+"""
+API 응답 클래스 모듈
+
+**역할**:
+- 대용량 백테스트 응답을 jsonable_encoder를 거치지 않고 orjson으로 바로 인코딩
+- 인코딩(페이로드 생성) 시간을 Server-Timing 헤더와 로그로 보고
+
+**사용 패턴**:
+```python
+@router.post("/backtest")
+async def run_backtest(request: BacktestRequest):
+    result = await service.run(request)
+    return FastJSONResponse(result)  # Response 인스턴스를 반환하면 FastAPI 직렬화 단계 생략
+```
+
+**의존성**:
+- app/utils/serializers.py: encode_json
+- app/utils/metrics.py: 인코딩 시간 (serialization 단계)
+
+**연관 컴포넌트**:
+- Backend: app/api/v1/endpoints/backtest.py (포트폴리오 백테스트 응답)
+- Backend: app/services/result_cache.py (인코딩된 본문을 그대로 캐시)
+"""
+import logging
+import time
+from typing import Any
+
+from fastapi.responses import Response
+
+from app.utils.metrics import span
+from app.utils.serializers import encode_json
+
+logger = logging.getLogger(__name__)
+
+
+class FastJSONResponse(Response):
+    """orjson 인코딩 JSON 응답 (bytes content는 이미 인코딩된 본문으로 그대로 전송)"""
+
+    media_type = "application/json"
+
+    def __init__(self, content: Any, *args, **kwargs):
+        self.payload_ms = 0.0
+        super().__init__(content, *args, **kwargs)
+        self.headers.append("Server-Timing", f"payload;dur={self.payload_ms:.1f}")
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        started = time.perf_counter()
+        with span('serialization'):
+            body = encode_json(content)
+        self.payload_ms = (time.perf_counter() - started) * 1000
+        logger.info(f"응답 페이로드 인코딩: {len(body) / 1024:.0f}KB, {self.payload_ms:.1f}ms")
+        return body
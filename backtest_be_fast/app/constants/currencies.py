@@ -66,5 +66,9 @@ SUPPORTED_CURRENCIES = {
     'INR': 'INR=X',        # 인도루피 (1 USD = X INR)
 }
 
+# USD 환율 통화 (XXXUSD=X 티커, 1 통화 = X USD → 가격에 환율 곱하기)
+# 이 목록에 없는 통화는 직접 환율 (1 USD = X 통화 → 가격을 환율로 나누기)
+USD_QUOTED_CURRENCIES = frozenset({'EUR', 'GBP', 'AUD', 'CAD', 'CHF'})
+
 # 환율 데이터 검색 설정
 EXCHANGE_RATE_LOOKBACK_DAYS = 30  # 환율 데이터 누락 시 과거 검색 일수
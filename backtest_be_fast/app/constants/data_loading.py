@@ -11,6 +11,7 @@
 2. RetryConfig: 재시도 로직 설정
 3. TradingThresholds: 거래 전략 임계값
 4. DataValidation: 데이터 검증 기준
+5. IngestionConfig: DB 저장(upsert) 설정
 
 **사용 예**:
 ```python
@@ -40,6 +41,31 @@ class CacheConfig:
     NEWS_CACHE_MAX_HOURS = 3  # 3시간
     NEWS_DEFAULT_DISPLAY = 20  # 기본 표시 개수
 
+    # 로컬 가격 저장소 (app/services/price_store.py)
+    PRICE_STORE_SETTLE_DAYS = 3  # 종료일이 최근 N일 이내면 신규 봉이 추가될 수 있는 구간으로 간주
+
+
+class IngestionConfig:
+    """DB 저장(upsert) 관련 상수"""
+
+    # daily_prices 다중 행 INSERT 1문장당 행 수
+    UPSERT_CHUNK_ROWS = 1000
+
+    # stocks 메타데이터(info_json) 갱신 주기 - 이보다 오래된 경우에만 yfinance info 재조회
+    TICKER_INFO_REFRESH_HOURS = 24 * 7  # 7일
+
+    # 커버리지 워터마크(price_coverage)가 없는 기존 데이터의 내부 구멍 탐지 (거래소 세션 기준)
+    # - 요청 구간 행 수가 세션 수보다 이 비율 이상 적으면 날짜를 조회해 구멍 탐색
+    # - 연속 누락 세션이 이 값 이상이면 누락 구간으로 간주 (캘린더에 없는 음력 연휴 등은 1~2세션 여유)
+    LEGACY_MISSING_RATIO = 0.02
+    LEGACY_GAP_MIN_SESSIONS = 3
+
+    # 누락 구간 수집 시 앞쪽에 덧붙이는 세션 수 (1건 구간도 최소 레코드 수를 만족하도록)
+    FETCH_PAD_SESSIONS = 2
+
+    # 일괄 조회에서 누락 구간 보완이 필요한 티커를 동시에 처리하는 수 (티커별 단일 비행 경로)
+    GAP_FILL_CONCURRENCY = 4
+
 
 class RetryConfig:
     """재시도 로직 설정"""
@@ -65,7 +91,7 @@ class TradingThresholds:
     RSI_OVERBOUGHT = 70  # 과매수 임계값
 
     # 상장폐지 감지
-    DELISTING_THRESHOLD_DAYS = 30  # 30일 이상 데이터 없으면 상폐 의심
+    DELISTING_THRESHOLD_SESSIONS = 21  # 종목 거래소 기준 21세션(약 30일) 이상 데이터 없으면 상폐 의심
 
     # 환율 데이터
     EXCHANGE_RATE_LOOKBACK_DAYS = 30  # 환율 데이터 조회 여유 기간
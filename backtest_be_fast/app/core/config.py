@@ -26,6 +26,8 @@ API 서버 설정 관리
 - `settings` 객체는 모듈 로드 시 한 번만 생성됨
 """
 import json
+import os
+import tempfile
 from typing import Optional
 from pydantic_settings import BaseSettings
 from pydantic import Field
@@ -82,6 +84,64 @@ class Settings(BaseSettings):
     max_symbol_length: int = 10  # 심볼 최대 길이
     default_dca_periods: int = 12  # DCA 기본 기간 (개월)
     max_dca_periods: int = 60  # DCA 최대 기간 (개월)
+    # 포트폴리오 시뮬레이션 엔진 (vectorized: 행렬 기반, loop: 기존 일별 루프)
+    portfolio_simulation_engine: str = Field(default="vectorized", env="PORTFOLIO_SIMULATION_ENGINE")
+
+    # 로컬 가격 저장소 설정 (티커별 열 지향 파일, MySQL은 원본 저장소로 유지)
+    price_store_enabled: bool = Field(default=True, env="PRICE_STORE_ENABLED")
+    price_store_dir: str = Field(
+        default=os.path.join(tempfile.gettempdir(), "backtest_price_store"),
+        env="PRICE_STORE_DIR",
+    )
+
+    # 메모리 가격 캐시 예산 (YfinanceDataRepository, DataFrame 실측 바이트 기준 LRU)
+    memory_cache_max_mb: int = Field(default=256, env="MEMORY_CACHE_MAX_MB")
+
+    # 백테스트 프로세스 풀 (0이면 CPU 수, 1 이하로 해석되면 프로세스 풀 미사용)
+    backtest_process_workers: int = Field(default=0, env="BACKTEST_PROCESS_WORKERS")
+    backtest_job_timeout_seconds: float = Field(default=120.0, env="BACKTEST_JOB_TIMEOUT_SECONDS")
+    # 단일 종목 전략 백테스트 엔진 (vectorized: 기본 전략은 신호 배열 기반 실행, backtesting: 항상 backtesting.py)
+    strategy_backtest_engine: str = Field(default="vectorized", env="STRATEGY_BACKTEST_ENGINE")
+
+    # 전략 파라미터 최적화 (그리드/랜덤 탐색 시 요청당 최대 조합 수)
+    optimization_max_combinations: int = Field(default=500, env="OPTIMIZATION_MAX_COMBINATIONS")
+    # 워크포워드 분석 최대 윈도우 수 (윈도우마다 전체 조합을 평가)
+    walk_forward_max_windows: int = Field(default=40, env="WALK_FORWARD_MAX_WINDOWS")
+
+    # 포트폴리오 몬테카를로 시뮬레이션 (요청당 최대 경로 수, 청크당 (경로 × 일수) 셀 수 상한)
+    monte_carlo_max_paths: int = Field(default=20000, env="MONTE_CARLO_MAX_PATHS")
+    monte_carlo_chunk_cells: int = Field(default=5_000_000, env="MONTE_CARLO_CHUNK_CELLS")
+
+    # 장 마감 후 가격 증분 갱신 (워터마크 이후 봉만 일괄 다운로드, 시각은 거래소 현지 시간)
+    eod_refresh_enabled: bool = Field(default=False, env="EOD_REFRESH_ENABLED")
+    eod_refresh_time: str = Field(default="18:30", env="EOD_REFRESH_TIME")
+    eod_refresh_timezone: str = Field(default="America/New_York", env="EOD_REFRESH_TIMEZONE")
+    eod_refresh_batch_size: int = Field(default=50, env="EOD_REFRESH_BATCH_SIZE")
+
+    # 포트폴리오 백테스트 결과 캐시 (종료일이 지난 요청만, 프로세스 내 LRU + 선택적 SQL 계층)
+    # backend: memory (LRU만), mysql (공유 테이블 backtest_result_cache), disk (result_cache_dir의 SQLite 파일)
+    result_cache_enabled: bool = Field(default=True, env="RESULT_CACHE_ENABLED")
+    result_cache_backend: str = Field(default="memory", env="RESULT_CACHE_BACKEND")
+    result_cache_max_entries: int = Field(default=128, env="RESULT_CACHE_MAX_ENTRIES")
+    # 응답에 포함된 최신 뉴스가 오래 고정되지 않도록 결과 자체에도 TTL 적용
+    result_cache_ttl_seconds: int = Field(default=6 * 3600, env="RESULT_CACHE_TTL_SECONDS")
+    result_cache_dir: str = Field(
+        default=os.path.join(tempfile.gettempdir(), "backtest_result_cache"),
+        env="RESULT_CACHE_DIR",
+    )
+
+    # yfinance 데이터 소스 (live: 직접 호출, record: 응답을 data_source_recording_dir에 기록,
+    # replay: 기록만 사용 (네트워크 없음), auto: 기록된 구간은 재생하고 나머지는 기록)
+    data_source_mode: str = Field(default="live", env="DATA_SOURCE_MODE")
+    data_source_recording_dir: str = Field(
+        default=os.path.join(tempfile.gettempdir(), "backtest_recordings"),
+        env="DATA_SOURCE_RECORDING_DIR",
+    )
+    # CachedDataSource 디스크 계층 (티커별 압축 파일, 구간별 만료 시각)
+    data_source_cache_dir: str = Field(
+        default=os.path.join(tempfile.gettempdir(), "backtest_data_source_cache"),
+        env="DATA_SOURCE_CACHE_DIR",
+    )
     
     # 로깅 설정
     log_level: str = Field(default="INFO", env="LOG_LEVEL")
@@ -104,6 +164,12 @@ class Settings(BaseSettings):
     database_user: Optional[str] = Field(default=None, env="DATABASE_USER")
     database_password: Optional[str] = Field(default=None, env="DATABASE_PASSWORD")
     database_name: Optional[str] = Field(default=None, env="DATABASE_NAME")
+    # 비동기 DB 계층 (aiomysql): 활성화 시 API 경로의 주가/메타데이터/뉴스 조회가 스레드 풀 대신 이벤트 루프에서 대기
+    # 풀은 동기 엔진(PoolConfig)과 별도로 구성 (스크립트/쓰기 경로는 기존 동기 엔진 유지)
+    db_async_enabled: bool = Field(default=False, env="DB_ASYNC_ENABLED")
+    db_async_pool_size: int = Field(default=20, env="DB_ASYNC_POOL_SIZE")
+    db_async_max_overflow: int = Field(default=40, env="DB_ASYNC_MAX_OVERFLOW")
+    db_async_pool_timeout: int = Field(default=30, env="DB_ASYNC_POOL_TIMEOUT")
     
     # pydantic v2 configuration
     model_config = {
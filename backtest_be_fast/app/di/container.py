@@ -25,6 +25,10 @@ portfolio_service = service_container.get_portfolio_service()
 from unittest.mock import Mock
 mock_data_source = Mock()
 service_container.set_data_source(mock_data_source)
+
+# yfinance 기록/재생 (전역 data_fetcher를 거치는 모든 조회에 적용)
+from app.interfaces.data_source import RecordReplayDataSource
+service_container.set_data_source(RecordReplayDataSource('recordings/', mode='replay'))
 ```
 
 **의존성 그래프**:
@@ -72,8 +76,16 @@ class ServiceContainer:
         return self._data_source
 
     def set_data_source(self, data_source):
-        """데이터 소스 설정 (테스트용)"""
+        """
+        데이터 소스 설정 (테스트/기록/재생용)
+
+        전역 data_fetcher에도 연결하므로 누락 구간 보완, 환율, 메타데이터, 티커 검증 등
+        yfinance를 호출하던 모든 경로가 이 소스를 사용합니다.
+        """
+        from app.utils.data_fetcher import data_fetcher
+
         self._data_source = data_source
+        data_fetcher.set_source(data_source)
         logger.info(f"데이터 소스 설정: {type(data_source).__name__}")
 
     # ==================== BacktestEngine ====================
@@ -167,7 +179,10 @@ class ServiceContainer:
 
     # ==================== 컨테이너 관리 ====================
     def reset(self):
-        """모든 서비스 초기화 (테스트용)"""
+        """모든 서비스 초기화 (테스트용, 전역 data_fetcher는 yfinance로 복귀)"""
+        from app.utils.data_fetcher import data_fetcher
+
+        data_fetcher.set_source(None)
         self._data_source = None
         self._backtest_engine = None
         self._portfolio_service = None
@@ -3,10 +3,11 @@
 
 의존성 주입과 느슨한 결합을 위한 추상 인터페이스 정의
 """
-from .data_source import DataSource, YFinanceDataSource, CachedDataSource
+from .data_source import DataSource, YFinanceDataSource, CachedDataSource, RecordReplayDataSource
 
 __all__ = [
     'DataSource',
     'YFinanceDataSource',
-    'CachedDataSource'
+    'CachedDataSource',
+    'RecordReplayDataSource'
 ]
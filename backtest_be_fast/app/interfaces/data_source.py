@@ -13,7 +13,8 @@
 
 **구현체**:
 - YFinanceDataSource: yfinance 기반 구현
-- CachedDataSource: 캐싱 래퍼 (Decorator 패턴)
+- CachedDataSource: 2계층 캐싱 래퍼 (Decorator 패턴, 메모리 LRU + 디스크 압축 파일)
+- RecordReplayDataSource: yfinance 응답 기록/재생 (네트워크 없는 결정적 실행, 부하 테스트/벤치마크용)
 
 **사용 예**:
 ```python
@@ -26,12 +27,20 @@ data_source: DataSource = YFinanceDataSource()
 # 또는 캐싱 포함
 from app.interfaces.data_source import CachedDataSource
 cached_source = CachedDataSource(data_source)
+
+# 기록/재생: 파이프라인 전체(누락 구간 보완, 환율 포함)의 yfinance 호출을 대체
+from app.di.container import service_container
+from app.interfaces.data_source import RecordReplayDataSource
+service_container.set_data_source(RecordReplayDataSource('recordings/', mode='record'))  # 1회 기록
+service_container.set_data_source(RecordReplayDataSource('recordings/', mode='replay'))  # 이후 재생
 ```
 
 **의존성**:
 - abc: 추상 기본 클래스
 - pandas: 데이터 처리
 - datetime: 날짜 처리
+- gzip, json: 기록/캐시 파일 (티커별 압축 JSON)
+- app/utils/frame_cache.py: TickerFrameCache (CachedDataSource 메모리 계층)
 
 **연관 컴포넌트**:
 - Backend: app/utils/data_fetcher.py (구현체 기반)
@@ -39,11 +48,21 @@ cached_source = CachedDataSource(data_source)
 - Backend: app/di/container.py (DI 컨테이너)
 """
 from abc import ABC, abstractmethod
-from datetime import date
-from typing import Dict, Any
+from datetime import date, timedelta
+from typing import Dict, Any, List, Optional, Tuple
+from urllib.parse import quote
+import gzip
+import json
+import os
+import threading
+import time
 import pandas as pd
 import logging
 
+from app.constants.data_loading import CacheConfig
+from app.core.config import settings
+from app.utils.frame_cache import TickerFrameCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -142,7 +161,7 @@ class YFinanceDataSource(DataSource):
         cache_hours: int = 24
     ) -> pd.DataFrame:
         """yfinance에서 주식 데이터를 조회합니다."""
-        return self._fetcher.get_stock_data(
+        return self._fetcher.fetch_stock_data(
             ticker=ticker,
             start_date=start_date,
             end_date=end_date,
@@ -156,13 +175,34 @@ class YFinanceDataSource(DataSource):
 
     def get_ticker_info(self, ticker: str) -> Dict[str, Any]:
         """yfinance에서 종목 정보를 조회합니다."""
-        return self._fetcher.get_ticker_info(ticker)
+        return self._fetcher.fetch_ticker_info(ticker)
 
 
 class CachedDataSource(DataSource):
-    """캐싱을 추가하는 데코레이터 패턴 구현 (선택사항)"""
-
-    def __init__(self, data_source: DataSource, cache_hours: int = 24):
+    """
+    2계층 캐시 데코레이터 (메모리 LRU + 디스크 티커별 압축 파일)
+
+    **주가 (get_stock_data)**:
+    - 메모리: TickerFrameCache (티커별 병합 프레임, 바이트 예산 LRU)
+    - 디스크: cache_dir/prices/<TICKER>.json.gz (열 단위 배열, 구간별 만료 시각)
+    - 겹치거나 맞닿은 요청 구간은 병합되어, 그 안쪽 임의 구간을 원본 호출 없이 슬라이스로 응답
+    - TTL: 오늘을 포함하는 구간은 min(cache_hours, 1시간), 과거 구간은 cache_hours
+    - use_cache=False: 캐시를 읽지 않고 원본 조회 후 두 계층 갱신, cache_hours=0: 캐시 미사용
+
+    **종목 정보 / 티커 검증**:
+    - 메모리 캐시 (cache_hours)
+    - 유효하지 않은 티커(검증 실패, InvalidSymbolError, 오류 응답)는 negative_cache_hours 동안
+      음성 캐시 (검증 실패/InvalidSymbolError 티커의 주가 조회는 원본 호출 없이 InvalidSymbolError)
+    """
+
+    def __init__(
+        self,
+        data_source: DataSource,
+        cache_hours: int = 24,
+        cache_dir: Optional[str] = None,
+        max_memory_mb: Optional[int] = None,
+        negative_cache_hours: float = 1
+    ):
         """
         캐싱 래퍼를 초기화합니다.
 
@@ -171,11 +211,353 @@ class CachedDataSource(DataSource):
         data_source : DataSource
             기본 데이터 소스
         cache_hours : int
-            캐시 유효 시간
+            캐시 유효 시간 (get_stock_data에서 cache_hours를 생략했을 때의 기본값)
+        cache_dir : str, optional
+            디스크 계층 디렉터리 (None이면 settings.data_source_cache_dir)
+        max_memory_mb : int, optional
+            메모리 계층 예산 (None이면 settings.memory_cache_max_mb)
+        negative_cache_hours : float
+            유효하지 않은 티커 결과의 캐시 유효 시간
         """
         self._data_source = data_source
-        self._cache = {}
         self._cache_hours = cache_hours
+        self._negative_cache_hours = negative_cache_hours
+        self._cache_dir = cache_dir or settings.data_source_cache_dir
+        memory_mb = settings.memory_cache_max_mb if max_memory_mb is None else max_memory_mb
+        self._cache = TickerFrameCache(
+            max_bytes=memory_mb * 1024 * 1024,
+            ttl_resolver=lambda end: self._ttl_seconds(end, self._cache_hours),
+        )
+        self._lock = threading.Lock()
+        self._info: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._valid: Dict[str, Tuple[float, bool]] = {}
+        self._stats = {'disk_hits': 0, 'source_calls': 0, 'info_hits': 0, 'negative_hits': 0, 'disk_errors': 0}
+
+    def get_stock_data(
+        self,
+        ticker: str,
+        start_date: date,
+        end_date: date,
+        use_cache: bool = True,
+        cache_hours: Optional[int] = None
+    ) -> pd.DataFrame:
+        """메모리 → 디스크 → 원본 순으로 조회하고, 원본 결과를 두 계층에 저장합니다."""
+        from app.utils.data_fetcher import InvalidSymbolError
+
+        key = ticker.upper()
+        start, end = _to_date(start_date), _to_date(end_date)
+        hours = self._cache_hours if cache_hours is None else cache_hours
+        use_cache = use_cache and hours > 0
+
+        if use_cache:
+            if self._cached_validity(key) is False:
+                raise InvalidSymbolError(f"'{key}'은(는) 유효하지 않은 종목입니다 (캐시된 검증 결과).")
+            frame = self._cache.get(key, start, end)
+            if frame is not None and not frame.empty:
+                return frame.copy()
+            frame = self._read_disk(key, start, end)
+            if frame is not None:
+                return frame
+
+        with self._lock:
+            self._stats['source_calls'] += 1
+        try:
+            frame = self._data_source.get_stock_data(key, start_date, end_date, use_cache, hours)
+        except InvalidSymbolError:
+            self._remember_validity(key, False)
+            raise
+        if hours > 0:
+            self._store(key, start, end, frame, hours)
+        return frame
+
+    def validate_ticker(self, ticker: str) -> bool:
+        """캐시된 검증 결과가 없으면 원본에 위임하고 결과(실패 포함)를 캐시합니다."""
+        key = ticker.upper()
+        cached = self._cached_validity(key)
+        if cached is not None:
+            return cached
+        valid = self._data_source.validate_ticker(key)
+        self._remember_validity(key, valid)
+        return valid
+
+    def get_ticker_info(self, ticker: str) -> Dict[str, Any]:
+        """캐시된 종목 정보가 없으면 원본에 위임합니다 (오류 응답은 negative_cache_hours 동안 캐시)."""
+        key = ticker.upper()
+        now = time.time()
+        with self._lock:
+            entry = self._info.get(key)
+            if entry is not None and entry[0] > now:
+                self._stats['negative_hits' if 'error' in entry[1] else 'info_hits'] += 1
+                return dict(entry[1])
+
+        info = self._data_source.get_ticker_info(key)
+        hours = self._negative_cache_hours if 'error' in info else self._cache_hours
+        with self._lock:
+            self._info[key] = (now + hours * 3600, dict(info))
+        return info
+
+    def invalidate(self, ticker: str) -> None:
+        """티커의 두 계층 주가 캐시와 종목 정보/검증 캐시 제거"""
+        key = ticker.upper()
+        self._cache.invalidate(key)
+        with self._lock:
+            self._info.pop(key, None)
+            self._valid.pop(key, None)
+            path = self._path(key)
+            if os.path.exists(path):
+                os.remove(path)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """메모리 계층 통계 + 디스크 적중/원본 호출/음성 캐시 적중 수"""
+        memory = self._cache.get_stats()
+        memory.pop('tickers', None)
+        with self._lock:
+            return {**self._stats, 'memory': memory, 'cache_dir': self._cache_dir}
+
+    # ==================== 내부 ====================
+
+    @staticmethod
+    def _ttl_seconds(end: date, cache_hours: float) -> float:
+        """오늘을 포함하는 구간은 새 봉이 추가될 수 있으므로 최대 MEMORY_TTL_RECENT"""
+        ttl = cache_hours * 3600
+        if end >= date.today():
+            ttl = min(ttl, CacheConfig.MEMORY_TTL_RECENT)
+        return ttl
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self._cache_dir, 'prices', f"{quote(key, safe='')}.json.gz")
+
+    def _read_disk(self, key: str, start: date, end: date) -> Optional[pd.DataFrame]:
+        """디스크 계층 조회 (적중 시 커버리지 구간 전체를 남은 유효 시간으로 메모리 계층에 올림)"""
+        try:
+            price_file = _TickerPriceFile.load(self._path(key))
+        except Exception as e:
+            with self._lock:
+                self._stats['disk_errors'] += 1
+            logger.warning(f"디스크 캐시 조회 실패 ({key}): {e}")
+            return None
+        coverage = price_file.covering(start, end) if price_file is not None else None
+        if coverage is None:
+            return None
+        frame = price_file.slice(start, end)
+        if frame.empty:
+            return None
+
+        cov_start, cov_end, expires_at = coverage
+        self._cache.put(key, cov_start, cov_end, price_file.slice(cov_start, cov_end),
+                        ttl_seconds=expires_at - time.time())
+        with self._lock:
+            self._stats['disk_hits'] += 1
+        return frame
+
+    def _store(self, key: str, start: date, end: date, frame: pd.DataFrame, hours: float) -> None:
+        if frame is None or frame.empty:
+            return
+        ttl = self._ttl_seconds(end, hours)
+        self._cache.put(key, start, end, frame, ttl_seconds=ttl)
+        with self._lock:
+            try:
+                path = self._path(key)
+                price_file = _TickerPriceFile.load(path) or _TickerPriceFile(frame.iloc[0:0].copy(), [])
+                price_file.merge(frame, start, end, time.time() + ttl)
+                _atomic_write(path, price_file.to_bytes())
+            except Exception as e:
+                self._stats['disk_errors'] += 1
+                logger.warning(f"디스크 캐시 저장 실패 ({key}): {e}")
+
+    def _cached_validity(self, key: str) -> Optional[bool]:
+        with self._lock:
+            entry = self._valid.get(key)
+            if entry is None or entry[0] <= time.time():
+                return None
+            self._stats['info_hits' if entry[1] else 'negative_hits'] += 1
+            return entry[1]
+
+    def _remember_validity(self, key: str, valid: bool) -> None:
+        hours = self._cache_hours if valid else self._negative_cache_hours
+        with self._lock:
+            self._valid[key] = (time.time() + hours * 3600, valid)
+
+
+def _to_date(value) -> date:
+    """str / date / datetime / Timestamp → date"""
+    return pd.Timestamp(value).date()
+
+
+# (시작일, 종료일, 만료 시각 epoch - None이면 만료 없음)
+Coverage = Tuple[date, date, Optional[float]]
+
+
+def _earlier(a: Optional[float], b: Optional[float]) -> Optional[float]:
+    """두 만료 시각 중 이른 쪽 (None은 만료 없음)"""
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return min(a, b)
+
+
+def _merge_ranges(ranges: List[Coverage]) -> List[Coverage]:
+    """만료된 구간을 버리고 겹치거나 맞닿은 날짜 구간 병합 (만료 시각은 더 이른 쪽)"""
+    now = time.time()
+    merged: List[Coverage] = []
+    for start, end, expires_at in sorted(
+        (r for r in ranges if r[2] is None or r[2] > now), key=lambda r: (r[0], r[1])
+    ):
+        if merged and start <= merged[-1][1] + timedelta(days=1):
+            prev_start, prev_end, prev_expires = merged[-1]
+            merged[-1] = (prev_start, max(prev_end, end), _earlier(prev_expires, expires_at))
+        else:
+            merged.append((start, end, expires_at))
+    return merged
+
+
+def _atomic_write(path: str, raw: bytes) -> None:
+    """임시 파일 작성 후 os.replace로 교체"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(raw)
+    os.replace(tmp_path, path)
+
+
+class _TickerPriceFile:
+    """
+    티커 1개의 가격 파일 (받은 응답을 날짜 기준으로 병합한 프레임 + 커버리지 구간)
+
+    gzip JSON, 열 단위 배열 + UTC 인덱스(ns) + 타임존 (RecordReplayDataSource, CachedDataSource 공용)
+    """
+
+    def __init__(self, frame: pd.DataFrame, coverage: List[Coverage]):
+        self.frame = frame
+        self.coverage = coverage
+
+    def covering(self, start: date, end: date) -> Optional[Coverage]:
+        """요청 구간을 포함하는 만료되지 않은 커버리지 구간"""
+        now = time.time()
+        for coverage in self.coverage:
+            s, e, expires_at = coverage
+            if s <= start and end <= e and (expires_at is None or expires_at > now):
+                return coverage
+        return None
+
+    def slice(self, start: date, end: date) -> pd.DataFrame:
+        """요청 구간(종료일 포함) 행 - 거래소 현지 날짜 기준"""
+        index = pd.DatetimeIndex(self.frame.index)
+        local = index.tz_localize(None) if index.tz is not None else index
+        mask = (local >= pd.Timestamp(start)) & (local < pd.Timestamp(end) + pd.Timedelta(days=1))
+        return self.frame.loc[mask].copy()
+
+    def merge(self, frame: pd.DataFrame, start: date, end: date, expires_at: Optional[float] = None) -> None:
+        if not self.frame.empty and (
+            self.frame.columns.tolist() != frame.columns.tolist() or self.frame.index.tz != frame.index.tz
+        ):
+            # 형식이 다른 응답(예: 다른 데이터 소스)은 섞지 않고 교체
+            self.frame, self.coverage = frame.iloc[0:0].copy(), []
+        combined = pd.concat([self.frame, frame]) if not self.frame.empty else frame.copy()
+        combined = combined[~combined.index.duplicated(keep='last')].sort_index()
+        self.frame = combined
+        if not frame.empty:
+            # 빈 응답에 대한 yfinance의 범위 확장 재시도로 받은 행도 재생되도록 실제 받은 구간 포함
+            local = pd.DatetimeIndex(frame.index)
+            local = local.tz_localize(None) if local.tz is not None else local
+            start, end = min(start, local.min().date()), max(end, local.max().date())
+        self.coverage = _merge_ranges(self.coverage + [(start, end, expires_at)])
+
+    def to_bytes(self) -> bytes:
+        index = pd.DatetimeIndex(self.frame.index)
+        tz = str(index.tz) if index.tz is not None else None
+        epoch_ns = index.as_unit('ns')
+        if tz:
+            epoch_ns = epoch_ns.tz_convert('UTC')
+        payload = {
+            'version': 1,
+            'tz': tz,
+            'unit': index.unit,
+            'index_name': index.name,
+            'index': epoch_ns.asi8.tolist(),
+            'columns': {str(col): self.frame[col].tolist() for col in self.frame.columns},
+            'dtypes': {str(col): str(self.frame[col].dtype) for col in self.frame.columns},
+            'coverage': [[s.isoformat(), e.isoformat(), expires_at] for s, e, expires_at in self.coverage],
+        }
+        return gzip.compress(json.dumps(payload).encode('utf-8'))
+
+    @classmethod
+    def from_bytes(cls, raw: bytes) -> '_TickerPriceFile':
+        payload = json.loads(gzip.decompress(raw))
+        index = pd.to_datetime(payload['index'], utc=payload['tz'] is not None)
+        if payload['tz'] is not None:
+            index = index.tz_convert(payload['tz'])
+        index = index.as_unit(payload['unit'])
+        frame = pd.DataFrame(payload['columns'], index=pd.DatetimeIndex(index, name=payload['index_name']))
+        frame = frame.astype(payload['dtypes'])
+        coverage = [
+            (date.fromisoformat(entry[0]), date.fromisoformat(entry[1]), entry[2] if len(entry) > 2 else None)
+            for entry in payload['coverage']
+        ]
+        return cls(frame, coverage)
+
+    @classmethod
+    def load(cls, path: str) -> Optional['_TickerPriceFile']:
+        """파일이 없으면 None"""
+        if not os.path.exists(path):
+            return None
+        with open(path, 'rb') as f:
+            return cls.from_bytes(f.read())
+
+
+class RecordReplayDataSource(DataSource):
+    """
+    yfinance 응답 기록/재생 데이터 소스
+
+    **모드**:
+    - record: 내부 소스(기본 YFinanceDataSource) 응답을 그대로 반환하면서 기록 파일에 병합 저장
+    - replay: 기록 파일만 사용 (네트워크 없음), 기록되지 않은 구간은 DataNotFoundError
+    - auto: 요청 구간이 기록되어 있으면 재생, 아니면 기록
+
+    **기록 파일** (directory 아래, 티커별 gzip JSON):
+    - prices/<TICKER>.json.gz: OHLCV 열 배열, UTC 인덱스 + 타임존, 기록한 요청 구간 목록
+    - info/<TICKER>.json.gz: get_ticker_info / validate_ticker 결과
+
+    Note:
+        - 같은 티커의 여러 요청은 하나의 프레임으로 병합되므로 재생 시 기록한 구간 안쪽의
+          임의 구간(누락 구간 보완 요청 포함)을 잘라서 반환
+        - 기록 파일은 원자적 교체(임시 파일 → os.replace)로 저장
+    """
+
+    MODES = ('record', 'replay', 'auto')
+
+    def __init__(self, directory: str, mode: str = 'replay', data_source: Optional[DataSource] = None):
+        """
+        Parameters
+        ----------
+        directory : str
+            기록 파일 디렉터리
+        mode : str
+            record / replay / auto
+        data_source : DataSource, optional
+            기록 대상 실제 소스 (None이면 YFinanceDataSource, replay 모드에서는 생성하지 않음)
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"지원하지 않는 기록/재생 모드입니다: {mode} (가능: {', '.join(self.MODES)})")
+        self.directory = directory
+        self.mode = mode
+        self._data_source = data_source
+        self._lock = threading.Lock()
+        self._prices: Dict[str, Optional[_TickerPriceFile]] = {}
+        self._infos: Dict[str, Dict[str, Any]] = {}
+        self._stats = {'replayed': 0, 'recorded': 0, 'misses': 0}
+
+    @classmethod
+    def from_settings(cls) -> 'RecordReplayDataSource':
+        """settings.data_source_mode / data_source_recording_dir 기반 생성"""
+        return cls(settings.data_source_recording_dir, settings.data_source_mode)
+
+    @property
+    def data_source(self) -> DataSource:
+        if self._data_source is None:
+            self._data_source = YFinanceDataSource()
+        return self._data_source
 
     def get_stock_data(
         self,
@@ -185,20 +567,107 @@ class CachedDataSource(DataSource):
         use_cache: bool = True,
         cache_hours: int = 24
     ) -> pd.DataFrame:
-        """캐시를 확인한 후 데이터를 조회합니다."""
-        # 현재는 단순 구현 - 향후 개선 가능
-        return self._data_source.get_stock_data(
-            ticker=ticker,
-            start_date=start_date,
-            end_date=end_date,
-            use_cache=use_cache,
-            cache_hours=cache_hours
-        )
+        """기록된 구간이면 재생, 아니면 (record/auto) 내부 소스 호출 후 기록합니다."""
+        from app.utils.data_fetcher import DataNotFoundError
+
+        key = ticker.upper()
+        start, end = _to_date(start_date), _to_date(end_date)
+        if self.mode != 'record':
+            recording = self._load_prices(key)
+            if recording is not None and recording.covering(start, end) is not None:
+                frame = recording.slice(start, end)
+                if frame.empty:
+                    # 라이브 경로와 같이 범위를 넓혀 재시도 (DataFetcher의 +/-7일 확장)
+                    frame = recording.slice(start - timedelta(days=7), end + timedelta(days=7))
+                if frame.empty:
+                    raise DataNotFoundError(f"'{key}' 종목의 {start}~{end} 기록에 데이터가 없습니다.")
+                self._count('replayed')
+                return frame
+            if self.mode == 'replay':
+                self._count('misses')
+                raise DataNotFoundError(f"'{key}' 종목의 {start}~{end} 구간이 기록되어 있지 않습니다 (replay 모드).")
+
+        frame = self.data_source.get_stock_data(key, start_date, end_date, use_cache, cache_hours)
+        self._record_prices(key, frame, start, end)
+        return frame
 
     def validate_ticker(self, ticker: str) -> bool:
-        """티커 검증을 캐시하지 않고 위임합니다."""
-        return self._data_source.validate_ticker(ticker)
+        """기록된 검증 결과 재생 (replay 모드에서 검증 기록이 없으면 주가 기록 유무로 판단)"""
+        key = ticker.upper()
+        record = self._load_info(key)
+        if self.mode != 'record' and 'valid' in record:
+            self._count('replayed')
+            return record['valid']
+        if self.mode == 'replay':
+            self._count('misses')
+            return self._load_prices(key) is not None
+
+        valid = self.data_source.validate_ticker(key)
+        self._record_info(key, valid=valid)
+        return valid
 
     def get_ticker_info(self, ticker: str) -> Dict[str, Any]:
-        """종목 정보를 위임합니다."""
-        return self._data_source.get_ticker_info(ticker)
+        """기록된 종목 정보 재생 (replay 모드에서 기록이 없으면 DataFetcher 실패 응답과 같은 형식)"""
+        key = ticker.upper()
+        record = self._load_info(key)
+        if self.mode != 'record' and 'info' in record:
+            self._count('replayed')
+            return dict(record['info'])
+        if self.mode == 'replay':
+            self._count('misses')
+            return {
+                'symbol': key, 'error': '기록된 종목 정보가 없습니다 (replay 모드)', 'company_name': key,
+                'sector': 'Unknown', 'industry': 'Unknown', 'first_trade_date': None,
+            }
+
+        info = self.data_source.get_ticker_info(key)
+        if 'error' not in info:
+            self._record_info(key, info=info)
+        return info
+
+    def get_stats(self) -> Dict[str, Any]:
+        """재생/기록/미기록 요청 수"""
+        with self._lock:
+            return {**self._stats, 'mode': self.mode, 'directory': self.directory}
+
+    # ==================== 기록 파일 ====================
+
+    def _path(self, kind: str, key: str) -> str:
+        return os.path.join(self.directory, kind, f"{quote(key, safe='')}.json.gz")
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    def _load_prices(self, key: str) -> Optional[_TickerPriceFile]:
+        with self._lock:
+            if key not in self._prices:
+                self._prices[key] = _TickerPriceFile.load(self._path('prices', key))
+            return self._prices[key]
+
+    def _load_info(self, key: str) -> Dict[str, Any]:
+        with self._lock:
+            if key not in self._infos:
+                path = self._path('info', key)
+                record: Dict[str, Any] = {}
+                if os.path.exists(path):
+                    with open(path, 'rb') as f:
+                        record = json.loads(gzip.decompress(f.read()))
+                self._infos[key] = record
+            return self._infos[key]
+
+    def _record_prices(self, key: str, frame: pd.DataFrame, start: date, end: date) -> None:
+        recording = self._load_prices(key)
+        with self._lock:
+            if recording is None:
+                recording = self._prices[key] = _TickerPriceFile(frame.iloc[0:0].copy(), [])
+            recording.merge(frame, start, end)
+            _atomic_write(self._path('prices', key), recording.to_bytes())
+            self._stats['recorded'] += 1
+
+    def _record_info(self, key: str, **values: Any) -> None:
+        record = self._load_info(key)
+        with self._lock:
+            record.update(values)
+            _atomic_write(self._path('info', key), gzip.compress(json.dumps(record, default=str).encode('utf-8')))
+            self._stats['recorded'] += 1
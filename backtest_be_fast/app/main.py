@@ -12,6 +12,8 @@ FastAPI 애플리케이션 메인 진입점
 2. API 라우팅: /api/v1 경로로 모든 백테스트 API 제공
 3. 헬스 체크: /health 엔드포인트로 서버 상태 확인
 4. 에러 핸들링: 전역 예외 처리기 등록
+5. 요청 시간 측정: 단계별 시간을 Server-Timing 헤더로 보고 (app/utils/metrics.py)
+6. 메트릭: /metrics 엔드포인트로 Prometheus 텍스트 형식 제공
 
 **연관 컴포넌트**:
 - Backend: app/core/config.py (환경 설정)
@@ -24,15 +26,25 @@ FastAPI 애플리케이션 메인 진입점
 - 로컬: `uvicorn app.main:app --reload`
 """
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import RedirectResponse, JSONResponse
+from fastapi.responses import RedirectResponse, JSONResponse, PlainTextResponse
+from starlette.routing import Match
 import logging
 from datetime import datetime
 
 from .core.config import settings
 from .api.v1.api import api_router
 from .schemas.responses import HealthResponse
+from .services.backtest_executor import backtest_executor
+from .services.price_refresh_service import price_refresh_scheduler
+from .services.database.connection_manager import DatabaseConnectionManager
+from .services.result_cache import backtest_result_cache
+from .services.price_store import local_price_store
+from .repositories.data_repository import data_repository
+from .di.container import service_container
+from .interfaces.data_source import RecordReplayDataSource
+from .utils.metrics import metrics, start_request_timings
 
 # 로깅 설정
 logging.basicConfig(
@@ -48,10 +60,17 @@ async def lifespan(app: FastAPI):
     # 시작 시 초기화
     logger.info(f"{settings.project_name} v{settings.version} 시작됨")
     logger.info(f"문서 URL: http://{settings.host}:{settings.port}{settings.api_v1_str}/docs")
+    if settings.data_source_mode != "live":
+        service_container.set_data_source(RecordReplayDataSource.from_settings())
+        logger.info(f"yfinance {settings.data_source_mode} 모드: {settings.data_source_recording_dir}")
+    price_refresh_scheduler.start()
     
     yield
     
     # 종료 시 정리
+    await price_refresh_scheduler.stop()
+    backtest_executor.shutdown()
+    await DatabaseConnectionManager.dispose_async_engine()
     logger.info(f"{settings.project_name} 종료됨")
 
 
@@ -79,6 +98,45 @@ app.add_middleware(
 app.include_router(api_router, prefix=settings.api_v1_str)
 
 
+def _route_label(request: Request) -> str:
+    """경로 템플릿 (/api/v1/backtest 등) - 경로 파라미터/미등록 경로로 라벨이 늘어나지 않도록"""
+    for route in request.app.routes:
+        match, _ = route.matches(request.scope)
+        if match == Match.FULL:
+            return route.path
+    return "unmatched"
+
+
+@app.middleware("http")
+async def request_timing_middleware(request: Request, call_next):
+    """요청 단계별 시간 측정 (Server-Timing 헤더 + http_request_duration_seconds)"""
+    timings = start_request_timings()
+    try:
+        response = await call_next(request)
+    finally:
+        metrics.observe(
+            'http_request_duration_seconds', timings.elapsed(),
+            method=request.method, path=_route_label(request)
+        )
+    response.headers.append("Server-Timing", timings.server_timing())
+    return response
+
+
+def _cache_metric_samples():
+    """캐시별 누적 히트/미스 (각 캐시의 get_stats() 값을 스크레이프 시점에 노출)"""
+    caches = {
+        'result': backtest_result_cache.get_stats(),
+        'price_store': local_price_store.get_stats(),
+        'frame': data_repository._memory_cache.get_stats(),
+    }
+    for cache, stats in caches.items():
+        yield 'cache_hits_total', {'cache': cache}, stats.get('hits', 0)
+        yield 'cache_misses_total', {'cache': cache}, stats.get('misses', 0)
+
+
+metrics.register_collector(_cache_metric_samples)
+
+
 @app.get("/", include_in_schema=False)
 async def root():
     """루트 경로 - API 문서로 리다이렉트"""
@@ -109,6 +167,12 @@ async def health_check():
         raise HTTPException(status_code=503, detail="서비스 상태 불량")
 
 
+@app.get("/metrics", include_in_schema=False)
+async def prometheus_metrics():
+    """Prometheus 스크레이프 엔드포인트 (텍스트 형식 0.0.4)"""
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
+
 # 전역 예외 핸들러
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
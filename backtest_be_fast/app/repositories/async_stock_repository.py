@@ -0,0 +1,236 @@
+"""
+비동기 DB 드라이버 기반 주식 데이터 Repository
+
+**역할**:
+- API 경로의 읽기 조회(주가, 티커 메타데이터, 뉴스)를 비동기 드라이버(aiomysql)로 수행
+- DB 대기 중 스레드 풀 워커를 점유하지 않아, 동시 요청 수가 스레드 풀 크기가 아닌
+  비동기 연결 풀 크기(settings.db_async_pool_size)로 제한됨
+
+**주요 기능**:
+1. load_stock_data_async(): 커버리지 워터마크 안쪽 요청은 비동기 연결로 조회
+   - 로컬 가격 저장소 → 비동기 DB(읽기 전용) → 동기 경로(누락 구간 yfinance 보완/쓰기) 순
+   - load_stock_data_batch_async(): 같은 규칙으로 여러 티커를 비동기 연결 1개로 조회
+     (나머지 티커는 동기 경로로 동시 처리)
+2. get_tickers_info_batch_async() / get_ticker_info_async(): 메타데이터 조회 (IN 절 1회)
+3. load_ticker_news_async(): 뉴스 조회
+
+**설계**:
+- 주가: yfinance_db의 쿼리 생성 헬퍼로 행만 비동기 연결에서 읽고,
+  DataFrame 변환/로컬 가격 저장소 읽기·반영은 asyncio.to_thread 1회씩 (이벤트 루프에서 pandas 작업 없음)
+- 메타데이터/뉴스: 연결을 받는 헬퍼를 AsyncConnection.run_sync로 공유 (행 수가 적은 dict 변환만 수행)
+- 쓰기/수집 경로와 동기 메서드는 StockRepository 그대로 사용 (스크립트는 동기 구현 유지)
+- 비동기 경로 실패 시 동기 경로로 대체하여 기존 동작 보장
+
+**의존성**:
+- sqlalchemy.ext.asyncio + aiomysql: 비동기 연결 풀
+- app.services.database.connection_manager: get_async_engine
+- app.repositories.stock_repository: StockRepository (동기 경로, 단일 비행)
+
+**연관 컴포넌트**:
+- Backend: app/repositories/stock_repository.py (get_stock_repository가 settings.db_async_enabled로 선택)
+- Backend: app/api/v1/endpoints/backtest.py, app/services/portfolio_service.py (비동기 호출자)
+"""
+
+import asyncio
+import logging
+from datetime import date
+from typing import Any, Dict, List, Optional, Union
+
+import pandas as pd
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from app.constants.data_loading import IngestionConfig
+from app.repositories.stock_repository import StockRepository
+from app.services import yfinance_db
+from app.services.database.connection_manager import DatabaseConnectionManager
+from app.services.price_store import local_price_store
+
+logger = logging.getLogger(__name__)
+
+
+def _read_local(tickers: List[str], start_date, end_date) -> Dict[str, pd.DataFrame]:
+    """로컬 가격 저장소에서 여러 티커를 읽습니다 (커버리지 밖 티커는 제외)."""
+    result: Dict[str, pd.DataFrame] = {}
+    for ticker in dict.fromkeys(tickers):
+        cached = local_price_store.read(ticker, start_date, end_date)
+        if cached is not None:
+            result[ticker] = cached
+    return result
+
+
+def _record_local(frames: Dict[str, pd.DataFrame], start_date, end_date) -> None:
+    """DB에서 읽은 여러 티커를 로컬 가격 저장소에 반영합니다."""
+    for ticker, df in frames.items():
+        local_price_store.record_load(ticker, df, start_date, end_date)
+
+
+class AsyncStockRepository(StockRepository):
+    """비동기 DB 드라이버로 읽기 조회를 수행하는 StockRepository 구현"""
+
+    def __init__(self, engine: Optional[AsyncEngine] = None):
+        """
+        Args:
+            engine: 사용할 AsyncEngine (None이면 DatabaseConnectionManager.get_async_engine)
+        """
+        super().__init__()
+        self._engine = engine
+        self._async_stats = {'native': 0, 'fallback': 0, 'errors': 0}
+
+    @property
+    def engine(self) -> AsyncEngine:
+        if self._engine is None:
+            self._engine = DatabaseConnectionManager.get_async_engine()
+        return self._engine
+
+    async def _run(self, func, *args):
+        """연결 1개를 빌려 동기 쿼리 헬퍼를 비동기 드라이버로 실행합니다."""
+        async with self.engine.connect() as conn:
+            return await conn.run_sync(func, *args)
+
+    @staticmethod
+    async def _fetch(conn: AsyncConnection, query, params: Dict[str, Any]) -> list:
+        return (await conn.execute(query, params)).fetchall()
+
+    async def _load_covered(
+        self,
+        tickers: List[str],
+        start_date: Optional[Union[str, date]],
+        end_date: Optional[Union[str, date]]
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        yfinance_db.load_covered_ticker_data_batch의 비동기 버전 (쿼리 3회, 워터마크 안쪽 티커만)
+
+        행은 비동기 연결로 읽고 DataFrame 변환은 스레드에서 수행합니다.
+        """
+        tickers = list(dict.fromkeys(tickers))
+        start, end = yfinance_db._normalize_date_params(start_date, end_date)
+        async with self.engine.connect() as conn:
+            rows = await self._fetch(conn, *yfinance_db._stock_ids_query(tickers))
+            stock_ids = yfinance_db._stock_ids_from_rows(rows, tickers)
+            if not stock_ids:
+                return {}
+            rows = await self._fetch(conn, *yfinance_db._coverage_query(list(stock_ids.values()), start, end))
+            covered = yfinance_db._covered_stock_ids(stock_ids, yfinance_db._coverage_from_rows(rows), start, end)
+            if not covered:
+                return {}
+            rows = await self._fetch(conn, *yfinance_db._price_rows_query(covered, start, end))
+        return await asyncio.to_thread(yfinance_db._price_frames_from_rows, rows, covered, start, end)
+
+    async def load_stock_data_async(
+        self,
+        ticker: str,
+        start_date: Optional[Union[str, date]] = None,
+        end_date: Optional[Union[str, date]] = None,
+        max_retries: int = 3,
+        retry_delay: float = 2.0
+    ) -> pd.DataFrame:
+        """
+        주가 데이터 조회 (비동기 드라이버 우선)
+
+        Note:
+            - 커버리지 워터마크 안쪽 요청만 비동기 연결로 읽음 (쓰기 없음)
+            - DB에 없는 티커, 워터마크 밖 구간, 비동기 조회 실패는 StockRepository의
+              스레드 경로(누락 구간 보완, 단일 비행, 재시도)로 처리
+        """
+        cached = await asyncio.to_thread(local_price_store.read, ticker, start_date, end_date)
+        if cached is not None:
+            return cached
+
+        try:
+            df = (await self._load_covered([ticker], start_date, end_date)).get(ticker)
+        except Exception as e:
+            self._async_stats['errors'] += 1
+            logger.warning(f"{ticker} 비동기 조회 실패 - 동기 경로로 전환: {e}")
+            df = None
+
+        if df is None:
+            self._async_stats['fallback'] += 1
+            return await super().load_stock_data_async(ticker, start_date, end_date, max_retries, retry_delay)
+
+        self._async_stats['native'] += 1
+        await asyncio.to_thread(local_price_store.record_load, ticker, df, start_date, end_date)
+        return df
+
+    async def load_stock_data_batch_async(
+        self,
+        tickers: List[str],
+        start_date: Optional[Union[str, date]] = None,
+        end_date: Optional[Union[str, date]] = None
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        여러 티커의 주가 데이터 일괄 조회 (비동기 드라이버 우선)
+
+        로컬 가격 저장소에 없는 티커를 비동기 연결 1개, 쿼리 3회로 읽고(워터마크 안쪽만),
+        나머지는 StockRepository.load_stock_data_async(누락 구간 보완, 단일 비행)로 동시에 처리합니다
+        (동시 처리 수: IngestionConfig.GAP_FILL_CONCURRENCY, 로드 실패 티커는 제외).
+        """
+        result = await asyncio.to_thread(_read_local, tickers, start_date, end_date)
+        pending = [ticker for ticker in dict.fromkeys(tickers) if ticker not in result]
+        if not pending:
+            return result
+
+        try:
+            covered = await self._load_covered(pending, start_date, end_date)
+        except Exception as e:
+            self._async_stats['errors'] += 1
+            logger.warning(f"주가 비동기 배치 조회 실패 - 동기 경로로 전환: {e}")
+            covered = {}
+
+        if covered:
+            await asyncio.to_thread(_record_local, covered, start_date, end_date)
+            result.update(covered)
+        self._async_stats['native'] += len(covered)
+
+        remaining = [ticker for ticker in pending if ticker not in covered]
+        if not remaining:
+            return result
+        self._async_stats['fallback'] += len(remaining)
+        semaphore = asyncio.Semaphore(IngestionConfig.GAP_FILL_CONCURRENCY)
+
+        async def load(ticker: str) -> pd.DataFrame:
+            async with semaphore:
+                return await super(AsyncStockRepository, self).load_stock_data_async(ticker, start_date, end_date)
+
+        loaded = await asyncio.gather(*(load(ticker) for ticker in remaining), return_exceptions=True)
+        for ticker, df in zip(remaining, loaded):
+            if isinstance(df, Exception):
+                logger.warning(f"{ticker} 데이터 로드 실패: {df}")
+            else:
+                result[ticker] = df
+        return result
+
+    async def get_tickers_info_batch_async(self, tickers: List[str]) -> Dict[str, Dict[str, Any]]:
+        """여러 티커의 메타데이터 배치 조회 (비동기 드라이버, 실패 시 동기 경로)"""
+        if not tickers:
+            return {}
+        try:
+            return await self._run(yfinance_db._query_ticker_info_batch, tickers)
+        except Exception as e:
+            self._async_stats['errors'] += 1
+            logger.warning(f"메타데이터 비동기 조회 실패 - 동기 경로로 전환: {e}")
+            return await super().get_tickers_info_batch_async(tickers)
+
+    async def get_ticker_info_async(self, ticker: str) -> Dict[str, Any]:
+        """
+        티커 메타데이터 조회
+
+        상장일(first_trade_date)이 없으면 동기 경로(get_ticker_info_from_db)로 넘겨
+        yfinance 보완/저장을 수행합니다.
+        """
+        info = (await self.get_tickers_info_batch_async([ticker])).get(ticker.upper())
+        if info is None or not info.get('first_trade_date'):
+            return await super().get_ticker_info_async(ticker)
+        return info
+
+    async def load_ticker_news_async(self, ticker: str, max_age_hours: int = 3) -> Optional[list]:
+        """뉴스 조회 (비동기 드라이버, 실패 시 None - load_news_from_db와 같은 규칙)"""
+        try:
+            return await self._run(yfinance_db._query_news, ticker, max_age_hours)
+        except Exception as e:
+            logger.error(f"DB 뉴스 조회 실패: {ticker} - {str(e)}")
+            return None
+
+    def get_load_stats(self) -> Dict[str, int]:
+        """단일 비행 통계 + 비동기 경로 통계 (native: 비동기 조회, fallback: 동기 경로 위임)"""
+        return {**super().get_load_stats(), **{f'async_{k}': v for k, v in self._async_stats.items()}}
+
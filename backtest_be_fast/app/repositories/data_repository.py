@@ -8,7 +8,7 @@
 
 **주요 기능**:
 1. get_stock_data(): 주식 데이터 조회
-   - 메모리 캐시 우선 확인
+   - 메모리 캐시 우선 확인 (티커별 병합 프레임에서 하위 구간 슬라이스)
    - DB 조회
    - yfinance API fallback
 2. invalidate_cache(): 캐시 무효화
@@ -16,8 +16,9 @@
 
 **캐싱 전략**:
 - 3단계 캐싱: 메모리 → DB → yfinance API
-- TTL (Time To Live): 메모리 캐시 만료 시간
-- 캐시 키: f"{ticker}:{start_date}:{end_date}"
+- TTL (Time To Live): 커버리지 구간별 만료 시간 (종료일 기준 동적 TTL)
+- 캐시 키: 티커 (요청 구간마다 복사본을 두지 않고 하나의 프레임으로 병합)
+- 메모리 예산: settings.memory_cache_max_mb 초과 시 LRU 제거
 
 **인터페이스**:
 - DataRepositoryInterface: 추상 인터페이스 정의
@@ -26,6 +27,7 @@
 **의존성**:
 - app/services/yfinance_db.py: yfinance 데이터 로딩
 - app/utils/data_fetcher.py: 데이터 페칭 유틸리티
+- app/utils/frame_cache.py: 티커별 바이트 예산 LRU 캐시
 
 **연관 컴포넌트**:
 - Backend: app/services/data_service.py (Repository 사용)
@@ -46,6 +48,8 @@ from abc import ABC, abstractmethod
 from app.utils.data_fetcher import data_fetcher
 from app.repositories.stock_repository import get_stock_repository
 from app.constants.data_loading import CacheConfig
+from app.core.config import settings
+from app.utils.frame_cache import TickerFrameCache
 
 
 class DataRepositoryInterface(ABC):
@@ -79,10 +83,13 @@ class YfinanceDataRepository(DataRepositoryInterface):
     def __init__(self):
         self.data_fetcher = data_fetcher
         self.logger = logging.getLogger(__name__)
-        self._memory_cache: Dict[str, Dict[str, Any]] = {}
+        # 동적 TTL: 과거 데이터 24시간, 최근 데이터 1시간
+        self._memory_cache = TickerFrameCache(
+            max_bytes=settings.memory_cache_max_mb * 1024 * 1024,
+            ttl_resolver=self._get_cache_ttl,
+        )
         # Repository 초기화 (Repository 패턴)
         self.stock_repository = get_stock_repository()
-        # 동적 TTL: 과거 데이터 24시간, 최근 데이터 1시간
 
     def _get_cache_ttl(self, end_date: Union[date, str]) -> int:
         """날짜에 따라 캐시 TTL 결정 (과거 데이터는 길게, 최근 데이터는 짧게)"""
@@ -109,27 +116,19 @@ class YfinanceDataRepository(DataRepositoryInterface):
                            end_date: Union[date, str]) -> pd.DataFrame:
         """주식 데이터 조회 (캐시 우선)"""
         try:
-            # 캐시 키 생성
-            cache_key = f"{ticker}_{start_date}_{end_date}"
-            
             # 1. 메모리 캐시 확인
-            if self._is_cache_valid(cache_key, end_date):
-                self.logger.debug(f"메모리 캐시에서 데이터 반환: {cache_key}")
-                return self._memory_cache[cache_key]['data']
+            cached = self._memory_cache.get(ticker, start_date, end_date)
+            if cached is not None:
+                self.logger.debug(f"메모리 캐시에서 데이터 반환: {ticker} {start_date}~{end_date}")
+                return cached
 
             # 2. MySQL 캐시 확인
             try:
-                cached_data = await asyncio.to_thread(
-                    self.stock_repository.load_stock_data, ticker, start_date, end_date
-                )
+                cached_data = await self.stock_repository.load_stock_data_async(ticker, start_date, end_date)
                 if cached_data is not None and not cached_data.empty:
                     self.logger.debug(f"MySQL 캐시에서 데이터 반환: {ticker}")
                     # 메모리 캐시에도 저장
-                    self._memory_cache[cache_key] = {
-                        'data': cached_data,
-                        'timestamp': datetime.now(),
-                        'end_date': end_date
-                    }
+                    self._memory_cache.put(ticker, start_date, end_date, cached_data)
                     return cached_data
             except Exception as e:
                 self.logger.warning(f"MySQL 캐시 조회 실패: {str(e)}")
@@ -144,12 +143,8 @@ class YfinanceDataRepository(DataRepositoryInterface):
             await self.cache_stock_data(ticker, fresh_data)
 
             # 5. 메모리 캐시에 저장
-            self._memory_cache[cache_key] = {
-                'data': fresh_data,
-                'timestamp': datetime.now(),
-                'end_date': end_date
-            }
-            
+            self._memory_cache.put(ticker, start_date, end_date, fresh_data)
+
             return fresh_data
             
         except Exception as e:
@@ -177,11 +172,7 @@ class YfinanceDataRepository(DataRepositoryInterface):
         """특정 티커의 캐시 무효화"""
         try:
             # 메모리 캐시에서 제거
-            keys_to_remove = [key for key in self._memory_cache.keys() 
-                            if key.startswith(f"{ticker}_")]
-            
-            for key in keys_to_remove:
-                del self._memory_cache[key]
+            self._memory_cache.invalidate(ticker)
             
             # MySQL 캐시에서 제거 (필요시)
             # TODO: MySQL 캐시 무효화 로직 구현
@@ -196,19 +187,21 @@ class YfinanceDataRepository(DataRepositoryInterface):
     async def get_cache_stats(self) -> Dict[str, Any]:
         """캐시 통계 정보"""
         try:
-            # 메모리 캐시 통계
+            # 메모리 캐시 통계 (DataFrame 실측 바이트 기준)
+            cache_stats = self._memory_cache.get_stats()
             memory_stats = {
-                'total_entries': len(self._memory_cache),
-                'memory_usage_mb': len(str(self._memory_cache)) / (1024 * 1024),
-                'oldest_entry': None,
-                'newest_entry': None
+                'total_entries': cache_stats['total_entries'],
+                'memory_usage_bytes': cache_stats['total_bytes'],
+                'memory_usage_mb': cache_stats['total_bytes'] / (1024 * 1024),
+                'memory_budget_mb': cache_stats['max_bytes'] / (1024 * 1024),
+                'hits': cache_stats['hits'],
+                'misses': cache_stats['misses'],
+                'evictions': cache_stats['evictions'],
+                'oldest_entry': cache_stats['oldest_entry'],
+                'newest_entry': cache_stats['newest_entry'],
+                'tickers': cache_stats['tickers'],
             }
             
-            if self._memory_cache:
-                timestamps = [item['timestamp'] for item in self._memory_cache.values()]
-                memory_stats['oldest_entry'] = min(timestamps)
-                memory_stats['newest_entry'] = max(timestamps)
-            
             # MySQL 캐시 통계 (필요시)
             mysql_stats = {
                 'total_tickers': 0,
@@ -219,6 +212,7 @@ class YfinanceDataRepository(DataRepositoryInterface):
             return {
                 'memory_cache': memory_stats,
                 'mysql_cache': mysql_stats,
+                'load_coalescing': self.stock_repository.get_load_stats(),
                 'cache_hit_rate': self._calculate_hit_rate()
             }
             
@@ -226,18 +220,9 @@ class YfinanceDataRepository(DataRepositoryInterface):
             self.logger.error(f"캐시 통계 조회 실패: {str(e)}")
             return {}
     
-    def _is_cache_valid(self, cache_key: str, end_date: Union[date, str]) -> bool:
-        """캐시 유효성 검사 (동적 TTL 적용)"""
-        if cache_key not in self._memory_cache:
-            return False
-
-        cached_time = self._memory_cache[cache_key]['timestamp']
-        elapsed = (datetime.now() - cached_time).total_seconds()
-
-        # 동적 TTL 계산
-        ttl = self._get_cache_ttl(end_date)
-
-        return elapsed < ttl
+    def _calculate_hit_rate(self) -> float:
+        """메모리 캐시 히트율 (0~1)"""
+        return self._memory_cache.hit_rate()
 
 
 # 전역 인스턴스
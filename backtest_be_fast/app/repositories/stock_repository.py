@@ -7,17 +7,25 @@
 - 데이터 소스 독립적인 인터페이스 제공
 
 **주요 기능**:
-1. load_stock_data(): 주가 데이터 조회 (DB 우선)
+1. load_stock_data(): 주가 데이터 조회 (로컬 가격 저장소 → DB 순)
+   - 로컬 가격 저장소 커버리지 안이면 DB 미조회
    - 누락 기간이 있으면 yfinance로 자동 보완
    - 새 데이터를 DB에 저장
-2. save_stock_data(): DataFrame을 DB에 저장
-3. get_ticker_info(): 티커 메타데이터 조회 (currency, first_trade_date 포함)
-4. get_tickers_info_batch(): 여러 티커의 메타데이터 배치 조회
-5. load_ticker_news(): 티커의 뉴스 데이터 조회
-6. save_ticker_news(): 티커의 뉴스 데이터 저장
+   - 같은 티커의 동시 조회는 단일 비행(single-flight)으로 합침
+   - load_stock_data_async(): 재시도 대기를 이벤트 루프에서 수행 (워커 스레드 비점유)
+   - *_async(): 비동기 호출자용 메서드 (기본은 스레드 실행, AsyncStockRepository는 비동기 드라이버 사용)
+2. load_stock_data_batch(): 여러 티커 주가 데이터 일괄 조회 (DB 왕복 1회)
+   - 누락 구간 보완이 필요한 티커는 load_stock_data(단일 비행)로 동시 처리
+   - load_stock_data_batch_async(): 비동기 호출자용
+3. save_stock_data(): DataFrame을 DB에 저장
+4. get_ticker_info(): 티커 메타데이터 조회 (currency, first_trade_date 포함)
+5. get_tickers_info_batch(): 여러 티커의 메타데이터 배치 조회
+6. load_ticker_news(): 티커의 뉴스 데이터 조회
+7. save_ticker_news(): 티커의 뉴스 데이터 저장
 
 **의존성**:
 - app.services.yfinance_db: 실제 데이터 접근 구현
+- app.services.price_store: 로컬 열 지향 가격 저장소 (읽기 가속)
 - pandas: 데이터 처리
 
 **연관 컴포넌트**:
@@ -26,15 +34,22 @@
 - Backend: app/services/data_service.py (Repository 사용)
 - Backend: app/repositories/data_repository.py (Repository 사용)
 - Backend: app/utils/currency_converter.py (Repository 사용)
+- Backend: app/repositories/async_stock_repository.py (비동기 DB 구현, settings.db_async_enabled)
 """
 
 from typing import Optional, Union, List, Dict, Any
-from datetime import date
+from datetime import date, datetime
 import pandas as pd
+import asyncio
 import logging
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 
+from app.constants.data_loading import IngestionConfig
 from app.services import yfinance_db
+from app.services.price_store import local_price_store
+from app.utils.retry import retry_async
 
 logger = logging.getLogger(__name__)
 
@@ -66,6 +81,26 @@ class StockRepositoryInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    def load_stock_data_batch(
+        self,
+        tickers: List[str],
+        start_date: Optional[Union[str, date]] = None,
+        end_date: Optional[Union[str, date]] = None
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        여러 티커의 주가 데이터 일괄 조회
+
+        Args:
+            tickers: 종목 심볼 리스트
+            start_date: 시작 날짜
+            end_date: 종료 날짜
+
+        Returns:
+            티커별 주가 데이터 (로드 실패 티커는 제외)
+        """
+        pass
+
     @abstractmethod
     def save_stock_data(self, ticker: str, df: pd.DataFrame) -> int:
         """
@@ -135,12 +170,53 @@ class StockRepositoryInterface(ABC):
         pass
 
 
+def _to_bound(value: Optional[Union[str, date]]) -> Optional[date]:
+    """조회 구간 경계를 date로 정규화합니다 (None은 그대로)."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return datetime.strptime(value, '%Y-%m-%d').date()
+    if isinstance(value, datetime):
+        return value.date()
+    return value
+
+
+class _InFlightLoad:
+    """진행 중인 주가 조회 1건 (대기자들이 결과를 공유)"""
+
+    __slots__ = ('start', 'end', 'done', 'result', 'error')
+
+    def __init__(self, start: Optional[date], end: Optional[date]):
+        self.start = start
+        self.end = end
+        self.done = threading.Event()
+        self.result: Optional[pd.DataFrame] = None
+        self.error: Optional[BaseException] = None
+
+    def covers(self, start: Optional[date], end: Optional[date]) -> bool:
+        """요청 구간이 이 조회 구간에 포함되는지 여부"""
+        if (self.start, self.end) == (start, end):
+            return True
+        if None in (self.start, self.end, start, end):
+            return False
+        return self.start <= start and end <= self.end
+
+    def overlaps(self, start: Optional[date], end: Optional[date]) -> bool:
+        """요청 구간과 겹치는지 여부 (경계가 없으면 겹친다고 간주)"""
+        return ((self.start is None or end is None or self.start <= end)
+                and (self.end is None or start is None or start <= self.end))
+
+
 class StockRepository(StockRepositoryInterface):
     """yfinance_db를 기반으로 하는 주식 데이터 Repository 구현"""
 
     def __init__(self):
         """주식 Repository 초기화"""
         self.logger = logger
+        # 단일 비행(single-flight): 티커별 진행 중인 조회 목록
+        self._inflight: Dict[str, List[_InFlightLoad]] = {}
+        self._inflight_lock = threading.Lock()
+        self._load_stats = {'loads': 0, 'coalesced': 0, 'serialized': 0}
         self.logger.info("StockRepository 초기화됨")
 
     def load_stock_data(
@@ -165,14 +241,203 @@ class StockRepository(StockRepositoryInterface):
 
         Returns:
             주가 데이터 DataFrame
+
+        Note:
+            - 로컬 가격 저장소(price_store)의 커버리지 안이면 DB를 거치지 않고 반환
+            - DB 경로로 읽은 결과는 로컬 가격 저장소에 반영
+            - 같은 티커의 진행 중인 조회가 요청 구간을 포함하면 그 결과를 기다려 공유
+              (겹치기만 하면 끝날 때까지 기다린 뒤 조회하여 누락 구간 보완/upsert 경합 방지)
+        """
+        cached = local_price_store.read(ticker, start_date, end_date)
+        if cached is not None:
+            self.logger.debug(f"{ticker} 로컬 가격 저장소 히트 ({start_date} ~ {end_date}, {len(cached)}행)")
+            return cached
+
+        start, end = _to_bound(start_date), _to_bound(end_date)
+
+        with self._inflight_lock:
+            flights = self._inflight.setdefault(ticker, [])
+            leader = next((f for f in flights if f.covers(start, end)), None)
+            if leader is None:
+                overlapping = [f for f in flights if f.overlaps(start, end)]
+                flight = _InFlightLoad(start, end)
+                flights.append(flight)
+                self._load_stats['loads'] += 1
+                if overlapping:
+                    self._load_stats['serialized'] += 1
+            else:
+                self._load_stats['coalesced'] += 1
+
+        if leader is not None:
+            return self._await_flight(ticker, leader, start, end)
+
+        try:
+            for other in overlapping:
+                other.done.wait()
+            flight.result = self._load_from_db(ticker, start_date, end_date, max_retries, retry_delay)
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._inflight_lock:
+                flights = self._inflight.get(ticker, [])
+                flights.remove(flight)
+                if not flights:
+                    self._inflight.pop(ticker, None)
+            flight.done.set()
+
+    async def load_stock_data_async(
+        self,
+        ticker: str,
+        start_date: Optional[Union[str, date]] = None,
+        end_date: Optional[Union[str, date]] = None,
+        max_retries: int = 3,
+        retry_delay: float = 2.0
+    ) -> pd.DataFrame:
+        """
+        주가 데이터 조회 (비동기, 비차단 재시도)
+
+        시도마다 load_stock_data를 재시도 없이(1회) 스레드에서 실행하고,
+        재시도 대기는 이벤트 루프에서 수행하여 대기 중 워커 스레드를 반환합니다.
+
+        Args:
+            ticker: 종목 심볼
+            start_date: 시작 날짜
+            end_date: 종료 날짜
+            max_retries: 최대 재시도 횟수
+            retry_delay: 재시도 간 대기 시간 (초, 시도마다 선형 증가)
+
+        Returns:
+            주가 데이터 DataFrame
+
+        Raises:
+            ValueError: 모든 재시도 실패 시
         """
-        return yfinance_db.load_ticker_data(
+        return await retry_async(
+            lambda: asyncio.to_thread(self.load_stock_data, ticker, start_date, end_date, 1, 0.0),
+            max_retries=max_retries,
+            retry_delay=retry_delay,
+            label=f"{ticker} 데이터 로드",
+        )
+
+    def _await_flight(
+        self,
+        ticker: str,
+        flight: _InFlightLoad,
+        start: Optional[date],
+        end: Optional[date]
+    ) -> pd.DataFrame:
+        """진행 중인 조회를 기다려 요청 구간만 잘라 반환합니다."""
+        self.logger.debug(f"{ticker} 진행 중인 조회에 합류 ({flight.start} ~ {flight.end})")
+        flight.done.wait()
+        if flight.error is not None:
+            raise flight.error
+        df = flight.result
+        if df is None or df.empty:
+            return df
+        if (flight.start, flight.end) == (start, end):
+            # 호출자 간 같은 객체 공유 방지 (index 재할당 등)
+            return df.copy(deep=False)
+        return df.loc[pd.Timestamp(start):pd.Timestamp(end)]
+
+    def _load_from_db(
+        self,
+        ticker: str,
+        start_date: Optional[Union[str, date]],
+        end_date: Optional[Union[str, date]],
+        max_retries: int,
+        retry_delay: float
+    ) -> pd.DataFrame:
+        """DB(누락 구간은 yfinance 보완) 조회 후 로컬 가격 저장소에 반영합니다."""
+        df = yfinance_db.load_ticker_data(
             ticker=ticker,
             start_date=start_date,
             end_date=end_date,
             max_retries=max_retries,
             retry_delay=retry_delay
         )
+        local_price_store.record_load(ticker, df, start_date, end_date)
+        return df
+
+    def load_stock_data_batch(
+        self,
+        tickers: List[str],
+        start_date: Optional[Union[str, date]] = None,
+        end_date: Optional[Union[str, date]] = None
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        여러 티커의 주가 데이터 일괄 조회
+
+        로컬 가격 저장소에 없는 티커 중 누락 구간이 없는 티커는 yfinance_db.load_ticker_data_batch로
+        한 번에 조회하고 (티커 수와 무관하게 DB 쿼리 3회), 나머지는 load_stock_data로 동시에 조회합니다.
+
+        Args:
+            tickers: 종목 심볼 리스트
+            start_date: 시작 날짜
+            end_date: 종료 날짜
+
+        Returns:
+            티커별 주가 데이터 (로드 실패 티커는 제외, 실패는 로그로 남김)
+
+        Note:
+            - 배치 결과에서 빠진 티커(DB에 없음, 누락 구간 보완 필요, 배치 조회 실패)는
+              load_stock_data로 처리하여 재시도/단일 비행 동작 유지
+              (동시 처리 수: IngestionConfig.GAP_FILL_CONCURRENCY)
+        """
+        result: Dict[str, pd.DataFrame] = {}
+        pending: List[str] = []
+        for ticker in dict.fromkeys(tickers):
+            cached = local_price_store.read(ticker, start_date, end_date)
+            if cached is not None:
+                result[ticker] = cached
+            else:
+                pending.append(ticker)
+        if not pending:
+            return result
+
+        try:
+            loaded = yfinance_db.load_ticker_data_batch(pending, start_date, end_date)
+        except Exception as e:
+            self.logger.warning(f"주가 배치 조회 실패 - 티커별 조회로 전환: {e}")
+            loaded = {}
+
+        remaining: List[str] = []
+        for ticker in pending:
+            df = loaded.get(ticker)
+            if df is not None and not df.empty:
+                local_price_store.record_load(ticker, df, start_date, end_date)
+                result[ticker] = df
+            else:
+                remaining.append(ticker)
+        if not remaining:
+            return result
+
+        workers = min(len(remaining), IngestionConfig.GAP_FILL_CONCURRENCY)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='gap-fill') as pool:
+            futures = {ticker: pool.submit(self.load_stock_data, ticker, start_date, end_date) for ticker in remaining}
+        for ticker, future in futures.items():
+            try:
+                result[ticker] = future.result()
+            except Exception as e:
+                self.logger.warning(f"{ticker} 데이터 로드 실패: {e}")
+
+        return result
+
+    async def load_stock_data_batch_async(
+        self,
+        tickers: List[str],
+        start_date: Optional[Union[str, date]] = None,
+        end_date: Optional[Union[str, date]] = None
+    ) -> Dict[str, pd.DataFrame]:
+        """load_stock_data_batch의 비동기 버전 (기본 구현: 스레드에서 실행)"""
+        return await asyncio.to_thread(self.load_stock_data_batch, tickers, start_date, end_date)
+
+    def get_load_stats(self) -> Dict[str, int]:
+        """주가 조회 단일 비행 통계 (실제 조회/합류/직렬화 횟수, 진행 중인 조회 수)"""
+        with self._inflight_lock:
+            in_flight = sum(len(flights) for flights in self._inflight.values())
+            return {**self._load_stats, 'in_flight': in_flight}
 
     def save_stock_data(self, ticker: str, df: pd.DataFrame) -> int:
         """
@@ -233,6 +498,18 @@ class StockRepository(StockRepositoryInterface):
         """
         return yfinance_db.load_news_from_db(ticker=ticker, max_age_hours=max_age_hours)
 
+    async def get_ticker_info_async(self, ticker: str) -> Dict[str, Any]:
+        """get_ticker_info의 비동기 버전 (기본 구현: 스레드에서 실행)"""
+        return await asyncio.to_thread(self.get_ticker_info, ticker)
+
+    async def get_tickers_info_batch_async(self, tickers: List[str]) -> Dict[str, Dict[str, Any]]:
+        """get_tickers_info_batch의 비동기 버전 (기본 구현: 스레드에서 실행)"""
+        return await asyncio.to_thread(self.get_tickers_info_batch, tickers)
+
+    async def load_ticker_news_async(self, ticker: str, max_age_hours: int = 3) -> Optional[list]:
+        """load_ticker_news의 비동기 버전 (기본 구현: 스레드에서 실행)"""
+        return await asyncio.to_thread(self.load_ticker_news, ticker, max_age_hours)
+
     def save_ticker_news(self, ticker: str, news_list: list) -> int:
         """
         티커의 뉴스 데이터 저장
@@ -254,8 +531,19 @@ _stock_repository_instance: Optional[StockRepository] = None
 
 
 def get_stock_repository() -> StockRepository:
-    """StockRepository 싱글톤 인스턴스 획득"""
+    """
+    StockRepository 싱글톤 인스턴스 획득
+
+    settings.db_async_enabled이면 비동기 DB 드라이버를 쓰는 AsyncStockRepository를 반환합니다
+    (동기 메서드는 두 구현이 같으므로 스크립트/동기 호출자는 영향 없음).
+    """
     global _stock_repository_instance
     if _stock_repository_instance is None:
-        _stock_repository_instance = StockRepository()
+        from app.core.config import settings
+
+        if settings.db_async_enabled:
+            from app.repositories.async_stock_repository import AsyncStockRepository
+            _stock_repository_instance = AsyncStockRepository()
+        else:
+            _stock_repository_instance = StockRepository()
     return _stock_repository_instance
@@ -77,3 +77,89 @@ class BacktestRequest(BaseModel):
                 "benchmark_ticker": "MSFT"
             }
         }
+
+
+OPTIMIZATION_SEARCH_MODES = ('grid', 'random')
+
+
+class OptimizationRequest(BacktestRequest):
+    """전략 파라미터 최적화 요청 모델 (strategy_params는 탐색하지 않는 고정 파라미터)"""
+    param_grid: Dict[str, List[Union[int, float]]] = Field(
+        ..., min_length=1, description="탐색할 파라미터별 후보 값 목록"
+    )
+    search_mode: str = Field(default="grid", description="탐색 방식 (grid: 전체 조합, random: 무작위 표본)")
+    n_samples: Optional[int] = Field(default=None, gt=0, description="random 모드 표본 수 (기본: 최대 조합 수)")
+    max_combinations: Optional[int] = Field(
+        default=None, gt=0, description=f"평가할 최대 조합 수 (서버 상한 {settings.optimization_max_combinations})"
+    )
+    rank_by: str = Field(default="sharpe_ratio", description="순위 기준 지표")
+    heatmap_params: Optional[List[str]] = Field(
+        default=None, min_length=2, max_length=2, description="히트맵 축 파라미터 [x, y] (기본: 앞의 두 탐색 파라미터)"
+    )
+    seed: Optional[int] = Field(default=None, description="random 모드 난수 시드")
+    job_id: Optional[str] = Field(default=None, max_length=64, description="진행률 조회용 작업 ID (미지정 시 자동 생성)")
+
+    @field_validator('param_grid')
+    @classmethod
+    def validate_param_grid(cls, v):
+        """후보 값 목록이 비어 있지 않은지 검증"""
+        for name, values in v.items():
+            if not values:
+                raise ValueError(f'{name}의 후보 값 목록이 비어 있습니다')
+        return v
+
+    @field_validator('search_mode')
+    @classmethod
+    def validate_search_mode(cls, v):
+        if v not in OPTIMIZATION_SEARCH_MODES:
+            raise ValueError(f'탐색 방식은 {", ".join(OPTIMIZATION_SEARCH_MODES)} 중 하나여야 합니다')
+        return v
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "ticker": "AAPL",
+                "start_date": "2020-01-01",
+                "end_date": "2023-12-31",
+                "initial_cash": 10000.0,
+                "strategy": "sma_strategy",
+                "param_grid": {
+                    "short_window": [5, 10, 15, 20],
+                    "long_window": [20, 50, 100, 200]
+                },
+                "search_mode": "grid",
+                "rank_by": "sharpe_ratio",
+                "commission": 0.002
+            }
+        }
+
+
+class WalkForwardRequest(OptimizationRequest):
+    """
+    워크포워드 분석 요청 모델
+
+    in_sample_bars 구간에서 파라미터를 최적화하고 바로 뒤 out_of_sample_bars 구간에서 평가하며,
+    윈도우를 out_of_sample_bars씩 이동해 전체 기간을 검증합니다.
+    """
+    in_sample_bars: int = Field(default=252, ge=20, description="최적화(in-sample) 구간 봉 수")
+    out_of_sample_bars: int = Field(default=63, ge=5, description="검증(out-of-sample) 구간 봉 수 (윈도우 이동 간격)")
+    anchored: bool = Field(default=False, description="True면 in-sample 시작을 첫 봉에 고정 (확장 윈도우)")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "ticker": "AAPL",
+                "start_date": "2015-01-01",
+                "end_date": "2023-12-31",
+                "initial_cash": 10000.0,
+                "strategy": "ema_strategy",
+                "param_grid": {
+                    "fast_window": [5, 10, 20],
+                    "slow_window": [30, 50, 100]
+                },
+                "rank_by": "sharpe_ratio",
+                "in_sample_bars": 504,
+                "out_of_sample_bars": 126,
+                "commission": 0.002
+            }
+        }
@@ -26,6 +26,9 @@
    - start_date, end_date: 백테스트 기간
    - rebalance_frequency: 리밸런싱 주기
    - commission: 거래 수수료
+   - monte_carlo: 몬테카를로 강건성 시뮬레이션 옵션 (선택)
+
+3. MonteCarloOptions: 일일 수익률 재표본 시뮬레이션 설정
 
 **기본 검증 (Pydantic)**:
 - 날짜 형식: YYYY-MM-DD
@@ -51,7 +54,7 @@
 - Frontend: src/features/backtest/model/backtest-types.ts (TypeScript 타입)
 """
 from pydantic import BaseModel, Field, field_validator, model_validator
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Literal
 from datetime import datetime
 import numpy as np
 import re
@@ -140,6 +143,14 @@ class PortfolioStock(BaseModel):
             raise ValueError(f'DCA 주기는 {", ".join(FREQUENCY_MAP.keys())} 중 하나여야 합니다.')
         return v
 
+class MonteCarloOptions(BaseModel):
+    """몬테카를로 강건성 시뮬레이션 옵션"""
+    n_paths: int = Field(1000, ge=100, le=settings.monte_carlo_max_paths, description="재표본 경로 수")
+    method: Literal['bootstrap', 'block'] = Field('bootstrap', description="재표본 방식 (bootstrap: 일별 복원 추출, block: 연속 구간 추출)")
+    block_size: int = Field(20, ge=2, le=252, description="block 방식의 블록 길이 (거래일)")
+    seed: Optional[int] = Field(None, description="난수 시드 (지정 시 재현 가능)")
+
+
 class PortfolioBacktestRequest(BaseModel):
     """포트폴리오 백테스트 요청 모델"""
     portfolio: List[PortfolioStock] = Field(..., min_length=1, max_length=settings.max_portfolio_items, description="포트폴리오 구성")
@@ -149,6 +160,7 @@ class PortfolioBacktestRequest(BaseModel):
     rebalance_frequency: str = Field("monthly_1", description="리밸런싱 주기 (weekly_1, weekly_2, monthly_1, monthly_2, monthly_3, monthly_6, monthly_12, none)")
     strategy: str = Field("buy_and_hold", description="전략명")
     strategy_params: Optional[Dict[str, Any]] = Field(default_factory=dict, description="전략 파라미터")
+    monte_carlo: Optional[MonteCarloOptions] = Field(None, description="몬테카를로 강건성 시뮬레이션 옵션 (생략 시 미실행)")
     
     @field_validator('portfolio')
     @classmethod
@@ -25,6 +25,9 @@
 - backtesting.py: 백테스팅 라이브러리
 - app/utils/data_fetcher.py: 데이터 조회
 - app/services/strategy_service.py: 전략 관리
+- app/services/backtest_executor.py: bt.run() 프로세스 풀 실행
+- app/services/strategy_vector_engine.py: 기본 전략 벡터화 실행 (settings.strategy_backtest_engine)
+- app/utils/metrics.py: 단계별 시간 측정 (data_load, fx_conversion, strategy_run)
 
 **연관 컴포넌트**:
 - Backend: app/services/backtest_service.py (서비스 레이어)
@@ -37,6 +40,7 @@
 """
 import asyncio
 import logging
+import time
 from datetime import datetime, timedelta, date
 from typing import Dict, Any, Optional, List, Type
 from uuid import uuid4
@@ -52,10 +56,14 @@ from app.utils.data_fetcher import data_fetcher, InvalidSymbolError as DataFetch
 from app.repositories.data_repository import data_repository
 from app.services.strategy_service import strategy_service
 from app.services.validation_service import validation_service
+from app.core.config import settings
 from app.core.exceptions import ValidationError
 from app.constants.currencies import SUPPORTED_CURRENCIES
 from app.utils.currency_converter import currency_converter
 from app.utils.type_converters import safe_float, safe_int
+from app.services.backtest_executor import backtest_executor, run_backtest_with_fallback
+from app.services.strategy_vector_engine import strategy_vector_engine
+from app.utils.metrics import span
 
 
 class BacktestEngine:
@@ -66,15 +74,20 @@ class BacktestEngine:
         data_repository=None,
         strategy_service_instance=None,
         validation_service_instance=None,
+        executor=None,
+        vector_engine=None,
     ):
         self.data_repository = data_repository
         self.data_fetcher = data_fetcher
         self.strategy_service = strategy_service_instance or strategy_service
         self.validation_service = validation_service_instance or validation_service
+        self.executor = executor or backtest_executor
+        self.vector_engine = vector_engine or strategy_vector_engine
         self.logger = logging.getLogger(__name__)
     
     async def run_backtest(self, request: BacktestRequest) -> BacktestResult:
         """백테스트 실행"""
+        started = time.perf_counter()
         try:
             # 요청 검증
             self.validation_service.validate_backtest_request(request)
@@ -105,18 +118,8 @@ class BacktestEngine:
             self.logger.info(f"초기 자본: ${request.initial_cash}")
             
             # 백테스트 실행
-            bt = Backtest(
-                data,
-                strategy_class,
-                cash=request.initial_cash,
-                commission=request.commission,
-            )
-            self.logger.debug("백테스트 객체 생성 완료")
-            
             try:
-                run_kwargs = self._build_run_kwargs(request)
-                # FIXED: Wrap synchronous bt.run() with asyncio.to_thread() (async/sync boundary)
-                result = await asyncio.to_thread(self._execute_backtest, bt, run_kwargs)
+                result = await self._run_strategy(data, strategy_class, request)
                 self.logger.info("백테스트 실행 완료")
                 self.logger.info(f"거래 수: {result['# Trades']}")
                 self.logger.info(f"수익률: {result.get('Return [%]', 0):.2f}%")
@@ -130,7 +133,7 @@ class BacktestEngine:
                 
                 # 결과가 유효한지 확인
                 if result is not None and '# Trades' in result:
-                    return self._convert_result_to_response(result, request)
+                    return self._convert_result_to_response(result, request, started)
                 else:
                     self.logger.warning(f"백테스트 결과가 유효하지 않음 ({request.ticker}), fallback 사용")
                     raise Exception(f"백테스트 결과가 유효하지 않습니다: {request.ticker}")
@@ -139,7 +142,7 @@ class BacktestEngine:
                 self.logger.error(f"백테스트 실행 중 오류: {e}")
                 self.logger.info("Fallback 통계 생성 중...")
                 # 실제 주가 변동을 반영한 fallback 통계 생성
-                return self._create_fallback_result(data, request)
+                return self._create_fallback_result(data, request, started)
             
         except Exception as e:
             self.logger.error(f"백테스트 전체 프로세스 오류: {e}")
@@ -171,16 +174,17 @@ class BacktestEngine:
         self, ticker: str, start_date: str, end_date: str
     ) -> pd.DataFrame:
         """캐시-우선 가격 데이터 조회"""
-        if self.data_repository:
-            data = await self.data_repository.get_stock_data(ticker, start_date, end_date)
-        else:
-            # 동기 data_fetcher를 안전하게 async로 실행
-            data = await asyncio.to_thread(
-                self.data_fetcher.fetch_stock_data,
-                ticker=ticker,
-                start_date=start_date,
-                end_date=end_date,
-            )
+        with span('data_load'):
+            if self.data_repository:
+                data = await self.data_repository.get_stock_data(ticker, start_date, end_date)
+            else:
+                # 동기 data_fetcher를 안전하게 async로 실행
+                data = await asyncio.to_thread(
+                    self.data_fetcher.fetch_stock_data,
+                    ticker=ticker,
+                    start_date=start_date,
+                    end_date=end_date,
+                )
 
         if data is None or data.empty:
             raise HTTPException(status_code=404, detail=f"가격 데이터를 찾을 수 없습니다: {ticker}")
@@ -215,12 +219,13 @@ class BacktestEngine:
         Note:
             Phase 2.3 리팩토링: 중복 코드를 currency_converter.py로 추출
         """
-        return await currency_converter.convert_dataframe_to_usd(
-            ticker=ticker,
-            data=data,
-            start_date=start_date,
-            end_date=end_date
-        )
+        with span('fx_conversion'):
+            return await currency_converter.convert_dataframe_to_usd(
+                ticker=ticker,
+                data=data,
+                start_date=start_date,
+                end_date=end_date
+            )
 
     def _build_strategy(
         self, strategy_name: str, params: Optional[Dict[str, Any]]
@@ -274,21 +279,68 @@ class BacktestEngine:
             run_kwargs["spread"] = request.spread
         return run_kwargs
 
+    async def _run_strategy(
+        self, data: pd.DataFrame, strategy_class: Type[Strategy], request: BacktestRequest
+    ) -> pd.Series:
+        """
+        전략별 실행 엔진을 선택해 백테스트를 실행합니다.
+
+        1. 벡터화 엔진이 지원하는 기본 전략: 신호 배열 기반 실행 (봉별 콜백 없음)
+        2. 그 외: backtesting.py bt.run() (프로세스 풀 사용 가능 시 프로세스, 아니면 스레드)
+        """
+        with span('strategy_run'):
+            return await self._dispatch_strategy(data, strategy_class, request)
+
+    async def _dispatch_strategy(
+        self, data: pd.DataFrame, strategy_class: Type[Strategy], request: BacktestRequest
+    ) -> pd.Series:
+        """실행 엔진 선택 및 실행 (_run_strategy 참고)"""
+        if (
+            settings.strategy_backtest_engine == 'vectorized'
+            and self.vector_engine.supports(strategy_class, data)
+        ):
+            return await asyncio.to_thread(
+                self.vector_engine.run,
+                data,
+                strategy_class,
+                request.initial_cash,
+                request.commission,
+                request.spread or 0.0,
+            )
+
+        run_kwargs = self._build_run_kwargs(request)
+        if self.executor.enabled:
+            # CPU 바운드 bt.run()을 프로세스 풀에서 실행 (GIL 우회, 멀티코어 병렬)
+            return await self.executor.run(
+                data,
+                strategy_class,
+                {'cash': request.initial_cash, 'commission': request.commission},
+                run_kwargs,
+            )
+
+        bt = Backtest(
+            data,
+            strategy_class,
+            cash=request.initial_cash,
+            commission=request.commission,
+        )
+        # FIXED: Wrap synchronous bt.run() with asyncio.to_thread() (async/sync boundary)
+        return await asyncio.to_thread(self._execute_backtest, bt, run_kwargs)
+
     def _execute_backtest(self, bt: Backtest, run_kwargs: Dict[str, Any]) -> pd.Series:
         """Backtest 실행 래퍼 (옵션 인자 호환성 처리)"""
-        try:
-            if run_kwargs:
-                return bt.run(**run_kwargs)
-            return bt.run()
-        except TypeError as error:
-            # 일부 backtesting 버전은 spread 매개변수를 지원하지 않음
-            if "spread" in run_kwargs and "spread" in str(error):
-                self.logger.warning("Backtest.run spread 인자 미지원 - spread 제외 후 재시도")
-                safe_kwargs = {k: v for k, v in run_kwargs.items() if k != "spread"}
-                return bt.run(**safe_kwargs) if safe_kwargs else bt.run()
-            raise
-
-    def _create_fallback_result(self, data: pd.DataFrame, request: BacktestRequest) -> BacktestResult:
+        return run_backtest_with_fallback(bt, run_kwargs)
+
+    @staticmethod
+    def _elapsed_seconds(started: Optional[float]) -> float:
+        """run_backtest 시작 시점부터의 경과 시간 (초, 시작 시점이 없으면 0)"""
+        if started is None:
+            return 0.0
+        return round(time.perf_counter() - started, 3)
+
+    def _create_fallback_result(
+        self, data: pd.DataFrame, request: BacktestRequest, started: Optional[float] = None
+    ) -> BacktestResult:
         """실제 데이터 기반의 fallback 결과 생성"""
         try:
             fallback_stats = self.validation_service.create_fallback_stats(data, request.initial_cash)
@@ -330,7 +382,7 @@ class BacktestEngine:
                 beta=None,
                 kelly_criterion=None,
                 sqn=None,
-                execution_time_seconds=0.1,
+                execution_time_seconds=self._elapsed_seconds(started),
                 timestamp=datetime.now()
             )
             
@@ -366,11 +418,13 @@ class BacktestEngine:
                 kelly_criterion=None,
                 sqn=None,
                 trade_log=[],
-                execution_time_seconds=0.1,
+                execution_time_seconds=self._elapsed_seconds(started),
                 timestamp=datetime.now()
             )
 
-    def _convert_result_to_response(self, stats: pd.Series, request: BacktestRequest) -> BacktestResult:
+    def _convert_result_to_response(
+        self, stats: pd.Series, request: BacktestRequest, started: Optional[float] = None
+    ) -> BacktestResult:
         """백테스트 결과를 API 응답 형식으로 변환"""
         try:
             # duration_days 계산
@@ -475,12 +529,12 @@ class BacktestEngine:
                 sqn=safe_float(stats.get('SQN', 0.0)) if 'SQN' in stats else None,
                 trade_log=trade_log,
                 equity_curve=equity_curve_dict,  # 일일 자산 가치
-                execution_time_seconds=0.5,  # 추후 실제 시간 측정 추가
+                execution_time_seconds=self._elapsed_seconds(started),
                 timestamp=datetime.now()
             )
         except Exception as e:
             self.logger.error(f"결과 변환 실패: {str(e)}")
-            return self._create_fallback_result(pd.DataFrame(), request)
+            return self._create_fallback_result(pd.DataFrame(), request, started)
 
 
 # 글로벌 인스턴스
@@ -0,0 +1,266 @@
+"""
+백테스트 프로세스 풀 실행기
+
+**역할**:
+- backtesting.py의 bt.run()(CPU 바운드 순수 Python)을 별도 프로세스에서 실행
+- GIL 때문에 asyncio.to_thread로는 얻을 수 없는 멀티코어 병렬성 제공
+- 여러 종목의 전략 백테스트를 동시에 요청하면 워커 수만큼 병렬 실행
+
+**데이터 전달**:
+- 가격 DataFrame은 공유 메모리(multiprocessing.shared_memory)에 한 번 복사
+  (인덱스 int64 ns + 열별 float64), 워커는 이름으로 연결하여 복원
+- 공유 메모리로 표현할 수 없는 열(object 등)이 있으면 pickle로 전달
+- 전략 클래스는 import 가능한 기본 전략 + 파라미터 오버라이드로 분해하여 전달
+  (BacktestEngine._build_strategy가 동적으로 만든 클래스는 pickle 불가)
+
+**설정** (app/core/config.py):
+- backtest_process_workers: 워커 수 (0이면 CPU 수, 1 이하로 해석되면 프로세스 풀 미사용)
+- backtest_job_timeout_seconds: 작업당 타임아웃 (초)
+
+**의존성**:
+- backtesting.py: Backtest
+- concurrent.futures.ProcessPoolExecutor (spawn 컨텍스트)
+
+**연관 컴포넌트**:
+- Backend: app/services/backtest_engine.py (_execute_backtest 위임)
+- Backend: app/services/portfolio_service.py (종목별 전략 백테스트 동시 실행)
+- Backend: app/main.py (종료 시 풀 정리)
+"""
+import asyncio
+import logging
+import multiprocessing
+import os
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, Optional, Tuple, Type
+
+import numpy as np
+import pandas as pd
+from backtesting import Backtest, Strategy
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def run_backtest_with_fallback(bt: Backtest, run_kwargs: Dict[str, Any]) -> pd.Series:
+    """Backtest 실행 래퍼 (옵션 인자 호환성 처리)"""
+    try:
+        if run_kwargs:
+            return bt.run(**run_kwargs)
+        return bt.run()
+    except TypeError as error:
+        # 일부 backtesting 버전은 spread 매개변수를 지원하지 않음
+        if "spread" in run_kwargs and "spread" in str(error):
+            logger.warning("Backtest.run spread 인자 미지원 - spread 제외 후 재시도")
+            safe_kwargs = {k: v for k, v in run_kwargs.items() if k != "spread"}
+            return bt.run(**safe_kwargs) if safe_kwargs else bt.run()
+        raise
+
+
+def _share_frame(data: pd.DataFrame) -> Tuple[Optional[SharedMemory], Dict[str, Any]]:
+    """DataFrame을 공유 메모리에 복사합니다. 표현할 수 없으면 (None, pickle용 payload)."""
+    numeric = all(
+        pd.api.types.is_float_dtype(dtype) or pd.api.types.is_integer_dtype(dtype)
+        for dtype in data.dtypes
+    )
+    if not numeric or not isinstance(data.index, pd.DatetimeIndex) or data.empty:
+        return None, {'frame': data}
+
+    n_rows, n_cols = len(data), len(data.columns)
+    shm = SharedMemory(create=True, size=8 * n_rows * (n_cols + 1))
+    try:
+        index_view = np.ndarray((n_rows,), dtype=np.int64, buffer=shm.buf)
+        index_view[:] = data.index.as_unit('ns').asi8
+        values_view = np.ndarray((n_cols, n_rows), dtype=np.float64, buffer=shm.buf, offset=8 * n_rows)
+        for i, column in enumerate(data.columns):
+            values_view[i] = data[column].to_numpy(dtype=np.float64)
+        del index_view, values_view
+    except Exception:
+        shm.close()
+        shm.unlink()
+        raise
+
+    meta = {
+        'shm_name': shm.name,
+        'rows': n_rows,
+        'columns': list(data.columns),
+        'dtypes': [str(dtype) for dtype in data.dtypes],
+        'index_name': data.index.name,
+        'index_tz': str(data.index.tz) if data.index.tz is not None else None,
+        'index_unit': data.index.unit,
+    }
+    return shm, meta
+
+
+def _attach_frame(meta: Dict[str, Any]) -> pd.DataFrame:
+    """(워커) 공유 메모리에서 DataFrame을 복원합니다 (복사본)."""
+    if 'frame' in meta:
+        return meta['frame']
+
+    try:
+        shm = SharedMemory(name=meta['shm_name'], track=False)
+    except TypeError:
+        # Python < 3.13: track 인자 없음. 부모와 같은 resource tracker를 공유하므로
+        # 워커에서 등록하지 않도록 막는다 (수명 관리는 부모 프로세스가 담당)
+        register = resource_tracker.register
+        resource_tracker.register = lambda *args, **kwargs: None
+        try:
+            shm = SharedMemory(name=meta['shm_name'])
+        finally:
+            resource_tracker.register = register
+
+    try:
+        n_rows, columns = meta['rows'], meta['columns']
+        index_values = np.ndarray((n_rows,), dtype=np.int64, buffer=shm.buf).copy()
+        values = np.ndarray((len(columns), n_rows), dtype=np.float64, buffer=shm.buf, offset=8 * n_rows).copy()
+    finally:
+        shm.close()
+
+    index = pd.DatetimeIndex(index_values.view('datetime64[ns]'), name=meta['index_name'])
+    if meta['index_tz'] is not None:
+        index = index.tz_localize('UTC').tz_convert(meta['index_tz'])
+    index = index.as_unit(meta['index_unit'])
+
+    return pd.DataFrame(
+        {column: values[i].astype(dtype) for i, (column, dtype) in enumerate(zip(columns, meta['dtypes']))},
+        index=index,
+    )
+
+
+def _portable_strategy(strategy_class: Type[Strategy]) -> Tuple[Type[Strategy], Dict[str, Any]]:
+    """전략 클래스를 (import 가능한 기본 클래스, 파라미터 오버라이드)로 분해합니다."""
+    def importable(cls) -> bool:
+        module = sys.modules.get(cls.__module__)
+        return getattr(module, cls.__qualname__, None) is cls
+
+    if importable(strategy_class):
+        return strategy_class, {}
+
+    base = strategy_class.__bases__[0]
+    if not importable(base):
+        raise TypeError(f"프로세스로 전달할 수 없는 전략 클래스입니다: {strategy_class.__name__}")
+    overrides = {k: v for k, v in vars(strategy_class).items() if not k.startswith('_')}
+    return base, overrides
+
+
+def _run_job(job: Dict[str, Any]) -> pd.Series:
+    """(워커) 공유 메모리 데이터로 백테스트 1건을 실행합니다."""
+    data = _attach_frame(job['frame'])
+    strategy_class = job['strategy']
+    if job['overrides']:
+        strategy_class = type(f"{strategy_class.__name__}Configured", (strategy_class,), job['overrides'])
+
+    bt = Backtest(data, strategy_class, **job['backtest_kwargs'])
+    stats = run_backtest_with_fallback(bt, job['run_kwargs'])
+    # 워커에서 만든 전략 인스턴스는 pickle 불가 → 표현 문자열로 대체
+    stats['_strategy'] = str(stats['_strategy'])
+    return stats
+
+
+class BacktestProcessExecutor:
+    """bt.run()을 프로세스 풀로 실행하는 실행기"""
+
+    def __init__(self, max_workers: Optional[int] = None, timeout_seconds: Optional[float] = None):
+        configured = settings.backtest_process_workers if max_workers is None else max_workers
+        self.max_workers = configured if configured > 0 else (os.cpu_count() or 1)
+        self.timeout_seconds = (
+            settings.backtest_job_timeout_seconds if timeout_seconds is None else timeout_seconds
+        )
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._stats = {'submitted': 0, 'completed': 0, 'timeouts': 0, 'failures': 0}
+
+    @property
+    def enabled(self) -> bool:
+        """워커가 2개 이상일 때만 프로세스 풀 사용 (1개면 스레드 실행과 차이 없음)"""
+        return self.max_workers > 1
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                )
+            return self._pool
+
+    def _reset_pool(self) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    async def run(
+        self,
+        data: pd.DataFrame,
+        strategy_class: Type[Strategy],
+        backtest_kwargs: Dict[str, Any],
+        run_kwargs: Dict[str, Any],
+    ) -> pd.Series:
+        """
+        백테스트 1건을 워커 프로세스에서 실행합니다.
+
+        Args:
+            data: 가격 데이터 (USD 변환 완료)
+            strategy_class: 전략 클래스 (동적 생성 클래스 허용)
+            backtest_kwargs: Backtest 생성 인자 (cash, commission)
+            run_kwargs: Backtest.run 인자 (spread 등)
+
+        Returns:
+            pd.Series: bt.run() 결과 (_strategy는 문자열)
+
+        Raises:
+            asyncio.TimeoutError: 작업 타임아웃
+            BrokenProcessPool: 워커 비정상 종료 (풀은 다음 호출 시 재생성)
+        """
+        base, overrides = _portable_strategy(strategy_class)
+        shm, frame_meta = _share_frame(data)
+        job = {
+            'frame': frame_meta,
+            'strategy': base,
+            'overrides': overrides,
+            'backtest_kwargs': backtest_kwargs,
+            'run_kwargs': run_kwargs,
+        }
+
+        self._stats['submitted'] += 1
+        try:
+            future = self._get_pool().submit(_run_job, job)
+            try:
+                result = await asyncio.wait_for(asyncio.wrap_future(future), timeout=self.timeout_seconds)
+            except asyncio.TimeoutError:
+                self._stats['timeouts'] += 1
+                future.cancel()
+                logger.warning(f"백테스트 작업 타임아웃 ({self.timeout_seconds}초)")
+                raise
+            self._stats['completed'] += 1
+            return result
+        except BrokenProcessPool:
+            self._stats['failures'] += 1
+            logger.error("백테스트 워커 프로세스 비정상 종료 - 풀 재생성 예정")
+            self._reset_pool()
+            raise
+        finally:
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """실행기 통계"""
+        return {**self._stats, 'max_workers': self.max_workers, 'enabled': self.enabled}
+
+    def shutdown(self) -> None:
+        """풀 종료 (애플리케이션 종료 시)"""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+
+# 전역 인스턴스
+backtest_executor = BacktestProcessExecutor()
@@ -3,29 +3,69 @@
 
 **역할**:
 - SQLAlchemy Engine 생성 및 캐싱
+- 비동기 AsyncEngine 생성 및 캐싱 (settings.db_async_* 풀 설정, 동기 풀과 별도)
+- 엔진 계측: 실행한 SQL 수(db_queries_total), 풀 체크아웃 대기 시간(db_pool_checkout_wait_seconds)
 - DatabaseConfig와 PoolConfig를 활용한 통합 관리
 - 싱글톤 패턴으로 중복 생성 방지
 
 **의존성**:
 - app.services.database.database_config: DB 설정
 - app.services.database.pool_config: 연결 풀 설정
+- aiomysql: 비동기 MySQL 드라이버 (get_async_engine 사용 시)
+- app.utils.metrics: Prometheus 메트릭
 """
 
 import logging
+import time
 from typing import Optional
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 from app.services.database.database_config import DatabaseConfig
 from app.services.database.pool_config import PoolConfig
+from app.utils.metrics import metrics
 
 logger = logging.getLogger(__name__)
 
 
+class _CheckoutTimingMixin:
+    """풀 체크아웃 시간(대기 + 새 연결 생성)을 db_pool_checkout_wait_seconds에 기록"""
+
+    metrics_label = "sync"
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            metrics.observe("db_pool_checkout_wait_seconds", time.perf_counter() - started, engine=self.metrics_label)
+
+
+class TimedQueuePool(_CheckoutTimingMixin, QueuePool):
+    metrics_label = "sync"
+
+
+class TimedAsyncQueuePool(_CheckoutTimingMixin, AsyncAdaptedQueuePool):
+    metrics_label = "async"
+
+
+def instrument_engine(engine: Engine, label: str) -> Engine:
+    """엔진이 실행하는 SQL 문 수를 db_queries_total{engine=label}로 집계합니다."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _count_query(conn, cursor, statement, parameters, context, executemany):
+        metrics.inc("db_queries_total", engine=label)
+
+    return engine
+
+
 class DatabaseConnectionManager:
     """데이터베이스 연결 관리 클래스 (싱글톤)"""
 
     _instance: Optional["DatabaseConnectionManager"] = None
     _engine_cache: Optional[Engine] = None
+    _async_engine_cache: Optional[AsyncEngine] = None
 
     def __new__(cls) -> "DatabaseConnectionManager":
         """싱글톤 패턴 구현"""
@@ -94,15 +134,60 @@ class DatabaseConnectionManager:
             pool_kwargs["max_overflow"],
         )
 
-        engine = create_engine(db_url, **pool_kwargs)
+        engine = instrument_engine(create_engine(db_url, poolclass=TimedQueuePool, **pool_kwargs), "sync")
 
         logger.info("SQLAlchemy engine created successfully")
         return engine
 
+    @classmethod
+    def get_async_engine(cls) -> AsyncEngine:
+        """
+        캐시된 SQLAlchemy AsyncEngine을 반환합니다.
+
+        캐시가 없으면 생성합니다. 풀 크기는 settings.db_async_pool_size / db_async_max_overflow로
+        동기 엔진과 독립적으로 설정합니다 (대기 중인 쿼리가 스레드를 점유하지 않으므로
+        동시 요청 수는 스레드 풀이 아닌 이 풀 크기로 제한됨).
+
+        Returns:
+            SQLAlchemy AsyncEngine 인스턴스
+        """
+        if cls._async_engine_cache is not None:
+            return cls._async_engine_cache
+
+        from app.core.config import settings
+
+        manager = cls()
+        url = manager.config.get_async_url()
+        pool_kwargs = {
+            "pool_size": settings.db_async_pool_size,
+            "max_overflow": settings.db_async_max_overflow,
+            "pool_timeout": settings.db_async_pool_timeout,
+            "pool_recycle": manager.pool_config.pool_recycle,
+            "pool_pre_ping": manager.pool_config.pool_pre_ping,
+        }
+        logger.info(
+            "Creating SQLAlchemy async engine: %s (pool_size=%d, max_overflow=%d)",
+            manager.config.get_masked_url(),
+            pool_kwargs["pool_size"],
+            pool_kwargs["max_overflow"],
+        )
+        cls._async_engine_cache = create_async_engine(url, poolclass=TimedAsyncQueuePool, **pool_kwargs)
+        instrument_engine(cls._async_engine_cache.sync_engine, "async")
+        return cls._async_engine_cache
+
+    @classmethod
+    async def dispose_async_engine(cls) -> None:
+        """비동기 엔진의 연결을 모두 닫습니다 (앱 종료 시)."""
+        if cls._async_engine_cache is not None:
+            await cls._async_engine_cache.dispose()
+            cls._async_engine_cache = None
+            logger.info("Database async engine disposed")
+
     @classmethod
     def reset_cache(cls) -> None:
         """엔진 캐시를 초기화합니다 (테스트용)."""
         cls._engine_cache = None
+        cls._async_engine_cache = None
         logger.info("Database engine cache cleared")
 
     @classmethod
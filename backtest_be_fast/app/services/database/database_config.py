@@ -6,6 +6,7 @@
 - DATABASE_URL 또는 개별 설정 우선순위 처리
 - DB 연결 정보 검증 및 제공
 - 마스킹된 URL 생성 (로깅용)
+- 비동기 드라이버 URL 생성 (mysql+pymysql → mysql+aiomysql)
 
 **의존성**:
 - app.core.config: 애플리케이션 설정
@@ -122,6 +123,31 @@ class DatabaseConfig:
         """데이터베이스 연결 URL을 반환합니다."""
         return self.database_url
 
+    # 동기 드라이버 → 비동기 드라이버 (SQLAlchemy AsyncEngine용)
+    ASYNC_DRIVERS = {
+        "mysql": "mysql+aiomysql",
+        "mysql+pymysql": "mysql+aiomysql",
+        "mysql+mysqldb": "mysql+aiomysql",
+        "sqlite": "sqlite+aiosqlite",
+        "sqlite+pysqlite": "sqlite+aiosqlite",
+    }
+
+    def get_async_url(self) -> str:
+        """
+        비동기 드라이버를 사용하는 연결 URL을 반환합니다.
+
+        Raises:
+            ValueError: 비동기 드라이버가 정의되지 않은 DB 방언
+        """
+        from sqlalchemy.engine import make_url
+
+        url = make_url(self.database_url)
+        if url.drivername in self.ASYNC_DRIVERS.values():
+            return url.render_as_string(hide_password=False)
+        if url.drivername not in self.ASYNC_DRIVERS:
+            raise ValueError(f"비동기 드라이버를 지원하지 않는 DB URL입니다: {url.drivername}")
+        return url.set(drivername=self.ASYNC_DRIVERS[url.drivername]).render_as_string(hide_password=False)
+
     def get_masked_url(self) -> str:
         """로깅용 마스킹된 URL을 반환합니다 (비밀번호 숨김)."""
         try:
@@ -0,0 +1,375 @@
+"""
+전략 파라미터 최적화 서비스
+
+**역할**:
+- 같은 종목/기간에 대해 전략 파라미터 조합을 일괄 평가 (그리드/랜덤 탐색)
+- 가격 데이터 조회와 USD 변환은 요청당 1회만 수행
+- 조합별 실행은 BacktestEngine의 전략별 엔진 선택을 따름
+  (기본 전략은 벡터화 엔진, 그 외는 백테스트 프로세스 풀에서 병렬 실행)
+
+**주요 기능**:
+1. build_combinations(): 후보 값으로 조합 생성, StrategyService 제약 조건으로 가지치기
+2. run_optimization(): 조합 평가 → 지표 순위표 + 히트맵 행렬 반환
+3. get_progress(): 작업 ID별 진행률 조회
+
+**조합 상한**:
+- settings.optimization_max_combinations (요청의 max_combinations는 이보다 작게만 지정 가능)
+- grid 모드에서 전체 조합이 상한을 넘으면 검증 오류 (random 모드 안내)
+
+**의존성**:
+- app/services/backtest_engine.py: 가격 조회/USD 변환, 전략별 실행 엔진 선택
+- app/services/strategy_service.py: 파라미터 검증 및 제약 조건
+
+**연관 컴포넌트**:
+- Backend: app/api/v1/endpoints/optimization.py (API 엔드포인트)
+- Backend: app/schemas/requests.py (OptimizationRequest)
+"""
+import asyncio
+import itertools
+import logging
+import math
+import random
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from uuid import uuid4
+
+import pandas as pd
+from fastapi import HTTPException
+
+from app.core.config import settings
+from app.core.exceptions import DataNotFoundError, ValidationError
+from app.schemas.requests import OptimizationRequest
+from app.services.backtest_engine import backtest_engine
+from app.services.strategy_service import STRATEGIES, strategy_service
+from app.utils.type_converters import safe_float, safe_int
+
+logger = logging.getLogger(__name__)
+
+# 응답 지표 이름 → backtesting.py 통계 키
+OPTIMIZATION_METRICS: Dict[str, str] = {
+    'total_return_pct': 'Return [%]',
+    'annualized_return_pct': 'Return (Ann.) [%]',
+    'sharpe_ratio': 'Sharpe Ratio',
+    'sortino_ratio': 'Sortino Ratio',
+    'calmar_ratio': 'Calmar Ratio',
+    'max_drawdown_pct': 'Max. Drawdown [%]',
+    'win_rate_pct': 'Win Rate [%]',
+    'profit_factor': 'Profit Factor',
+    'total_trades': '# Trades',
+    'final_equity': 'Equity Final [$]',
+}
+
+_MAX_TRACKED_JOBS = 100  # 진행률을 보관할 최근 작업 수
+
+ProgressCallback = Callable[[Dict[str, Any]], None]
+
+
+class ParameterOptimizationService:
+    """전략 파라미터 그리드/랜덤 탐색 서비스"""
+
+    def __init__(self, engine=None, strategy_service_instance=None):
+        self.engine = engine or backtest_engine
+        self.strategy_service = strategy_service_instance or strategy_service
+        self._progress: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        self._progress_lock = threading.Lock()
+
+    def build_combinations(
+        self,
+        strategy_name: str,
+        param_grid: Dict[str, List[Any]],
+        fixed_params: Optional[Dict[str, Any]] = None,
+        search_mode: str = 'grid',
+        n_samples: Optional[int] = None,
+        max_combinations: Optional[int] = None,
+        seed: Optional[int] = None,
+    ) -> Tuple[List[Dict[str, Any]], int, int]:
+        """
+        파라미터 조합을 생성하고 유효하지 않은 조합을 제거합니다.
+
+        Args:
+            strategy_name: 전략 이름
+            param_grid: 파라미터별 후보 값 목록
+            fixed_params: 탐색하지 않는 고정 파라미터
+            search_mode: 'grid' (전체 조합) 또는 'random' (무작위 표본, 중복 없음)
+            n_samples: random 모드 표본 수
+            max_combinations: 최대 조합 수 (서버 상한 이하로 제한)
+            seed: random 모드 난수 시드
+
+        Returns:
+            (검증된 파라미터 목록, 전체 조합 수, 제거된 조합 수)
+
+        Raises:
+            ValidationError: 지원하지 않는 전략/파라미터, grid 조합 수 상한 초과
+        """
+        if strategy_name not in STRATEGIES:
+            raise ValidationError(f"지원하지 않는 전략입니다: {strategy_name}")
+
+        known = STRATEGIES[strategy_name]['parameters']
+        unknown = [name for name in param_grid if name not in known]
+        if unknown:
+            raise ValidationError(
+                f"{strategy_name} 전략에 없는 파라미터입니다: {', '.join(unknown)} "
+                f"(사용 가능: {', '.join(known) or '없음'})"
+            )
+
+        cap = min(max_combinations or settings.optimization_max_combinations,
+                  settings.optimization_max_combinations)
+        names = list(param_grid)
+        value_lists = [list(dict.fromkeys(values)) for values in param_grid.values()]
+        total = math.prod(len(values) for values in value_lists)
+
+        if search_mode == 'grid':
+            if total > cap:
+                raise ValidationError(
+                    f"파라미터 조합 수({total})가 최대 {cap}개를 초과합니다. "
+                    f"후보 값을 줄이거나 random 탐색을 사용하세요."
+                )
+            candidates = itertools.product(*value_lists)
+        else:
+            sample_size = min(n_samples or cap, cap, total)
+            rng = random.Random(seed)
+            candidates = (
+                self._decode_index(index, value_lists)
+                for index in rng.sample(range(total), sample_size)
+            )
+
+        combinations: List[Dict[str, Any]] = []
+        seen = set()
+        pruned = 0
+        for values in candidates:
+            params = {**(fixed_params or {}), **dict(zip(names, values))}
+            try:
+                validated = self.strategy_service.validate_strategy_params(strategy_name, params)
+            except ValueError:
+                pruned += 1
+                continue
+            key = tuple(sorted(validated.items()))
+            if key not in seen:
+                seen.add(key)
+                combinations.append(validated)
+
+        return combinations, total, pruned
+
+    async def run_optimization(
+        self,
+        request: OptimizationRequest,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> Dict[str, Any]:
+        """
+        파라미터 조합을 평가하고 순위표와 히트맵 행렬을 반환합니다.
+
+        Args:
+            request: 최적화 요청
+            progress_callback: 조합 평가가 끝날 때마다 진행률 dict로 호출
+
+        Returns:
+            Dict: job_id, 조합 수 요약, results(순위표), best, heatmap, execution_time_seconds
+        """
+        started = time.perf_counter()
+        strategy_name = request.strategy.value if hasattr(request.strategy, 'value') else str(request.strategy)
+
+        self.validate_rank_by(request.rank_by)
+        heatmap_params = request.heatmap_params or [
+            name for name, values in request.param_grid.items() if len(set(values)) > 1
+        ][:2]
+        if any(name not in request.param_grid for name in heatmap_params):
+            raise ValidationError("heatmap_params는 param_grid의 파라미터여야 합니다")
+
+        combinations, total, pruned = self.build_combinations(
+            strategy_name,
+            request.param_grid,
+            fixed_params=request.strategy_params,
+            search_mode=request.search_mode,
+            n_samples=request.n_samples,
+            max_combinations=request.max_combinations,
+            seed=request.seed,
+        )
+        if not combinations:
+            raise ValidationError("제약 조건을 만족하는 파라미터 조합이 없습니다")
+
+        job_id = request.job_id or uuid4().hex
+        progress = self._start_progress(job_id, len(combinations), total, pruned)
+        logger.info(
+            f"파라미터 최적화 시작 [{job_id}]: {request.ticker} {strategy_name}, "
+            f"{len(combinations)}개 조합 (전체 {total}, 제거 {pruned}, 방식 {request.search_mode})"
+        )
+
+        try:
+            # 가격 데이터 조회/USD 변환은 1회만
+            data = await self.load_prices(request)
+
+            base_strategy = self.strategy_service.get_strategy_class(strategy_name)
+            executor = self.engine.executor
+            semaphore = asyncio.Semaphore(executor.max_workers if executor.enabled else 1)
+
+            async def evaluate(params: Dict[str, Any]) -> Dict[str, Any]:
+                strategy_class = self.configure_strategy(base_strategy, params)
+                swept = {name: params[name] for name in request.param_grid}
+                async with semaphore:
+                    try:
+                        stats = await self.engine._run_strategy(data, strategy_class, request)
+                        row = {'params': swept, 'metrics': self.extract_metrics(stats)}
+                    except Exception as e:
+                        logger.warning(f"파라미터 조합 평가 실패 {swept}: {e}")
+                        row = {'params': swept, 'error': str(e)}
+                self._advance_progress(progress, failed='error' in row, callback=progress_callback)
+                return row
+
+            rows = await asyncio.gather(*(evaluate(params) for params in combinations))
+        except Exception:
+            self._finish_progress(progress, 'failed')
+            raise
+
+        succeeded = [row for row in rows if 'metrics' in row]
+        succeeded.sort(key=lambda row: row['metrics'][request.rank_by], reverse=True)
+        for rank, row in enumerate(succeeded, start=1):
+            row['rank'] = rank
+
+        self._finish_progress(progress, 'completed')
+        elapsed = time.perf_counter() - started
+        logger.info(f"파라미터 최적화 완료 [{job_id}]: {len(succeeded)}/{len(rows)}개 성공, {elapsed:.2f}초")
+
+        return {
+            'job_id': job_id,
+            'ticker': request.ticker,
+            'strategy': strategy_name,
+            'search_mode': request.search_mode,
+            'rank_by': request.rank_by,
+            'total_combinations': total,
+            'evaluated': len(rows),
+            'pruned': pruned,
+            'failed': len(rows) - len(succeeded),
+            'results': succeeded,
+            'best': succeeded[0] if succeeded else None,
+            'heatmap': self._build_heatmap(succeeded, heatmap_params, request.rank_by),
+            'execution_time_seconds': round(elapsed, 3),
+        }
+
+    async def load_prices(self, request: OptimizationRequest) -> pd.DataFrame:
+        """요청 종목/기간의 가격 데이터를 조회하고 USD로 변환합니다 (데이터 없음은 DataNotFoundError)."""
+        try:
+            data = await self.engine._get_price_data(request.ticker, request.start_date, request.end_date)
+        except HTTPException as e:
+            if e.status_code == 404:
+                raise DataNotFoundError(request.ticker, str(request.start_date), str(request.end_date))
+            raise
+        return await self.engine._convert_to_usd(request.ticker, data, request.start_date, request.end_date)
+
+    @staticmethod
+    def configure_strategy(base_strategy, params: Dict[str, Any]):
+        """검증된 파라미터로 오버라이드 클래스 생성 (_build_strategy의 재검증/로그 생략)"""
+        overrides = {k: v for k, v in params.items() if hasattr(base_strategy, k)}
+        return type(f"{base_strategy.__name__}Configured", (base_strategy,), overrides)
+
+    @staticmethod
+    def validate_rank_by(rank_by: str) -> None:
+        """순위 지표 검증"""
+        if rank_by not in OPTIMIZATION_METRICS:
+            raise ValidationError(
+                f"지원하지 않는 순위 지표입니다: {rank_by} "
+                f"(사용 가능: {', '.join(OPTIMIZATION_METRICS)})"
+            )
+
+    def get_progress(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """작업 진행률 조회 (없으면 None)"""
+        with self._progress_lock:
+            progress = self._progress.get(job_id)
+            return dict(progress) if progress is not None else None
+
+    @staticmethod
+    def extract_metrics(stats: pd.Series) -> Dict[str, Any]:
+        """백테스트 통계에서 순위표 지표 추출 (NaN은 0)"""
+        metrics = {name: safe_float(stats.get(key, 0.0)) for name, key in OPTIMIZATION_METRICS.items()}
+        metrics['total_trades'] = safe_int(stats.get('# Trades', 0))
+        return metrics
+
+    @staticmethod
+    def _decode_index(index: int, value_lists: List[List[Any]]) -> Tuple[Any, ...]:
+        """조합 번호를 각 파라미터 값으로 변환 (itertools.product 순서와 동일)"""
+        values = []
+        for options in reversed(value_lists):
+            index, position = divmod(index, len(options))
+            values.append(options[position])
+        return tuple(reversed(values))
+
+    @staticmethod
+    def _build_heatmap(
+        rows: List[Dict[str, Any]],
+        params: List[str],
+        metric: str,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        두 파라미터 축의 지표 행렬 (values[y][x], 나머지 파라미터는 최댓값으로 집계, 미평가 칸은 None)
+        """
+        if len(params) != 2 or not rows:
+            return None
+
+        x_param, y_param = params
+        x_values = sorted({row['params'][x_param] for row in rows})
+        y_values = sorted({row['params'][y_param] for row in rows})
+        x_index = {value: i for i, value in enumerate(x_values)}
+        y_index = {value: i for i, value in enumerate(y_values)}
+
+        values: List[List[Optional[float]]] = [[None] * len(x_values) for _ in y_values]
+        for row in rows:
+            i, j = y_index[row['params'][y_param]], x_index[row['params'][x_param]]
+            value = row['metrics'][metric]
+            if values[i][j] is None or value > values[i][j]:
+                values[i][j] = value
+
+        return {
+            'x_param': x_param,
+            'y_param': y_param,
+            'x_values': x_values,
+            'y_values': y_values,
+            'metric': metric,
+            'aggregation': 'max',
+            'values': values,
+        }
+
+    def _start_progress(self, job_id: str, planned: int, total: int, pruned: int) -> Dict[str, Any]:
+        progress = {
+            'job_id': job_id,
+            'status': 'running',
+            'total': planned,
+            'completed': 0,
+            'failed': 0,
+            'total_combinations': total,
+            'pruned': pruned,
+            'started_at': datetime.now().isoformat(),
+            'updated_at': datetime.now().isoformat(),
+        }
+        with self._progress_lock:
+            self._progress[job_id] = progress
+            self._progress.move_to_end(job_id)
+            while len(self._progress) > _MAX_TRACKED_JOBS:
+                self._progress.popitem(last=False)
+        return progress
+
+    def _advance_progress(
+        self,
+        progress: Dict[str, Any],
+        failed: bool,
+        callback: Optional[ProgressCallback] = None,
+    ) -> None:
+        with self._progress_lock:
+            progress['completed'] += 1
+            progress['failed'] += int(failed)
+            progress['updated_at'] = datetime.now().isoformat()
+            snapshot = dict(progress)
+        if snapshot['completed'] % max(1, snapshot['total'] // 10) == 0:
+            logger.info(f"파라미터 최적화 진행 [{snapshot['job_id']}]: {snapshot['completed']}/{snapshot['total']}")
+        if callback is not None:
+            callback(snapshot)
+
+    def _finish_progress(self, progress: Dict[str, Any], status: str) -> None:
+        with self._progress_lock:
+            progress['status'] = status
+            progress['updated_at'] = datetime.now().isoformat()
+
+
+# 전역 인스턴스
+optimization_service = ParameterOptimizationService()
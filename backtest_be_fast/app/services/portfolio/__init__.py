@@ -6,6 +6,9 @@
 - portfolio_rebalancer: 리밸런싱 로직
 - portfolio_simulator: 시뮬레이션 실행
 - portfolio_metrics: 통계 계산
+- portfolio_vector_engine: 행렬 기반 시뮬레이션 엔진
+- portfolio_monte_carlo: 수익률 재표본 강건성 시뮬레이션
+- portfolio_schedule: 리밸런싱/DCA 실행 일정 사전 계산
 
 Note:
 - portfolio_service 메인 오케스트레이터는 app/services/portfolio_service.py에 위치
@@ -15,10 +18,16 @@ from app.services.portfolio.portfolio_dca_manager import PortfolioDcaManager
 from app.services.portfolio.portfolio_rebalancer import PortfolioRebalancer
 from app.services.portfolio.portfolio_simulator import PortfolioSimulator
 from app.services.portfolio.portfolio_metrics import PortfolioMetrics
+from app.services.portfolio.portfolio_vector_engine import PortfolioVectorEngine
+from app.services.portfolio.portfolio_monte_carlo import PortfolioMonteCarlo
+from app.services.portfolio.portfolio_schedule import PortfolioSchedule
 
 __all__ = [
     'PortfolioDcaManager',
     'PortfolioRebalancer',
     'PortfolioSimulator',
     'PortfolioMetrics',
+    'PortfolioVectorEngine',
+    'PortfolioMonteCarlo',
+    'PortfolioSchedule',
 ]
@@ -5,6 +5,7 @@ DCA(Dollar Cost Averaging) 투자 관리
 - 초기 매수 실행 (일시불 또는 DCA 첫 투자)
 - 주기적 DCA 투자 실행
 - Nth Weekday 기반 DCA 일정 관리
+- 사전 계산된 일정(PortfolioSchedule)의 실행일 매수
 
 **의존성**:
 - app/schemas/schemas.py: FREQUENCY_MAP
@@ -12,7 +13,7 @@ DCA(Dollar Cost Averaging) 투자 관리
 """
 
 import logging
-from typing import Dict, Tuple
+from typing import Dict, Iterable, Tuple
 from datetime import datetime, date
 import pandas as pd
 
@@ -181,3 +182,58 @@ class PortfolioDcaManager:
                         logger.warning(f"{current_date.date()}: {symbol} DCA 매수 시점이지만 가격 데이터 없음 (주기 {executed_count + 1}/{info['dca_periods']})")
 
         return trades_executed, daily_cash_inflow
+
+    def execute_scheduled_purchases(
+        self,
+        current_date: pd.Timestamp,
+        unique_keys: Iterable[str],
+        current_prices: Dict[str, float],
+        dca_info: Dict[str, Dict],
+        shares: Dict[str, float],
+        commission: float
+    ) -> Tuple[int, float]:
+        """
+        사전 계산된 DCA 실행일에 매수를 실행합니다 (PortfolioSchedule.dca_keys_at).
+
+        **역할**:
+        - 일정 판단 없이 전달된 종목만 매수 (실행일 여부는 PortfolioSchedule이 결정)
+        - DCA 투자 횟수 제한 준수, 가격이 없으면 해당 회차 건너뜀
+
+        **파라미터**:
+        - current_date: 현재 시뮬레이션 날짜
+        - unique_keys: 당일 DCA 실행 종목 키
+        - current_prices: 종목별 USD 변환 가격
+        - dca_info: 종목 정보 (MODIFIED - executed_count, last_dca_date 업데이트)
+        - shares: 종목별 보유 주식 수 (MODIFIED)
+        - commission: 거래 수수료
+
+        **반환**:
+        - trades_executed: 실행된 거래 수
+        - daily_cash_inflow: 당일 현금 유입 (투자 금액)
+        """
+        trades_executed = 0
+        daily_cash_inflow = 0.0
+
+        for unique_key in unique_keys:
+            info = dca_info[unique_key]
+            executed_count = info.get('executed_count', 0)
+            if executed_count >= info['dca_periods']:
+                continue
+
+            if unique_key not in current_prices:
+                logger.warning(f"{current_date.date()}: {unique_key} DCA 매수 시점이지만 가격 데이터 없음 (주기 {executed_count + 1}/{info['dca_periods']})")
+                continue
+
+            period_amount = info['monthly_amount']  # 회당 투자 금액
+            shares[unique_key] += period_amount * (1 - commission) / current_prices[unique_key]
+            trades_executed += 1
+            daily_cash_inflow += period_amount
+
+            info['executed_count'] = executed_count + 1
+            info['last_dca_date'] = current_date
+            logger.info(
+                f"{current_date.date()}: {unique_key} DCA 추가 매수 실행! "
+                f"(주기 {executed_count + 1}/{info['dca_periods']}, 금액: ${period_amount:,.2f})"
+            )
+
+        return trades_executed, daily_cash_inflow
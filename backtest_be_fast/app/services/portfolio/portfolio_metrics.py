@@ -12,6 +12,7 @@
 import logging
 from typing import Dict, Any, Tuple
 from datetime import datetime
+import numpy as np
 import pandas as pd
 
 logger = logging.getLogger(__name__)
@@ -187,17 +188,10 @@ class PortfolioMetrics:
         Returns:
             최대 연속 개수
         """
-        if len(series) == 0:
+        matches = np.asarray(series) == target_value
+        if not matches.any():
             return 0
 
-        max_consecutive = 0
-        current_consecutive = 0
-
-        for value in series:
-            if value == target_value:
-                current_consecutive += 1
-                max_consecutive = max(max_consecutive, current_consecutive)
-            else:
-                current_consecutive = 0
-
-        return max_consecutive
+        # run-length encoding: 일치 구간의 시작(+1)/끝(-1) 경계 위치 차이가 구간 길이
+        edges = np.diff(np.concatenate(([0], matches.view(np.int8), [0])))
+        return int((np.flatnonzero(edges == -1) - np.flatnonzero(edges == 1)).max())
@@ -0,0 +1,207 @@
+"""
+포트폴리오 몬테카를로 강건성 시뮬레이션
+
+**역할**:
+- 백테스트 일일 수익률을 재표본 추출해 수천 개의 가상 수익률 경로 생성
+- 경로별 CAGR / 최대 낙폭 / 샤프 비율 분포와 손실 확률 계산
+- 거래 로그의 거래별 수익률을 재표본 추출해 누적 수익률 분포 계산
+
+**재표본 방식**:
+- bootstrap: 일일 수익률을 복원 추출 (i.i.d. 가정)
+- block: 연속 block_size일 묶음을 순환 추출 (변동성 군집 등 자기상관 보존)
+
+**성능**:
+- (경로 × 일수) 행렬 단위 NumPy 연산, 파이썬 루프는 청크 단위로만 순회
+- 청크당 셀 수 상한(settings.monte_carlo_chunk_cells)으로 메모리 사용량 제한
+- 시드가 같으면 청크 크기와 무관하게 같은 경로 생성 (난수를 행 순서대로 소비)
+
+**의존성**:
+- None (순수 계산 로직)
+
+**연관 컴포넌트**:
+- Backend: app/services/portfolio_service.py (run_portfolio_backtest 결과에 추가)
+- Backend: app/schemas/schemas.py (MonteCarloOptions)
+"""
+
+import logging
+from typing import Dict, Any, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+TRADING_DAYS_PER_YEAR = 252
+PERCENTILES = (5, 25, 50, 75, 95)
+
+
+class PortfolioMonteCarlo:
+    """일일 수익률 / 거래 수익률 재표본 시뮬레이션 클래스"""
+
+    def __init__(self, chunk_cells: int = 5_000_000):
+        """
+        Args:
+            chunk_cells: 한 번에 생성할 (경로 × 일수) 셀 수 상한 (float64 기준 약 8바이트/셀)
+        """
+        self.chunk_cells = chunk_cells
+
+    @staticmethod
+    def resample_indices(
+        rng: np.random.Generator,
+        n_paths: int,
+        n_days: int,
+        method: str = 'bootstrap',
+        block_size: int = 20
+    ) -> np.ndarray:
+        """
+        (경로 × 일수) 재표본 인덱스 행렬을 생성합니다.
+
+        block 방식은 경로마다 ceil(n_days / block_size)개의 시작점을 뽑아
+        연속 구간(끝을 넘으면 처음으로 순환)을 이어 붙입니다.
+        """
+        if method == 'bootstrap':
+            return rng.integers(0, n_days, size=(n_paths, n_days))
+
+        block_size = min(block_size, n_days)
+        n_blocks = -(-n_days // block_size)
+        starts = rng.integers(0, n_days, size=(n_paths, n_blocks))
+        indices = (starts[:, :, None] + np.arange(block_size)) % n_days
+        return indices.reshape(n_paths, n_blocks * block_size)[:, :n_days]
+
+    @staticmethod
+    def path_statistics(returns: np.ndarray, periods_per_year: int = TRADING_DAYS_PER_YEAR) -> Dict[str, np.ndarray]:
+        """
+        경로별 CAGR(%), 최대 낙폭(%, 음수), 연환산 샤프 비율을 계산합니다.
+
+        Args:
+            returns: (경로 × 일수) 일일 수익률 행렬 (소수)
+        """
+        n_days = returns.shape[1]
+        wealth = np.cumprod(1.0 + returns, axis=1)
+        # 시작 자산(1.0)도 고점 후보에 포함
+        peaks = np.maximum(np.maximum.accumulate(wealth, axis=1), 1.0)
+        max_drawdown = (wealth / peaks - 1.0).min(axis=1)
+
+        final = wealth[:, -1]
+        with np.errstate(invalid='ignore'):
+            cagr = np.where(final > 0, np.power(np.maximum(final, 0.0), periods_per_year / n_days) - 1.0, -1.0)
+
+        mean = returns.mean(axis=1)
+        std = returns.std(axis=1, ddof=1) if n_days > 1 else np.zeros(len(returns))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            sharpe = np.where(std > 0, mean / std * np.sqrt(periods_per_year), 0.0)
+
+        return {
+            'cagr_pct': cagr * 100,
+            'max_drawdown_pct': max_drawdown * 100,
+            'sharpe_ratio': sharpe,
+            'final_multiple': final,
+        }
+
+    @staticmethod
+    def summarize(values: np.ndarray) -> Dict[str, float]:
+        """분포 요약 (평균, 표준편차, 백분위수)"""
+        percentiles = np.percentile(values, PERCENTILES)
+        summary = {
+            'mean': float(values.mean()),
+            'std': float(values.std()),
+        }
+        summary.update({f'p{p}': float(v) for p, v in zip(PERCENTILES, percentiles)})
+        return summary
+
+    def simulate_returns(
+        self,
+        daily_returns: np.ndarray,
+        n_paths: int = 1000,
+        method: str = 'bootstrap',
+        block_size: int = 20,
+        seed: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        일일 수익률 재표본 시뮬레이션
+
+        Args:
+            daily_returns: 백테스트 일일 수익률 (소수, NaN 제외)
+            n_paths: 생성할 경로 수
+            method: bootstrap 또는 block
+            block_size: block 방식의 블록 길이 (일)
+            seed: 난수 시드 (None이면 매 실행 다른 결과)
+
+        Returns:
+            Dict: 지표별 분포 요약, 손실 확률, 실제 백테스트 값의 백분위 순위
+        """
+        returns = np.asarray(daily_returns, dtype=float)
+        returns = returns[np.isfinite(returns)]
+        n_days = len(returns)
+        if n_days < 2:
+            raise ValueError("몬테카를로 시뮬레이션에는 최소 2일 이상의 수익률이 필요합니다")
+
+        rng = np.random.default_rng(seed)
+        rows_per_chunk = max(1, self.chunk_cells // n_days)
+        collected: Dict[str, List[np.ndarray]] = {}
+
+        for start in range(0, n_paths, rows_per_chunk):
+            rows = min(rows_per_chunk, n_paths - start)
+            indices = self.resample_indices(rng, rows, n_days, method, block_size)
+            for name, values in self.path_statistics(returns[indices]).items():
+                collected.setdefault(name, []).append(values)
+
+        stats = {name: np.concatenate(parts) for name, parts in collected.items()}
+        actual = {name: values[0] for name, values in self.path_statistics(returns[None, :]).items()}
+
+        return {
+            'method': method,
+            'block_size': block_size if method == 'block' else None,
+            'n_paths': n_paths,
+            'n_days': n_days,
+            'seed': seed,
+            'metrics': {
+                name: {
+                    **self.summarize(stats[name]),
+                    'actual': float(actual[name]),
+                    # 실제 백테스트 값보다 나쁜(작은) 경로 비율
+                    'actual_percentile': float((stats[name] < actual[name]).mean() * 100),
+                }
+                for name in ('cagr_pct', 'max_drawdown_pct', 'sharpe_ratio')
+            },
+            'probability_of_loss_pct': float((stats['final_multiple'] < 1.0).mean() * 100),
+        }
+
+    def simulate_trades(
+        self,
+        trade_returns: np.ndarray,
+        n_paths: int = 1000,
+        seed: Optional[int] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        거래별 수익률 재표본 시뮬레이션 (거래 순서/구성에 대한 민감도)
+
+        Args:
+            trade_returns: 거래별 수익률 (소수, backtesting.py ReturnPct)
+
+        Returns:
+            Dict: 누적 수익률 / 거래 최대 낙폭 분포, 거래가 2개 미만이면 None
+        """
+        returns = np.asarray(trade_returns, dtype=float)
+        returns = returns[np.isfinite(returns)]
+        n_trades = len(returns)
+        if n_trades < 2:
+            return None
+
+        rng = np.random.default_rng(seed)
+        rows_per_chunk = max(1, self.chunk_cells // n_trades)
+        total_parts, drawdown_parts = [], []
+
+        for start in range(0, n_paths, rows_per_chunk):
+            rows = min(rows_per_chunk, n_paths - start)
+            stats = self.path_statistics(returns[rng.integers(0, n_trades, size=(rows, n_trades))])
+            total_parts.append((stats['final_multiple'] - 1.0) * 100)
+            drawdown_parts.append(stats['max_drawdown_pct'])
+
+        total_return = np.concatenate(total_parts)
+        return {
+            'n_paths': n_paths,
+            'n_trades': n_trades,
+            'total_return_pct': self.summarize(total_return),
+            'max_drawdown_pct': self.summarize(np.concatenate(drawdown_parts)),
+            'probability_of_loss_pct': float((total_return < 0).mean() * 100),
+        }
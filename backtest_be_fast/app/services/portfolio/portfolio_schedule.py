@@ -0,0 +1,118 @@
+"""
+리밸런싱 / DCA 실행 일정 사전 계산
+
+**역할**:
+- 시뮬레이션 시작 전에 리밸런싱 실행 행과 종목별 DCA 실행 행을 한 번에 계산
+- 시뮬레이션 루프는 날짜마다 Nth Weekday를 다시 계산하는 대신 행 번호 포함 여부만 확인
+- 루프 엔진(portfolio_service)과 벡터화 엔진(PortfolioVectorEngine)이 같은 일정을 공유
+
+**일정 규칙**:
+- 예정일 이상인 첫 세션에서 실행, 다음 예정일은 실제 실행 세션 기준 (build_schedule_rows)
+- 리밸런싱: 시뮬레이션 날짜 기준
+- DCA: 종목 거래소 세션으로 이동 (다른 시장만 열린 날에는 매수하지 않음), dca_periods 회까지
+
+**의존성**:
+- app/services/rebalance_helper.py: build_schedule_rows, get_weekday_occurrence
+- app/utils/trading_calendar.py: 종목별 거래소 세션
+
+**연관 컴포넌트**:
+- Backend: app/services/portfolio_service.py (calculate_dca_portfolio_returns 루프 엔진)
+- Backend: app/services/portfolio/portfolio_vector_engine.py (이벤트 날짜 순회)
+"""
+
+import logging
+from datetime import datetime
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from app.schemas.schemas import FREQUENCY_MAP
+from app.services.rebalance_helper import build_schedule_rows, get_weekday_occurrence
+from app.utils.trading_calendar import calendar_for_ticker
+
+logger = logging.getLogger(__name__)
+
+
+class PortfolioSchedule:
+    """시뮬레이션 날짜 기준 리밸런싱 / DCA 실행 행 집합"""
+
+    def __init__(self, n_dates: int, rebalance_rows: np.ndarray, dca_rows: Dict[str, np.ndarray]):
+        """
+        Args:
+            n_dates: 시뮬레이션 날짜 수
+            rebalance_rows: 리밸런싱 실행 행 번호
+            dca_rows: 종목별 DCA 실행 행 번호
+        """
+        self.rebalance_rows = rebalance_rows
+        self.dca_rows = dca_rows
+
+        self.rebalance_mask = np.zeros(n_dates, dtype=bool)
+        self.rebalance_mask[rebalance_rows] = True
+        self._dca_keys_by_row: Dict[int, List[str]] = {}
+        for unique_key, rows in dca_rows.items():
+            for row in rows.tolist():
+                self._dca_keys_by_row.setdefault(row, []).append(unique_key)
+
+        self.event_rows = np.union1d(rebalance_rows, np.array(list(self._dca_keys_by_row), dtype=np.int64))
+
+    @classmethod
+    def build(
+        cls,
+        sim_dates: pd.DatetimeIndex,
+        stock_keys: List[str],
+        dca_info: Dict[str, Dict],
+        start_date_obj: datetime,
+        rebalance_frequency: str,
+        can_rebalance: bool
+    ) -> 'PortfolioSchedule':
+        """
+        전체 실행 일정을 계산합니다.
+
+        Args:
+            sim_dates: 시뮬레이션 날짜 (시작일~종료일, 정렬됨)
+            stock_keys: 주식 종목 키 목록
+            dca_info: 분할 매수 정보 (MODIFIED - original_nth_weekday 설정)
+            start_date_obj: 시작 날짜
+            rebalance_frequency: 리밸런싱 주기
+            can_rebalance: 리밸런싱 실행 여부 (주기 유효 + 자산 2개 이상)
+
+        Returns:
+            PortfolioSchedule
+        """
+        original_nth = get_weekday_occurrence(start_date_obj)
+
+        rebalance_rows = np.array([], dtype=np.int64)
+        if can_rebalance:
+            rebalance_rows = build_schedule_rows(sim_dates, start_date_obj, rebalance_frequency, original_nth)
+
+        dca_rows: Dict[str, np.ndarray] = {}
+        for unique_key in stock_keys:
+            info = dca_info.get(unique_key)
+            if not info or info.get('investment_type') != 'dca':
+                continue
+            if info.get('dca_frequency') not in FREQUENCY_MAP:
+                logger.error(f"{unique_key}: 알 수 없는 DCA 주기 '{info.get('dca_frequency')}'")
+                continue
+
+            if info.get('original_nth_weekday') is None:
+                info['original_nth_weekday'] = original_nth
+
+            remaining = info['dca_periods'] - info.get('executed_count', 0)
+            if remaining <= 0:
+                continue
+
+            dca_rows[unique_key] = build_schedule_rows(
+                sim_dates,
+                start_date_obj,
+                info['dca_frequency'],
+                info['original_nth_weekday'],
+                max_events=remaining,
+                eligible=calendar_for_ticker(info['symbol']).is_session(sim_dates)
+            )
+
+        return cls(len(sim_dates), rebalance_rows, dca_rows)
+
+    def dca_keys_at(self, row: int) -> List[str]:
+        """row에 DCA를 실행할 종목 키 목록"""
+        return self._dca_keys_by_row.get(row, [])
@@ -18,7 +18,7 @@
 import asyncio
 import logging
 from typing import Dict, Any, Tuple
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
 import pandas as pd
 import numpy as np
 
@@ -27,6 +27,7 @@ from app.services.portfolio.portfolio_rebalancer import PortfolioRebalancer
 from app.services.rebalance_helper import RebalanceHelper, get_next_nth_weekday, get_weekday_occurrence
 from app.utils.currency_converter import currency_converter
 from app.constants.data_loading import TradingThresholds
+from app.utils.trading_calendar import calendar_for_ticker
 
 logger = logging.getLogger(__name__)
 
@@ -102,7 +103,7 @@ class PortfolioSimulator:
         상장폐지 종목을 감지하고 상태를 업데이트합니다.
 
         **역할**:
-        - 30일 이상 가격 데이터가 없는 종목을 상장폐지로 판단
+        - 종목 거래소 기준 21세션 이상 가격 데이터가 없는 종목을 상장폐지로 판단 (휴장일은 세지 않음)
         - 마지막 유효 가격과 날짜를 추적
         - 재상장 케이스 처리
 
@@ -115,7 +116,7 @@ class PortfolioSimulator:
             last_valid_prices: 마지막 유효 가격 (MODIFIED)
             last_price_date: 마지막 가격 날짜 (MODIFIED)
         """
-        # 상장폐지 감지: 가격 데이터가 30일 이상 없으면 상장폐지로 판단
+        # 상장폐지 감지: 가격 데이터가 21세션 이상 없으면 상장폐지로 판단
         for unique_key in stock_amounts.keys():
             # 현재 가격이 있으면 마지막 유효 가격 갱신
             if unique_key in current_prices:
@@ -127,15 +128,17 @@ class PortfolioSimulator:
                     delisted_stocks.remove(unique_key)
             else:
                 # 현재 가격이 없을 때
-                if unique_key in last_price_date:
-                    days_without_price = (current_date.date() - last_price_date[unique_key]).days
-                    if days_without_price >= TradingThresholds.DELISTING_THRESHOLD_DAYS and unique_key not in delisted_stocks:
+                if unique_key in last_price_date and unique_key not in delisted_stocks:
+                    symbol = dca_info[unique_key]['symbol']
+                    sessions_without_price = calendar_for_ticker(symbol).session_count(
+                        last_price_date[unique_key] + timedelta(days=1), current_date.date()
+                    )
+                    if sessions_without_price >= TradingThresholds.DELISTING_THRESHOLD_SESSIONS:
                         # 상장폐지로 판단
-                        symbol = dca_info[unique_key]['symbol']
                         self.logger.warning(
                             f"{symbol} ({unique_key}) 상장폐지 감지: "
                             f"마지막 가격 날짜 {last_price_date[unique_key]}, "
-                            f"{days_without_price}일간 가격 데이터 없음. "
+                            f"{sessions_without_price}세션 동안 가격 데이터 없음. "
                             f"마지막 유효 가격 ${last_valid_prices[unique_key]:.2f} 유지"
                         )
                         delisted_stocks.add(unique_key)
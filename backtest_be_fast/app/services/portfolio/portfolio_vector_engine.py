@@ -0,0 +1,526 @@
+"""
+포트폴리오 벡터화 시뮬레이션 엔진
+
+**역할**:
+- 전 종목 종가와 환율을 (날짜 × 종목) NumPy 행렬로 한 번만 정렬
+- 상장폐지 감지와 마지막 유효 가격 유지를 행렬 연산으로 처리
+- DCA 매수 / 리밸런싱이 발생하는 "이벤트 날짜"만 순회하여 상태 갱신
+- 포트폴리오 가치, 일일 수익률, 비중 히스토리를 한 번에 계산
+
+**배경**:
+- 기존 일별 루프는 매일 `df[df.index.date <= current_date.date()]`로 종목별
+  DataFrame 전체를 다시 필터링하므로 O(일수² × 종목수) 비용이 발생
+- 이 엔진은 searchsorted로 가격을 한 번에 정렬하므로 O(일수 × 종목수)
+
+**결과 호환성**:
+- 이벤트 날짜에는 기존과 동일한 PortfolioDcaManager / PortfolioRebalancer를 호출
+- 가치 합산 순서(현금 → 종목 순)를 기존 루프와 동일하게 유지하여
+  Portfolio_Value / Daily_Return / attrs가 기존 루프와 일치
+
+**의존성**:
+- app/services/portfolio/portfolio_dca_manager.py: DCA 매수 실행
+- app/services/portfolio/portfolio_rebalancer.py: 리밸런싱 거래 실행
+- app/services/portfolio/portfolio_schedule.py: 리밸런싱/DCA 실행 행 사전 계산
+- app/utils/currency_converter.py: 통화 변환 비율
+
+**연관 컴포넌트**:
+- Backend: app/services/portfolio_service.py (calculate_dca_portfolio_returns)
+"""
+
+import logging
+from datetime import datetime, date
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app.schemas.schemas import FREQUENCY_MAP
+from app.services.portfolio.portfolio_dca_manager import PortfolioDcaManager
+from app.services.portfolio.portfolio_rebalancer import PortfolioRebalancer
+from app.services.portfolio.portfolio_schedule import PortfolioSchedule
+from app.utils.currency_converter import CurrencyConverter
+from app.constants.data_loading import TradingThresholds
+from app.utils.trading_calendar import TradingCalendar, calendar_for_ticker, get_calendar
+
+logger = logging.getLogger(__name__)
+
+
+class PortfolioVectorEngine:
+    """(날짜 × 종목) 행렬 기반 포트폴리오 시뮬레이션 엔진"""
+
+    def __init__(
+        self,
+        dca_manager: PortfolioDcaManager = None,
+        rebalancer: PortfolioRebalancer = None
+    ):
+        """
+        벡터화 엔진 초기화
+
+        Args:
+            dca_manager: DCA 관리 매니저
+            rebalancer: 리밸런싱 리밸런서
+        """
+        self.dca_manager = dca_manager or PortfolioDcaManager()
+        self.rebalancer = rebalancer or PortfolioRebalancer()
+
+    @staticmethod
+    def supports(portfolio_data: Dict[str, pd.DataFrame], date_range: pd.DatetimeIndex) -> bool:
+        """
+        벡터화 엔진으로 처리 가능한 입력인지 확인합니다.
+
+        기존 루프는 "해당 날짜 이전의 마지막 행"을 사용하므로 인덱스가
+        오름차순으로 정렬되어 있어야 searchsorted 결과가 일치합니다.
+
+        Args:
+            portfolio_data: 종목별 가격 데이터
+            date_range: 시뮬레이션 날짜 범위
+
+        Returns:
+            bool: 처리 가능 여부 (False면 기존 일별 루프 사용)
+        """
+        if getattr(date_range, 'tz', None) is not None:
+            return False
+
+        for df in portfolio_data.values():
+            if not isinstance(df.index, pd.DatetimeIndex):
+                return False
+            if 'Close' not in df.columns:
+                return False
+            if not df.index.is_monotonic_increasing:
+                return False
+        return True
+
+    @staticmethod
+    def _to_days(index: pd.DatetimeIndex) -> np.ndarray:
+        """DatetimeIndex를 일 단위 datetime64 배열로 변환합니다 (타임존은 현지 날짜 기준)."""
+        if index.tz is not None:
+            index = index.tz_localize(None)
+        return index.values.astype('datetime64[D]')
+
+    def build_price_matrix(
+        self,
+        sim_dates: pd.DatetimeIndex,
+        stock_keys: List[str],
+        portfolio_data: Dict[str, pd.DataFrame],
+        dca_info: Dict[str, Dict],
+        ticker_currencies: Dict[str, str],
+        exchange_rates_by_currency: Dict[str, Dict[date, float]]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        USD 변환된 종가 행렬과 가격 존재 여부 행렬을 생성합니다.
+
+        PortfolioSimulator.fetch_and_convert_prices()를 모든 날짜에 대해
+        한 번에 수행한 것과 같습니다.
+
+        Args:
+            sim_dates: 시뮬레이션 날짜
+            stock_keys: 종목 키 목록 (열 순서)
+            portfolio_data: 종목별 OHLC 데이터
+            dca_info: 종목 정보
+            ticker_currencies: 종목별 통화 코드
+            exchange_rates_by_currency: 통화별 날짜-환율 매핑
+
+        Returns:
+            (가격 행렬, 가격 존재 마스크) 튜플, 각각 (날짜 수 × 종목 수)
+        """
+        n_dates = len(sim_dates)
+        prices = np.full((n_dates, len(stock_keys)), np.nan)
+        available = np.zeros((n_dates, len(stock_keys)), dtype=bool)
+
+        sim_days = self._to_days(sim_dates)
+        multipliers_by_currency: Dict[str, np.ndarray] = {}
+
+        for col, unique_key in enumerate(stock_keys):
+            symbol = dca_info[unique_key]['symbol']
+            if symbol not in portfolio_data:
+                continue
+
+            df = portfolio_data[symbol]
+            if df.empty:
+                continue
+
+            # 각 날짜 이하의 마지막 행 위치 (df[df.index.date <= d]['Close'].iloc[-1]과 동일)
+            positions = np.searchsorted(self._to_days(df.index), sim_days, side='right') - 1
+            has_row = positions >= 0
+            closes = df['Close'].to_numpy(dtype=float)
+            raw_prices = np.where(has_row, closes[np.maximum(positions, 0)], np.nan)
+
+            currency = ticker_currencies.get(unique_key, 'USD')
+            if currency == 'USD' or currency not in exchange_rates_by_currency:
+                if currency != 'USD':
+                    logger.warning(f"{symbol} 지원하지 않는 통화 {currency}, 변환 없이 사용")
+                prices[:, col] = raw_prices
+                available[:, col] = has_row
+                continue
+
+            if currency not in multipliers_by_currency:
+                currency_rates = exchange_rates_by_currency[currency]
+                rates = np.array(
+                    [currency_rates.get(d.date(), np.nan) for d in sim_dates],
+                    dtype=float
+                )
+                multipliers = CurrencyConverter.get_conversion_multipliers(currency, rates)
+                multipliers[~(rates > 0)] = np.nan
+                multipliers_by_currency[currency] = multipliers
+
+            multipliers = multipliers_by_currency[currency]
+            rate_valid = ~np.isnan(multipliers)
+            missing_rate_days = int((has_row & ~rate_valid).sum())
+            if missing_rate_days:
+                logger.error(f"{symbol}: {currency} 환율 데이터 없음 ({missing_rate_days}일)")
+
+            prices[:, col] = raw_prices * multipliers
+            available[:, col] = has_row & rate_valid
+
+        return prices, available
+
+    @staticmethod
+    def apply_delisting(
+        sim_dates: pd.DatetimeIndex,
+        prices: np.ndarray,
+        available: np.ndarray,
+        calendars: Optional[List[TradingCalendar]] = None,
+        threshold_sessions: int = TradingThresholds.DELISTING_THRESHOLD_SESSIONS
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        상장폐지 상태와 평가 가격 행렬을 계산합니다.
+
+        PortfolioSimulator.detect_and_update_delisting()과 동일한 규칙:
+        - 마지막 가격 날짜 이후 종목 거래소 세션이 threshold_sessions 이상 지나도록 가격이 없으면 상장폐지
+        - 상장폐지 기간에는 마지막 유효 가격으로 평가
+        - 가격이 다시 나타나면 상장폐지 해제
+
+        Args:
+            sim_dates: 시뮬레이션 날짜
+            prices: 가격 행렬
+            available: 가격 존재 마스크
+            calendars: 열별 거래소 캘린더 (None이면 모두 NYSE)
+            threshold_sessions: 상장폐지 판단 기준 세션 수
+
+        Returns:
+            (평가 가격 행렬, 평가 대상 마스크, 상장폐지 마스크) 튜플
+        """
+        n_dates, n_assets = prices.shape
+        if n_dates == 0 or n_assets == 0:
+            return prices.copy(), available.copy(), np.zeros_like(available)
+
+        sim_days = PortfolioVectorEngine._to_days(sim_dates)
+        row_index = np.arange(n_dates)[:, None]
+
+        # 각 날짜 기준 마지막으로 가격이 존재했던 행
+        last_row = np.maximum.accumulate(np.where(available, row_index, -1), axis=0)
+        has_history = last_row >= 0
+        safe_last_row = np.maximum(last_row, 0)
+
+        # 열별 세션 위치 (같은 캘린더의 열은 한 번만 계산), 위치 차 = 마지막 가격일 이후 세션 수
+        calendars = calendars or [get_calendar('XNYS')] * n_assets
+        positions_by_code: Dict[str, np.ndarray] = {}
+        positions = np.empty((n_dates, n_assets), dtype=np.int64)
+        for col, calendar in enumerate(calendars):
+            if calendar.code not in positions_by_code:
+                positions_by_code[calendar.code] = calendar.session_positions(sim_days)
+            positions[:, col] = positions_by_code[calendar.code]
+
+        sessions_without_price = positions - np.take_along_axis(positions, safe_last_row, axis=0)
+        delisted = ~available & has_history & (sessions_without_price >= threshold_sessions)
+
+        last_valid_prices = np.take_along_axis(prices, safe_last_row, axis=0)
+        effective_prices = np.where(available, prices, np.where(delisted, last_valid_prices, np.nan))
+        present = available | delisted
+
+        return effective_prices, present, delisted
+
+    def simulate(
+        self,
+        date_range: pd.DatetimeIndex,
+        portfolio_data: Dict[str, pd.DataFrame],
+        amounts: Dict[str, float],
+        stock_amounts: Dict[str, float],
+        state: Dict[str, Any],
+        dca_info: Dict[str, Dict],
+        ticker_currencies: Dict[str, str],
+        exchange_rates_by_currency: Dict[str, Dict[date, float]],
+        target_weights: Dict[str, float],
+        start_date_obj: datetime,
+        end_date_obj: datetime,
+        rebalance_frequency: str,
+        commission: float
+    ) -> pd.DataFrame:
+        """
+        벡터화 방식으로 DCA/리밸런싱 포트폴리오를 시뮬레이션합니다.
+
+        Args:
+            date_range: 전체 날짜 범위 (정렬됨)
+            portfolio_data: 종목별 가격 데이터 {symbol: DataFrame}
+            amounts: 전체 자산 금액 (주식 + 현금)
+            stock_amounts: 주식 종목별 투자 금액
+            state: PortfolioSimulator.initialize_portfolio_state() 결과
+            dca_info: 분할 매수 정보 (MODIFIED - executed_count, last_dca_date 등)
+            ticker_currencies: 종목별 통화 코드
+            exchange_rates_by_currency: 통화별 날짜-환율 매핑
+            target_weights: 목표 비중
+            start_date_obj: 시작 날짜
+            end_date_obj: 종료 날짜
+            rebalance_frequency: 리밸런싱 주기
+            commission: 거래 수수료율
+
+        Returns:
+            Portfolio_Value, Daily_Return, Cumulative_Return 컬럼과
+            total_trades / rebalance_history / weight_history attrs를 가진 DataFrame
+        """
+        total_amount = sum(amounts.values())
+        sim_dates = pd.DatetimeIndex(
+            [d for d in date_range if start_date_obj.date() <= d.date() <= end_date_obj.date()]
+        )
+        n_dates = len(sim_dates)
+
+        stock_keys = list(stock_amounts.keys())
+        cash_keys = list(state['cash_holdings'].keys())
+
+        shares = state['shares']
+        available_cash = state['available_cash']
+        cash_holdings = state['cash_holdings']
+        total_trades = state['total_trades']
+        rebalance_history = state['rebalance_history']
+        last_rebalance_date = state['last_rebalance_date']
+
+        if n_dates == 0:
+            return self._build_result_frame([], np.array([]), np.array([]), total_trades, rebalance_history, [])
+
+        prices, available = self.build_price_matrix(
+            sim_dates, stock_keys, portfolio_data, dca_info, ticker_currencies, exchange_rates_by_currency
+        )
+        calendars = [calendar_for_ticker(dca_info[key]['symbol']) for key in stock_keys]
+        effective_prices, present, delisted = self.apply_delisting(sim_dates, prices, available, calendars)
+        self._log_delisting_transitions(sim_dates, stock_keys, delisted, dca_info)
+
+        can_rebalance = (
+            rebalance_frequency != 'none'
+            and rebalance_frequency in FREQUENCY_MAP
+            and len(target_weights) > 1
+        )
+
+        daily_cash_inflows = np.zeros(n_dates)
+        event_rows: List[int] = []
+        event_states: List[Tuple[np.ndarray, float, np.ndarray]] = []
+
+        def prices_at(row: int) -> Dict[str, float]:
+            return {
+                key: float(effective_prices[row, col])
+                for col, key in enumerate(stock_keys)
+                if present[row, col]
+            }
+
+        def snapshot(row: int) -> None:
+            event_rows.append(row)
+            event_states.append((
+                np.array([shares.get(key, 0.0) for key in stock_keys], dtype=float),
+                float(available_cash),
+                np.array([cash_holdings.get(key, 0.0) for key in cash_keys], dtype=float),
+            ))
+
+        # 첫 날: 초기 매수 (일시불 전액 또는 DCA 첫 회차)
+        first_date = sim_dates[0]
+        first_prices = prices_at(0)
+        trades, cash_inflow = self.dca_manager.execute_initial_purchases(
+            current_date=first_date,
+            stock_amounts=stock_amounts,
+            current_prices=first_prices,
+            dca_info=dca_info,
+            shares=shares,
+            commission=commission
+        )
+        total_trades += trades
+        daily_cash_inflows[0] += cash_inflow
+
+        snapshot(0)
+
+        # 이벤트 날짜만 순회 (사전 계산된 DCA / 리밸런싱 실행 행)
+        schedule = PortfolioSchedule.build(
+            sim_dates, stock_keys, dca_info, start_date_obj, rebalance_frequency, can_rebalance
+        )
+        for row in schedule.event_rows.tolist():
+            current_date = sim_dates[row]
+            current_prices = prices_at(row)
+
+            trades, cash_inflow = self.dca_manager.execute_scheduled_purchases(
+                current_date=current_date,
+                unique_keys=schedule.dca_keys_at(row),
+                current_prices=current_prices,
+                dca_info=dca_info,
+                shares=shares,
+                commission=commission
+            )
+            total_trades += trades
+            daily_cash_inflows[row] += cash_inflow
+
+            if schedule.rebalance_mask[row]:
+                delisted_stocks = {key for col, key in enumerate(stock_keys) if delisted[row, col]}
+                logger.info(
+                    f"{current_date.date()}: 리밸런싱 트리거됨 "
+                    f"(주기: {rebalance_frequency}, 자산 수: {len(target_weights)}, "
+                    f"마지막 리밸런싱: {last_rebalance_date.date() if last_rebalance_date else '없음'})"
+                )
+
+                adjusted_target_weights = self.rebalancer.calculate_adjusted_weights(
+                    target_weights=target_weights,
+                    delisted_stocks=delisted_stocks,
+                    dca_info=dca_info
+                )
+
+                total_stock_value = sum(
+                    shares[key] * current_prices.get(key, 0)
+                    for key in shares.keys()
+                    if key in current_prices
+                )
+
+                rebalance_result = self.rebalancer.execute_rebalancing_trades(
+                    current_date=current_date,
+                    adjusted_target_weights=adjusted_target_weights,
+                    shares=shares,
+                    current_prices=current_prices,
+                    available_cash=available_cash,
+                    cash_holdings=cash_holdings,
+                    commission=commission,
+                    total_stock_value=total_stock_value,
+                    dca_info=dca_info,
+                    delisted_stocks=delisted_stocks
+                )
+
+                shares = rebalance_result['updated_shares']
+                cash_holdings = rebalance_result['updated_cash_holdings']
+                available_cash = rebalance_result['updated_available_cash']
+
+                if rebalance_result['rebalance_trades']:
+                    rebalance_history.append({
+                        'date': current_date.strftime('%Y-%m-%d'),
+                        'trades': rebalance_result['rebalance_trades'],
+                        'weights_before': rebalance_result['weights_before'],
+                        'weights_after': rebalance_result['weights_after'],
+                        'commission_cost': rebalance_result['commission_cost']
+                    })
+
+                last_rebalance_date = current_date
+                total_trades += rebalance_result['trades_executed']
+
+            snapshot(row)
+
+        # 이벤트 사이 구간은 직전 이벤트의 보유 상태를 그대로 사용 (forward-fill)
+        segment = np.searchsorted(np.array(event_rows), np.arange(n_dates), side='right') - 1
+        share_matrix = np.vstack([s[0] for s in event_states])[segment]
+        cash_series = np.array([s[1] for s in event_states])[segment]
+        cash_matrix = np.vstack([s[2] for s in event_states])[segment] if cash_keys else np.zeros((n_dates, 0))
+
+        # 포트폴리오 가치: 현금 → 종목 순으로 누적 (기존 루프와 동일한 합산 순서)
+        stock_values = share_matrix * effective_prices
+        portfolio_value = cash_series.copy()
+        for col in range(len(stock_keys)):
+            portfolio_value = portfolio_value + np.where(present[:, col], stock_values[:, col], 0.0)
+
+        normalized_values = portfolio_value / total_amount
+
+        # 일일 수익률: 전일 가치(정규화 후 복원)와 당일 추가 투자금 기준
+        prev_values = np.empty(n_dates)
+        prev_values[0] = 0.0
+        prev_values[1:] = normalized_values[:-1] * total_amount
+        with np.errstate(divide='ignore', invalid='ignore'):
+            daily_returns = np.where(
+                prev_values > 0,
+                (portfolio_value - prev_values - daily_cash_inflows) / prev_values,
+                0.0
+            )
+
+        weight_history = self._build_weight_history(
+            sim_dates, stock_keys, cash_keys, dca_info, stock_values, present, cash_matrix, portfolio_value
+        )
+
+        return self._build_result_frame(
+            list(sim_dates), normalized_values, daily_returns, total_trades, rebalance_history, weight_history
+        )
+
+    @staticmethod
+    def _build_weight_history(
+        sim_dates: pd.DatetimeIndex,
+        stock_keys: List[str],
+        cash_keys: List[str],
+        dca_info: Dict[str, Dict],
+        stock_values: np.ndarray,
+        present: np.ndarray,
+        cash_matrix: np.ndarray,
+        portfolio_value: np.ndarray
+    ) -> List[Dict[str, Any]]:
+        """일별 비중 딕셔너리 목록을 생성합니다 (PortfolioMetrics와 동일한 형식)."""
+        stock_symbols = [dca_info[key]['symbol'] for key in stock_keys]
+        cash_symbols = [dca_info[key]['symbol'] for key in cash_keys]
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            stock_weights = (stock_values / portfolio_value[:, None]).tolist()
+            cash_weights = (cash_matrix / portfolio_value[:, None]).tolist()
+
+        date_strings = sim_dates.strftime('%Y-%m-%d')
+        present_rows = present.tolist()
+        positive_rows = (portfolio_value > 0).tolist()
+
+        weight_history = []
+        for row in range(len(sim_dates)):
+            current_weights = {'date': date_strings[row]}
+            if positive_rows[row]:
+                row_present = present_rows[row]
+                row_weights = stock_weights[row]
+                for col, symbol in enumerate(stock_symbols):
+                    if row_present[col]:
+                        current_weights[symbol] = current_weights.get(symbol, 0) + row_weights[col]
+                row_cash_weights = cash_weights[row]
+                for col, symbol in enumerate(cash_symbols):
+                    current_weights[symbol] = current_weights.get(symbol, 0) + row_cash_weights[col]
+            weight_history.append(current_weights)
+
+        return weight_history
+
+    @staticmethod
+    def _log_delisting_transitions(
+        sim_dates: pd.DatetimeIndex,
+        stock_keys: List[str],
+        delisted: np.ndarray,
+        dca_info: Dict[str, Dict]
+    ) -> None:
+        """상장폐지 감지/해제 시점을 로깅합니다."""
+        if not delisted.any():
+            return
+
+        for col, unique_key in enumerate(stock_keys):
+            flags = delisted[:, col]
+            if not flags.any():
+                continue
+            changes = np.flatnonzero(np.diff(np.concatenate(([False], flags)).astype(np.int8)))
+            symbol = dca_info[unique_key]['symbol']
+            for change_row in changes:
+                if flags[change_row]:
+                    logger.warning(f"{symbol} ({unique_key}) 상장폐지 감지: {sim_dates[change_row].date()}")
+                else:
+                    logger.info(f"{unique_key} 가격 데이터 재등장 (재상장?), 상장폐지 상태 해제")
+
+    @staticmethod
+    def _build_result_frame(
+        valid_dates: list,
+        portfolio_values: np.ndarray,
+        daily_returns: np.ndarray,
+        total_trades: int,
+        rebalance_history: list,
+        weight_history: list
+    ) -> pd.DataFrame:
+        """기존 루프와 동일한 형식의 결과 DataFrame을 생성합니다."""
+        portfolio_values = np.asarray(portfolio_values, dtype=float)
+        result = pd.DataFrame({
+            'Date': valid_dates,
+            'Portfolio_Value': portfolio_values,
+            'Daily_Return': np.asarray(daily_returns, dtype=float),
+            'Cumulative_Return': (portfolio_values - 1) * 100
+        })
+        result.set_index('Date', inplace=True)
+
+        result.attrs['total_trades'] = total_trades
+        result.attrs['rebalance_history'] = rebalance_history
+        result.attrs['weight_history'] = weight_history
+
+        return result
@@ -10,6 +10,7 @@
 1. calculate_portfolio_statistics(): 백테스트 결과 통계 계산
 2. _get_max_consecutive(): 연속된 상승/하락일 계산
 3. _calculate_realistic_equity_curve(): 개별 종목 equity curve 합산
+   - (날짜 × 종목) 행렬로 정렬 후 forward fill, 열 합산, 비중 행렬 계산
 4. _fallback_equity_curve(): 데이터 없을 때 선형 equity curve
 
 **의존성**:
@@ -23,6 +24,7 @@ from datetime import datetime
 import logging
 
 from app.schemas.schemas import PortfolioBacktestRequest
+from app.services.portfolio.portfolio_metrics import PortfolioMetrics
 
 logger = logging.getLogger(__name__)
 
@@ -52,7 +54,7 @@ class PortfolioCalculator:
         total_return = (final_value - 1) * 100
 
         # 드로우다운 계산
-        running_max = portfolio_data['Portfolio_Value'].expanding().max()
+        running_max = portfolio_data['Portfolio_Value'].cummax()
         drawdown = (portfolio_data['Portfolio_Value'] - running_max) / running_max * 100
         max_drawdown = drawdown.min()
         avg_drawdown = drawdown[drawdown < 0].mean() if len(drawdown[drawdown < 0]) > 0 else 0
@@ -116,17 +118,7 @@ class PortfolioCalculator:
         Returns:
             연속된 값의 최대 길이
         """
-        max_count = 0
-        current_count = 0
-
-        for value in series:
-            if value == target_value:
-                current_count += 1
-                max_count = max(max_count, current_count)
-            else:
-                current_count = 0
-
-        return max_count
+        return PortfolioMetrics._get_max_consecutive(series, target_value)
 
     async def _calculate_realistic_equity_curve(self, request: PortfolioBacktestRequest,
                                               portfolio_results: Dict, total_amount: float) -> Tuple[Dict, Dict, list]:
@@ -165,59 +157,43 @@ class PortfolioCalculator:
             logger.warning("모든 종목의 equity curve가 없음, fallback 사용")
             return await self._fallback_equity_curve(request, portfolio_results, total_amount)
 
+        # YYYY-MM-DD 문자열은 사전순 = 날짜순
         date_range = sorted(all_dates)
-
-        equity_curve = {}
-        daily_returns = {}
-        weight_history = []
-        prev_portfolio_value = total_amount
-
-        for i, date_str in enumerate(date_range):
-            portfolio_value = 0
-            symbol_equities = {}  # 각 종목의 equity 저장
-
-            # 각 종목의 해당 날짜 equity 합산
-            for symbol, result in portfolio_results.items():
-                equity_curve_dict = equity_curves_by_symbol.get(symbol)
-                symbol_equity = 0
-
-                if equity_curve_dict:
-                    # 전략 실행 결과의 equity curve 사용
-                    if date_str in equity_curve_dict:
-                        symbol_equity = equity_curve_dict[date_str]
-                    elif i == 0:
-                        # 첫날에 데이터가 없으면 초기 투자금
-                        symbol_equity = result.get('amount', 0)
-                    else:
-                        # 중간에 데이터가 없으면 마지막 값 사용 (forward fill)
-                        symbol_equity = result.get('final_value', result.get('amount', 0))
-                else:
-                    # equity curve가 없는 종목 (예: 현금)
-                    symbol_equity = result.get('amount', 0)
-
-                symbol_equities[symbol] = symbol_equity
-                portfolio_value += symbol_equity
-
-            # 일일 수익률 계산
-            if i == 0:
-                daily_return = 0.0
-            else:
-                daily_return = (portfolio_value - prev_portfolio_value) / prev_portfolio_value * 100 if prev_portfolio_value > 0 else 0.0
-
-            equity_curve[date_str] = portfolio_value
-            daily_returns[date_str] = daily_return
-
-            # 포트폴리오 비중 계산
-            current_weights = {'date': date_str}
-            if portfolio_value > 0:
-                for symbol, symbol_equity in symbol_equities.items():
-                    current_weights[symbol] = symbol_equity / portfolio_value
-            else:
-                for symbol in symbol_equities.keys():
-                    current_weights[symbol] = 0
-
-            weight_history.append(current_weights)
-            prev_portfolio_value = portfolio_value
+        symbols = list(portfolio_results.keys())
+
+        # (날짜 × 종목) equity 행렬: 거래일이 다른 종목은 마지막 값 유지(forward fill),
+        # 첫 거래일 이전 구간과 equity curve가 없는 종목(예: 현금)은 초기 투자금
+        positions = {date_str: i for i, date_str in enumerate(date_range)}
+        equities = np.full((len(date_range), len(symbols)), np.nan)
+        for column, symbol in enumerate(symbols):
+            curve = equity_curves_by_symbol.get(symbol)
+            if curve:
+                rows = np.fromiter(map(positions.__getitem__, curve), dtype=np.intp, count=len(curve))
+                equities[rows, column] = np.fromiter(curve.values(), dtype=float, count=len(curve))
+        equities = pd.DataFrame(equities, columns=symbols).ffill().fillna(
+            {symbol: float(result.get('amount', 0)) for symbol, result in portfolio_results.items()}
+        ).to_numpy()
+
+        # 열 순서대로 누적 합산 (기존 종목 순서 합산과 동일한 부동소수점 결과)
+        portfolio_values = np.zeros(len(date_range))
+        for column in equities.T:
+            portfolio_values = portfolio_values + column
+
+        # 일일 수익률 (첫날 0, 전일 가치가 0 이하이면 0)
+        prev_values = np.concatenate(([np.nan], portfolio_values[:-1]))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            returns = np.where(prev_values > 0, (portfolio_values - prev_values) / prev_values * 100, 0.0)
+            weights = np.where(
+                portfolio_values[:, None] > 0, equities / portfolio_values[:, None], 0.0
+            )
+
+        equity_curve = dict(zip(date_range, portfolio_values.tolist()))
+        daily_returns = dict(zip(date_range, returns.tolist()))
+        weight_keys = ['date', *symbols]
+        weight_history = [
+            dict(zip(weight_keys, row))
+            for row in zip(date_range, *weights.T.tolist())
+        ]
 
         logger.info(f"포트폴리오 equity curve 및 weight history 계산 완료: {len(equity_curve)}일치")
         return equity_curve, daily_returns, weight_history
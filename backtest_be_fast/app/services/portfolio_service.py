@@ -25,6 +25,8 @@
 3. run_strategy_portfolio_backtest(): 기술적 전략 백테스트
 4. calculate_dca_portfolio_returns(): DCA 투자 수익률 계산
 5. calculate_portfolio_statistics(): 샤프 비율, 최대 낙폭 등 통계
+6. run_monte_carlo(): 일일 수익률 / 거래 수익률 재표본 강건성 통계 (request.monte_carlo 지정 시)
+   - 시뮬레이션 실패(예: 일일 수익률 2개 미만) 시 monte_carlo = {'error': ...}, 백테스트 결과는 정상 반환
 
 **지원 투자 방식**:
 - lump_sum: 일시불 투자 (전액 한 번에 투자)
@@ -38,6 +40,7 @@
 - app/services/backtest_service.py: 단일 종목 백테스트
 - app/services/yfinance_db.py: 주가 데이터 로딩
 - app/repositories/backtest_repository.py: 백테스트 결과 저장
+- app/utils/metrics.py: 단계별 시간 측정 (data_load, fx_conversion, portfolio_simulation)
 
 **연관 컴포넌트**:
 - Backend: app/api/v1/endpoints/backtest.py (API 엔드포인트)
@@ -53,22 +56,27 @@
 import asyncio
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, Tuple
+from typing import Dict, Any, Tuple, Optional
 from datetime import datetime, timedelta, date
 import logging
 
-from app.schemas.schemas import PortfolioBacktestRequest, FREQUENCY_MAP
+from app.schemas.schemas import PortfolioBacktestRequest, MonteCarloOptions, FREQUENCY_MAP
 from app.schemas.requests import BacktestRequest
 from app.services.backtest_service import backtest_service
 from app.repositories.stock_repository import get_stock_repository
 from app.services.dca_calculator import DcaCalculator
-from app.services.rebalance_helper import RebalanceHelper, get_next_nth_weekday, get_weekday_occurrence
+from app.services.rebalance_helper import RebalanceHelper
 from app.services.portfolio_calculator_service import portfolio_calculator
 from app.services.portfolio.portfolio_dca_manager import PortfolioDcaManager
 from app.services.portfolio.portfolio_rebalancer import PortfolioRebalancer
 from app.services.portfolio.portfolio_simulator import PortfolioSimulator
 from app.services.portfolio.portfolio_metrics import PortfolioMetrics
-from app.utils.serializers import recursive_serialize
+from app.services.portfolio.portfolio_vector_engine import PortfolioVectorEngine
+from app.services.portfolio.portfolio_monte_carlo import PortfolioMonteCarlo
+from app.services.portfolio.portfolio_schedule import PortfolioSchedule
+from app.utils.metrics import span
+from app.utils.serializers import date_value_dict, recursive_serialize
+from app.utils.trading_calendar import get_calendar
 from app.core.exceptions import (
     DataNotFoundError,
     InvalidSymbolError,
@@ -77,6 +85,7 @@ from app.core.exceptions import (
 from app.constants.currencies import SUPPORTED_CURRENCIES, EXCHANGE_RATE_LOOKBACK_DAYS
 from app.constants.data_loading import TradingThresholds
 from app.utils.currency_converter import currency_converter
+from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
@@ -92,6 +101,11 @@ class PortfolioService:
             rebalancer=self.rebalancer
         )
         self.metrics = PortfolioMetrics()
+        self.vector_engine = PortfolioVectorEngine(
+            dca_manager=self.dca_manager,
+            rebalancer=self.rebalancer
+        )
+        self.monte_carlo = PortfolioMonteCarlo(chunk_cells=settings.monte_carlo_chunk_cells)
         # Repository 초기화 (Repository 패턴)
         self.stock_repository = get_stock_repository()
         logger.info("포트폴리오 서비스가 초기화되었습니다")
@@ -104,7 +118,8 @@ class PortfolioService:
         start_date: str,
         end_date: str,
         rebalance_frequency: str = "weekly_4",
-        commission: float = 0.0
+        commission: float = 0.0,
+        engine: Optional[str] = None
     ) -> pd.DataFrame:
         """
         분할 매수(DCA)와 리밸런싱을 고려한 포트폴리오 수익률을 계산합니다.
@@ -117,11 +132,14 @@ class PortfolioService:
             end_date: 종료 날짜
             rebalance_frequency: 리밸런싱 주기 (weekly_1, weekly_2, weekly_4, weekly_8, weekly_12, weekly_24, weekly_48, none)
             commission: 거래 수수료율 (예: 0.002 = 0.2%)
+            engine: 시뮬레이션 엔진 ('vectorized' 또는 'loop', None이면 설정값 사용)
 
         Returns:
             포트폴리오 가치와 수익률이 포함된 DataFrame
             
         Note:
+            - 'vectorized'는 (날짜 × 종목) 행렬 기반 PortfolioVectorEngine 사용
+            - 'loop'는 기존 일별 루프 (결과 동일, 비교 검증용)
             - last_rebalance_date는 리밸런싱 예정일 추적용 (거래 여부 무관)
             - rebalance_history는 실제 거래가 발생한 리밸런싱만 기록
             - 이는 의도된 동작: 다음 리밸런싱 스케줄 계산을 위해 예정일 기준 추적
@@ -135,19 +153,20 @@ class PortfolioService:
         stock_amounts = {k: v for k, v in amounts.items() if dca_info[k].get('asset_type') != 'cash'}
 
         # 날짜 범위 설정
-        all_dates = set()
-        for unique_key, df in portfolio_data.items():
-            if dca_info.get(unique_key, {}).get('asset_type') != 'cash':
-                all_dates.update(df.index)
+        # 실제 관측된 거래일의 합집합 (거래소별 휴장일은 각 종목 데이터에 이미 반영됨)
+        indexes = [
+            df.index for unique_key, df in portfolio_data.items()
+            if dca_info.get(unique_key, {}).get('asset_type') != 'cash' and len(df.index)
+        ]
 
-        if not all_dates and cash_amount == 0:
+        if not indexes and cash_amount == 0:
             raise ValueError("유효한 데이터가 없습니다.")
 
-        if not all_dates and cash_amount > 0:
+        if not indexes and cash_amount > 0:
             today = datetime.now().date()
             date_range = pd.DatetimeIndex([today])
         else:
-            date_range = pd.DatetimeIndex(sorted(all_dates))
+            date_range = indexes[0].append(indexes[1:]).unique().sort_values()
 
         total_amount = sum(amounts.values())
         start_date_obj = datetime.strptime(start_date, '%Y-%m-%d')
@@ -156,9 +175,7 @@ class PortfolioService:
         # 각 종목의 currency 정보 먼저 가져오기 (배치 조회로 최적화)
         symbols = [dca_info[unique_key]['symbol'] for unique_key in stock_amounts.keys()]
         try:
-            ticker_info_dict = await asyncio.to_thread(
-                self.stock_repository.get_tickers_info_batch, symbols
-            )
+            ticker_info_dict = await self.stock_repository.get_tickers_info_batch_async(symbols)
             ticker_currencies = {}
             for unique_key in stock_amounts.keys():
                 symbol = dca_info[unique_key]['symbol']
@@ -176,13 +193,14 @@ class PortfolioService:
         if required_currencies:
             logger.info(f"포트폴리오 환율 로딩 시작: {len(required_currencies)}개 통화 [{', '.join(required_currencies)}]")
 
-        exchange_rates_by_currency = await currency_converter.load_multiple_exchange_rates(
-            currencies=required_currencies,
-            start_date=start_date,
-            end_date=end_date,
-            date_range=date_range,
-            buffer_multiplier=2  # EXCHANGE_RATE_LOOKBACK_DAYS * 2
-        )
+        with span('fx_conversion'):
+            exchange_rates_by_currency = await currency_converter.load_multiple_exchange_rates(
+                currencies=required_currencies,
+                start_date=start_date,
+                end_date=end_date,
+                date_range=date_range,
+                buffer_multiplier=2  # EXCHANGE_RATE_LOOKBACK_DAYS * 2
+            )
 
         # 환율 로드 결과 요약 로깅
         if required_currencies:
@@ -211,6 +229,24 @@ class PortfolioService:
             dca_info=dca_info
         )
 
+        engine = engine or settings.portfolio_simulation_engine
+        if engine == 'vectorized' and PortfolioVectorEngine.supports(portfolio_data, date_range):
+            return self.vector_engine.simulate(
+                date_range=date_range,
+                portfolio_data=portfolio_data,
+                amounts=amounts,
+                stock_amounts=stock_amounts,
+                state=state,
+                dca_info=dca_info,
+                ticker_currencies=ticker_currencies,
+                exchange_rates_by_currency=exchange_rates_by_currency,
+                target_weights=target_weights,
+                start_date_obj=start_date_obj,
+                end_date_obj=end_date_obj,
+                rebalance_frequency=rebalance_frequency,
+                commission=commission
+            )
+
         # 상태 변수 언팩
         shares = state['shares']
         portfolio_values = state['portfolio_values']
@@ -224,17 +260,25 @@ class PortfolioService:
         rebalance_history = state['rebalance_history']
         weight_history = state['weight_history']
         last_rebalance_date = state['last_rebalance_date']
-        original_rebalance_nth = state['original_rebalance_nth']
         last_valid_prices = state['last_valid_prices']
         last_price_date = state['last_price_date']
         delisted_stocks = state['delisted_stocks']
 
-        for current_date in date_range:
+        # 리밸런싱 / DCA 실행일 사전 계산 (루프에서는 행 번호 포함 여부만 확인)
+        day_of = date_range.date
+        valid_dates = date_range[(day_of >= start_date_obj.date()) & (day_of <= end_date_obj.date())]
+        can_rebalance = (
+            rebalance_frequency != 'none'
+            and rebalance_frequency in FREQUENCY_MAP
+            and len(target_weights) > 1
+        )
+        schedule = PortfolioSchedule.build(
+            valid_dates, list(stock_amounts.keys()), dca_info, start_date_obj, rebalance_frequency, can_rebalance
+        )
+
+        for row, current_date in enumerate(valid_dates):
             daily_cash_inflow = 0.0  # 당일 추가 투자금 (DCA)
-            if current_date.date() < start_date_obj.date():
-                continue
-            if current_date.date() > end_date_obj.date():
-                break
+            should_rebalance = bool(schedule.rebalance_mask[row])
 
             # 현재 가격 가져오기 및 USD 변환 (Extract Method 리팩토링)
             current_prices, last_valid_exchange_rates = self.simulator.fetch_and_convert_prices(
@@ -280,45 +324,26 @@ class PortfolioService:
                 is_first_day = False
                 prev_date = current_date
 
-            # DCA 추가 매수 실행 (Extract Method 리팩토링)
-            if prev_date is not None:
-                trades, cash_inflow = self.dca_manager.execute_periodic_purchases(
-                    current_date=current_date,
-                    prev_date=prev_date,
-                    stock_amounts=stock_amounts,
-                    current_prices=current_prices,
-                    dca_info=dca_info,
-                    shares=shares,
-                    commission=commission,
-                    start_date_obj=start_date_obj
-                )
-                total_trades += trades
-                daily_cash_inflow += cash_inflow
-
-            # 리밸런싱 실행
-            # 첫 리밸런싱 시 original_nth 설정
-            if original_rebalance_nth is None and rebalance_frequency != 'none':
-                original_rebalance_nth = get_weekday_occurrence(start_date_obj)
-                logger.debug(f"리밸런싱 원본 Nth 값 설정 = {original_rebalance_nth}번째 {['월','화','수','목','금','토','일'][start_date_obj.weekday()]}요일")
-
-            should_rebalance = RebalanceHelper.is_rebalance_date(
-                current_date, prev_date, rebalance_frequency, start_date_obj, last_rebalance_date, original_rebalance_nth
+            # DCA 추가 매수 실행 (사전 계산된 실행일)
+            trades, cash_inflow = self.dca_manager.execute_scheduled_purchases(
+                current_date=current_date,
+                unique_keys=schedule.dca_keys_at(row),
+                current_prices=current_prices,
+                dca_info=dca_info,
+                shares=shares,
+                commission=commission
             )
+            total_trades += trades
+            daily_cash_inflow += cash_inflow
 
-            # 리밸런싱 트리거 결정 로깅
-            if rebalance_frequency != 'none':
-                if should_rebalance and len(target_weights) > 1:
-                    logger.info(
-                        f"{current_date.date()}: 리밸런싱 트리거됨 "
-                        f"(주기: {rebalance_frequency}, 자산 수: {len(target_weights)}, "
-                        f"마지막 리밸런싱: {last_rebalance_date.date() if last_rebalance_date else '없음'})"
-                    )
-                elif should_rebalance and len(target_weights) <= 1:
-                    logger.debug(
-                        f"{current_date.date()}: 리밸런싱 조건 충족하지만 자산 수 부족 (자산 수: {len(target_weights)})"
-                    )
+            # 리밸런싱 실행 (자산이 2개 이상일 때만 일정이 생성됨)
+            if should_rebalance:
+                logger.info(
+                    f"{current_date.date()}: 리밸런싱 트리거됨 "
+                    f"(주기: {rebalance_frequency}, 자산 수: {len(target_weights)}, "
+                    f"마지막 리밸런싱: {last_rebalance_date.date() if last_rebalance_date else '없음'})"
+                )
 
-            if should_rebalance and len(target_weights) > 1:  # 자산이 2개 이상일 때만
                 # 상장폐지 종목이 있는 경우 동적 비중 재계산 (Extract Method 리팩토링)
                 adjusted_target_weights = self.rebalancer.calculate_adjusted_weights(
                     target_weights=target_weights,
@@ -399,8 +424,6 @@ class PortfolioService:
             prev_date = current_date
 
         # 결과 DataFrame 생성
-        valid_dates = [d for d in date_range if start_date_obj.date() <= d.date() <= end_date_obj.date()]
-
         if len(portfolio_values) != len(valid_dates):
             logger.warning(f"포트폴리오 값 길이 불일치: portfolio_values={len(portfolio_values)}, valid_dates={len(valid_dates)}")
             logger.warning(f"첫 3개 날짜: {valid_dates[:3] if len(valid_dates) > 0 else 'None'}")
@@ -424,12 +447,18 @@ class PortfolioService:
         return result
     
     
-    async def run_portfolio_backtest(self, request: PortfolioBacktestRequest) -> Dict[str, Any]:
+    async def run_portfolio_backtest(
+        self,
+        request: PortfolioBacktestRequest,
+        loaded_price_data: Optional[Dict[str, pd.DataFrame]] = None
+    ) -> Dict[str, Any]:
         """
         포트폴리오 백테스트 실행
         
         Args:
             request: 포트폴리오 백테스트 요청
+            loaded_price_data: 백테스트 중 로드한 종목별 가격 데이터를 채워 받을 딕셔너리
+                (Buy & Hold 경로만 해당, 통합 데이터 수집 시 재조회 방지용)
             
         Returns:
             백테스트 결과
@@ -440,9 +469,20 @@ class PortfolioService:
 
             # 전략이 buy_hold_strategy가 아닌 경우 개별 종목별로 전략 백테스트 실행
             if strategy_name != "buy_hold_strategy":
-                return await self.run_strategy_portfolio_backtest(request)
+                result = await self.run_strategy_portfolio_backtest(request)
             else:
-                return await self.run_buy_and_hold_portfolio_backtest(request)
+                result = await self.run_buy_and_hold_portfolio_backtest(request, loaded_price_data)
+
+            if request.monte_carlo is not None and result.get('status') == 'success':
+                # CPU 연산이므로 이벤트 루프 비차단, 실패해도 백테스트 결과는 유지
+                try:
+                    result['data']['monte_carlo'] = await asyncio.to_thread(
+                        self.run_monte_carlo, result['data'], request.monte_carlo
+                    )
+                except Exception as e:
+                    logger.warning(f"몬테카를로 시뮬레이션 실패 (백테스트 결과는 반환): {e}")
+                    result['data']['monte_carlo'] = {'error': str(e)}
+            return result
                 
         except Exception as e:
             logger.exception("포트폴리오 백테스트 실행 중 오류 발생")
@@ -452,6 +492,41 @@ class PortfolioService:
                 'code': 'PORTFOLIO_BACKTEST_ERROR'
             }
     
+    def run_monte_carlo(self, data: Dict[str, Any], options: MonteCarloOptions) -> Dict[str, Any]:
+        """
+        백테스트 결과로 몬테카를로 강건성 통계 계산
+
+        Args:
+            data: 백테스트 결과 data (daily_returns: 백분율, strategy_details[*].trade_log)
+            options: 시뮬레이션 옵션
+
+        Returns:
+            daily: 일일 수익률 재표본 경로의 CAGR / 최대 낙폭 / 샤프 비율 분포
+            trades: 거래별 수익률 재표본 분포 (ReturnPct가 있는 거래가 2개 미만이면 None)
+        """
+        # API 응답의 daily_returns는 백분율 → 소수로 변환 (calculate_dca_portfolio_returns의 Daily_Return)
+        daily_returns = np.fromiter(data.get('daily_returns', {}).values(), dtype=float) / 100
+        trade_returns = [
+            trade['ReturnPct']
+            for details in (data.get('strategy_details') or {}).values()
+            if isinstance(details, dict)
+            for trade in details.get('trade_log') or []
+            if trade.get('ReturnPct') is not None
+        ]
+
+        return {
+            'daily': self.monte_carlo.simulate_returns(
+                daily_returns,
+                n_paths=options.n_paths,
+                method=options.method,
+                block_size=options.block_size,
+                seed=options.seed
+            ),
+            'trades': self.monte_carlo.simulate_trades(
+                np.asarray(trade_returns, dtype=float), n_paths=options.n_paths, seed=options.seed
+            )
+        }
+
     async def run_strategy_portfolio_backtest(self, request: PortfolioBacktestRequest) -> Dict[str, Any]:
         """
         전략 기반 포트폴리오 백테스트 실행
@@ -476,7 +551,38 @@ class PortfolioService:
             strategy_name = request.strategy.value if hasattr(request.strategy, 'value') else str(request.strategy)
             logger.info(f"전략 기반 백테스트: {strategy_name}, 총 투자금액: ${total_amount:,.2f}")
             
-            # 각 종목별로 전략 백테스트 실행
+            # 종목별 전략 백테스트를 동시에 시작 (프로세스 풀 사용 시 종목별로 다른 코어에서 실행)
+            backtest_requests = {}
+            for idx, item in enumerate(request.portfolio):
+                if item.asset_type == 'cash':
+                    continue
+                symbol = item.symbol
+                amount = amounts[symbol]
+                weight = amount / total_amount if total_amount > 0 else 0.0
+                
+                logger.info(f"종목 {symbol} (#{idx+1}) 전략 백테스트 실행 (투자금액: ${amount:,.2f}, 비중: {weight:.3f})")
+                
+                # 개별 종목 백테스트 요청 생성
+                strategy_value = strategy_name  # 이미 위에서 변환한 strategy_name 사용
+                backtest_req = BacktestRequest(
+                    ticker=symbol,
+                    start_date=request.start_date,
+                    end_date=request.end_date,
+                    initial_cash=amount,
+                    strategy=strategy_value,
+                    strategy_params=request.strategy_params or {}
+                )
+                backtest_requests[idx] = backtest_req
+            
+            backtest_outcomes = dict(zip(
+                backtest_requests.keys(),
+                await asyncio.gather(
+                    *(backtest_service.run_backtest(req) for req in backtest_requests.values()),
+                    return_exceptions=True
+                )
+            ))
+            
+            # 요청 순서대로 결과 결합
             for idx, item in enumerate(request.portfolio):
                 symbol = item.symbol
                 # amount/weight 동시 지원
@@ -518,22 +624,11 @@ class PortfolioService:
                     logger.info(f"현금 자산 완료: 0.00% 수익률")
                     continue
                 
-                logger.info(f"종목 {symbol} (#{idx+1}) 전략 백테스트 실행 (투자금액: ${amount:,.2f}, 비중: {weight:.3f})")
-                
-                # 개별 종목 백테스트 요청 생성
-                strategy_value = strategy_name  # 이미 위에서 변환한 strategy_name 사용
-                backtest_req = BacktestRequest(
-                    ticker=symbol,
-                    start_date=request.start_date,
-                    end_date=request.end_date,
-                    initial_cash=amount,
-                    strategy=strategy_value,
-                    strategy_params=request.strategy_params or {}
-                )
-                
                 try:
-                    # 개별 종목 백테스트 실행
-                    result = await backtest_service.run_backtest(backtest_req)
+                    # 개별 종목 백테스트 결과 (실행 중 발생한 예외는 여기서 재발생)
+                    result = backtest_outcomes[idx]
+                    if isinstance(result, BaseException):
+                        raise result
                     
                     if result and hasattr(result, 'final_equity'):
                         final_value = result.final_equity
@@ -708,10 +803,16 @@ class PortfolioService:
                 'code': 'STRATEGY_PORTFOLIO_BACKTEST_ERROR'
             }
     
-    async def run_buy_and_hold_portfolio_backtest(self, request: PortfolioBacktestRequest) -> Dict[str, Any]:
+    async def run_buy_and_hold_portfolio_backtest(
+        self,
+        request: PortfolioBacktestRequest,
+        loaded_price_data: Optional[Dict[str, pd.DataFrame]] = None
+    ) -> Dict[str, Any]:
         """
         Buy & Hold 포트폴리오 백테스트 실행 (투자 금액 기반)
         현금(CASH)과 주식을 함께 처리, 분할 매수(DCA) 지원
+
+        loaded_price_data가 주어지면 로드한 종목별 가격 데이터(원본 통화)를 채워 넣습니다.
         """
         try:
             # 각 종목의 데이터 수집 (중복 종목 지원)
@@ -808,25 +909,18 @@ class PortfolioService:
                 # 로드할 종목 리스트에 추가
                 symbols_to_load.append(symbol)
 
-            # Phase 2: 모든 종목 데이터를 병렬로 로드 (N+1 query 최적화)
+            # Phase 2: 모든 종목 데이터를 일괄 로드 (N+1 query 최적화: DB 왕복 1회)
             if symbols_to_load:
-                logger.info(f"포트폴리오 데이터 병렬 로드 시작: {len(symbols_to_load)}개 종목")
-
-                # 병렬 로드 태스크 생성
-                load_tasks = [
-                    asyncio.to_thread(self.stock_repository.load_stock_data, symbol, request.start_date, request.end_date)
-                    for symbol in symbols_to_load
-                ]
-
-                # 병렬 실행
-                load_results = await asyncio.gather(*load_tasks, return_exceptions=True)
+                logger.info(f"포트폴리오 데이터 일괄 로드 시작: {len(symbols_to_load)}개 종목")
 
-                # 결과 처리
-                for symbol, result in zip(symbols_to_load, load_results):
-                    if isinstance(result, Exception):
-                        logger.warning(f"종목 {symbol} 데이터 로드 실패: {result}")
-                        continue
+                with span('data_load'):
+                    loaded = await self.stock_repository.load_stock_data_batch_async(
+                        symbols_to_load, request.start_date, request.end_date
+                    )
 
+                # 결과 처리 (실패 종목은 배치 결과에서 제외됨)
+                for symbol in symbols_to_load:
+                    result = loaded.get(symbol)
                     if result is None or result.empty:
                         logger.warning(f"종목 {symbol}의 데이터가 없습니다.")
                         continue
@@ -834,7 +928,10 @@ class PortfolioService:
                     portfolio_data[symbol] = result
                     logger.info(f"종목 {symbol} 데이터 로드 완료: {len(result)} 행")
 
-                logger.info(f"포트폴리오 데이터 병렬 로드 완료: {len(portfolio_data)}/{len(symbols_to_load)}개 성공")
+                logger.info(f"포트폴리오 데이터 일괄 로드 완료: {len(portfolio_data)}/{len(symbols_to_load)}개 성공")
+
+                if loaded_price_data is not None:
+                    loaded_price_data.update(portfolio_data)
 
             # 총 투자 금액 계산
             total_amount = sum(amounts.values())
@@ -864,7 +961,7 @@ class PortfolioService:
                     'Avg_Drawdown': 0.0,
                     'Max_Consecutive_Gains': 0,
                     'Max_Consecutive_Losses': 0,
-                    'Total_Trading_Days': duration_days,
+                    'Total_Trading_Days': len(get_calendar('XNYS').sessions(start_date_obj, end_date_obj)),
                     'Positive_Days': 0,
                     'Negative_Days': 0,
                     'Win_Rate': 0.0
@@ -882,8 +979,8 @@ class PortfolioService:
                     }
                 }
                 
-                # 기본 equity curve (현금은 변동 없음)
-                date_range = pd.date_range(start=start_date_obj, end=end_date_obj, freq='D')
+                # 기본 equity curve (현금은 변동 없음, NYSE 거래일 기준)
+                date_range = get_calendar('XNYS').session_index(start_date_obj, end_date_obj)
                 equity_curve = {
                     date.strftime('%Y-%m-%d'): cash_amount
                     for date in date_range
@@ -914,14 +1011,16 @@ class PortfolioService:
             
             # 분할 매수를 고려한 포트폴리오 수익률 계산
             logger.info("분할 매수 및 리밸런싱을 고려한 포트폴리오 수익률 계산 중...")
-            portfolio_result = await self.calculate_dca_portfolio_returns(
-                portfolio_data, amounts, dca_info, request.start_date, request.end_date,
-                request.rebalance_frequency, request.commission
-            )
-            
-            # 통계 계산
-            logger.info("포트폴리오 통계 계산 중...")
-            statistics = portfolio_calculator.calculate_portfolio_statistics(portfolio_result, total_amount)
+            # (환율 로딩은 fx_conversion 단계로도 따로 집계됨)
+            with span('portfolio_simulation'):
+                portfolio_result = await self.calculate_dca_portfolio_returns(
+                    portfolio_data, amounts, dca_info, request.start_date, request.end_date,
+                    request.rebalance_frequency, request.commission
+                )
+
+                # 통계 계산
+                logger.info("포트폴리오 통계 계산 중...")
+                statistics = portfolio_calculator.calculate_portfolio_statistics(portfolio_result, total_amount)
             
             # 개별 종목 수익률 (참고용, 현금 포함)
             individual_returns = {}
@@ -1087,10 +1186,7 @@ class PortfolioService:
                         }
                         for unique_key, amount in amounts.items()
                     ],
-                    'equity_curve': {
-                        date.strftime('%Y-%m-%d'): value * total_amount
-                        for date, value in portfolio_result['Portfolio_Value'].items()
-                    },
+                    'equity_curve': date_value_dict(portfolio_result['Portfolio_Value'], total_amount),
                     # ============================================================
                     # 수익률 표현 형식: 백분율(Percentage) vs 소수(Decimal)
                     # ============================================================
@@ -1116,10 +1212,7 @@ class PortfolioService:
                     # - 이중 변환 방지: API에서 이미 백분율로 반환했으므로 추가 변환 불필요
                     # - 계산 필요 시에만 `/100` 사용 (예: BenchmarkIndexChart의 복리 계산)
                     # ============================================================
-                    'daily_returns': {
-                        date.strftime('%Y-%m-%d'): return_val * 100  # 소수 → 백분율 변환 (0.025 → 2.5)
-                        for date, return_val in portfolio_result['Daily_Return'].items()
-                    },
+                    'daily_returns': date_value_dict(portfolio_result['Daily_Return'], 100),  # 소수 → 백분율 변환 (0.025 → 2.5)
                     'strategy_details': strategy_details,  # 거래 로그 포함
                     'rebalance_history': rebalance_history,
                     'weight_history': weight_history
@@ -0,0 +1,165 @@
+"""
+장 마감 후 가격 증분 갱신 서비스
+
+**역할**:
+- 커버리지 워터마크(price_coverage) 이후의 새 봉만 yfinance에서 받아 저장
+- 같은 워터마크와 마지막 거래일을 가진 티커끼리 묶어 일괄 다운로드 (티커당 요청 대신 묶음당 1회)
+- 워터마크가 없는 기존 티커는 개별 수집 경로로 누락 구간을 검증한 뒤 워터마크 생성
+
+**실행 방식**:
+- PriceRefreshScheduler: 앱 lifespan에서 시작, 매 평일 eod_refresh_time(거래소 현지 시간)에 실행
+- scripts/refresh_prices_eod.py: cron 등 외부 스케줄러에서 직접 실행
+- 갱신 작업은 동기 DB/네트워크 I/O이므로 asyncio.to_thread로 이벤트 루프 밖에서 실행
+
+**설정** (app/core/config.py):
+- eod_refresh_enabled / eod_refresh_time / eod_refresh_timezone / eod_refresh_batch_size
+
+**의존성**:
+- app/services/yfinance_db.py: 워터마크 조회, 증분 저장, 개별 누락 구간 수집
+- app/utils/data_fetcher.py: 일괄 다운로드
+- app/utils/trading_calendar.py: 티커 거래소별 마지막 거래일
+
+**연관 컴포넌트**:
+- Backend: app/main.py (스케줄러 시작/종료)
+- Database: database/add_price_coverage.sql (워터마크 테이블)
+"""
+import asyncio
+import logging
+from datetime import date, datetime, time as dt_time, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+import pandas as pd
+
+from app.core.config import settings
+from app.services.yfinance_db import (
+    _last_complete_session,
+    get_price_watermarks,
+    save_incremental_prices,
+    sync_ticker_prices,
+)
+from app.utils.data_fetcher import data_fetcher
+from app.utils.trading_calendar import calendar_for_ticker
+
+logger = logging.getLogger(__name__)
+
+
+class PriceRefreshService:
+    """워터마크 기반 EOD 증분 갱신 서비스"""
+
+    def __init__(self, batch_size: Optional[int] = None):
+        self.batch_size = batch_size or settings.eod_refresh_batch_size
+
+    def refresh_all(self, as_of: Optional[date] = None) -> Dict[str, Any]:
+        """
+        DB에 있는 모든 티커를 as_of 거래일까지 갱신합니다.
+
+        Args:
+            as_of: 장 마감이 끝난 기준일 (기본: 오늘, 거래소 현지 날짜)
+
+        Returns:
+            Dict: 기준일과 상태별 티커 수 (마지막 거래일은 티커 거래소 캘린더 기준)
+                  (up_to_date, refreshed: 일괄 갱신, bootstrapped: 워터마크 신규 생성,
+                   fallback: 일괄 다운로드 누락으로 개별 수집, failed)
+        """
+        as_of = as_of or date.today()
+        summary = {'as_of': as_of.isoformat(), 'up_to_date': 0, 'refreshed': 0,
+                   'bootstrapped': 0, 'fallback': 0, 'failed': 0}
+
+        groups: Dict[Tuple[date, date], List[str]] = {}
+        for ticker, coverage in get_price_watermarks().items():
+            # as_of 당일 봉은 장 마감 후이므로 완결된 봉으로 취급
+            last_session = _last_complete_session(as_of + timedelta(days=1), calendar_for_ticker(ticker))
+            if coverage['covered_to'] is None:
+                self._sync(ticker, coverage['db_min'], last_session, summary, 'bootstrapped')
+            elif coverage['covered_to'] >= last_session:
+                summary['up_to_date'] += 1
+            else:
+                groups.setdefault((coverage['covered_to'], last_session), []).append(ticker)
+
+        for (covered_to, last_session), tickers in groups.items():
+            for i in range(0, len(tickers), self.batch_size):
+                self._refresh_chunk(tickers[i:i + self.batch_size], covered_to, last_session, summary)
+
+        logger.info(f"EOD 가격 갱신 완료: {summary}")
+        return summary
+
+    def _refresh_chunk(self, tickers: List[str], covered_to: date, last_session: date, summary: Dict[str, Any]) -> None:
+        """같은 워터마크를 가진 티커 묶음을 일괄 다운로드하고, 결과가 없는 티커는 개별 수집"""
+        start = covered_to + timedelta(days=1)
+        frames = data_fetcher.fetch_multiple_stock_data(tickers, start, last_session)
+
+        for ticker in tickers:
+            df = frames.get(ticker)
+            if df is not None:
+                days = df.index.normalize()
+                df = df[(days >= pd.Timestamp(start)) & (days <= pd.Timestamp(last_session))]
+            if df is None or df.empty:
+                self._sync(ticker, start, last_session, summary, 'fallback')
+                continue
+            try:
+                save_incremental_prices(ticker, df, covered_to)
+                summary['refreshed'] += 1
+            except Exception:
+                logger.exception(f"EOD 증분 저장 실패: {ticker}")
+                summary['failed'] += 1
+
+    @staticmethod
+    def _sync(ticker: str, start: date, last_session: date, summary: Dict[str, Any], status: str) -> None:
+        try:
+            sync_ticker_prices(ticker, start, last_session, last_session)
+            summary[status] += 1
+        except Exception:
+            logger.exception(f"EOD 개별 수집 실패: {ticker}")
+            summary['failed'] += 1
+
+
+class PriceRefreshScheduler:
+    """매 평일 장 마감 후 PriceRefreshService.refresh_all을 실행하는 백그라운드 태스크"""
+
+    def __init__(self, service: Optional[PriceRefreshService] = None):
+        self.service = service or price_refresh_service
+        self._task: Optional[asyncio.Task] = None
+
+    @staticmethod
+    def next_run(now: datetime, run_time: str) -> datetime:
+        """now(시간대 포함) 이후 첫 평일 run_time(HH:MM) 시각"""
+        hour, minute = (int(part) for part in run_time.split(':'))
+        candidate = datetime.combine(now.date(), dt_time(hour, minute), tzinfo=now.tzinfo)
+        if candidate <= now:
+            candidate += timedelta(days=1)
+        while candidate.weekday() >= 5:
+            candidate += timedelta(days=1)
+        return candidate
+
+    def start(self) -> None:
+        if not settings.eod_refresh_enabled or self._task is not None:
+            return
+        self._task = asyncio.create_task(self._run())
+        logger.info(f"EOD 가격 갱신 스케줄러 시작: 평일 {settings.eod_refresh_time} ({settings.eod_refresh_timezone})")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        tz = ZoneInfo(settings.eod_refresh_timezone)
+        while True:
+            now = datetime.now(tz)
+            scheduled = self.next_run(now, settings.eod_refresh_time)
+            await asyncio.sleep((scheduled - now).total_seconds())
+            try:
+                await asyncio.to_thread(self.service.refresh_all, scheduled.date())
+            except Exception:
+                logger.exception("EOD 가격 갱신 실패")
+
+
+# 전역 인스턴스
+price_refresh_service = PriceRefreshService()
+price_refresh_scheduler = PriceRefreshScheduler()
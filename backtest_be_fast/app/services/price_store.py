@@ -0,0 +1,438 @@
+"""
+로컬 열 지향(columnar) 가격 저장소
+
+**역할**:
+- 티커별 OHLCV를 로컬 파일 1개(열 지향 NumPy 배열)로 보관
+- 메모리 매핑(mmap)으로 파일을 열고 날짜 열에 이진 탐색하여 범위만 슬라이스
+- MySQL은 원본 저장소(system of record)로 유지, 이 저장소는 읽기 가속용
+
+**파일 형식** (`<base_dir>/<ticker>.npy`):
+- shape = (7, N) float64, 각 행이 하나의 열 (열 단위로 연속 메모리)
+- 0: date (1970-01-01 기준 일수), 1~6: Open, High, Low, Close, Adj Close, Volume
+- 날짜 오름차순 정렬, 중복 없음
+- 메타데이터(`<ticker>.meta.json`): 커버리지 구간 (DB와 동일 결과를 보장하는 범위)
+
+**동기화 정책**:
+- save_ticker_data(): DB upsert 성공 후 같은 행을 저장소에 upsert (write-through)
+- load_stock_data(): DB에서 읽은 결과를 저장소에 반영하고 요청 구간을 커버리지로 기록
+- 커버리지 밖 요청, 최근 구간(신규 봉 가능성)의 TTL 만료 시에는 DB 경로 사용
+
+**동시성**:
+- 파일은 임시 파일 작성 후 os.replace로 원자적 교체 (데이터 → 메타 순서)
+- 같은 티커의 read-modify-write는 프로세스 내 Lock + 파일 잠금(fcntl, 지원 시)으로 직렬화
+
+**의존성**:
+- numpy: 메모리 매핑 및 이진 탐색
+- app/core/config.py: price_store_enabled, price_store_dir
+- app/constants/data_loading.py: CacheConfig
+
+**연관 컴포넌트**:
+- Backend: app/services/yfinance_db.py (save_ticker_data write-through)
+- Backend: app/repositories/stock_repository.py (load_stock_data 우선 조회)
+"""
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Union
+from urllib.parse import quote
+
+import numpy as np
+import pandas as pd
+
+from app.constants.data_loading import CacheConfig
+from app.core.config import settings
+
+try:
+    import fcntl
+except ImportError:  # Windows 등 fcntl 미지원 환경
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+PRICE_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Adj Close', 'Volume']
+_DB_PRICE_DECIMALS = 4  # daily_prices DECIMAL(19, 4)과 동일한 정밀도
+_DB_PRICE_KEYS = ['open', 'high', 'low', 'close', 'adj_close']
+
+
+def _to_date(value: Union[str, date, datetime, pd.Timestamp, None]) -> Optional[date]:
+    """다양한 날짜 형식을 date 객체로 변환합니다."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    if isinstance(value, (pd.Timestamp, datetime)):
+        return pd.Timestamp(value).date()
+    if isinstance(value, date):
+        return value
+    return pd.Timestamp(value).date()
+
+
+def _to_day_number(value: date) -> int:
+    """date를 1970-01-01 기준 일수로 변환합니다."""
+    return int(np.datetime64(value, 'D').astype(np.int64))
+
+
+class LocalPriceStore:
+    """티커별 열 지향 가격 파일 저장소"""
+
+    def __init__(self, base_dir: Optional[str] = None, enabled: Optional[bool] = None):
+        """
+        로컬 가격 저장소 초기화
+
+        Args:
+            base_dir: 저장 디렉터리 (None이면 settings.price_store_dir)
+            enabled: 사용 여부 (None이면 settings.price_store_enabled)
+        """
+        self.base_dir = base_dir or settings.price_store_dir
+        self.enabled = settings.price_store_enabled if enabled is None else enabled
+        self._lock = threading.RLock()
+        self._mmaps: Dict[str, tuple] = {}  # ticker -> (mtime_ns, memmap)
+        self._stats = {'hits': 0, 'misses': 0, 'writes': 0, 'errors': 0}
+
+    # ------------------------------------------------------------------
+    # 경로 / 파일 I/O
+    # ------------------------------------------------------------------
+
+    def _paths(self, ticker: str) -> tuple:
+        """티커별 데이터/메타 파일 경로 (^GSPC, KRW=X 등 특수문자는 URL 인코딩)"""
+        safe = quote(ticker.upper(), safe='')
+        return (
+            os.path.join(self.base_dir, f"{safe}.npy"),
+            os.path.join(self.base_dir, f"{safe}.meta.json"),
+        )
+
+    @contextmanager
+    def _ticker_lock(self, ticker: str):
+        """같은 티커에 대한 쓰기를 프로세스 내/간 직렬화합니다."""
+        with self._lock:
+            os.makedirs(self.base_dir, exist_ok=True)
+            if fcntl is None:
+                yield
+                return
+            lock_path = os.path.join(self.base_dir, f"{quote(ticker.upper(), safe='')}.lock")
+            with open(lock_path, 'a') as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _open_array(self, ticker: str) -> Optional[np.ndarray]:
+        """데이터 파일을 메모리 매핑으로 엽니다 (파일 교체 시 다시 매핑)."""
+        data_path, _ = self._paths(ticker)
+        try:
+            mtime_ns = os.stat(data_path).st_mtime_ns
+        except FileNotFoundError:
+            self._mmaps.pop(ticker, None)
+            return None
+
+        cached = self._mmaps.get(ticker)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        array = np.load(data_path, mmap_mode='r')
+        self._mmaps[ticker] = (mtime_ns, array)
+        return array
+
+    def _read_meta(self, ticker: str) -> Dict[str, Any]:
+        """메타데이터(커버리지) 로드"""
+        _, meta_path = self._paths(ticker)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {'coverage': [], 'recent': None}
+
+    def _atomic_write(self, path: str, writer) -> None:
+        """임시 파일에 쓴 뒤 os.replace로 원자적으로 교체합니다."""
+        fd, tmp_path = tempfile.mkstemp(dir=self.base_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                writer(f)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def read(
+        self,
+        ticker: str,
+        start_date: Union[str, date, None],
+        end_date: Union[str, date, None]
+    ) -> Optional[pd.DataFrame]:
+        """
+        커버리지 안의 요청이면 저장소에서 범위를 잘라 반환합니다.
+
+        Args:
+            ticker: 종목 심볼
+            start_date: 시작 날짜
+            end_date: 종료 날짜
+
+        Returns:
+            DB 조회 결과와 동일한 형식의 DataFrame, 커버리지 밖이면 None
+        """
+        if not self.enabled or start_date is None or end_date is None:
+            return None
+
+        try:
+            start, end = _to_date(start_date), _to_date(end_date)
+            meta = self._read_meta(ticker)
+            if not self._is_covered(meta, start, end):
+                self._stats['misses'] += 1
+                return None
+
+            array = self._open_array(ticker)
+            if array is None:
+                self._stats['misses'] += 1
+                return None
+
+            dates = array[0]
+            lo = int(np.searchsorted(dates, _to_day_number(start), side='left'))
+            hi = int(np.searchsorted(dates, _to_day_number(end), side='right'))
+            if hi <= lo:
+                # DB 경로는 빈 결과에 예외를 발생시키므로 동일하게 처리하도록 위임
+                self._stats['misses'] += 1
+                return None
+
+            self._stats['hits'] += 1
+            return self._to_frame(array[:, lo:hi])
+
+        except Exception as e:
+            self._stats['errors'] += 1
+            logger.warning(f"로컬 가격 저장소 조회 실패 ({ticker}): {e}")
+            return None
+
+    @staticmethod
+    def _to_frame(block: np.ndarray) -> pd.DataFrame:
+        """(7, n) 블록을 DB 조회 결과와 같은 형식의 DataFrame으로 변환합니다."""
+        index = pd.DatetimeIndex(block[0].astype(np.int64).astype('datetime64[D]').astype('datetime64[s]'), name='date')
+        df = pd.DataFrame(
+            {column: np.array(block[row + 1]) for row, column in enumerate(PRICE_COLUMNS)},
+            index=index
+        )
+        df['Volume'] = df['Volume'].astype('int64')
+        return df
+
+    @staticmethod
+    def _is_covered(meta: Dict[str, Any], start: date, end: date) -> bool:
+        """요청 구간이 커버리지(확정 구간 또는 TTL 내 최근 구간)에 포함되는지 확인합니다."""
+        start_s, end_s = start.isoformat(), end.isoformat()
+
+        for cov_start, cov_end in meta.get('coverage', []):
+            if cov_start <= start_s and end_s <= cov_end:
+                return True
+
+        recent = meta.get('recent')
+        if recent and recent['start'] <= start_s and end_s <= recent['end']:
+            return time.time() - recent['synced_at'] < CacheConfig.MEMORY_TTL_RECENT
+
+        return False
+
+    # ------------------------------------------------------------------
+    # 쓰기
+    # ------------------------------------------------------------------
+
+    def upsert_frame(self, ticker: str, df: pd.DataFrame) -> int:
+        """
+        DB 형식(Open/High/Low/Close/Adj Close/Volume, 날짜 인덱스) DataFrame을 병합합니다.
+
+        Args:
+            ticker: 종목 심볼
+            df: 가격 데이터
+
+        Returns:
+            반영된 행 수
+        """
+        if not self.enabled or df is None or df.empty:
+            return 0
+
+        index = pd.DatetimeIndex(df.index)
+        if index.tz is not None:
+            index = index.tz_localize(None)
+
+        block = np.empty((7, len(df)), dtype=np.float64)
+        block[0] = index.values.astype('datetime64[D]').astype(np.int64)
+        for row, column in enumerate(PRICE_COLUMNS):
+            if column in df.columns:
+                block[row + 1] = pd.to_numeric(df[column], errors='coerce').to_numpy(dtype=float)
+            else:
+                block[row + 1] = np.nan
+        return self._merge_block(ticker, block)
+
+    def upsert_records(self, ticker: str, records: Iterable[Dict[str, Any]]) -> int:
+        """
+        DB에 쓴 행(dict 목록)을 그대로 반영합니다.
+
+        Args:
+            ticker: 종목 심볼
+            records: {'date', 'open', 'high', 'low', 'close', 'adj_close', 'volume'} 목록
+
+        Returns:
+            반영된 행 수
+        """
+        records = list(records)
+        if not self.enabled or not records:
+            return 0
+
+        return self.upsert_columns(
+            ticker,
+            np.array([r['date'] for r in records], dtype='datetime64[D]'),
+            {
+                key: np.array([np.nan if r[key] is None else r[key] for r in records], dtype=float)
+                for key in _DB_PRICE_KEYS
+            },
+            np.array([r['volume'] for r in records], dtype=float),
+        )
+
+    def upsert_columns(
+        self,
+        ticker: str,
+        days: np.ndarray,
+        prices: Dict[str, np.ndarray],
+        volume: np.ndarray
+    ) -> int:
+        """
+        save_ticker_data()가 DB에 쓴 값을 열 배열 그대로 반영합니다.
+
+        Args:
+            ticker: 종목 심볼
+            days: 날짜 배열 (datetime64[D])
+            prices: {'open', 'high', 'low', 'close', 'adj_close'} → float 배열 (NULL은 NaN)
+            volume: 거래량 배열
+
+        Returns:
+            반영된 행 수
+        """
+        if not self.enabled or len(days) == 0:
+            return 0
+
+        block = np.empty((7, len(days)), dtype=np.float64)
+        block[0] = np.asarray(days, dtype='datetime64[D]').astype(np.int64)
+        for row, key in enumerate(_DB_PRICE_KEYS, start=1):
+            # DB 컬럼 정밀도에 맞춰 반올림 (DB 재조회 결과와 일치)
+            block[row] = np.round(np.asarray(prices[key], dtype=float), _DB_PRICE_DECIMALS)
+        block[6] = np.asarray(volume, dtype=float)
+        return self._merge_block(ticker, block)
+
+    def _merge_block(self, ticker: str, block: np.ndarray) -> int:
+        """새 블록을 기존 파일과 날짜 기준으로 병합합니다 (같은 날짜는 새 값 우선)."""
+        try:
+            with self._ticker_lock(ticker):
+                existing = self._open_array(ticker)
+                if existing is not None and existing.shape[1] > 0:
+                    combined = np.concatenate([np.asarray(existing), block], axis=1)
+                else:
+                    combined = block
+
+                # 같은 날짜는 마지막(새) 값 유지: 역순 배열에서 첫 등장 위치 = 원래 배열의 마지막 등장
+                # (np.unique 결과는 날짜 오름차순이므로 별도 정렬 불필요)
+                _, first_idx = np.unique(combined[0, ::-1], return_index=True)
+                keep = combined.shape[1] - 1 - first_idx
+                merged = np.ascontiguousarray(combined[:, keep])
+
+                data_path, _ = self._paths(ticker)
+                self._atomic_write(data_path, lambda f: np.save(f, merged))
+                self._mmaps.pop(ticker, None)
+                self._stats['writes'] += 1
+                return block.shape[1]
+
+        except Exception as e:
+            self._stats['errors'] += 1
+            logger.warning(f"로컬 가격 저장소 쓰기 실패 ({ticker}): {e}")
+            return 0
+
+    def record_load(
+        self,
+        ticker: str,
+        df: pd.DataFrame,
+        start_date: Union[str, date, None],
+        end_date: Union[str, date, None]
+    ) -> None:
+        """
+        DB 조회 결과를 저장소에 반영하고 요청 구간을 커버리지로 기록합니다.
+
+        DB 경로는 요청 구간의 누락 데이터를 모두 채운 뒤 반환하므로,
+        반환된 행이 해당 구간의 DB 내용 전체입니다. 단, 종료일이 최근이고
+        마지막 행 이후에 신규 봉이 추가될 수 있으면 그 부분은 TTL 동안만 유효합니다.
+
+        Args:
+            ticker: 종목 심볼
+            df: DB 조회 결과
+            start_date: 요청 시작 날짜
+            end_date: 요청 종료 날짜
+        """
+        if not self.enabled or df is None or df.empty or start_date is None or end_date is None:
+            return
+
+        if self.upsert_frame(ticker, df) == 0:
+            return
+
+        start, end = _to_date(start_date), _to_date(end_date)
+        last_row_date = pd.Timestamp(df.index.max()).date()
+        settle_limit = date.today() - timedelta(days=CacheConfig.PRICE_STORE_SETTLE_DAYS)
+        settled_end = end if (end <= last_row_date or end < settle_limit) else last_row_date
+
+        try:
+            with self._ticker_lock(ticker):
+                meta = self._read_meta(ticker)
+                coverage = meta.get('coverage', [])
+                if start <= settled_end:
+                    coverage = self._merge_intervals(coverage + [[start.isoformat(), settled_end.isoformat()]])
+
+                recent = meta.get('recent')
+                if settled_end < end:
+                    recent = {'start': start.isoformat(), 'end': end.isoformat(), 'synced_at': time.time()}
+
+                _, meta_path = self._paths(ticker)
+                payload = json.dumps({'ticker': ticker, 'coverage': coverage, 'recent': recent}).encode('utf-8')
+                self._atomic_write(meta_path, lambda f: f.write(payload))
+
+        except Exception as e:
+            self._stats['errors'] += 1
+            logger.warning(f"로컬 가격 저장소 커버리지 기록 실패 ({ticker}): {e}")
+
+    @staticmethod
+    def _merge_intervals(intervals: List[List[str]]) -> List[List[str]]:
+        """겹치거나 인접한 날짜 구간을 병합합니다."""
+        merged: List[List[str]] = []
+        for start, end in sorted(intervals):
+            if merged:
+                prev_end = date.fromisoformat(merged[-1][1])
+                if date.fromisoformat(start) <= prev_end + timedelta(days=1):
+                    merged[-1][1] = max(merged[-1][1], end)
+                    continue
+            merged.append([start, end])
+        return merged
+
+    def invalidate(self, ticker: str) -> None:
+        """티커의 저장소 파일을 삭제합니다."""
+        with self._ticker_lock(ticker):
+            self._mmaps.pop(ticker, None)
+            for path in self._paths(ticker):
+                if os.path.exists(path):
+                    os.remove(path)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """저장소 통계 (히트/미스/쓰기/오류 횟수)"""
+        total = self._stats['hits'] + self._stats['misses']
+        return {
+            **self._stats,
+            'enabled': self.enabled,
+            'base_dir': self.base_dir,
+            'hit_rate': self._stats['hits'] / total if total else 0.0,
+            'mapped_tickers': len(self._mmaps),
+        }
+
+
+# 글로벌 인스턴스
+local_price_store = LocalPriceStore()
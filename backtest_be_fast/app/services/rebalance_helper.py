@@ -15,6 +15,10 @@
    - 각 자산의 목표 비중 계산
    - 현금 포함
 
+3. build_schedule_rows(): 전체 일정 사전 계산
+   - 시작일~종료일의 리밸런싱/DCA 실행 행 번호를 한 번에 생성
+   - 시뮬레이션 루프는 행 번호 포함 여부만 확인
+
 **리밸런싱(Rebalancing) 개념**:
 - 포트폴리오의 원래 비중 복원
 - 정기적으로 수행 (주/월/분기 단위)
@@ -51,16 +55,21 @@ weights = RebalanceHelper.calculate_target_weights(
 
 **의존성**:
 - datetime: 날짜 계산
+- numpy / pandas: 세션 배열 탐색 (searchsorted)
 - app.schemas.schemas: 리밸런싱 주기 매핑
 
 **연관 컴포넌트**:
 - Backend: app/services/portfolio_service.py (포트폴리오 백테스트)
 - Backend: app/schemas/schemas.py (DCA_FREQUENCY_MAP)
 """
-from typing import Dict
+from typing import Dict, Optional
 from datetime import datetime, timedelta
 import calendar
 import logging
+
+import numpy as np
+import pandas as pd
+
 from app.schemas.schemas import FREQUENCY_MAP
 
 logger = logging.getLogger(__name__)
@@ -86,15 +95,8 @@ def get_weekday_occurrence(date: datetime) -> int:
     >>> get_weekday_occurrence(date)
     4  # 1월의 4번째 금요일
     """
-    weekday = date.weekday()
-    year, month = date.year, date.month
-    
-    occurrence = 0
-    for day in range(1, date.day + 1):
-        if datetime(year, month, day).weekday() == weekday:
-            occurrence += 1
-    
-    return occurrence
+    # 같은 요일은 7일 간격이므로 1~7일이 1번째, 8~14일이 2번째, ...
+    return (date.day - 1) // 7 + 1
 
 
 def get_nth_weekday_of_month(year: int, month: int, weekday: int, n: int) -> int:
@@ -213,6 +215,73 @@ def get_next_nth_weekday(
     return current_date
 
 
+def build_schedule_rows(
+    sessions: pd.DatetimeIndex,
+    start_date: datetime,
+    frequency: str,
+    original_nth: int = None,
+    max_events: Optional[int] = None,
+    eligible: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Nth Weekday 일정의 실행 행 번호를 한 번에 계산
+
+    is_rebalance_date()를 매일 호출하는 것과 같은 규칙입니다.
+    예정일 이상인 첫 세션에서 실행되고, 다음 예정일은 실제 실행 세션을 기준으로 다시 계산됩니다.
+
+    Parameters
+    ----------
+    sessions : pd.DatetimeIndex
+        시뮬레이션 날짜 (정렬됨)
+    start_date : datetime
+        시작 날짜 (첫 예정일 계산 기준)
+    frequency : str
+        주기 (FREQUENCY_MAP 키)
+    original_nth : int, optional
+        원본 "몇 번째 요일" 값 (1-5)
+    max_events : int, optional
+        최대 실행 횟수 (DCA 회차 수)
+    eligible : np.ndarray, optional
+        행별 실행 가능 여부 (종목 거래소 휴장일 제외용), 예정일 이후 첫 가능 행으로 이동
+
+    Returns
+    -------
+    np.ndarray
+        실행 행 번호 (오름차순, int64)
+
+    Notes
+    -----
+    - 첫 행은 초기 매수일이므로 실행하지 않으며,
+      예정일이 첫 행 이전이면 이후 일정도 생성하지 않음 (기존 일별 판단과 동일)
+    """
+    period_info = FREQUENCY_MAP.get(frequency)
+    if period_info is None or len(sessions) == 0:
+        return np.array([], dtype=np.int64)
+
+    period_type, interval = period_info
+    eligible_rows = np.flatnonzero(eligible) if eligible is not None else None
+    n_sessions = len(sessions)
+
+    rows = []
+    reference_date = start_date
+    while max_events is None or len(rows) < max_events:
+        scheduled = get_next_nth_weekday(reference_date, period_type, interval, original_nth)
+        row = int(sessions.searchsorted(scheduled, side='left'))
+        if row == 0:
+            break
+        if eligible_rows is not None:
+            position = eligible_rows.searchsorted(row, side='left')
+            if position == len(eligible_rows):
+                break
+            row = int(eligible_rows[position])
+        if row >= n_sessions:
+            break
+        rows.append(row)
+        reference_date = sessions[row]
+
+    return np.array(rows, dtype=np.int64)
+
+
 class RebalanceHelper:
     """리밸런싱 유틸리티"""
 
@@ -0,0 +1,368 @@
+"""
+포트폴리오 백테스트 결과 캐시
+
+**역할**:
+- 종료일이 지난(결과가 결정적인) 포트폴리오 백테스트 요청의 전체 응답 본문(인코딩된 JSON)을 캐시
+- 요청 순서와 무관한 정규화 요청 해시 + 티커별 가격 데이터 버전 스탬프를 키로 사용
+- save_ticker_data()가 캐시 구간과 겹치는 행을 저장하면 해당 티커 결과를 무효화
+
+**캐시 키**:
+- 정규화 요청: model_dump 후 portfolio 항목 정렬, dict 키 정렬 JSON
+- 데이터 버전: yfinance_db.get_price_versions() (구간 내 행 수/날짜/가격 합계)
+- 종목 + 환율 + 벤치마크(^GSPC, ^IXIC) 티커의 버전을 모두 포함하므로
+  다른 프로세스가 데이터를 갱신해도 키가 달라져 오래된 결과를 반환하지 않음
+
+**캐시 대상**:
+- 종료일이 모든 티커 거래소의 마지막 완결 거래일 이전
+- 몬테카를로 옵션이 없거나 시드가 지정된 요청 (시드 없는 난수 결과는 제외)
+
+**계층**:
+- 1차: 프로세스 내 LRU (result_cache_max_entries)
+- 2차 (선택): result_cache_backend=mysql (backtest_result_cache 테이블) 또는 disk (SQLite 파일)
+- 두 계층 모두 result_cache_ttl_seconds 이후 만료 (응답의 최신 뉴스 고정 방지)
+
+**의존성**:
+- app/core/config.py: result_cache_* 설정
+- app/services/yfinance_db.py: get_price_versions (지연 import, yfinance_db가 이 모듈을 import)
+- app/utils/trading_calendar.py: 티커별 마지막 완결 거래일
+
+**연관 컴포넌트**:
+- Backend: app/api/v1/endpoints/backtest.py (조회/저장)
+- Database: database/add_backtest_result_cache.sql
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterable, NamedTuple, Optional, Tuple
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DBAPIError
+
+from app.constants.currencies import EXCHANGE_RATE_LOOKBACK_DAYS, SUPPORTED_CURRENCIES
+from app.core.config import settings
+from app.schemas.schemas import PortfolioBacktestRequest
+from app.utils.trading_calendar import calendar_for_ticker
+
+logger = logging.getLogger(__name__)
+
+# 응답의 벤치마크 데이터 (unified_data_service.collect_benchmark_data)
+BENCHMARK_TICKERS = ('^GSPC', '^IXIC')
+
+
+class ResultCacheScope(NamedTuple):
+    """캐시 항목이 의존하는 가격 데이터 범위"""
+    tickers: Tuple[str, ...]
+    start: date
+    end: date
+
+
+class _ResultEntry:
+    """메모리 계층 항목"""
+
+    __slots__ = ('value', 'scope', 'created_at')
+
+    def __init__(self, value: bytes, scope: ResultCacheScope, created_at: float):
+        self.value = value
+        self.scope = scope
+        self.created_at = created_at
+
+
+class SqlResultStore:
+    """결과 캐시 SQL 계층 (MySQL 공유 테이블 또는 로컬 SQLite 파일)"""
+
+    _SQLITE_DDL = (
+        "CREATE TABLE IF NOT EXISTS backtest_result_cache ("
+        "cache_key TEXT PRIMARY KEY, tickers TEXT NOT NULL, start_date TEXT NOT NULL, "
+        "end_date TEXT NOT NULL, payload BLOB NOT NULL, created_at INTEGER NOT NULL)"
+    )
+
+    def __init__(self, engine: Engine, create_table: bool = False):
+        """
+        Args:
+            engine: SQLAlchemy Engine
+            create_table: 테이블 자동 생성 여부 (SQLite 파일 계층)
+        """
+        self.engine = engine
+        if create_table:
+            with self.engine.begin() as conn:
+                conn.execute(text(self._SQLITE_DDL))
+
+    @classmethod
+    def from_settings(cls) -> Optional['SqlResultStore']:
+        """result_cache_backend 설정에 맞는 SQL 계층 (memory이면 None)"""
+        backend = settings.result_cache_backend
+        if backend == 'mysql':
+            from app.services.database.connection_manager import DatabaseConnectionManager
+            return cls(DatabaseConnectionManager.get_engine())
+        if backend == 'disk':
+            os.makedirs(settings.result_cache_dir, exist_ok=True)
+            path = os.path.join(settings.result_cache_dir, 'result_cache.sqlite3')
+            return cls(create_engine(f"sqlite:///{path}"), create_table=True)
+        return None
+
+    def get(self, key: str, min_created_at: float) -> Optional[Tuple[bytes, ResultCacheScope, float]]:
+        with self.engine.connect() as conn:
+            row = conn.execute(
+                text(
+                    "SELECT tickers, start_date, end_date, payload, created_at FROM backtest_result_cache "
+                    "WHERE cache_key = :k AND created_at >= :min_created"
+                ),
+                {'k': key, 'min_created': int(min_created_at)}
+            ).fetchone()
+        if row is None:
+            return None
+        tickers, start, end, payload, created_at = row
+        scope = ResultCacheScope(
+            tuple(t for t in tickers.split(',') if t), _to_date(start), _to_date(end)
+        )
+        return zlib.decompress(payload), scope, float(created_at)
+
+    def put(self, key: str, scope: ResultCacheScope, value: bytes, created_at: float) -> None:
+        payload = zlib.compress(value)
+        with self.engine.begin() as conn:
+            conn.execute(text("DELETE FROM backtest_result_cache WHERE cache_key = :k"), {'k': key})
+            conn.execute(
+                text(
+                    "INSERT INTO backtest_result_cache (cache_key, tickers, start_date, end_date, payload, created_at) "
+                    "VALUES (:k, :tickers, :start, :end, :payload, :created_at)"
+                ),
+                {
+                    'k': key, 'tickers': ',' + ','.join(scope.tickers) + ',',
+                    'start': str(scope.start), 'end': str(scope.end),
+                    'payload': payload, 'created_at': int(created_at),
+                }
+            )
+
+    def invalidate(self, ticker: str, start: date, end: date) -> int:
+        with self.engine.begin() as conn:
+            result = conn.execute(
+                text(
+                    "DELETE FROM backtest_result_cache "
+                    "WHERE tickers LIKE :pattern AND start_date <= :end AND end_date >= :start"
+                ),
+                {'pattern': f'%,{ticker.upper()},%', 'start': str(start), 'end': str(end)}
+            )
+            return result.rowcount or 0
+
+    def clear(self) -> None:
+        with self.engine.begin() as conn:
+            conn.execute(text("DELETE FROM backtest_result_cache"))
+
+
+def _to_date(value: Any) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return datetime.strptime(str(value), '%Y-%m-%d').date()
+
+
+class BacktestResultCache:
+    """정규화 요청 해시 + 데이터 버전 키 기반 백테스트 결과 캐시"""
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: int,
+        store: Optional[SqlResultStore] = None,
+        enabled: bool = True
+    ):
+        """
+        Args:
+            max_entries: 메모리 계층 최대 항목 수
+            ttl_seconds: 결과 유효 시간 (초)
+            store: 2차 SQL 계층 (None이면 메모리만)
+            enabled: 사용 여부
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.store = store
+        self.enabled = enabled
+        self._entries: 'OrderedDict[str, _ResultEntry]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'store_hits': 0, 'misses': 0, 'invalidations': 0, 'errors': 0}
+
+    # ------------------------------------------------------------------
+    # 키 / 캐시 대상 판단
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def canonical_request(request: PortfolioBacktestRequest) -> str:
+        """요청 순서와 무관한 정규화 JSON (portfolio 항목 정렬, dict 키 정렬)"""
+        data = request.model_dump(mode='json')
+        data['portfolio'] = sorted(
+            (json.dumps(item, sort_keys=True, ensure_ascii=False) for item in data['portfolio'])
+        )
+        return json.dumps(data, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+
+    @classmethod
+    def make_key(cls, request: PortfolioBacktestRequest, versions: Dict[str, str]) -> str:
+        """정규화 요청 + 티커별 데이터 버전의 SHA-256"""
+        versions_json = json.dumps(versions, sort_keys=True, separators=(',', ':'))
+        return hashlib.sha256(f"{cls.canonical_request(request)}|{versions_json}".encode('utf-8')).hexdigest()
+
+    def scope(
+        self,
+        request: PortfolioBacktestRequest,
+        symbols: Iterable[str],
+        currencies: Dict[str, str],
+        today: Optional[date] = None
+    ) -> Optional[ResultCacheScope]:
+        """
+        캐시 가능한 요청이면 데이터 버전을 확인할 범위를, 아니면 None을 반환합니다.
+
+        Args:
+            request: 포트폴리오 백테스트 요청
+            symbols: 현금을 제외한 종목 심볼
+            currencies: 종목별 통화 코드 (환율 티커 포함용)
+            today: 기준일 (기본: 오늘)
+        """
+        if not self.enabled:
+            return None
+        if request.monte_carlo is not None and request.monte_carlo.seed is None:
+            return None
+
+        today = today or date.today()
+        end = _to_date(request.end_date)
+        symbols = sorted({symbol.upper() for symbol in symbols})
+        # 종료일 봉이 모든 거래소에서 확정된 경우만 (당일/미래 종료일은 새 봉이 추가될 수 있음)
+        if any(end > calendar_for_ticker(t).previous_session(today) for t in [*symbols, *BENCHMARK_TICKERS]):
+            return None
+
+        fx_tickers = {
+            SUPPORTED_CURRENCIES[currency]
+            for currency in currencies.values()
+            if SUPPORTED_CURRENCIES.get(currency)
+        }
+        fx_tickers.add(settings.exchange_rate_ticker)
+        tickers = tuple(sorted({*symbols, *fx_tickers, *BENCHMARK_TICKERS}))
+        # 환율은 시작일 이전 구간도 조회하므로 (load_multiple_exchange_rates buffer) 범위를 넓혀 확인
+        start = _to_date(request.start_date) - timedelta(days=EXCHANGE_RATE_LOOKBACK_DAYS * 2)
+        return ResultCacheScope(tickers, start, end)
+
+    @staticmethod
+    def load_versions(scope: ResultCacheScope) -> Dict[str, str]:
+        from app.services.yfinance_db import get_price_versions
+        return get_price_versions(list(scope.tickers), scope.start, scope.end)
+
+    # ------------------------------------------------------------------
+    # 조회 / 저장 (동기 I/O 포함, 엔드포인트에서 asyncio.to_thread로 호출)
+    # ------------------------------------------------------------------
+
+    def lookup(self, request: PortfolioBacktestRequest, scope: ResultCacheScope) -> Optional[bytes]:
+        """현재 데이터 버전 기준 캐시된 응답 본문 (없으면 None)"""
+        try:
+            return self.get(self.make_key(request, self.load_versions(scope)))
+        except Exception as e:
+            self._stats['errors'] += 1
+            logger.warning(f"결과 캐시 조회 실패: {e}")
+            return None
+
+    def save(self, request: PortfolioBacktestRequest, scope: ResultCacheScope, value: bytes) -> None:
+        """실행 후 데이터 버전으로 결과 저장 (실행 중 누락 구간이 채워졌으면 그 버전 기준)"""
+        try:
+            self.put(self.make_key(request, self.load_versions(scope)), scope, value)
+        except Exception as e:
+            self._stats['errors'] += 1
+            logger.warning(f"결과 캐시 저장 실패: {e}")
+
+    def get(self, key: str) -> Optional[bytes]:
+        min_created_at = time.time() - self.ttl_seconds
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.created_at >= min_created_at:
+                self._entries.move_to_end(key)
+                self._stats['hits'] += 1
+                return entry.value
+            if entry is not None:
+                del self._entries[key]
+
+        stored = self._store_call('get', key, min_created_at)
+        if stored is None:
+            with self._lock:
+                self._stats['misses'] += 1
+            return None
+
+        value, scope, created_at = stored
+        with self._lock:
+            self._stats['store_hits'] += 1
+            self._put_memory(key, _ResultEntry(value, scope, created_at))
+        return value
+
+    def put(self, key: str, scope: ResultCacheScope, value: bytes) -> None:
+        created_at = time.time()
+        with self._lock:
+            self._put_memory(key, _ResultEntry(value, scope, created_at))
+        self._store_call('put', key, scope, value, created_at)
+
+    def invalidate(self, ticker: str, start: date, end: date) -> int:
+        """ticker가 포함되고 [start, end]와 겹치는 결과를 제거합니다. 제거한 메모리 항목 수를 반환."""
+        ticker = ticker.upper()
+        with self._lock:
+            stale = [
+                key for key, entry in self._entries.items()
+                if ticker in entry.scope.tickers and entry.scope.start <= end and start <= entry.scope.end
+            ]
+            for key in stale:
+                del self._entries[key]
+            self._stats['invalidations'] += len(stale)
+        self._store_call('invalidate', ticker, start, end)
+        return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+        self._store_call('clear')
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self._stats,
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'backend': 'memory' if self.store is None else self.store.engine.dialect.name,
+            }
+
+    def _put_memory(self, key: str, entry: _ResultEntry) -> None:
+        """Lock 보유 상태에서 호출"""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _store_call(self, method: str, *args) -> Any:
+        """SQL 계층 호출 (계층이 없거나 실패하면 None - 메모리 계층만으로 동작)"""
+        if self.store is None:
+            return None
+        try:
+            return getattr(self.store, method)(*args)
+        except DBAPIError as e:
+            self._stats['errors'] += 1
+            logger.warning(f"결과 캐시 SQL 계층 {method} 실패 (database/add_backtest_result_cache.sql 적용 필요?): {e}")
+            return None
+
+
+def _create_result_cache() -> BacktestResultCache:
+    store = None
+    if settings.result_cache_enabled:
+        try:
+            store = SqlResultStore.from_settings()
+        except Exception as e:
+            logger.warning(f"결과 캐시 SQL 계층 초기화 실패, 메모리 계층만 사용: {e}")
+    return BacktestResultCache(
+        max_entries=settings.result_cache_max_entries,
+        ttl_seconds=settings.result_cache_ttl_seconds,
+        store=store,
+        enabled=settings.result_cache_enabled,
+    )
+
+
+# 전역 인스턴스
+backtest_result_cache = _create_result_cache()
@@ -0,0 +1,516 @@
+"""
+전략 백테스트 벡터화 엔진
+
+**역할**:
+- 기본 제공 6개 전략(long-only, 신호 기반)을 backtesting.py의 봉별 next() 콜백 없이 실행
+- 진입/청산 신호를 배열로 계산하고, 포지션/자산 곡선을 누적 연산으로 산출
+- backtesting.py compute_stats와 같은 키의 통계를 벡터 연산으로 계산
+
+**체결 규칙** (backtesting.py 0.6 기본 설정과 동일):
+- i봉 종가 시점에 신호 → i+1봉 시가에 체결 (trade_on_close=False)
+- 지표 워밍업: 모든 지표가 NaN이 아닌 첫 봉 + 1부터 신호 평가
+- 매수 수량: int(자산 × position_size / i봉 종가), 체결 시 증거금 부족이면 주문 취소
+- 진입가: 시가 × (1 + spread), 청산가: 시가
+- 수수료: 진입/청산 각각 수량 × 체결가 × commission
+- 마지막 봉까지 청산되지 않은 거래는 자산 곡선에만 반영 (# Trades 제외)
+
+**계산 방식**:
+- 신호/지표/자산 곡선/통계는 전부 배열 연산
+- 거래 간 자산 복리(다음 매수 수량이 이전 거래 손익에 의존)만 거래 수만큼 순회
+  (searchsorted로 다음 신호 봉을 찾으므로 봉 수와 무관)
+
+**의존성**:
+- app/strategies/strategies.py: 전략 클래스 및 지표 계산 함수 (동일 수식 재사용)
+- backtesting.test.SMA: 볼린저 밴드 중심선
+
+**연관 컴포넌트**:
+- Backend: app/services/backtest_engine.py (전략별 엔진 선택)
+- Backend: app/services/optimization_service.py (파라미터 조합 평가)
+- Tests: tests/unit/test_strategy_vector_engine.py (backtesting.py 패리티)
+"""
+import logging
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+import numpy as np
+import pandas as pd
+from backtesting import Strategy
+from backtesting.test import SMA
+
+from app.strategies.strategies import (
+    BollingerBandsStrategy,
+    BuyAndHoldStrategy,
+    EmaStrategy,
+    MacdStrategy,
+    RsiStrategy,
+    SmaCrossStrategy,
+    _sma_helper,
+)
+
+logger = logging.getLogger(__name__)
+
+# Strategy.buy() 기본 size (가용 증거금 대비 비율) - 1 - sys.float_info.epsilon이며 repr만 '.9999'
+_DEFAULT_BUY_FRACTION = float(Strategy.buy.__kwdefaults__['size'])
+
+# (지표 배열 목록, 진입 신호, 청산 신호) — 신호는 "i봉 next()에서 주문" 여부
+Signals = Tuple[List[np.ndarray], np.ndarray, np.ndarray]
+
+
+def _crossover(series1: np.ndarray, series2: np.ndarray) -> np.ndarray:
+    """backtesting.lib.crossover의 배열 버전 (i-1봉 아래 → i봉 위)"""
+    crossed = np.zeros(len(series1), dtype=bool)
+    with np.errstate(invalid='ignore'):
+        crossed[1:] = (series1[:-1] < series2[:-1]) & (series1[1:] > series2[1:])
+    return crossed
+
+
+def _sma_cross_signals(strategy_class, close: np.ndarray) -> Signals:
+    sma1 = _sma_helper(close, strategy_class.sma_short).to_numpy()
+    sma2 = _sma_helper(close, strategy_class.sma_long).to_numpy()
+    return [sma1, sma2], _crossover(sma1, sma2), _crossover(sma2, sma1)
+
+
+def _ema_cross_signals(strategy_class, close: np.ndarray) -> Signals:
+    fast = EmaStrategy._ema(close, strategy_class.fast_window).to_numpy()
+    slow = EmaStrategy._ema(close, strategy_class.slow_window).to_numpy()
+    return [fast, slow], _crossover(fast, slow), _crossover(slow, fast)
+
+
+def _rsi_signals(strategy_class, close: np.ndarray) -> Signals:
+    rsi = RsiStrategy._rsi(None, close, strategy_class.rsi_period).to_numpy()
+    # next(): len(self.rsi) > rsi_period 인 봉부터 평가
+    active = np.arange(len(close)) >= strategy_class.rsi_period
+    prev = np.r_[np.nan, rsi[:-1]]
+    with np.errstate(invalid='ignore'):
+        entries = active & (rsi < strategy_class.rsi_oversold)
+        exits = active & ((rsi > strategy_class.rsi_overbought) | ((rsi >= 50) & (prev < 50)))
+    return [rsi], entries, exits
+
+
+def _bollinger_signals(strategy_class, close: np.ndarray) -> Signals:
+    sma = np.asarray(SMA(close, strategy_class.period), dtype=float)
+    std = BollingerBandsStrategy._std(None, close, strategy_class.period).to_numpy()
+    upper = sma + strategy_class.std_dev * std
+    lower = sma - strategy_class.std_dev * std
+    # next(): len(self.data) >= period 이고 밴드가 유효한 봉부터 평가
+    active = (np.arange(len(close)) + 1 >= strategy_class.period) & ~np.isnan(upper) & ~np.isnan(lower)
+    with np.errstate(invalid='ignore'):
+        entries = active & (close < lower)
+        exits = active & ((close > upper) | (close >= sma))
+    return [sma, std, upper, lower], entries, exits
+
+
+def _macd_signals(strategy_class, close: np.ndarray) -> Signals:
+    macd = MacdStrategy._macd_line(None, close, strategy_class.fast_period, strategy_class.slow_period)
+    signal = macd.ewm(span=strategy_class.signal_period).mean().to_numpy()
+    macd = macd.to_numpy()
+    valid = ~np.isnan(macd) & ~np.isnan(signal)
+    return [macd, signal], valid & _crossover(macd, signal), valid & _crossover(signal, macd)
+
+
+def _buy_and_hold_signals(strategy_class, close: np.ndarray) -> Signals:
+    entries = np.ones(len(close), dtype=bool)
+    return [], entries, np.zeros(len(close), dtype=bool)
+
+
+# 기본 전략 → 신호 함수 (등록되지 않은 전략은 backtesting.py로 실행)
+SIGNAL_BUILDERS: Dict[Type[Strategy], Callable[[Any, np.ndarray], Signals]] = {
+    SmaCrossStrategy: _sma_cross_signals,
+    EmaStrategy: _ema_cross_signals,
+    RsiStrategy: _rsi_signals,
+    BollingerBandsStrategy: _bollinger_signals,
+    MacdStrategy: _macd_signals,
+    BuyAndHoldStrategy: _buy_and_hold_signals,
+}
+
+
+class StrategyVectorEngine:
+    """신호 배열 기반 단일 종목 전략 백테스트 엔진"""
+
+    def get_base_strategy(self, strategy_class: Type[Strategy]) -> Optional[Type[Strategy]]:
+        """
+        벡터화 엔진으로 실행할 수 있는 기본 전략을 반환합니다.
+
+        BacktestEngine._build_strategy가 만드는 파라미터 오버라이드 서브클래스는 지원하고,
+        init/next를 재정의한 서브클래스는 동작이 달라질 수 있으므로 None을 반환합니다.
+        """
+        for base in getattr(strategy_class, '__mro__', ()):
+            if base in SIGNAL_BUILDERS:
+                if strategy_class.init is base.init and strategy_class.next is base.next:
+                    return base
+                return None
+        return None
+
+    def supports(self, strategy_class: Type[Strategy], data: pd.DataFrame) -> bool:
+        """
+        벡터화 엔진으로 처리 가능한 입력인지 확인합니다.
+
+        Returns:
+            bool: 처리 가능 여부 (False면 backtesting.py로 실행)
+        """
+        if self.get_base_strategy(strategy_class) is None:
+            return False
+        if not isinstance(data.index, pd.DatetimeIndex) or len(data) < 2:
+            return False
+        if not data.index.is_monotonic_increasing:
+            return False
+        return all(column in data.columns for column in ('Open', 'High', 'Low', 'Close'))
+
+    def run(
+        self,
+        data: pd.DataFrame,
+        strategy_class: Type[Strategy],
+        cash: float = 10000.0,
+        commission: float = 0.0,
+        spread: float = 0.0,
+    ) -> pd.Series:
+        """
+        전략 백테스트를 실행합니다.
+
+        Args:
+            data: OHLC(V) 가격 데이터 (DatetimeIndex 오름차순)
+            strategy_class: 기본 전략 또는 파라미터 오버라이드 서브클래스
+            cash: 초기 자본
+            commission: 거래 수수료 (비율)
+            spread: 매수 체결가 가산 비율
+
+        Returns:
+            pd.Series: backtesting.py Backtest.run()과 같은 키의 통계
+                       (_equity_curve, _trades 포함)
+        """
+        base = self.get_base_strategy(strategy_class)
+        if base is None:
+            raise ValueError(f"벡터화 엔진이 지원하지 않는 전략입니다: {strategy_class.__name__}")
+
+        open_ = data['Open'].to_numpy(dtype=float)
+        close = data['Close'].to_numpy(dtype=float)
+        n_bars = len(close)
+
+        indicators, entries, exits = SIGNAL_BUILDERS[base](strategy_class, close)
+        warmup = max((int(np.isnan(ind).argmin()) for ind in indicators), default=0)
+
+        # next()는 warmup + 1 봉부터 호출
+        decision = np.arange(n_bars) >= warmup + 1
+        entry_bars = np.flatnonzero(entries & decision)
+        exit_bars = np.flatnonzero(exits & decision)
+
+        if base is BuyAndHoldStrategy:
+            trades, open_trade = self._simulate_buy_and_hold(open_, entry_bars, cash, commission, spread)
+        else:
+            position_size = getattr(strategy_class, 'position_size', 1.0)
+            trades, open_trade = self._simulate_trades(
+                open_, close, entry_bars, exit_bars, cash, commission, spread, position_size
+            )
+
+        equity = self._equity_curve(close, cash, trades, open_trade)
+        trades_df = self._trades_frame(trades, data.index)
+        return compute_vector_stats(equity, trades_df, data, warmup, strategy_class)
+
+    @staticmethod
+    def _simulate_trades(
+        open_: np.ndarray,
+        close: np.ndarray,
+        entry_bars: np.ndarray,
+        exit_bars: np.ndarray,
+        cash: float,
+        commission: float,
+        spread: float,
+        position_size: float,
+    ) -> Tuple[List[Dict[str, float]], Optional[Dict[str, float]]]:
+        """
+        진입/청산 신호 봉으로 거래 목록을 만듭니다 (거래 수만큼만 순회).
+
+        Returns:
+            (청산된 거래 목록, 마지막까지 보유 중인 거래 또는 None)
+            각 거래: size, entry_bar, entry_price, cash_after_entry, exit_bar, exit_price, cash_after_exit, commission
+        """
+        n_bars = len(open_)
+        trades: List[Dict[str, float]] = []
+        cursor = 0
+
+        while True:
+            k = np.searchsorted(entry_bars, cursor)
+            if k >= len(entry_bars):
+                return trades, None
+            signal_bar = int(entry_bars[k])
+            fill_bar = signal_bar + 1
+            cursor = fill_bar
+            if fill_bar >= n_bars:
+                return trades, None
+
+            # 보유 포지션이 없으면 자산 = 현금
+            size = int((cash * position_size) / close[signal_bar])
+            if size <= 0:
+                continue
+            fill_price = open_[fill_bar]
+            entry_price = fill_price * (1 + spread)
+            if size * (entry_price + (size * fill_price * commission) / size) > cash:
+                # 증거금 부족 → 브로커가 주문 취소
+                continue
+
+            trade = _open_trade(size, fill_bar, entry_price, cash, commission)
+            cash = trade['cash_after_entry']
+
+            k = np.searchsorted(exit_bars, fill_bar)
+            if k >= len(exit_bars) or exit_bars[k] + 1 >= n_bars:
+                return trades, trade
+
+            exit_bar = int(exit_bars[k]) + 1
+            exit_price = open_[exit_bar]
+            exit_commission = size * exit_price * commission
+            cash += size * (exit_price - entry_price) - exit_commission
+            trade.update(
+                exit_bar=exit_bar,
+                exit_price=exit_price,
+                cash_after_exit=cash,
+                commission=exit_commission + size * entry_price * commission,
+            )
+            trades.append(trade)
+            cursor = exit_bar
+
+    @staticmethod
+    def _simulate_buy_and_hold(
+        open_: np.ndarray,
+        entry_bars: np.ndarray,
+        cash: float,
+        commission: float,
+        spread: float,
+    ) -> Tuple[List[Dict[str, float]], Optional[Dict[str, float]]]:
+        """첫 평가 봉에 Strategy.buy() (가용 현금 비율 주문) 후 끝까지 보유"""
+        if not len(entry_bars) or entry_bars[0] + 1 >= len(open_):
+            return [], None
+
+        fill_bar = int(entry_bars[0]) + 1
+        fill_price = open_[fill_bar]
+        entry_price = fill_price * (1 + spread)
+        price_with_commission = entry_price + (_DEFAULT_BUY_FRACTION * fill_price * commission) / _DEFAULT_BUY_FRACTION
+        size = int((cash * 1.0 * _DEFAULT_BUY_FRACTION) // price_with_commission)
+        if size <= 0:
+            return [], None
+
+        return [], _open_trade(size, fill_bar, entry_price, cash, commission)
+
+    @staticmethod
+    def _equity_curve(
+        close: np.ndarray,
+        initial_cash: float,
+        trades: List[Dict[str, float]],
+        open_trade: Optional[Dict[str, float]],
+    ) -> np.ndarray:
+        """
+        봉별 자산 = 현금 + (보유 수량 × 종가 - 보유 수량 × 진입가)
+
+        현금/보유 수량/진입가가 바뀌는 봉(체결 봉)에만 값을 기록하고 구간별로 펼칩니다.
+        """
+        n_bars = len(close)
+        change_bars: List[int] = [0]
+        cash_levels: List[float] = [initial_cash]
+        holdings: List[float] = [0.0]
+        entry_prices: List[float] = [0.0]
+
+        for trade in trades + ([open_trade] if open_trade else []):
+            change_bars.append(trade['entry_bar'])
+            cash_levels.append(trade['cash_after_entry'])
+            holdings.append(trade['size'])
+            entry_prices.append(trade['entry_price'])
+            if 'exit_bar' in trade:
+                change_bars.append(trade['exit_bar'])
+                cash_levels.append(trade['cash_after_exit'])
+                holdings.append(0.0)
+                entry_prices.append(0.0)
+
+        segment = np.searchsorted(np.asarray(change_bars), np.arange(n_bars), side='right') - 1
+        held = np.asarray(holdings)[segment]
+        unrealized = close * held - held * np.asarray(entry_prices)[segment]
+        return np.asarray(cash_levels)[segment] + unrealized
+
+    @staticmethod
+    def _trades_frame(trades: List[Dict[str, float]], index: pd.DatetimeIndex) -> pd.DataFrame:
+        """청산된 거래를 backtesting.py _trades 형식으로 변환 (지표 열 제외)"""
+        size = np.array([t['size'] for t in trades], dtype=np.int64)
+        entry_bar = np.array([t['entry_bar'] for t in trades], dtype=np.int64)
+        exit_bar = np.array([t['exit_bar'] for t in trades], dtype=np.int64)
+        entry_price = np.array([t['entry_price'] for t in trades], dtype=float)
+        exit_price = np.array([t['exit_price'] for t in trades], dtype=float)
+        commissions = np.array([t['commission'] for t in trades], dtype=float)
+
+        trades_df = pd.DataFrame({
+            'Size': size,
+            'EntryBar': entry_bar,
+            'ExitBar': exit_bar,
+            'EntryPrice': entry_price,
+            'ExitPrice': exit_price,
+            'SL': [None] * len(trades),
+            'TP': [None] * len(trades),
+            'PnL': size * (exit_price - entry_price) - commissions,
+            'Commission': commissions,
+            'ReturnPct': (exit_price / entry_price - 1) - commissions / (size * entry_price),
+            'EntryTime': index[entry_bar],
+            'ExitTime': index[exit_bar],
+        })
+        trades_df['Duration'] = trades_df['ExitTime'] - trades_df['EntryTime']
+        trades_df['Tag'] = [None] * len(trades)
+        return trades_df
+
+
+def _open_trade(size: int, fill_bar: int, entry_price: float, cash: float, commission: float) -> Dict[str, float]:
+    """진입 체결 (진입 수수료는 스프레드가 반영된 체결가 기준)"""
+    return {
+        'size': size,
+        'entry_bar': fill_bar,
+        'entry_price': entry_price,
+        'cash_after_entry': cash - size * entry_price * commission,
+    }
+
+
+def _geometric_mean(returns: np.ndarray) -> float:
+    returns = np.nan_to_num(returns, nan=0.0) + 1
+    if np.any(returns <= 0):
+        return 0
+    return np.exp(np.log(returns).sum() / (len(returns) or np.nan)) - 1
+
+
+def _mean(values: np.ndarray) -> float:
+    """빈 배열이면 NaN (pandas Series.mean과 동일)"""
+    return values.mean() if len(values) else np.nan
+
+
+def _drawdown_duration_peaks(dd: np.ndarray, index: pd.DatetimeIndex) -> Tuple[pd.Series, pd.Series]:
+    """
+    낙폭 구간별 기간/최대 낙폭 (구간 끝 봉에만 값, 나머지는 NaN)
+
+    구간 = 낙폭 0인 봉(또는 마지막 봉) 사이, 최댓값은 구간 시작 봉 기준 reduceat으로 계산.
+    """
+    zero_bars = np.unique(np.r_[np.flatnonzero(dd == 0), len(dd) - 1])
+    prev_bars, end_bars = zero_bars[:-1], zero_bars[1:]
+    keep = end_bars > prev_bars + 1
+    prev_bars, end_bars = prev_bars[keep], end_bars[keep]
+
+    if not len(end_bars):
+        empty = pd.Series(dd, index=index).replace(0, np.nan)
+        return empty, empty
+
+    # 구간 사이 값은 낙폭 0이므로 [시작, 다음 시작) 최댓값 = [시작, 끝] 최댓값
+    peaks = np.maximum.reduceat(np.nan_to_num(dd), prev_bars)
+    duration = pd.Series(pd.NaT, index=index, dtype='timedelta64[ns]')
+    duration.iloc[end_bars] = (index[end_bars] - index[prev_bars]).to_numpy()
+    peak = pd.Series(np.nan, index=index)
+    peak.iloc[end_bars] = peaks
+    return duration, peak
+
+
+def compute_vector_stats(
+    equity: np.ndarray,
+    trades_df: pd.DataFrame,
+    ohlc_data: pd.DataFrame,
+    warmup: int,
+    strategy_class: Optional[Type[Strategy]] = None,
+) -> pd.Series:
+    """
+    backtesting.py compute_stats와 같은 수식/키의 통계 (낙폭 구간 계산 벡터화)
+
+    Args:
+        equity: 봉별 자산
+        trades_df: 청산된 거래 (_trades 형식)
+        ohlc_data: 가격 데이터
+        warmup: 지표 워밍업 봉 수 (Buy & Hold 수익률 기준 봉)
+        strategy_class: 결과의 _strategy 항목
+    """
+    index = ohlc_data.index
+    dd = 1 - equity / np.maximum.accumulate(equity)
+    dd_dur, dd_peaks = _drawdown_duration_peaks(dd, index)
+
+    equity_df = pd.DataFrame({'Equity': equity, 'DrawdownPct': dd, 'DrawdownDuration': dd_dur}, index=index)
+
+    pl = trades_df['PnL'].to_numpy(dtype=float)
+    returns = trades_df['ReturnPct'].to_numpy(dtype=float)
+    durations = trades_df['Duration']
+    commissions = trades_df['Commission'].to_numpy(dtype=float).sum()
+
+    period = pd.Series(index[-100:]).diff().dropna().median()
+    resolution = getattr(period, 'resolution_string', None) or getattr(period, 'resolution', None)
+
+    def _round_timedelta(value):
+        if not isinstance(value, pd.Timedelta):
+            return value
+        return value.ceil(resolution)
+
+    s: Dict[str, Any] = {}
+    s['Start'] = index[0]
+    s['End'] = index[-1]
+    s['Duration'] = s['End'] - s['Start']
+
+    have_position = np.zeros(len(index) + 1, dtype=np.int64)
+    np.add.at(have_position, trades_df['EntryBar'].to_numpy(), 1)
+    np.add.at(have_position, trades_df['ExitBar'].to_numpy() + 1, -1)
+    s['Exposure Time [%]'] = (np.cumsum(have_position[:-1]) > 0).mean() * 100
+    s['Equity Final [$]'] = equity[-1]
+    s['Equity Peak [$]'] = equity.max()
+    if commissions:
+        s['Commissions [$]'] = commissions
+    s['Return [%]'] = (equity[-1] - equity[0]) / equity[0] * 100
+    c = ohlc_data['Close'].to_numpy(dtype=float)
+    s['Buy & Hold Return [%]'] = (c[-1] - c[warmup]) / c[warmup] * 100
+
+    freq_days = period.days
+    have_weekends = index.dayofweek.to_series().between(5, 6).mean() > 2 / 7 * .6
+    annual_trading_days = (
+        52 if freq_days == 7 else
+        12 if freq_days == 31 else
+        1 if freq_days == 365 else
+        (365 if have_weekends else 252))
+    freq = {7: 'W', 31: 'ME', 365: 'YE'}.get(freq_days, 'D')
+    day_returns = equity_df['Equity'].resample(freq).last().dropna().pct_change().dropna().to_numpy()
+    gmean_day_return = _geometric_mean(day_returns)
+
+    annualized_return = (1 + gmean_day_return) ** annual_trading_days - 1
+    s['Return (Ann.) [%]'] = annualized_return * 100
+    s['Volatility (Ann.) [%]'] = np.sqrt(
+        ((day_returns.var(ddof=1) if len(day_returns) > 1 else np.nan) + (1 + gmean_day_return) ** 2) ** annual_trading_days
+        - (1 + gmean_day_return) ** (2 * annual_trading_days)
+    ) * 100
+    time_in_years = (s['Duration'].days + s['Duration'].seconds / 86400) / 365.25
+    s['CAGR [%]'] = ((s['Equity Final [$]'] / equity[0]) ** (1 / time_in_years) - 1) * 100 if time_in_years else np.nan
+
+    s['Sharpe Ratio'] = s['Return (Ann.) [%]'] / (s['Volatility (Ann.) [%]'] or np.nan)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        s['Sortino Ratio'] = annualized_return / (
+            np.sqrt(_mean(np.minimum(day_returns, 0) ** 2)) * np.sqrt(annual_trading_days)
+        )
+    max_dd = -np.nan_to_num(dd.max())
+    s['Calmar Ratio'] = annualized_return / (-max_dd or np.nan)
+    with np.errstate(divide='ignore'):
+        equity_log_returns = np.log(equity[1:] / equity[:-1])
+    market_log_returns = np.log(c[1:] / c[:-1])
+    beta = np.nan
+    if len(equity_log_returns) > 1 and len(market_log_returns) > 1:
+        cov_matrix = np.cov(equity_log_returns, market_log_returns)
+        beta = cov_matrix[0, 1] / cov_matrix[1, 1]
+    s['Alpha [%]'] = s['Return [%]'] - beta * s['Buy & Hold Return [%]']
+    s['Beta'] = beta
+    s['Max. Drawdown [%]'] = max_dd * 100
+    s['Avg. Drawdown [%]'] = -dd_peaks.mean() * 100
+    s['Max. Drawdown Duration'] = _round_timedelta(dd_dur.max())
+    s['Avg. Drawdown Duration'] = _round_timedelta(dd_dur.mean())
+    s['# Trades'] = n_trades = len(trades_df)
+    win_rate = np.nan if not n_trades else (pl > 0).mean()
+    s['Win Rate [%]'] = win_rate * 100
+    s['Best Trade [%]'] = (returns.max() if n_trades else np.nan) * 100
+    s['Worst Trade [%]'] = (returns.min() if n_trades else np.nan) * 100
+    s['Avg. Trade [%]'] = _geometric_mean(returns) * 100
+    s['Max. Trade Duration'] = _round_timedelta(durations.max())
+    s['Avg. Trade Duration'] = _round_timedelta(durations.mean())
+    s['Profit Factor'] = returns[returns > 0].sum() / (abs(returns[returns < 0].sum()) or np.nan)
+    s['Expectancy [%]'] = _mean(returns) * 100
+    pl_std = pl.std(ddof=1) if n_trades > 1 else np.nan
+    s['SQN'] = np.sqrt(n_trades) * _mean(pl) / (pl_std or np.nan)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        s['Kelly Criterion'] = win_rate - (1 - win_rate) / (_mean(pl[pl > 0]) / -_mean(pl[pl < 0]))
+
+    s['_strategy'] = strategy_class
+    s['_equity_curve'] = equity_df
+    s['_trades'] = trades_df
+    return pd.Series(s, dtype=object)
+
+
+# 전역 인스턴스
+strategy_vector_engine = StrategyVectorEngine()
@@ -13,13 +13,21 @@
 5. news: 종목 관련 최신 뉴스 (네이버 검색 API)
 
 **주요 기능**:
-- collect_all_data(): 모든 데이터를 병렬로 수집하여 딕셔너리로 반환
+- collect_all_unified_data(): 모든 데이터를 수집하여 딕셔너리로 반환 (동기)
+- collect_all_unified_data_async(): 비동기 버전 (이벤트 루프 비차단)
+  - 백테스트에서 이미 로드한 가격 데이터 재사용, 나머지 종목은 1회만 로드
+  - 주가/환율/벤치마크/뉴스를 asyncio.gather로 동시 수집
+  - DataFrame → 딕셔너리 변환(CPU 작업)은 asyncio.to_thread로 실행
+  - 변환은 행 단위 iterrows 대신 열 배열로 수행 (column_records)
 - 에러 발생 시 빈 데이터 반환으로 백테스트 결과는 보존
 
 **의존성**:
 - app/services/data_service.py: 주가 데이터 조회
 - app/services/news_service.py: 뉴스 데이터 조회
 - app/utils/data_fetcher.py: 환율/벤치마크 데이터 페칭
+- app/utils/trading_calendar.py: 벤치마크를 종목 거래소 세션에 정렬
+- app/utils/serializers.py: column_records (열 단위 레코드 변환)
+- app/utils/metrics.py: 뉴스 수집 시간 (news 단계)
 
 **연관 컴포넌트**:
 - Backend: app/api/v1/endpoints/backtest.py (데이터 수집 호출)
@@ -30,13 +38,18 @@
 - 병렬 요청으로 전체 응답 시간 단축
 - 개별 데이터 소스 실패 시에도 나머지 데이터 반환
 """
+import asyncio
 import logging
+import numpy as np
 import pandas as pd
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 from .data_service import data_service
 from .yfinance_db import get_ticker_info_batch_from_db, load_news_from_db, save_news_to_db
 from ..core.config import settings
+from ..utils.metrics import span
+from ..utils.serializers import column_records
+from ..utils.trading_calendar import union_sessions
 
 logger = logging.getLogger(__name__)
 
@@ -198,7 +211,8 @@ class UnifiedDataService:
         self,
         start_date: str,
         end_date: str,
-        fill_missing_dates: bool = True
+        fill_missing_dates: bool = True,
+        symbols: Optional[List[str]] = None
     ) -> tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
         """
         벤치마크 데이터 수집 (S&P 500, NASDAQ)
@@ -207,6 +221,7 @@ class UnifiedDataService:
             start_date: 시작 날짜 (YYYY-MM-DD)
             end_date: 종료 날짜 (YYYY-MM-DD)
             fill_missing_dates: 누락된 날짜를 forward-fill로 채울지 여부 (기본: True)
+            symbols: 날짜를 맞출 종목 심볼 목록 (해당 거래소 세션으로 정렬)
 
         Returns:
             (S&P 500 데이터, NASDAQ 데이터) 튜플
@@ -215,8 +230,8 @@ class UnifiedDataService:
             fill_missing_dates=True일 경우, 벤치마크 시장 휴장일을 이전 거래일 가격으로 채웁니다.
             이를 통해 다른 시장(예: 한국) 종목과 날짜를 일치시켜 그래프 끊김 현상을 방지합니다.
         """
-        sp500_benchmark = self._collect_single_benchmark('^GSPC', start_date, end_date, fill_missing_dates)
-        nasdaq_benchmark = self._collect_single_benchmark('^IXIC', start_date, end_date, fill_missing_dates)
+        sp500_benchmark = self._collect_single_benchmark('^GSPC', start_date, end_date, fill_missing_dates, symbols)
+        nasdaq_benchmark = self._collect_single_benchmark('^IXIC', start_date, end_date, fill_missing_dates, symbols)
 
         return sp500_benchmark, nasdaq_benchmark
 
@@ -270,34 +285,10 @@ class UnifiedDataService:
             logger.warning("뉴스 서비스가 초기화되지 않았습니다.")
             return {symbol: [] for symbol in symbols}
 
-        latest_news = {}
-        for symbol in symbols:
-            try:
-                # 1. DB에서 먼저 조회 (3시간 이내)
-                cached_news = load_news_from_db(symbol, max_age_hours=max_cache_hours)
-
-                if cached_news and len(cached_news) > 0:
-                    # DB에 신선한 데이터가 있으면 반환
-                    latest_news[symbol] = cached_news[:display]  # display 개수만큼
-                    logger.info(f"{symbol} 뉴스 {len(latest_news[symbol])}개 (DB 캐시 사용)")
-                else:
-                    # 2. 캐시가 없거나 오래되었으면 API 호출
-                    logger.info(f"{symbol} 뉴스 캐시가 없거나 오래됨 - API 호출")
-                    search_query = self.news_service.get_ticker_query(symbol)
-                    news_list = self.news_service.search_news(search_query, display=display)
-
-                    # 3. API 결과를 DB에 저장
-                    if news_list:
-                        save_news_to_db(symbol, news_list)
-
-                    latest_news[symbol] = news_list
-                    logger.info(f"{symbol} 뉴스 {len(news_list)}개 (API 수집 완료)")
-
-            except Exception as e:
-                logger.warning(f"{symbol} 뉴스 수집 실패: {str(e)}")
-                latest_news[symbol] = []
-
-        return latest_news
+        return {
+            symbol: self._collect_symbol_news(symbol, display, max_cache_hours)
+            for symbol in symbols
+        }
     
     def collect_all_unified_data(
         self,
@@ -333,7 +324,7 @@ class UnifiedDataService:
         volatility_events = self.collect_volatility_events(symbols, start_date, end_date)
 
         # 벤치마크 데이터
-        sp500_benchmark, nasdaq_benchmark = self.collect_benchmark_data(start_date, end_date)
+        sp500_benchmark, nasdaq_benchmark = self.collect_benchmark_data(start_date, end_date, symbols=symbols)
 
         # 뉴스 (선택적)
         latest_news = {}
@@ -358,30 +349,174 @@ class UnifiedDataService:
             'latest_news': latest_news
         }
     
+    async def collect_all_unified_data_async(
+        self,
+        symbols: List[str],
+        start_date: str,
+        end_date: str,
+        include_news: bool = True,
+        news_display_count: int = 20,
+        preloaded_data: Optional[Dict[str, pd.DataFrame]] = None
+    ) -> Dict[str, Any]:
+        """
+        모든 통합 데이터를 비동기로 한 번에 수집
+
+        Args:
+            symbols: 종목 심볼 리스트
+            start_date: 시작 날짜 (YYYY-MM-DD)
+            end_date: 종료 날짜 (YYYY-MM-DD)
+            include_news: 뉴스 포함 여부
+            news_display_count: 종목당 뉴스 개수
+            preloaded_data: 백테스트에서 이미 로드한 종목별 가격 데이터 (같은 기간)
+
+        Returns:
+            collect_all_unified_data()와 같은 형식의 딕셔너리
+
+        Note:
+            - preloaded_data에 있는 종목은 다시 조회하지 않고, 나머지 종목은 1회만 조회하여
+              주가 데이터와 급등/급락 이벤트에 함께 사용
+            - 동기 I/O와 DataFrame 변환은 asyncio.to_thread로 이벤트 루프 밖에서 실행
+        """
+        preloaded_data = preloaded_data or {}
+        missing_symbols = [symbol for symbol in symbols if symbol not in preloaded_data]
+
+        async def load_frame(symbol: str) -> Optional[pd.DataFrame]:
+            try:
+                return await data_service.get_ticker_data(symbol, start_date, end_date)
+            except Exception as e:
+                logger.warning(f"주가 데이터 수집 실패: {symbol} - {str(e)}")
+                return None
+
+        async def collect_news() -> Dict[str, List[Dict[str, Any]]]:
+            if not include_news:
+                return {}
+            if not self.news_service:
+                logger.warning("뉴스 서비스가 초기화되지 않았습니다.")
+                return {symbol: [] for symbol in symbols}
+            with span('news'):
+                news_lists = await asyncio.gather(*[
+                    asyncio.to_thread(self._collect_symbol_news, symbol, news_display_count)
+                    for symbol in symbols
+                ])
+            return dict(zip(symbols, news_lists))
+
+        (
+            ticker_info,
+            loaded_frames,
+            (exchange_rates, exchange_stats),
+            sp500_benchmark,
+            nasdaq_benchmark,
+            latest_news,
+        ) = await asyncio.gather(
+            asyncio.to_thread(self.collect_ticker_info, symbols),
+            asyncio.gather(*[load_frame(symbol) for symbol in missing_symbols]),
+            asyncio.to_thread(self.collect_exchange_data, start_date, end_date),
+            asyncio.to_thread(self._collect_single_benchmark, '^GSPC', start_date, end_date, True, symbols),
+            asyncio.to_thread(self._collect_single_benchmark, '^IXIC', start_date, end_date, True, symbols),
+            collect_news(),
+        )
+
+        frames = {**preloaded_data, **dict(zip(missing_symbols, loaded_frames))}
+        symbol_payloads = await asyncio.gather(*[
+            asyncio.to_thread(self._build_symbol_payload, symbol, frames.get(symbol))
+            for symbol in symbols
+        ])
+        stock_data = {symbol: payload[0] for symbol, payload in zip(symbols, symbol_payloads)}
+        volatility_events = {symbol: payload[1] for symbol, payload in zip(symbols, symbol_payloads)}
+
+        logger.info(
+            f"통합 데이터 수집 완료: "
+            f"{len(symbols)}개 종목 (재사용 {len(symbols) - len(missing_symbols)}개), "
+            f"{len(exchange_rates)}개 환율 데이터, "
+            f"{len(latest_news)}개 종목 뉴스"
+        )
+
+        return {
+            'ticker_info': ticker_info,
+            'stock_data': stock_data,
+            'exchange_rates': exchange_rates,
+            'exchange_stats': exchange_stats,
+            'volatility_events': volatility_events,
+            'sp500_benchmark': sp500_benchmark,
+            'nasdaq_benchmark': nasdaq_benchmark,
+            'latest_news': latest_news
+        }
+    
     # ========================================
     # Private Helper Methods
     # ========================================
     
+    def _build_symbol_payload(
+        self,
+        symbol: str,
+        df: Optional[pd.DataFrame]
+    ) -> tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """가격 DataFrame 1개로 (주가 데이터, 급등/급락 이벤트)를 함께 생성"""
+        if df is None or df.empty:
+            return [], []
+
+        try:
+            stock_data = self._transform_stock_data(df)
+        except Exception as e:
+            logger.warning(f"주가 데이터 수집 실패: {symbol} - {str(e)}")
+            stock_data = []
+
+        try:
+            events = self._calculate_volatility_events(df, settings.volatility_threshold_pct, 10)
+        except Exception as e:
+            logger.warning(f"급등락 이벤트 수집 실패: {symbol} - {str(e)}")
+            events = []
+
+        return stock_data, events
+
+    def _collect_symbol_news(
+        self,
+        symbol: str,
+        display: int,
+        max_cache_hours: int = 3
+    ) -> List[Dict[str, Any]]:
+        """단일 종목 뉴스 수집 (DB 캐시 우선, 오래되었으면 API 호출 후 저장)"""
+        try:
+            # 1. DB에서 먼저 조회 (3시간 이내)
+            cached_news = load_news_from_db(symbol, max_age_hours=max_cache_hours)
+
+            if cached_news and len(cached_news) > 0:
+                # DB에 신선한 데이터가 있으면 반환
+                news_list = cached_news[:display]  # display 개수만큼
+                logger.info(f"{symbol} 뉴스 {len(news_list)}개 (DB 캐시 사용)")
+                return news_list
+
+            # 2. 캐시가 없거나 오래되었으면 API 호출
+            logger.info(f"{symbol} 뉴스 캐시가 없거나 오래됨 - API 호출")
+            search_query = self.news_service.get_ticker_query(symbol)
+            news_list = self.news_service.search_news(search_query, display=display)
+
+            # 3. API 결과를 DB에 저장
+            if news_list:
+                save_news_to_db(symbol, news_list)
+
+            logger.info(f"{symbol} 뉴스 {len(news_list)}개 (API 수집 완료)")
+            return news_list
+
+        except Exception as e:
+            logger.warning(f"{symbol} 뉴스 수집 실패: {str(e)}")
+            return []
+    
+    
     def _transform_stock_data(self, df: pd.DataFrame) -> List[Dict[str, Any]]:
-        """주가 DataFrame을 딕셔너리 리스트로 변환"""
-        return [
-            {
-                'date': date.strftime('%Y-%m-%d'),
-                'price': float(row['Close']),
-                'volume': int(row.get('Volume', 0)) if pd.notna(row.get('Volume', 0)) else 0
-            }
-            for date, row in df.iterrows()
-        ]
+        """주가 DataFrame을 딕셔너리 리스트로 변환 (Volume 없음/NaN은 0)"""
+        if 'Volume' in df.columns:
+            volume = df['Volume'].fillna(0).to_numpy(dtype=float).astype(np.int64)
+        else:
+            volume = np.zeros(len(df), dtype=np.int64)
+        return column_records(df.index, {
+            'price': df['Close'].to_numpy(dtype=float),
+            'volume': volume,
+        })
     
     def _transform_exchange_data(self, df: pd.DataFrame) -> List[Dict[str, Any]]:
         """환율 DataFrame을 딕셔너리 리스트로 변환"""
-        return [
-            {
-                'date': date.strftime('%Y-%m-%d'),
-                'rate': float(row['Close'])
-            }
-            for date, row in df.iterrows()
-        ]
+        return column_records(df.index, {'rate': df['Close'].to_numpy(dtype=float)})
     
     def _calculate_exchange_stats(self, exchange_rates: List[Dict[str, Any]]) -> Dict[str, Any]:
         """환율 주요 지점 통계 계산"""
@@ -447,7 +582,8 @@ class UnifiedDataService:
         ticker: str,
         start_date: str,
         end_date: str,
-        fill_missing_dates: bool = True
+        fill_missing_dates: bool = True,
+        symbols: Optional[List[str]] = None
     ) -> List[Dict[str, Any]]:
         """
         단일 벤치마크 데이터 수집
@@ -457,14 +593,16 @@ class UnifiedDataService:
             start_date: 시작 날짜 (YYYY-MM-DD)
             end_date: 종료 날짜 (YYYY-MM-DD)
             fill_missing_dates: 누락된 날짜 채우기 여부
+            symbols: 날짜를 맞출 종목 심볼 목록
 
         Returns:
             벤치마크 데이터 리스트 [{'date': 'YYYY-MM-DD', 'close': float, 'return_pct': float}]
 
         Note:
             모든 키를 소문자로 정규화하여 일관성 유지.
-            fill_missing_dates=True일 경우, 전체 날짜 범위에 대해 forward-fill을 적용하여
-            다른 시장 종목과 날짜를 일치시킵니다. 이를 통해 벤치마크 그래프 끊김 현상을 방지합니다.
+            fill_missing_dates=True일 경우, 벤치마크와 종목 거래소 세션의 합집합으로 reindex 후
+            forward-fill을 적용하여 다른 시장 종목과 날짜를 일치시킵니다 (주말/공통 휴장일 행은 만들지 않음).
+            이를 통해 벤치마크 그래프 끊김 현상을 방지합니다.
             일일 수익률(return_pct)도 함께 계산하여 반환합니다.
         """
         try:
@@ -475,11 +613,11 @@ class UnifiedDataService:
                 df_normalized.columns = [col.lower() for col in df_normalized.columns]
 
                 if fill_missing_dates:
-                    # 전체 날짜 범위 생성 (주말 포함)
-                    full_date_range = pd.date_range(start=start_date, end=end_date, freq='D')
+                    # 벤치마크 + 종목 거래소 세션 (다른 시장의 거래일만 추가)
+                    sessions = union_sessions([ticker, *(symbols or [])], start_date, end_date)
                     
                     # reindex로 누락된 날짜 추가 후 forward-fill
-                    df_normalized = df_normalized.reindex(full_date_range).ffill()
+                    df_normalized = df_normalized.reindex(df_normalized.index.union(sessions)).ffill()
                     
                     # 시작 부분에 NaN이 있으면 backward-fill
                     df_normalized = df_normalized.bfill()
@@ -489,15 +627,12 @@ class UnifiedDataService:
                 # 첫 날은 0으로 설정
                 df_normalized['return_pct'] = df_normalized['return_pct'].fillna(0)
 
-                return [
-                    {
-                        'date': date.strftime('%Y-%m-%d'),
-                        'close': float(row['close']),
-                        'return_pct': float(row['return_pct'])
-                    }
-                    for date, row in df_normalized.iterrows()
-                    if pd.notna(row['close'])  # NaN 제외
-                ]
+                # NaN 종가 행 제외
+                df_normalized = df_normalized[df_normalized['close'].notna()]
+                return column_records(df_normalized.index, {
+                    'close': df_normalized['close'].to_numpy(dtype=float),
+                    'return_pct': df_normalized['return_pct'].to_numpy(dtype=float),
+                })
         except Exception as e:
             logger.warning(f"{ticker} 벤치마크 데이터 수집 실패: {str(e)}")
 
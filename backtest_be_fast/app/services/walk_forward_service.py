@@ -0,0 +1,270 @@
+"""
+워크포워드 분석 서비스
+
+**역할**:
+- in-sample 윈도우에서 파라미터를 최적화하고 바로 뒤 out-of-sample 윈도우에서 평가
+- 윈도우를 out-of-sample 길이만큼 이동하며 전체 기간 반복
+- out-of-sample 자산 곡선을 이어 붙여 하나의 결과로 합산
+
+**실행 방식**:
+- 가격 데이터 조회/USD 변환은 요청당 1회, 윈도우는 iloc 슬라이스(복사 없는 뷰)
+- 모든 윈도우의 in-sample 최적화(윈도우 × 조합)를 한 번에 병렬 실행
+- out-of-sample 평가는 직전 윈도우 최종 자산을 초기 자본으로 이어서 순서대로 실행
+  (윈도우 종료 시 보유 포지션은 종가 평가액으로 이월)
+- 지표 워밍업: 검증 구간 직전 in-sample 길이만큼의 봉을 앞에 붙여 실행한 뒤
+  자산 곡선/거래/지표는 검증 구간만 잘라 직전 최종 자산 기준으로 환산
+
+**의존성**:
+- app/services/optimization_service.py: 조합 생성, 가격 조회, 지표 추출
+- app/services/backtest_engine.py: 전략별 실행 엔진 선택
+
+**연관 컴포넌트**:
+- Backend: app/api/v1/endpoints/optimization.py (API 엔드포인트)
+- Backend: app/schemas/requests.py (WalkForwardRequest)
+"""
+import asyncio
+import logging
+import math
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app.core.config import settings
+from app.core.exceptions import ValidationError
+from app.schemas.requests import WalkForwardRequest
+from app.services.optimization_service import ParameterOptimizationService, optimization_service
+from app.services.strategy_vector_engine import compute_vector_stats
+
+logger = logging.getLogger(__name__)
+
+# (in-sample 시작, out-of-sample 시작, out-of-sample 끝) 봉 위치
+Window = Tuple[int, int, int]
+
+
+class WalkForwardService:
+    """롤링/확장 윈도우 워크포워드 분석 서비스"""
+
+    def __init__(self, optimizer: Optional[ParameterOptimizationService] = None):
+        self.optimizer = optimizer or optimization_service
+
+    @property
+    def engine(self):
+        return self.optimizer.engine
+
+    @staticmethod
+    def build_windows(n_bars: int, in_sample_bars: int, out_of_sample_bars: int, anchored: bool) -> List[Window]:
+        """
+        윈도우 경계를 계산합니다.
+
+        마지막 out-of-sample 윈도우는 남은 봉 수가 2개 이상이면 짧아도 포함합니다.
+
+        Raises:
+            ValidationError: in-sample + 최소 out-of-sample 길이보다 데이터가 짧음
+        """
+        if n_bars < in_sample_bars + 2:
+            raise ValidationError(
+                f"데이터가 부족합니다: {n_bars}개 봉 (in-sample {in_sample_bars}개 + 검증 구간 필요)"
+            )
+
+        windows: List[Window] = []
+        for oos_start in range(in_sample_bars, n_bars, out_of_sample_bars):
+            oos_end = min(oos_start + out_of_sample_bars, n_bars)
+            if oos_end - oos_start < 2:
+                break
+            windows.append((0 if anchored else oos_start - in_sample_bars, oos_start, oos_end))
+        return windows
+
+    async def run_walk_forward(self, request: WalkForwardRequest) -> Dict[str, Any]:
+        """
+        워크포워드 분석을 실행합니다.
+
+        Returns:
+            Dict: windows(윈도우별 최적 파라미터/in-sample·out-of-sample 지표),
+                  combined(이어 붙인 out-of-sample 자산 곡선과 합산 지표), execution_time_seconds
+        """
+        started = time.perf_counter()
+        strategy_name = request.strategy.value if hasattr(request.strategy, 'value') else str(request.strategy)
+        self.optimizer.validate_rank_by(request.rank_by)
+
+        combinations, total, pruned = self.optimizer.build_combinations(
+            strategy_name,
+            request.param_grid,
+            fixed_params=request.strategy_params,
+            search_mode=request.search_mode,
+            n_samples=request.n_samples,
+            max_combinations=request.max_combinations,
+            seed=request.seed,
+        )
+        if not combinations:
+            raise ValidationError("제약 조건을 만족하는 파라미터 조합이 없습니다")
+
+        data = await self.optimizer.load_prices(request)
+        windows = self.build_windows(len(data), request.in_sample_bars, request.out_of_sample_bars, request.anchored)
+        if len(windows) > settings.walk_forward_max_windows:
+            raise ValidationError(
+                f"워크포워드 윈도우 수({len(windows)})가 최대 {settings.walk_forward_max_windows}개를 초과합니다. "
+                f"out_of_sample_bars를 늘리거나 기간을 줄이세요."
+            )
+
+        logger.info(
+            f"워크포워드 분석 시작: {request.ticker} {strategy_name}, "
+            f"{len(windows)}개 윈도우 × {len(combinations)}개 조합"
+        )
+
+        base_strategy = self.optimizer.strategy_service.get_strategy_class(strategy_name)
+        strategy_classes = [self.optimizer.configure_strategy(base_strategy, params) for params in combinations]
+        in_sample = await self._optimize_windows(data, windows, strategy_classes, request)
+
+        window_results: List[Dict[str, Any]] = []
+        equity_parts: List[pd.Series] = []
+        cash = request.initial_cash
+        for number, ((is_start, oos_start, oos_end), scores) in enumerate(zip(windows, in_sample), start=1):
+            result = {
+                'window': number,
+                'in_sample': self._span(data.index, is_start, oos_start),
+                'out_of_sample': self._span(data.index, oos_start, oos_end),
+                'evaluated': len(scores),
+                'failed': sum(1 for metrics in scores if metrics is None),
+            }
+            ranked = [(metrics, i) for i, metrics in enumerate(scores) if metrics is not None]
+            oos_data = data.iloc[oos_start:oos_end]
+
+            if not ranked:
+                # 평가 가능한 조합이 없으면 현금 보유로 이월
+                result.update(best_params=None, in_sample_metrics=None, out_of_sample_metrics=None)
+                equity_parts.append(pd.Series(cash, index=oos_data.index))
+                window_results.append(result)
+                continue
+
+            best_metrics, best = max(ranked, key=lambda item: item[0][request.rank_by])
+            warm_start = oos_start - request.in_sample_bars
+            stats = await self.engine._run_strategy(
+                data.iloc[warm_start:oos_end], strategy_classes[best], request.model_copy(update={'initial_cash': cash})
+            )
+            stats = self._out_of_sample_stats(stats, data.iloc[warm_start:oos_end], oos_start - warm_start, cash)
+            equity = stats['_equity_curve']['Equity']
+            equity_parts.append(equity)
+            cash = float(equity.iloc[-1])
+
+            result.update(
+                best_params={name: combinations[best][name] for name in request.param_grid},
+                in_sample_metrics=best_metrics,
+                out_of_sample_metrics=self.optimizer.extract_metrics(stats),
+            )
+            window_results.append(result)
+
+        combined = self._combine(pd.concat(equity_parts), request.initial_cash, window_results)
+        elapsed = time.perf_counter() - started
+        logger.info(
+            f"워크포워드 분석 완료: {request.ticker} {strategy_name}, "
+            f"OOS 수익률 {combined['total_return_pct']:.2f}%, {elapsed:.2f}초"
+        )
+
+        return {
+            'ticker': request.ticker,
+            'strategy': strategy_name,
+            'rank_by': request.rank_by,
+            'in_sample_bars': request.in_sample_bars,
+            'out_of_sample_bars': request.out_of_sample_bars,
+            'anchored': request.anchored,
+            'total_combinations': total,
+            'evaluated_combinations': len(combinations),
+            'pruned': pruned,
+            'windows': window_results,
+            'combined': combined,
+            'execution_time_seconds': round(elapsed, 3),
+        }
+
+    async def _optimize_windows(
+        self,
+        data: pd.DataFrame,
+        windows: List[Window],
+        strategy_classes: List[Any],
+        request: WalkForwardRequest,
+    ) -> List[List[Optional[Dict[str, Any]]]]:
+        """모든 윈도우의 in-sample 구간에서 전체 조합을 병렬 평가 (실패한 조합은 None)"""
+        executor = self.engine.executor
+        semaphore = asyncio.Semaphore(executor.max_workers if executor.enabled else 1)
+
+        async def evaluate(window: Window, strategy_class) -> Optional[Dict[str, Any]]:
+            is_start, oos_start, _ = window
+            async with semaphore:
+                try:
+                    stats = await self.engine._run_strategy(data.iloc[is_start:oos_start], strategy_class, request)
+                    return self.optimizer.extract_metrics(stats)
+                except Exception as e:
+                    logger.warning(f"in-sample 평가 실패 ({data.index[is_start].date()}~): {e}")
+                    return None
+
+        scores = await asyncio.gather(*(
+            evaluate(window, strategy_class) for window in windows for strategy_class in strategy_classes
+        ))
+        per_window = len(strategy_classes)
+        return [list(scores[i:i + per_window]) for i in range(0, len(scores), per_window)]
+
+    @staticmethod
+    def _out_of_sample_stats(stats: pd.Series, data: pd.DataFrame, warmup: int, cash: float) -> pd.Series:
+        """
+        워밍업 봉을 포함해 실행한 결과에서 out-of-sample 구간만 잘라 통계를 다시 계산합니다.
+
+        자산은 워밍업 마지막 봉 자산이 cash가 되도록 비례 환산하고(윈도우 경계에서 곡선 연속),
+        거래는 검증 구간에 청산된 것만 남깁니다(워밍업 중 진입한 거래는 진입 봉을 구간 시작으로 자름).
+        """
+        equity = stats['_equity_curve']['Equity'].to_numpy(dtype=float)
+        scale = cash / equity[warmup - 1]
+
+        trades = stats['_trades']
+        trades = trades[trades['ExitBar'] >= warmup].copy()
+        trades['EntryBar'] = (trades['EntryBar'] - warmup).clip(lower=0)
+        trades['ExitBar'] -= warmup
+        trades['PnL'] *= scale
+        trades['Commission'] *= scale
+
+        return compute_vector_stats(
+            equity[warmup:] * scale, trades, data.iloc[warmup:], warmup=0, strategy_class=stats['_strategy']
+        )
+
+    @staticmethod
+    def _span(index: pd.DatetimeIndex, start: int, end: int) -> Dict[str, Any]:
+        return {
+            'start_date': index[start].strftime('%Y-%m-%d'),
+            'end_date': index[end - 1].strftime('%Y-%m-%d'),
+            'bars': end - start,
+        }
+
+    @staticmethod
+    def _combine(equity: pd.Series, initial_cash: float, windows: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """이어 붙인 out-of-sample 자산 곡선의 합산 지표"""
+        values = equity.to_numpy(dtype=float)
+        returns = np.diff(values) / values[:-1]
+        days = (equity.index[-1] - equity.index[0]).days
+        final = values[-1]
+
+        drawdown = 1 - values / np.maximum.accumulate(values)
+        volatility = returns.std(ddof=1) if len(returns) > 1 else 0.0
+        evaluated = [w for w in windows if w['out_of_sample_metrics'] is not None]
+        is_annual = [w['in_sample_metrics']['annualized_return_pct'] for w in evaluated]
+        oos_annual = [w['out_of_sample_metrics']['annualized_return_pct'] for w in evaluated]
+        is_mean = float(np.mean(is_annual)) if is_annual else 0.0
+
+        return {
+            'initial_cash': initial_cash,
+            'final_equity': final,
+            'total_return_pct': (final / initial_cash - 1) * 100,
+            'annualized_return_pct': ((final / initial_cash) ** (365.25 / days) - 1) * 100 if days > 0 else 0.0,
+            'max_drawdown_pct': -float(drawdown.max()) * 100,
+            'sharpe_ratio': float(returns.mean() / volatility * math.sqrt(252)) if volatility else 0.0,
+            'total_trades': sum(w['out_of_sample_metrics']['total_trades'] for w in evaluated),
+            'profitable_windows': sum(1 for w in evaluated if w['out_of_sample_metrics']['total_return_pct'] > 0),
+            # out-of-sample 연환산 수익률 평균 / in-sample 평균 (과최적화 지표, 1에 가까울수록 안정)
+            'walk_forward_efficiency': float(np.mean(oos_annual)) / is_mean if is_mean else None,
+            'equity_curve': {
+                date.strftime('%Y-%m-%d'): float(value) for date, value in zip(equity.index, values)
+            },
+        }
+
+
+# 전역 인스턴스
+walk_forward_service = WalkForwardService()
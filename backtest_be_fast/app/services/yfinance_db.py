@@ -11,8 +11,14 @@ yfinance 데이터 MySQL 저장 서비스
    - DB에서 먼저 조회
    - 누락 기간이 있으면 yfinance로 보완
    - 새로 가져온 데이터를 DB에 저장
-2. save_ticker_data(): DataFrame을 DB에 저장
-3. get_date_range(): DB에 저장된 데이터 범위 조회
+2. load_ticker_data_batch(): 누락 구간이 없는 티커의 주가 데이터 일괄 조회 (DB 왕복 1회, 읽기 전용)
+3. save_ticker_data(): DataFrame을 DB에 저장
+4. get_date_range(): DB에 저장된 데이터 범위 조회
+5. get_price_watermarks() / sync_ticker_prices() / save_incremental_prices(): EOD 증분 갱신용
+6. get_price_versions(): 구간 내 가격 행 버전 스탬프 (백테스트 결과 캐시 키)
+7. load_covered_ticker_data_batch() / _query_ticker_info_batch() / _query_news(): 연결을 받는 읽기 전용 조회
+   (비동기 저장소가 공유 - 주가는 쿼리 생성(*_query)/행 변환(*_from_rows) 헬퍼로 나눠
+   조회는 비동기 연결, DataFrame 변환은 스레드에서 수행)
 
 **DB 스키마**:
 - 테이블: daily_prices
@@ -20,14 +26,17 @@ yfinance 데이터 MySQL 저장 서비스
 - 복합 기본키: (ticker, date)
 
 **최적화 전략**:
-- 배치 삽입: 대량 데이터를 한 번에 저장
+- 배치 삽입: 열 단위 변환 + 다중 행 INSERT로 대량 데이터를 한 번에 저장
+- 메타데이터 갱신 최소화: 오래된 경우에만 yfinance info 재조회
 - 중복 방지: ON DUPLICATE KEY UPDATE
 - 날짜 범위 캐싱: 불필요한 API 호출 방지
+- 커버리지 워터마크(price_coverage): 연속 수집이 확인된 구간 안쪽 요청은 yfinance 호출/쓰기 없음
 
 **의존성**:
 - SQLAlchemy: DB 연결 및 쿼리
 - yfinance: 외부 데이터 소스
 - pandas: 데이터 처리
+- app/utils/metrics.py: 누락 구간 수집 시간 (gap_fill 단계)
 
 **연관 컴포넌트**:
 - Backend: app/repositories/data_repository.py (Repository 패턴)
@@ -42,13 +51,21 @@ import json
 import logging
 import time
 import email.utils
-from typing import Optional, Union, List, Dict, Any, Tuple
+from functools import lru_cache
+from typing import Optional, Union, List, Dict, Any, NamedTuple, Tuple
 from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.engine import Engine
+import numpy as np
 import pandas as pd
 from datetime import datetime, date, timedelta
+from app.constants.data_loading import IngestionConfig
 from app.utils.data_fetcher import data_fetcher
+from app.utils.metrics import span
+from app.utils.trading_calendar import TradingCalendar, calendar_for_ticker, get_calendar
 from app.services.database.connection_manager import DatabaseConnectionManager
+from app.services.price_store import local_price_store
+from app.services.result_cache import backtest_result_cache
 
 logger = logging.getLogger(__name__)
 
@@ -68,104 +85,221 @@ def _get_engine() -> Engine:
 def save_ticker_data(ticker: str, df: pd.DataFrame) -> int:
     """stocks 테이블에 티커 등록 및 daily_prices에 행을 upsert 합니다.
 
+    - 가격 행은 열 단위(NumPy 배열)로 변환하여 다중 행 INSERT ... ON DUPLICATE KEY UPDATE로 저장
+    - 티커 메타데이터(yfinance info)는 오래된 경우에만 갱신 (IngestionConfig.TICKER_INFO_REFRESH_HOURS)
+
     Returns: 저장된 행 수
     """
     engine = _get_engine()
     conn = engine.connect()
-    trans = conn.begin()
     try:
-        # ensure stock exists
-        info = {}
-        try:
-            info = data_fetcher.fetch_ticker_info(ticker)
-        except Exception:
-            logger.warning("티커 info 조회 실패")
-
-        # insert or update stocks
-        insert_stock = text(
-            """
-            INSERT INTO stocks (ticker, name, exchange, sector, industry, summary, info_json, last_info_update)
-            VALUES (:ticker, :name, :exchange, :sector, :industry, :summary, :info_json, :now)
-            ON DUPLICATE KEY UPDATE name=VALUES(name), exchange=VALUES(exchange), sector=VALUES(sector),
-              industry=VALUES(industry), summary=VALUES(summary), info_json=VALUES(info_json), last_info_update=VALUES(last_info_update)
-            """
-        )
-        now = datetime.utcnow()
-        conn.execute(insert_stock, {
-            "ticker": ticker,
-            "name": info.get("company_name"),
-            "exchange": info.get("exchange"),
-            "sector": info.get("sector"),
-            "industry": info.get("industry"),
-            "summary": None,
-            "info_json": json.dumps(info),
-            "now": now
-        })
-
-        # get stock_id
-        stock_id_row = conn.execute(text("SELECT id FROM stocks WHERE ticker = :t"), {"t": ticker}).fetchone()
-        if not stock_id_row:
-            raise RuntimeError("stock_id를 찾을 수 없습니다.")
-        stock_id = stock_id_row[0]
-
-        # prepare daily prices upsert
-        rows = []
-        df_proc = df.copy()
-        if 'Date' in df_proc.columns:
-            df_proc['date'] = pd.to_datetime(df_proc['Date']).dt.date
-        else:
-            df_proc = df_proc.reset_index()
-            df_proc['date'] = pd.to_datetime(df_proc[df_proc.columns[0]]).dt.date
-
-        for _, r in df_proc.iterrows():
-            o = None if pd.isna(r.get('Open')) else float(r.get('Open'))
-            h = None if pd.isna(r.get('High')) else float(r.get('High'))
-            l = None if pd.isna(r.get('Low')) else float(r.get('Low'))
-            c = None if pd.isna(r.get('Close')) else float(r.get('Close'))
-            ac = None
-            if 'Adj Close' in r or 'AdjClose' in r or 'Adj_Close' in r:
-                ac = r.get('Adj Close') or r.get('AdjClose') or r.get('Adj_Close')
-                ac = None if pd.isna(ac) else float(ac)
-            vol = 0 if pd.isna(r.get('Volume')) else int(r.get('Volume'))
-            rows.append({
-                'stock_id': stock_id,
-                'date': r['date'].isoformat(),
-                'open': o,
-                'high': h,
-                'low': l,
-                'close': c,
-                'adj_close': ac,
-                'volume': vol
-            })
-
-        if rows:
-            # batch upsert
-            insert_stmt = text(
-                """
-                INSERT INTO daily_prices (stock_id, date, open, high, low, close, adj_close, volume)
-                VALUES (:stock_id, :date, :open, :high, :low, :close, :adj_close, :volume)
-                ON DUPLICATE KEY UPDATE open=VALUES(open), high=VALUES(high), low=VALUES(low), close=VALUES(close), adj_close=VALUES(adj_close), volume=VALUES(volume)
-                """
-            )
-            # chunking
-            chunk_size = 500
-            total = 0
-            for i in range(0, len(rows), chunk_size):
-                batch = rows[i:i+chunk_size]
-                conn.execute(insert_stmt, batch)
-                total += len(batch)
-
-        trans.commit()
-        return len(rows)
-
+        return _save_and_commit(conn, ticker, df)
     except Exception as e:
-        trans.rollback()
         logger.exception("save_ticker_data 실패")
         raise
     finally:
         conn.close()
 
 
+def _save_and_commit(conn, ticker: str, df: pd.DataFrame) -> int:
+    """
+    주어진 연결에서 티커 데이터를 저장하고 커밋합니다 (단일 작업 단위).
+
+    Args:
+        conn: DB 연결 객체 (조회 중이던 연결 그대로 사용 가능)
+        ticker: 티커 심볼
+        df: 저장할 가격 데이터
+
+    Returns:
+        int: 저장된 행 수
+
+    Note:
+        - 같은 연결에서 커밋하므로 이후 조회가 새 행을 바로 읽음
+          (별도 연결 저장 후 close → sleep → 재연결하던 방식 대체)
+        - 실패 시 롤백 후 예외 전파
+    """
+    days, prices, volume = _price_columns_from_frame(df)
+    try:
+        stock_id = _upsert_stock_metadata(conn, ticker)
+        total = _upsert_daily_prices(conn, stock_id, days, prices, volume)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+    # 로컬 가격 저장소 동기화 (DB 커밋 성공 후 write-through)
+    local_price_store.upsert_columns(ticker, days, prices, volume)
+    # 저장 구간과 겹치는 백테스트 결과 캐시 무효화
+    if len(days):
+        backtest_result_cache.invalidate(ticker, days.min().astype(date), days.max().astype(date))
+    return total
+
+
+def _upsert_stock_metadata(conn, ticker: str) -> int:
+    """
+    stocks 행을 보장하고 stock_id를 반환합니다.
+
+    Args:
+        conn: DB 연결 객체 (트랜잭션 진행 중)
+        ticker: 티커 심볼
+
+    Returns:
+        int: stock_id
+
+    Note:
+        - last_info_update가 갱신 주기 이내면 yfinance info 조회(네트워크) 생략
+        - info 조회 실패 시 기존 행은 그대로 두고 다음 저장 때 재시도
+    """
+    row = conn.execute(
+        text("SELECT id, last_info_update FROM stocks WHERE ticker = :t"), {"t": ticker}
+    ).fetchone()
+
+    now = datetime.utcnow()
+    refresh_after = timedelta(hours=IngestionConfig.TICKER_INFO_REFRESH_HOURS)
+    if row and row[1] is not None and now - pd.to_datetime(row[1]).to_pydatetime() < refresh_after:
+        return row[0]
+
+    info = {}
+    try:
+        info = data_fetcher.fetch_ticker_info(ticker)
+    except Exception:
+        logger.warning("티커 info 조회 실패")
+
+    if row and (not info or 'error' in info):
+        return row[0]
+
+    # insert or update stocks
+    insert_stock = text(
+        """
+        INSERT INTO stocks (ticker, name, exchange, sector, industry, summary, info_json, last_info_update)
+        VALUES (:ticker, :name, :exchange, :sector, :industry, :summary, :info_json, :now)
+        ON DUPLICATE KEY UPDATE name=VALUES(name), exchange=VALUES(exchange), sector=VALUES(sector),
+          industry=VALUES(industry), summary=VALUES(summary), info_json=VALUES(info_json), last_info_update=VALUES(last_info_update)
+        """
+    )
+    conn.execute(insert_stock, {
+        "ticker": ticker,
+        "name": info.get("company_name"),
+        "exchange": info.get("exchange"),
+        "sector": info.get("sector"),
+        "industry": info.get("industry"),
+        "summary": None,
+        "info_json": json.dumps(info),
+        "now": now
+    })
+
+    if row:
+        return row[0]
+
+    # get stock_id
+    stock_id_row = conn.execute(text("SELECT id FROM stocks WHERE ticker = :t"), {"t": ticker}).fetchone()
+    if not stock_id_row:
+        raise RuntimeError("stock_id를 찾을 수 없습니다.")
+    return stock_id_row[0]
+
+
+def _price_columns_from_frame(df: pd.DataFrame) -> Tuple[np.ndarray, Dict[str, np.ndarray], np.ndarray]:
+    """
+    저장할 DataFrame을 daily_prices 열 배열로 변환합니다 (행 단위 순회 없음).
+
+    Args:
+        df: 가격 데이터 (날짜 인덱스 또는 'Date' 컬럼)
+
+    Returns:
+        tuple: (날짜 datetime64[D] 배열, {'open'..'adj_close': float 배열(NULL은 NaN)}, int64 거래량 배열)
+    """
+    dates = pd.to_datetime(df['Date']) if 'Date' in df.columns else pd.to_datetime(df.index)
+    index = pd.DatetimeIndex(dates)
+    if index.tz is not None:
+        # 현지 날짜 유지
+        index = index.tz_localize(None)
+    days = index.values.astype('datetime64[D]')
+
+    def _column(*names: str) -> np.ndarray:
+        for name in names:
+            if name in df.columns:
+                return pd.to_numeric(df[name], errors='coerce').to_numpy(dtype=float)
+        return np.full(len(df), np.nan)
+
+    prices = {
+        'open': _column('Open'),
+        'high': _column('High'),
+        'low': _column('Low'),
+        'close': _column('Close'),
+        'adj_close': _column('Adj Close', 'AdjClose', 'Adj_Close'),
+    }
+    volume = np.nan_to_num(_column('Volume'), nan=0.0).astype(np.int64)
+    return days, prices, volume
+
+
+_UPSERT_BIND_NAMES = ('s', 'd', 'o', 'h', 'l', 'c', 'a', 'v')
+
+
+@lru_cache(maxsize=8)
+def _multi_row_upsert_statement(n_rows: int):
+    """n행 다중 행 daily_prices upsert 문장 (행 수별로 재사용)"""
+    values = ', '.join(
+        '(' + ', '.join(f':{name}{i}' for name in _UPSERT_BIND_NAMES) + ')'
+        for i in range(n_rows)
+    )
+    return text(
+        f"""
+        INSERT INTO daily_prices (stock_id, date, open, high, low, close, adj_close, volume)
+        VALUES {values}
+        ON DUPLICATE KEY UPDATE open=VALUES(open), high=VALUES(high), low=VALUES(low), close=VALUES(close), adj_close=VALUES(adj_close), volume=VALUES(volume)
+        """
+    )
+
+
+def _upsert_daily_prices(
+    conn,
+    stock_id: int,
+    days: np.ndarray,
+    prices: Dict[str, np.ndarray],
+    volume: np.ndarray
+) -> int:
+    """
+    열 배열을 다중 행 INSERT ... ON DUPLICATE KEY UPDATE로 저장합니다.
+
+    Args:
+        conn: DB 연결 객체 (트랜잭션 진행 중)
+        stock_id: 주식 ID
+        days: 날짜 배열 (datetime64[D])
+        prices: 가격 열 배열 (NULL은 NaN)
+        volume: 거래량 배열
+
+    Returns:
+        int: 저장된 행 수
+    """
+    n_rows = len(days)
+    if n_rows == 0:
+        return 0
+
+    def _nullable(values: np.ndarray) -> list:
+        column = values.astype(object)
+        column[np.isnan(values)] = None
+        return column.tolist()
+
+    rows = list(zip(
+        [stock_id] * n_rows,
+        np.datetime_as_string(days, unit='D').tolist(),
+        *(_nullable(prices[key]) for key in ('open', 'high', 'low', 'close', 'adj_close')),
+        volume.tolist(),
+    ))
+
+    chunk_size = IngestionConfig.UPSERT_CHUNK_ROWS
+    for i in range(0, n_rows, chunk_size):
+        batch = rows[i:i + chunk_size]
+        params = {
+            f'{name}{j}': value
+            for j, row in enumerate(batch)
+            for name, value in zip(_UPSERT_BIND_NAMES, row)
+        }
+        conn.execute(_multi_row_upsert_statement(len(batch)), params)
+
+    return n_rows
+
+
 def load_ticker_data(ticker: str, start_date: Optional[Union[str, date]] = None, end_date: Optional[Union[str, date]] = None, max_retries: int = 3, retry_delay: float = 2.0) -> pd.DataFrame:
     """DB에서 ticker의 daily_prices를 조회해 pandas DataFrame으로 반환합니다.
 
@@ -184,6 +318,10 @@ def load_ticker_data(ticker: str, start_date: Optional[Union[str, date]] = None,
         
     Raises:
         ValueError: 모든 재시도 실패 시
+
+    Note:
+        재시도 대기(time.sleep)가 호출 스레드를 점유합니다. async 경로에서는
+        StockRepository.load_stock_data_async(이벤트 루프 대기)를 사용하세요.
     """
     last_exception = None
     
@@ -315,80 +453,7 @@ def get_ticker_info_batch_from_db(tickers: List[str]) -> Dict[str, Dict[str, Any
     engine = _get_engine()
     conn = engine.connect()
     try:
-        # 대문자로 변환
-        upper_tickers = [t.upper() for t in tickers]
-
-        # IN 절을 사용한 배치 조회
-        placeholders = ', '.join([f':t{i}' for i in range(len(upper_tickers))])
-        query = text(f"SELECT ticker, info_json FROM stocks WHERE ticker IN ({placeholders})")
-        params = {f't{i}': ticker for i, ticker in enumerate(upper_tickers)}
-
-        rows = conn.execute(query, params).fetchall()
-
-        # 결과를 딕셔너리로 변환
-        result = {}
-        found_tickers = set()
-        missing_listing_dates = []
-
-        for row in rows:
-            ticker = row[0]
-            found_tickers.add(ticker)
-
-            if row[1]:
-                try:
-                    info = json.loads(row[1])
-                    first_trade_date = info.get('first_trade_date', None)
-                    
-                    # 상장일이 없으면 경고 리스트에 추가
-                    if not first_trade_date:
-                        missing_listing_dates.append(ticker)
-                    
-                    result[ticker] = {
-                        'symbol': ticker,
-                        'currency': info.get('currency', 'USD'),
-                        'company_name': info.get('company_name', ticker),
-                        'exchange': info.get('exchange', 'Unknown'),
-                        'first_trade_date': first_trade_date
-                    }
-                except Exception as e:
-                    logger.warning(f"info_json 파싱 실패: {ticker} - {e}")
-                    result[ticker] = {
-                        'symbol': ticker,
-                        'currency': 'USD',
-                        'company_name': ticker,
-                        'exchange': 'Unknown',
-                        'first_trade_date': None
-                    }
-            else:
-                result[ticker] = {
-                    'symbol': ticker,
-                    'currency': 'USD',
-                    'company_name': ticker,
-                    'exchange': 'Unknown',
-                    'first_trade_date': None
-                }
-        
-        # 상장일이 없는 종목이 있으면 경고
-        if missing_listing_dates:
-            logger.warning(
-                f"상장일 정보가 없는 종목: {', '.join(missing_listing_dates)}. "
-                f"'docker exec -it backtest-be-fast-dev python scripts/update_ticker_listing_dates.py' "
-                f"실행으로 업데이트할 수 있습니다."
-            )
-
-        # DB에 없는 티커들은 기본값 추가
-        for ticker in upper_tickers:
-            if ticker not in found_tickers:
-                result[ticker] = {
-                    'symbol': ticker,
-                    'currency': 'USD',
-                    'company_name': ticker,
-                    'exchange': 'Unknown',
-                    'first_trade_date': None
-                }
-
-        return result
-
+        return _query_ticker_info_batch(conn, tickers)
     except Exception as e:
         logger.error(f"배치 티커 정보 조회 실패: {e}")
         # 실패 시 기본값으로 채운 딕셔너리 반환
@@ -405,6 +470,87 @@ def get_ticker_info_batch_from_db(tickers: List[str]) -> Dict[str, Dict[str, Any
         conn.close()
 
 
+def _query_ticker_info_batch(conn, tickers: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    연결 1개로 여러 티커의 메타데이터를 조회합니다 (IN 절 1회).
+
+    동기 연결과 비동기 연결(AsyncConnection.run_sync)에서 함께 사용합니다.
+    """
+    # 대문자로 변환
+    upper_tickers = [t.upper() for t in tickers]
+
+    # IN 절을 사용한 배치 조회
+    placeholders = ', '.join([f':t{i}' for i in range(len(upper_tickers))])
+    query = text(f"SELECT ticker, info_json FROM stocks WHERE ticker IN ({placeholders})")
+    params = {f't{i}': ticker for i, ticker in enumerate(upper_tickers)}
+
+    rows = conn.execute(query, params).fetchall()
+
+    # 결과를 딕셔너리로 변환
+    result = {}
+    found_tickers = set()
+    missing_listing_dates = []
+
+    for row in rows:
+        ticker = row[0]
+        found_tickers.add(ticker)
+
+        if row[1]:
+            try:
+                info = json.loads(row[1])
+                first_trade_date = info.get('first_trade_date', None)
+                
+                # 상장일이 없으면 경고 리스트에 추가
+                if not first_trade_date:
+                    missing_listing_dates.append(ticker)
+                
+                result[ticker] = {
+                    'symbol': ticker,
+                    'currency': info.get('currency', 'USD'),
+                    'company_name': info.get('company_name', ticker),
+                    'exchange': info.get('exchange', 'Unknown'),
+                    'first_trade_date': first_trade_date
+                }
+            except Exception as e:
+                logger.warning(f"info_json 파싱 실패: {ticker} - {e}")
+                result[ticker] = {
+                    'symbol': ticker,
+                    'currency': 'USD',
+                    'company_name': ticker,
+                    'exchange': 'Unknown',
+                    'first_trade_date': None
+                }
+        else:
+            result[ticker] = {
+                'symbol': ticker,
+                'currency': 'USD',
+                'company_name': ticker,
+                'exchange': 'Unknown',
+                'first_trade_date': None
+            }
+    
+    # 상장일이 없는 종목이 있으면 경고
+    if missing_listing_dates:
+        logger.warning(
+            f"상장일 정보가 없는 종목: {', '.join(missing_listing_dates)}. "
+            f"'docker exec -it backtest-be-fast-dev python scripts/update_ticker_listing_dates.py' "
+            f"실행으로 업데이트할 수 있습니다."
+        )
+
+    # DB에 없는 티커들은 기본값 추가
+    for ticker in upper_tickers:
+        if ticker not in found_tickers:
+            result[ticker] = {
+                'symbol': ticker,
+                'currency': 'USD',
+                'company_name': ticker,
+                'exchange': 'Unknown',
+                'first_trade_date': None
+            }
+
+    return result
+
+
 def _normalize_date_params(start_date: Optional[Union[str, date, datetime, pd.Timestamp]], end_date: Optional[Union[str, date, datetime, pd.Timestamp]]) -> Tuple[date, date]:
     """
     날짜 매개변수를 정규화하고 기본값을 설정합니다.
@@ -449,26 +595,24 @@ def _normalize_date_params(start_date: Optional[Union[str, date, datetime, pd.Ti
     return start_date, end_date
 
 
-def _ensure_stock_exists(conn, engine: Engine, ticker: str, start_date: date, end_date: date) -> tuple[int, any]:
+def _ensure_stock_exists(conn, ticker: str, start_date: date, end_date: date) -> int:
     """
     stock_id를 조회하고, DB에 없으면 yfinance에서 데이터를 가져와 저장합니다.
 
     Args:
         conn: DB 연결 객체
-        engine: SQLAlchemy 엔진
         ticker: 티커 심볼
         start_date: 시작 날짜
         end_date: 종료 날짜
 
     Returns:
-        tuple[int, Connection]: (stock_id, 갱신된_connection)
+        int: stock_id
 
     Raises:
         ValueError: 티커를 찾을 수 없거나 생성할 수 없는 경우
 
     Note:
-        - DB에 없으면 yfinance에서 수집하여 저장
-        - 데이터 저장 후 트랜잭션 격리 문제 방지를 위해 connection 갱신
+        - DB에 없으면 yfinance에서 수집하여 같은 연결로 저장/커밋 후 재조회
     """
     row = conn.execute(text("SELECT id FROM stocks WHERE ticker = :t"), {"t": ticker}).fetchone()
 
@@ -478,12 +622,7 @@ def _ensure_stock_exists(conn, engine: Engine, ticker: str, start_date: date, en
             df_new = data_fetcher.fetch_stock_data(ticker, start_date, end_date, use_cache=True)
             if df_new is None or df_new.empty:
                 raise ValueError("yfinance에서 유효한 데이터가 반환되지 않았습니다.")
-            save_ticker_data(ticker, df_new)
-
-            # 데이터 저장 후 커넥션을 닫고 새로 연결 - 트랜잭션 격리 문제 방지
-            conn.close()
-            time.sleep(0.1)  # 100ms 대기 - DB 커밋 완료 보장
-            conn = engine.connect()
+            _save_and_commit(conn, ticker, df_new)
         except Exception as e:
             logger.exception("티커가 DB에 없고 yfinance 수집 실패")
             raise ValueError(f"티커 '{ticker}'이(가) DB에 없고 yfinance 수집 실패: {e}")
@@ -492,99 +631,251 @@ def _ensure_stock_exists(conn, engine: Engine, ticker: str, start_date: date, en
         if not row:
             raise ValueError(f"티커 '{ticker}'을(를) DB에 추가할 수 없습니다.")
 
-    stock_id = row[0]
-    return stock_id, conn
+    return row[0]
+
 
+class _PriceCoverage(NamedTuple):
+    """티커별 저장 범위 (db_min/db_max: 실제 행 범위, covered_*: 연속 수집이 확인된 워터마크)"""
+    db_min: Optional[date] = None
+    db_max: Optional[date] = None
+    rows_in_range: int = 0
+    covered_from: Optional[date] = None
+    covered_to: Optional[date] = None
 
-def _get_date_coverage(conn, stock_id: int) -> tuple[Optional[date], Optional[date]]:
+    @property
+    def verified(self) -> bool:
+        return self.covered_from is not None
+
+    @property
+    def bounds(self) -> Tuple[Optional[date], Optional[date]]:
+        """누락 구간 계산 기준 범위 (워터마크 우선, 없으면 MIN/MAX)"""
+        if self.verified:
+            return self.covered_from, self.covered_to
+        return self.db_min, self.db_max
+
+
+_COVERAGE_QUERY = (
+    "SELECT dp.stock_id, MIN(dp.date), MAX(dp.date), "
+    "SUM(CASE WHEN dp.date >= :start AND dp.date <= :end THEN 1 ELSE 0 END), {watermark} "
+    "FROM daily_prices dp {join}"
+    "WHERE dp.stock_id IN ({ids}) GROUP BY dp.stock_id{group}"
+)
+
+
+def _to_db_date(value) -> Optional[date]:
+    return pd.to_datetime(value).date() if value is not None else None
+
+
+def _get_price_coverage(conn, stock_ids: List[int], start_date: date, end_date: date) -> Dict[int, _PriceCoverage]:
     """
-    DB에 저장된 주가 데이터의 날짜 범위를 조회합니다.
+    여러 종목의 저장 범위와 커버리지 워터마크를 한 번의 쿼리로 조회합니다.
 
     Args:
         conn: DB 연결 객체
-        stock_id: 주식 ID
+        stock_ids: 주식 ID 목록
+        start_date: 요청 시작 날짜 (구간 내 행 수 집계용)
+        end_date: 요청 종료 날짜
 
     Returns:
-        tuple[Optional[date], Optional[date]]: (최소_날짜, 최대_날짜)
-        데이터가 없으면 (None, None) 반환
+        Dict[int, _PriceCoverage]: stock_id별 범위 (가격 행이 없는 종목은 제외)
+
+    Note:
+        - price_coverage 테이블이 없는 DB(마이그레이션 전)는 MIN/MAX만으로 동작
     """
-    date_row = conn.execute(
-        text("SELECT MIN(date), MAX(date) FROM daily_prices WHERE stock_id = :sid"),
-        {"sid": stock_id}
-    ).fetchone()
+    if not stock_ids:
+        return {}
+    try:
+        rows = conn.execute(*_coverage_query(stock_ids, start_date, end_date)).fetchall()
+    except DBAPIError:
+        logger.warning("price_coverage 테이블 조회 실패 - MIN/MAX 범위로 대체 (database/add_price_coverage.sql 적용 필요)")
+        conn.rollback()
+        rows = conn.execute(*_coverage_query(stock_ids, start_date, end_date, watermark=False)).fetchall()
+    return _coverage_from_rows(rows)
+
+
+def _coverage_query(stock_ids: List[int], start_date: date, end_date: date, watermark: bool = True):
+    """_get_price_coverage 쿼리와 바인드 파라미터 (watermark=False면 price_coverage 조인 없음)"""
+    placeholders = ', '.join([f':s{i}' for i in range(len(stock_ids))])
+    params = {f's{i}': stock_id for i, stock_id in enumerate(stock_ids)}
+    params.update(start=str(start_date), end=str(end_date))
+    if watermark:
+        query = _COVERAGE_QUERY.format(
+            watermark="pc.covered_from, pc.covered_to",
+            join="LEFT JOIN price_coverage pc ON pc.stock_id = dp.stock_id ",
+            ids=placeholders,
+            group=", pc.covered_from, pc.covered_to",
+        )
+    else:
+        query = _COVERAGE_QUERY.format(watermark="NULL, NULL", join="", ids=placeholders, group="")
+    return text(query), params
+
+
+def _coverage_from_rows(rows) -> Dict[int, _PriceCoverage]:
+    """_coverage_query 결과 행을 stock_id별 범위로 변환 (가격 행이 없는 종목은 제외)"""
+    return {
+        row[0]: _PriceCoverage(
+            db_min=_to_db_date(row[1]),
+            db_max=_to_db_date(row[2]),
+            rows_in_range=int(row[3] or 0),
+            covered_from=_to_db_date(row[4]),
+            covered_to=_to_db_date(row[5]),
+        )
+        for row in rows if row[1] is not None
+    }
+
+
+def _record_price_coverage(conn, stock_id: int, covered_from: date, covered_to: date) -> None:
+    """
+    커버리지 워터마크를 기록하고 커밋합니다.
+
+    기존 구간과 겹치거나 맞닿은 구간만 전달해야 하며, 저장 시 기존 값과
+    합집합(LEAST/GREATEST)으로 병합하므로 동시 갱신에도 범위가 줄어들지 않습니다.
+    """
+    if covered_from > covered_to:
+        return
+    if conn.dialect.name == 'mysql':
+        upsert = (
+            "INSERT INTO price_coverage (stock_id, covered_from, covered_to, last_refreshed_at) "
+            "VALUES (:sid, :from_, :to, :now) "
+            "ON DUPLICATE KEY UPDATE covered_from = LEAST(covered_from, VALUES(covered_from)), "
+            "covered_to = GREATEST(covered_to, VALUES(covered_to)), last_refreshed_at = VALUES(last_refreshed_at)"
+        )
+    else:
+        upsert = (
+            "INSERT INTO price_coverage (stock_id, covered_from, covered_to, last_refreshed_at) "
+            "VALUES (:sid, :from_, :to, :now) "
+            "ON CONFLICT (stock_id) DO UPDATE SET covered_from = MIN(covered_from, excluded.covered_from), "
+            "covered_to = MAX(covered_to, excluded.covered_to), last_refreshed_at = excluded.last_refreshed_at"
+        )
+    try:
+        conn.execute(text(upsert), {
+            "sid": stock_id, "from_": str(covered_from), "to": str(covered_to), "now": datetime.utcnow()
+        })
+        conn.commit()
+    except DBAPIError:
+        conn.rollback()
+        logger.warning(f"커버리지 워터마크 기록 실패 (stock_id={stock_id})")
+
+
+def _last_complete_session(today: Optional[date] = None, calendar: Optional[TradingCalendar] = None) -> date:
+    """
+    마지막으로 완결된 거래일 (오늘 봉은 장 마감 전일 수 있으므로 제외, 휴장일 건너뜀)
+
+    EOD 갱신 작업은 장 마감 후 실행되므로 as_of 다음 날을 넘깁니다.
+    """
+    return (calendar or get_calendar('XNYS')).previous_session(today or date.today())
+
+
+def _missing_ranges(
+    start_date: date,
+    end_date: date,
+    db_min: Optional[date],
+    db_max: Optional[date],
+    last_session: date,
+    calendar: Optional[TradingCalendar] = None
+) -> List[Tuple[date, date]]:
+    """
+    요청 범위에서 저장 범위 밖 구간을 계산합니다.
+
+    마지막 완결 거래일까지 세션이 하나도 없는 구간(주말, 휴장일, 장 마감 전 당일)은
+    새 봉이 있을 수 없으므로 제외합니다.
+    """
+    calendar = calendar or get_calendar('XNYS')
+    if db_min is None:
+        ranges = [(start_date, end_date)]
+    else:
+        ranges = []
+        if start_date < db_min:
+            ranges.append((start_date, db_min - timedelta(days=1)))
+        if end_date > db_max:
+            ranges.append((db_max + timedelta(days=1), end_date))
+    return [(s, e) for s, e in ranges if calendar.session_count(s, min(e, last_session)) > 0]
 
-    db_min, db_max = None, None
-    if date_row and date_row[0] is not None:
-        db_min = pd.to_datetime(date_row[0]).date()
-        db_max = pd.to_datetime(date_row[1]).date()
 
-    return db_min, db_max
+def _find_interior_gaps(
+    conn,
+    stock_id: int,
+    start_date: date,
+    end_date: date,
+    coverage: _PriceCoverage,
+    calendar: TradingCalendar
+) -> List[Tuple[date, date]]:
+    """
+    워터마크가 없는 기존 데이터에서 요청 구간 내부의 누락 구간을 찾습니다.
+
+    구간 내 행 수가 거래소 세션 수보다 IngestionConfig.LEGACY_MISSING_RATIO 이상 부족할 때만 날짜를 조회하고,
+    연속 누락 세션이 IngestionConfig.LEGACY_GAP_MIN_SESSIONS 이상인 구간을 반환합니다.
+    """
+    if coverage.db_min is None:
+        return []
+    lo, hi = max(start_date, coverage.db_min), min(end_date, coverage.db_max)
+    expected = calendar.session_count(lo, hi)
+    if expected - coverage.rows_in_range <= expected * IngestionConfig.LEGACY_MISSING_RATIO:
+        return []
+
+    rows = conn.execute(
+        text("SELECT date FROM daily_prices WHERE stock_id = :sid AND date >= :start AND date <= :end ORDER BY date"),
+        {"sid": stock_id, "start": str(lo), "end": str(hi)}
+    ).fetchall()
+    days = pd.to_datetime([row[0] for row in rows]).values.astype('datetime64[D]')
+    if len(days) < 2:
+        return []
+
+    missing = calendar.session_count(days[:-1] + 1, days[1:] - 1)
+    holes = np.flatnonzero(missing >= IngestionConfig.LEGACY_GAP_MIN_SESSIONS)
+    return [
+        ((days[i] + 1).astype(date), (days[i + 1] - 1).astype(date))
+        for i in holes
+    ]
 
 
 def _fetch_and_save_missing_data(
     conn,
-    engine: Engine,
     ticker: str,
     start_date: date,
     end_date: date,
     db_min: Optional[date],
     db_max: Optional[date]
-) -> any:
+) -> Tuple[bool, Optional[date]]:
     """
-    요청 범위와 DB 범위를 비교하여 누락된 데이터를 yfinance에서 가져와 저장합니다.
+    요청 범위와 저장 범위를 비교하여 누락된 데이터를 yfinance에서 가져와 저장합니다.
 
     Args:
         conn: DB 연결 객체
-        engine: SQLAlchemy 엔진
         ticker: 티커 심볼
         start_date: 요청 시작 날짜
-        end_date: 요청 종료 날짜
-        db_min: DB에 저장된 최소 날짜 (None이면 DB에 데이터 없음)
-        db_max: DB에 저장된 최대 날짜 (None이면 DB에 데이터 없음)
+        end_date: 요청 종료 날짜 (호출자가 마지막 완결 거래일 이하로 제한)
+        db_min: 저장 범위 시작 (None이면 요청 범위 전체 수집)
+        db_max: 저장 범위 끝
 
     Returns:
-        Connection: 갱신된 DB 연결 객체
+        Tuple[bool, Optional[date]]: (모든 누락 구간 수집 성공 여부, 저장한 마지막 날짜)
 
     Note:
-        - 통합 fetch 시도 (여러 구간을 하나로 합쳐서 패딩 추가)
+        - 통합 fetch 시도 (여러 구간을 하나로 합쳐서 앞쪽 패딩 추가, 끝쪽은 미완결 봉 방지를 위해 패딩 없음)
         - 실패 시 개별 구간별 fetch로 fallback
-        - 데이터 저장 후 트랜잭션 격리 문제 방지를 위해 connection 갱신
+        - 같은 연결로 저장/커밋하므로 이어지는 조회가 새 행을 바로 읽음
     """
-    # 누락된 구간 계산
-    missing_ranges = []
-    if db_min is None:
-        # DB에 데이터가 전혀 없음 -> 요청 범위 전체를 가져와야 함
-        missing_ranges.append((start_date, end_date))
-    else:
-        # 시작 날짜가 DB 범위보다 이전인 경우
-        if start_date < db_min:
-            missing_ranges.append((start_date, db_min - timedelta(days=1)))
-        # 종료 날짜가 DB 범위보다 이후인 경우
-        if end_date > db_max:
-            missing_ranges.append((db_max + timedelta(days=1), end_date))
+    calendar = calendar_for_ticker(ticker)
+    missing_ranges = _missing_ranges(start_date, end_date, db_min, db_max, end_date, calendar)
 
     # 누락된 구간이 없으면 그대로 반환
     if not missing_ranges:
-        return conn
+        return True, None
 
-    # 전략 1: 통합 fetch (여러 구간을 하나로 합쳐서 패딩 추가)
+    # 전략 1: 통합 fetch (여러 구간을 하나로 합쳐서 앞쪽 패딩 추가)
     if data_fetcher is not None:
-        min_start = min(s for s, _ in missing_ranges if s is not None)
-        max_end = max(e for _, e in missing_ranges if e is not None)
-        PAD_DAYS = 3
-        co_start = max(min_start - timedelta(days=PAD_DAYS), date(1970, 1, 1))
-        co_end = min(max_end + timedelta(days=PAD_DAYS), date.today())
+        min_start = min(s for s, _ in missing_ranges)
+        max_end = max(e for _, e in missing_ranges)
+        co_start = max(calendar.offset(min_start, -IngestionConfig.FETCH_PAD_SESSIONS), date(1970, 1, 1))
+        co_end = min(max_end, date.today())
 
         try:
             logger.info(f"DB에 누락된 기간을 yfinance에서 가져옵니다(통합+패드): {ticker} {co_start} -> {co_end}")
             df_new = data_fetcher.fetch_stock_data(ticker, co_start, co_end, use_cache=True)
             if df_new is not None and not df_new.empty:
-                save_ticker_data(ticker, df_new)
-                # 데이터 저장 후 커넥션을 닫고 새로 연결하여 트랜잭션 격리 문제 방지
-                conn.close()
-                time.sleep(0.1)  # 100ms 대기 - DB 커밋 완료 보장
-                conn = engine.connect()
-                return conn
+                _save_and_commit(conn, ticker, df_new)
+                return True, df_new.index.max().date()
             else:
                 logger.warning("통합 fetch가 빈 결과를 반환했습니다; 개별 구간으로 폴백합니다.")
                 raise ValueError("empty result from consolidated fetch")
@@ -592,24 +883,90 @@ def _fetch_and_save_missing_data(
             logger.exception("통합 누락 기간 수집 실패, 개별 구간 시도 중")
 
     # 전략 2 (fallback): 개별 구간별 fetch
+    resolved = True
+    last_saved = None
     for s, e in missing_ranges:
-        if s is None or e is None:
-            continue
-        if s > e:
-            continue
         try:
             logger.info(f"DB에 누락된 기간을 yfinance에서 가져옵니다: {ticker} {s} -> {e}")
             df_new = data_fetcher.fetch_stock_data(ticker, s, e, use_cache=True)
             if df_new is not None and not df_new.empty:
-                save_ticker_data(ticker, df_new)
-                # 데이터 저장 후 커넥션 갱신
-                conn.close()
-                time.sleep(0.1)
-                conn = engine.connect()
+                _save_and_commit(conn, ticker, df_new)
+                last_saved = max(filter(None, (last_saved, df_new.index.max().date())))
+            else:
+                resolved = False
         except Exception:
             logger.exception("누락 기간 수집 실패")
+            resolved = False
+    return resolved, last_saved
 
-    return conn
+
+def _pending_ranges(
+    conn,
+    stock_id: int,
+    start_date: date,
+    end_date: date,
+    coverage: _PriceCoverage,
+    last_session: date,
+    calendar: TradingCalendar
+) -> Tuple[List[Tuple[date, date]], List[Tuple[date, date]]]:
+    """
+    요청 구간에서 수집이 필요한 구간을 계산합니다 (쓰기 없음).
+
+    Returns:
+        Tuple: (내부 구멍 - 워터마크가 없는 기존 데이터만, 저장 범위 밖 구간)
+    """
+    gaps = [] if coverage.verified else _find_interior_gaps(conn, stock_id, start_date, end_date, coverage, calendar)
+    edges = _missing_ranges(start_date, end_date, *coverage.bounds, last_session, calendar)
+    return gaps, edges
+
+
+def _sync_missing_prices(
+    conn,
+    ticker: str,
+    stock_id: int,
+    start_date: date,
+    end_date: date,
+    coverage: _PriceCoverage,
+    last_session: Optional[date] = None,
+    bootstrap: bool = False
+) -> None:
+    """
+    요청 구간의 누락 데이터를 보완하고 커버리지 워터마크를 갱신합니다.
+
+    - 워터마크가 있으면 워터마크 밖 구간만 수집 (워터마크 안은 연속 수집이 확인된 구간)
+    - 워터마크가 없는 기존 데이터는 MIN/MAX 밖 구간 + 내부 구멍을 수집한 뒤 요청 구간을 워터마크로 기록
+    - 수집이 일부라도 실패하면 워터마크는 갱신하지 않음 (다음 요청에서 재시도)
+    - 수집이 없었던 요청은 쓰기 없이 반환 (읽기 경로 유지), bootstrap이면 워터마크가 없는 티커도 기록
+    """
+    calendar = calendar_for_ticker(ticker)
+    last_session = last_session or _last_complete_session(calendar=calendar)
+    lo, hi = coverage.bounds
+    gaps, edges = _pending_ranges(conn, stock_id, start_date, end_date, coverage, last_session, calendar)
+    if not gaps and not edges and (coverage.verified or not bootstrap):
+        return
+
+    resolved = True
+    last_saved = None
+    with span('gap_fill'):
+        for gap_start, gap_end in gaps:
+            ok, _ = _fetch_and_save_missing_data(conn, ticker, gap_start, gap_end, None, None) or (False, None)
+            resolved = resolved and ok
+
+        if edges:
+            fetch_end = min(end_date, last_session)
+            ok, last_saved = _fetch_and_save_missing_data(conn, ticker, start_date, fetch_end, lo, hi) or (False, None)
+            resolved = resolved and ok
+    if not resolved:
+        return
+
+    verified_to = min(end_date, last_session)
+    if edges and (hi is None or edges[-1][1] > hi):
+        # 뒤쪽 구간은 실제로 받은 마지막 봉까지만 확정 (미발행 봉은 다음 요청에서 재수집)
+        verified_to = min(verified_to, last_saved or date.min)
+    if coverage.verified:
+        _record_price_coverage(conn, stock_id, min(start_date, lo), max(verified_to, hi))
+    else:
+        _record_price_coverage(conn, stock_id, start_date, verified_to)
 
 
 def _query_and_format_dataframe(
@@ -656,6 +1013,19 @@ def _query_and_format_dataframe(
     if not rows:
         raise ValueError(f"티커 '{ticker}'에 대한 데이터가 없습니다. (요청 범위: {start_date} - {end_date})")
 
+    return _format_price_rows(rows)
+
+
+def _format_price_rows(rows) -> pd.DataFrame:
+    """
+    daily_prices 조회 결과 행을 표준 주가 DataFrame으로 변환합니다.
+
+    Args:
+        rows: (date, open, high, low, close, adj_close, volume) 행 목록
+
+    Returns:
+        pd.DataFrame: 주가 데이터 (날짜 인덱스, OHLCV 컬럼)
+    """
     # DataFrame 생성
     df = pd.DataFrame(rows, columns=["date", "open", "high", "low", "close", "adj_close", "volume"])
     df['date'] = pd.to_datetime(df['date'])
@@ -688,8 +1058,8 @@ def _load_ticker_data_internal(ticker: str, start_date=None, end_date=None) -> p
     DB 우선 조회 전략:
     1. 날짜 매개변수 정규화
     2. stock_id 확보 (없으면 yfinance에서 가져와 저장)
-    3. DB 데이터 범위 조회
-    4. 누락 구간 수집 (통합 fetch → fallback: 개별 fetch)
+    3. DB 데이터 범위 / 커버리지 워터마크 조회
+    4. 누락 구간 수집 (통합 fetch → fallback: 개별 fetch) 후 워터마크 갱신
     5. 최종 데이터 조회 및 DataFrame 반환
 
     Args:
@@ -714,13 +1084,13 @@ def _load_ticker_data_internal(ticker: str, start_date=None, end_date=None) -> p
         start_date, end_date = _normalize_date_params(start_date, end_date)
 
         # 2. stock_id 확보 (DB에 없으면 yfinance에서 수집)
-        stock_id, conn = _ensure_stock_exists(conn, engine, ticker, start_date, end_date)
+        stock_id = _ensure_stock_exists(conn, ticker, start_date, end_date)
 
-        # 3. DB에 저장된 데이터 범위 조회
-        db_min, db_max = _get_date_coverage(conn, stock_id)
+        # 3. DB에 저장된 데이터 범위 / 워터마크 조회
+        coverage = _get_price_coverage(conn, [stock_id], start_date, end_date).get(stock_id, _PriceCoverage())
 
         # 4. 누락된 구간 수집 (통합 fetch 시도 → fallback: 개별 fetch)
-        conn = _fetch_and_save_missing_data(conn, engine, ticker, start_date, end_date, db_min, db_max)
+        _sync_missing_prices(conn, ticker, stock_id, start_date, end_date, coverage)
 
         # 5. 최종 데이터 조회 및 DataFrame 반환
         df = _query_and_format_dataframe(conn, stock_id, ticker, start_date, end_date)
@@ -730,6 +1100,276 @@ def _load_ticker_data_internal(ticker: str, start_date=None, end_date=None) -> p
         conn.close()
 
 
+def _query_price_frames(conn, stock_ids: Dict[str, int], start_date: date, end_date: date) -> Dict[str, pd.DataFrame]:
+    """
+    여러 종목의 가격을 정렬 조회 1회로 읽어 티커별 DataFrame으로 분할합니다.
+
+    Returns:
+        Dict[str, pd.DataFrame]: 티커별 주가 데이터 (구간 안에 행이 없는 티커는 제외)
+    """
+    rows = conn.execute(*_price_rows_query(stock_ids, start_date, end_date)).fetchall()
+    return _price_frames_from_rows(rows, stock_ids, start_date, end_date)
+
+
+def _price_rows_query(stock_ids: Dict[str, int], start_date: date, end_date: date):
+    """_query_price_frames 쿼리와 바인드 파라미터 (stock_id, date 순 정렬)"""
+    id_placeholders = ', '.join([f':s{i}' for i in range(len(stock_ids))])
+    id_params = {f's{i}': stock_id for i, stock_id in enumerate(stock_ids.values())}
+    query = text(
+        f"SELECT stock_id, date, open, high, low, close, adj_close, volume FROM daily_prices "
+        f"WHERE stock_id IN ({id_placeholders}) AND date >= :start AND date <= :end "
+        f"ORDER BY stock_id ASC, date ASC"
+    )
+    return query, {**id_params, 'start': str(start_date), 'end': str(end_date)}
+
+
+def _price_frames_from_rows(rows, stock_ids: Dict[str, int], start_date: date, end_date: date) -> Dict[str, pd.DataFrame]:
+    """_price_rows_query 결과 행을 티커별 DataFrame으로 분할 (비동기 경로는 스레드에서 호출)"""
+    rows_by_id: Dict[int, list] = {}
+    for row in rows:
+        rows_by_id.setdefault(row[0], []).append(row[1:])
+
+    result: Dict[str, pd.DataFrame] = {}
+    for ticker, stock_id in stock_ids.items():
+        ticker_rows = rows_by_id.get(stock_id)
+        if not ticker_rows:
+            logger.warning(f"티커 '{ticker}'에 대한 데이터가 없습니다. (요청 범위: {start_date} - {end_date})")
+            continue
+        result[ticker] = _format_price_rows(ticker_rows)
+    return result
+
+
+def _query_stock_ids(conn, tickers: List[str]) -> Dict[str, int]:
+    """stocks에서 stock_id를 IN 절 1회로 조회합니다 (DB에 없는 티커는 제외, 요청한 티커 문자열이 key)."""
+    return _stock_ids_from_rows(conn.execute(*_stock_ids_query(tickers)).fetchall(), tickers)
+
+
+def _stock_ids_query(tickers: List[str]):
+    """_query_stock_ids 쿼리와 바인드 파라미터"""
+    placeholders = ', '.join([f':t{i}' for i in range(len(tickers))])
+    query = text(f"SELECT id, ticker FROM stocks WHERE ticker IN ({placeholders})")
+    return query, {f't{i}': ticker for i, ticker in enumerate(tickers)}
+
+
+def _stock_ids_from_rows(rows, tickers: List[str]) -> Dict[str, int]:
+    """_stock_ids_query 결과 행을 티커별 stock_id로 변환 (대소문자 무시)"""
+    ids_by_upper = {row[1].upper(): row[0] for row in rows}
+    return {ticker: ids_by_upper[ticker.upper()] for ticker in tickers if ticker.upper() in ids_by_upper}
+
+
+def _covered_stock_ids(
+    stock_ids: Dict[str, int],
+    coverage: Dict[int, _PriceCoverage],
+    start_date: date,
+    end_date: date
+) -> Dict[str, int]:
+    """워터마크가 요청 구간(마지막 완결 거래일까지)을 포함하는 티커만 선별합니다."""
+    covered: Dict[str, int] = {}
+    for ticker, stock_id in stock_ids.items():
+        cov = coverage.get(stock_id, _PriceCoverage())
+        calendar = calendar_for_ticker(ticker)
+        if cov.verified and not _missing_ranges(
+            start_date, end_date, *cov.bounds, _last_complete_session(calendar=calendar), calendar
+        ):
+            covered[ticker] = stock_id
+    return covered
+
+
+def load_covered_ticker_data_batch(conn, tickers: List[str], start_date=None, end_date=None) -> Dict[str, pd.DataFrame]:
+    """
+    커버리지 워터마크 안쪽 티커만 읽기 전용으로 일괄 조회합니다 (yfinance 호출/쓰기 없음, 쿼리 3회).
+
+    비동기 저장소는 같은 단계를 쿼리 생성/행 변환 헬퍼로 나눠 수행하며, 수집이 필요한 티커
+    (DB에 없는 티커, 워터마크가 없거나 워터마크 밖 구간)는 결과에서 제외하여
+    호출자가 동기 경로(StockRepository.load_stock_data, 단일 비행)로 넘기게 합니다.
+
+    Returns:
+        Dict[str, pd.DataFrame]: 티커별 주가 데이터 (요청한 티커 문자열이 key)
+    """
+    tickers = list(dict.fromkeys(tickers))
+    if not tickers:
+        return {}
+    start_date, end_date = _normalize_date_params(start_date, end_date)
+
+    stock_ids = _query_stock_ids(conn, tickers)
+    if not stock_ids:
+        return {}
+
+    coverage = _get_price_coverage(conn, list(stock_ids.values()), start_date, end_date)
+    covered = _covered_stock_ids(stock_ids, coverage, start_date, end_date)
+    if not covered:
+        return {}
+
+    return _query_price_frames(conn, covered, start_date, end_date)
+
+
+def load_ticker_data_batch(
+    tickers: List[str],
+    start_date: Optional[Union[str, date]] = None,
+    end_date: Optional[Union[str, date]] = None
+) -> Dict[str, pd.DataFrame]:
+    """
+    누락 구간이 없는 티커의 주가 데이터를 한 번의 DB 왕복으로 조회합니다 (N+1 쿼리 최적화).
+
+    조회 순서:
+    1. stocks에서 stock_id를 IN 절 1회로 조회
+    2. daily_prices 날짜 범위와 커버리지 워터마크를 GROUP BY 1회로 조회
+    3. 누락 구간이 없는 티커의 가격을 정렬 조회 1회로 읽어 stock_id별로 분할
+
+    Args:
+        tickers: 종목 심볼 리스트
+        start_date: 시작 날짜
+        end_date: 종료 날짜
+
+    Returns:
+        Dict[str, pd.DataFrame]: 티커별 주가 데이터 (요청한 티커 문자열이 key)
+
+    Note:
+        - 읽기 전용 (yfinance 수집/쓰기 없음)
+        - DB에 없는 티커, 누락 구간(워터마크 밖, 레거시 데이터의 내부 구멍)이 있는 티커는 결과에서 제외
+          (호출자가 StockRepository.load_stock_data로 보완 - 같은 티커 동시 수집은 단일 비행으로 합침)
+    """
+    tickers = list(dict.fromkeys(tickers))
+    if not tickers:
+        return {}
+
+    engine = _get_engine()
+    conn = engine.connect()
+    try:
+        start_date, end_date = _normalize_date_params(start_date, end_date)
+
+        # 1. stock_id 배치 조회
+        stock_ids = _query_stock_ids(conn, tickers)
+        if not stock_ids:
+            return {}
+
+        # 2. 날짜 범위 / 워터마크 배치 조회 후 누락 구간이 없는 티커만 선별
+        coverage = _get_price_coverage(conn, list(stock_ids.values()), start_date, end_date)
+        ready: Dict[str, int] = {}
+        for ticker, stock_id in stock_ids.items():
+            calendar = calendar_for_ticker(ticker)
+            gaps, edges = _pending_ranges(
+                conn, stock_id, start_date, end_date, coverage.get(stock_id, _PriceCoverage()),
+                _last_complete_session(calendar=calendar), calendar
+            )
+            if not gaps and not edges:
+                ready[ticker] = stock_id
+        if not ready:
+            return {}
+
+        # 3. 가격 일괄 조회 후 stock_id별 분할
+        result = _query_price_frames(conn, ready, start_date, end_date)
+
+        logger.info(f"[배치] 주가 데이터 로드 완료: {len(result)}/{len(tickers)}개 티커, "
+                    f"{sum(len(df) for df in result.values())}행")
+        return result
+    finally:
+        conn.close()
+
+
+def get_price_watermarks() -> Dict[str, Dict[str, Optional[date]]]:
+    """
+    가격 데이터가 있는 모든 티커의 저장 범위와 커버리지 워터마크를 조회합니다 (EOD 갱신용).
+
+    Returns:
+        Dict[str, Dict]: 티커별 db_min, db_max, covered_from, covered_to
+            (covered_*가 None이면 워터마크가 없는 기존 데이터)
+    """
+    engine = _get_engine()
+    conn = engine.connect()
+    try:
+        stocks = conn.execute(text("SELECT id, ticker FROM stocks")).fetchall()
+        ticker_by_id = {row[0]: row[1] for row in stocks}
+        today = date.today()
+        coverage = _get_price_coverage(conn, list(ticker_by_id), today, today)
+        return {
+            ticker_by_id[stock_id]: {
+                'db_min': cov.db_min,
+                'db_max': cov.db_max,
+                'covered_from': cov.covered_from,
+                'covered_to': cov.covered_to,
+            }
+            for stock_id, cov in coverage.items()
+        }
+    finally:
+        conn.close()
+
+
+def get_price_versions(tickers: List[str], start_date: date, end_date: date) -> Dict[str, str]:
+    """
+    티커별 [start_date, end_date] 구간 가격 행의 버전 스탬프를 한 번의 쿼리로 조회합니다.
+
+    행 수, 첫/마지막 날짜, 가격/거래량 합계로 만든 문자열이므로
+    구간 안의 행이 추가되거나 값이 바뀌면 스탬프도 바뀝니다 (백테스트 결과 캐시 키).
+
+    Returns:
+        Dict[str, str]: 티커별 스탬프 (DB에 없는 티커는 'none')
+    """
+    upper_tickers = sorted({ticker.upper() for ticker in tickers})
+    if not upper_tickers:
+        return {}
+    placeholders = ', '.join([f':t{i}' for i in range(len(upper_tickers))])
+    params = {f't{i}': ticker for i, ticker in enumerate(upper_tickers)}
+    params.update(start=str(start_date), end=str(end_date))
+
+    engine = _get_engine()
+    conn = engine.connect()
+    try:
+        rows = conn.execute(text(
+            "SELECT s.ticker, COUNT(dp.date), MIN(dp.date), MAX(dp.date), "
+            "SUM(dp.close), SUM(dp.adj_close), SUM(dp.volume) "
+            "FROM stocks s LEFT JOIN daily_prices dp "
+            "ON dp.stock_id = s.id AND dp.date >= :start AND dp.date <= :end "
+            f"WHERE s.ticker IN ({placeholders}) GROUP BY s.ticker"
+        ), params).fetchall()
+    finally:
+        conn.close()
+
+    versions = {ticker: 'none' for ticker in upper_tickers}
+    for ticker, *aggregates in rows:
+        versions[ticker.upper()] = ':'.join(str(value) for value in aggregates)
+    return versions
+
+
+def sync_ticker_prices(ticker: str, start_date: date, end_date: date, last_session: Optional[date] = None) -> None:
+    """
+    요청 구간의 누락 데이터를 개별 수집하고 커버리지 워터마크를 갱신합니다.
+
+    EOD 갱신에서 워터마크가 없는 티커의 초기 검증과 일괄 다운로드 누락 티커의 재시도에 사용합니다.
+    """
+    engine = _get_engine()
+    conn = engine.connect()
+    try:
+        stock_id = _ensure_stock_exists(conn, ticker, start_date, end_date)
+        coverage = _get_price_coverage(conn, [stock_id], start_date, end_date).get(stock_id, _PriceCoverage())
+        _sync_missing_prices(conn, ticker, stock_id, start_date, end_date, coverage, last_session, bootstrap=True)
+    finally:
+        conn.close()
+
+
+def save_incremental_prices(ticker: str, df: pd.DataFrame, covered_from: date) -> int:
+    """
+    증분 가격 데이터를 저장하고 워터마크를 마지막 저장 봉까지 연장합니다.
+
+    Args:
+        ticker: 티커 심볼
+        df: 기존 워터마크 끝 이후의 가격 데이터
+        covered_from: 기존 워터마크 끝 (연장 구간이 기존 구간과 이어지도록 전달)
+
+    Returns:
+        int: 저장된 행 수
+    """
+    engine = _get_engine()
+    conn = engine.connect()
+    try:
+        saved = _save_and_commit(conn, ticker, df)
+        stock_id = conn.execute(text("SELECT id FROM stocks WHERE ticker = :t"), {"t": ticker}).scalar()
+        _record_price_coverage(conn, stock_id, covered_from, df.index.max().date())
+        return saved
+    finally:
+        conn.close()
+
+
 def load_news_from_db(ticker: str, max_age_hours: int = 3) -> Optional[list]:
     """
     DB에서 뉴스 데이터 조회 (최대 age 체크)
@@ -749,43 +1389,47 @@ def load_news_from_db(ticker: str, max_age_hours: int = 3) -> Optional[list]:
     engine = _get_engine()
     conn = engine.connect()
     try:
-        # created_at이 max_age_hours 이내인 뉴스만 조회
-        cutoff_time = datetime.now() - timedelta(hours=max_age_hours)
-
-        query = text("""
-            SELECT title, link, description, news_date, created_at
-            FROM stock_news
-            WHERE ticker = :ticker
-            AND created_at >= :cutoff_time
-            ORDER BY news_date DESC, created_at DESC
-            LIMIT 20
-        """)
+        return _query_news(conn, ticker, max_age_hours)
+    except Exception as e:
+        logger.error(f"DB 뉴스 조회 실패: {ticker} - {str(e)}")
+        return None
+    finally:
+        conn.close()
 
-        result = conn.execute(query, {"ticker": ticker, "cutoff_time": cutoff_time})
-        rows = result.fetchall()
 
-        if not rows:
-            logger.debug(f"DB에 {ticker}의 최신 뉴스({max_age_hours}시간 이내)가 없습니다")
-            return None
+def _query_news(conn, ticker: str, max_age_hours: int) -> Optional[list]:
+    """연결 1개로 max_age_hours 이내 뉴스를 조회합니다 (동기/비동기 연결 공용)."""
+    # created_at이 max_age_hours 이내인 뉴스만 조회
+    cutoff_time = datetime.now() - timedelta(hours=max_age_hours)
 
-        # 뉴스 리스트로 변환
-        news_list = []
-        for row in rows:
-            news_list.append({
-                'title': row[0],
-                'link': row[1],
-                'description': row[2] or '',
-                'pubDate': row[3].strftime('%a, %d %b %Y %H:%M:%S +0900') if isinstance(row[3], date) else str(row[3])
-            })
+    query = text("""
+        SELECT title, link, description, news_date, created_at
+        FROM stock_news
+        WHERE ticker = :ticker
+        AND created_at >= :cutoff_time
+        ORDER BY news_date DESC, created_at DESC
+        LIMIT 20
+    """)
 
-        logger.info(f"DB에서 {ticker} 뉴스 {len(news_list)}개 조회 (created_at >= {cutoff_time})")
-        return news_list
+    result = conn.execute(query, {"ticker": ticker, "cutoff_time": cutoff_time})
+    rows = result.fetchall()
 
-    except Exception as e:
-        logger.error(f"DB 뉴스 조회 실패: {ticker} - {str(e)}")
+    if not rows:
+        logger.debug(f"DB에 {ticker}의 최신 뉴스({max_age_hours}시간 이내)가 없습니다")
         return None
-    finally:
-        conn.close()
+
+    # 뉴스 리스트로 변환
+    news_list = []
+    for row in rows:
+        news_list.append({
+            'title': row[0],
+            'link': row[1],
+            'description': row[2] or '',
+            'pubDate': row[3].strftime('%a, %d %b %Y %H:%M:%S +0900') if isinstance(row[3], date) else str(row[3])
+        })
+
+    logger.info(f"DB에서 {ticker} 뉴스 {len(news_list)}개 조회 (created_at >= {cutoff_time})")
+    return news_list
 
 
 def save_news_to_db(ticker: str, news_list: list) -> int:
@@ -45,13 +45,13 @@ exchange_rates = await converter.load_multiple_exchange_rates(
 )
 ```
 """
-import asyncio
 import logging
 from datetime import datetime, date, timedelta
 from typing import Dict, Optional, Tuple
+import numpy as np
 import pandas as pd
 
-from app.constants.currencies import SUPPORTED_CURRENCIES, EXCHANGE_RATE_LOOKBACK_DAYS
+from app.constants.currencies import SUPPORTED_CURRENCIES, EXCHANGE_RATE_LOOKBACK_DAYS, USD_QUOTED_CURRENCIES
 from app.constants.data_loading import TradingThresholds
 from app.repositories.stock_repository import get_stock_repository
 
@@ -83,12 +83,38 @@ class CurrencyConverter:
             - KRW, JPY, CNY, etc.: XXX=X 형태 (1 USD = X 통화) → 나누기
         """
         # USD 환율 (XXXUSD=X): 통화에 환율을 곱함
-        if currency in ['EUR', 'GBP', 'AUD', 'CAD', 'CHF']:
+        if currency in USD_QUOTED_CURRENCIES:
             return exchange_rate
 
         # 직접 환율 (XXX=X): 통화를 환율로 나눔
         return 1.0 / exchange_rate if exchange_rate > 0 else 1.0
 
+    @staticmethod
+    def get_conversion_multipliers(currency: str, exchange_rates: np.ndarray) -> np.ndarray:
+        """
+        get_conversion_multiplier()의 배열 버전입니다.
+
+        Args:
+            currency: 통화 코드 (ISO 4217)
+            exchange_rates: 환율 배열 (NaN 허용)
+
+        Returns:
+            np.ndarray: 원소별 USD 변환 비율 (NaN 환율은 NaN 유지)
+
+        Note:
+            - 스칼라 버전과 동일한 연산(rate 또는 1.0 / rate)을 원소별로 적용하므로
+              결과가 비트 단위로 일치합니다.
+        """
+        rates = np.asarray(exchange_rates, dtype=float)
+
+        if currency in USD_QUOTED_CURRENCIES:
+            return rates.copy()
+
+        multipliers = np.ones_like(rates)
+        np.divide(1.0, rates, out=multipliers, where=rates > 0)
+        multipliers[np.isnan(rates)] = np.nan
+        return multipliers
+
     @staticmethod
     def _normalize_date_to_datetime(date_value) -> datetime:
         """
@@ -178,9 +204,9 @@ class CurrencyConverter:
 
         logger.info(f"{currency} 환율 데이터 로드 중: {exchange_ticker} ({exchange_start_date} ~ {end_date})")
 
-        # 환율 데이터 로딩 (asyncio.to_thread로 async/sync 경계 준수)
-        exchange_data = await asyncio.to_thread(
-            self.stock_repository.load_stock_data, exchange_ticker, exchange_start_date, end_date
+        # 환율 데이터 로딩 (재시도 대기 중 워커 스레드 비점유)
+        exchange_data = await self.stock_repository.load_stock_data_async(
+            exchange_ticker, exchange_start_date, end_date
         )
 
         if exchange_data is None or exchange_data.empty:
@@ -227,7 +253,7 @@ class CurrencyConverter:
         # 통화 정보 조회
         if currency is None:
             try:
-                ticker_info = await asyncio.to_thread(self.stock_repository.get_ticker_info, ticker)
+                ticker_info = await self.stock_repository.get_ticker_info_async(ticker)
                 currency = ticker_info.get('currency', 'USD')
                 logger.info(f"{ticker} 통화: {currency}")
             except Exception as e:
@@ -270,25 +296,22 @@ class CurrencyConverter:
             original_close_min = data['Close'].min()
             original_close_max = data['Close'].max()
 
-            # 각 행에 대해 환율 적용
-            converted_count = 0
-            for idx in converted_data.index:
-                # 타임존 제거 (환율 데이터 인덱스와 매칭)
-                idx_no_tz = self._remove_timezone(pd.DatetimeIndex([idx]))[0]
-
-                # 환율 데이터에서 해당 날짜의 환율 가져오기
-                if idx_no_tz in exchange_data.index and pd.notna(exchange_data.loc[idx_no_tz, 'Close']):
-                    exchange_rate = exchange_data.loc[idx_no_tz, 'Close']
-
-                    # 통화별 변환 비율 계산
-                    multiplier = self.get_conversion_multiplier(currency, exchange_rate)
+            # 날짜별 환율을 가격 인덱스에 정렬 (타임존 제거 후 매칭, 없는 날짜는 NaN)
+            price_index_no_tz = self._remove_timezone(pd.DatetimeIndex(converted_data.index))
+            if exchange_data.index.equals(price_index_no_tz):
+                exchange_rates = exchange_data['Close'].to_numpy(dtype=float)
+            else:
+                exchange_rates = exchange_data['Close'].reindex(price_index_no_tz).to_numpy(dtype=float)
 
-                    # OHLC 컬럼 변환
-                    for col in ['Open', 'High', 'Low', 'Close']:
-                        if col in converted_data.columns:
-                            converted_data.loc[idx, col] *= multiplier
+            # 통화별 변환 비율을 한 번에 계산하고 OHLC에 브로드캐스트 적용
+            # 환율이 없는 날짜는 비율 1.0 (원본 유지)
+            multipliers = self.get_conversion_multipliers(currency, exchange_rates)
+            has_rate = ~np.isnan(exchange_rates)
+            multipliers[~has_rate] = 1.0
 
-                    converted_count += 1
+            price_columns = [col for col in ['Open', 'High', 'Low', 'Close'] if col in converted_data.columns]
+            converted_data[price_columns] = converted_data[price_columns].mul(multipliers, axis=0)
+            converted_count = int(has_rate.sum())
 
             # 변환 후 가격 범위
             converted_close_min = converted_data['Close'].min()
@@ -364,28 +387,20 @@ class CurrencyConverter:
             currencies_to_load.append(currency)
             tickers_to_load.append(exchange_ticker)
 
-        # Phase 2: 모든 환율 데이터를 병렬로 로드 (N+1 query 최적화)
+        # Phase 2: 모든 환율 데이터를 일괄 로드 (N+1 query 최적화: DB 왕복 1회)
         if currencies_to_load:
-            logger.info(f"환율 데이터 병렬 로드 시작: {len(currencies_to_load)}개 통화 [{', '.join(currencies_to_load)}]")
+            logger.info(f"환율 데이터 일괄 로드 시작: {len(currencies_to_load)}개 통화 [{', '.join(currencies_to_load)}]")
 
-            # 병렬 로드 태스크 생성
-            load_tasks = [
-                asyncio.to_thread(self.stock_repository.load_stock_data, ticker, exchange_start_date, end_date)
-                for ticker in tickers_to_load
-            ]
-
-            # 병렬 실행
-            load_results = await asyncio.gather(*load_tasks, return_exceptions=True)
+            loaded = await self.stock_repository.load_stock_data_batch_async(
+                tickers_to_load, exchange_start_date, end_date
+            )
 
-            # Phase 3: 결과 처리
+            # Phase 3: 결과 처리 (실패 티커는 배치 결과에서 제외됨)
             date_range_no_tz = self._remove_timezone(date_range)
 
-            for currency, ticker, result in zip(currencies_to_load, tickers_to_load, load_results):
+            for currency, ticker in zip(currencies_to_load, tickers_to_load):
                 try:
-                    if isinstance(result, Exception):
-                        logger.warning(f"{currency} 환율 로드 실패 ({ticker}): {result}")
-                        continue
-
+                    result = loaded.get(ticker)
                     if result is None or result.empty:
                         logger.warning(f"{currency} 환율 데이터 없음 ({ticker}), 건너뛰기")
                         continue
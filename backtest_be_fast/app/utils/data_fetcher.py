@@ -19,6 +19,11 @@
 **의존성**:
 - yfinance: 주가 데이터 다운로드
 - pandas: 데이터 처리
+- app/utils/metrics.py: yfinance_calls_total (네트워크 호출마다 집계)
+
+**데이터 소스 교체**:
+- set_source(DataSource)로 설정하면 모든 조회를 해당 소스에 위임 (yfinance 미호출)
+- ServiceContainer.set_data_source()가 전역 data_fetcher에 연결 (기록/재생 등)
 
 **연관 컴포넌트**:
 - Backend: app/services/data_service.py (데이터 로딩)
@@ -35,8 +40,11 @@ import yfinance as yf
 import pandas as pd
 import numpy as np
 from datetime import datetime, date
+from typing import Dict, List, Optional
 import logging
 
+from app.utils.metrics import metrics
+
 class DataNotFoundError(Exception):
     """데이터를 찾을 수 없을 때 발생하는 예외"""
     pass
@@ -56,7 +64,17 @@ class DataFetcher:
     """주식 데이터 수집 클래스"""
 
     def __init__(self):
-        pass
+        # None이면 yfinance 직접 호출, 설정되면 DataSource에 위임
+        self.source: Optional[object] = None
+
+    def set_source(self, source: Optional[object]) -> None:
+        """
+        데이터 소스 교체 (None이면 yfinance로 복귀)
+
+        Args:
+            source: DataSource 구현체 (get_stock_data / validate_ticker / get_ticker_info)
+        """
+        self.source = source
 
     def fetch_stock_data(
         self,
@@ -84,6 +102,9 @@ class DataFetcher:
             InvalidSymbolError: 유효하지 않은 티커인 경우
             YfinanceRateLimitError: API 연결 오류
         """
+        if self.source is not None:
+            return self.source.get_stock_data(ticker.upper(), start_date, end_date, use_cache, cache_hours)
+
         try:
             # 초기 설정
             ticker = ticker.upper()
@@ -117,6 +138,81 @@ class DataFetcher:
                 logger.error(f"데이터 수집 예상치 못한 오류: {ticker}, {str(e)}")
                 raise DataNotFoundError(f"'{ticker}' 종목 데이터 수집 실패: {str(e)}")
 
+    def fetch_multiple_stock_data(
+        self,
+        tickers: List[str],
+        start_date: date,
+        end_date: date
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        여러 종목의 주가 데이터를 한 번의 요청으로 가져옵니다 (EOD 증분 갱신용).
+
+        Args:
+            tickers: 주식 티커 심볼 목록
+            start_date: 시작 날짜
+            end_date: 종료 날짜 (포함)
+
+        Returns:
+            Dict[str, pd.DataFrame]: 티커별 OHLCV 데이터프레임 (요청한 티커 문자열이 key)
+
+        Note:
+            - 재시도/범위 확장 없이 1회 요청, 데이터가 없거나 검증에 실패한 티커는 결과에서 제외
+              (호출자가 fetch_stock_data로 개별 재시도)
+            - 증분 구간은 하루치일 수 있으므로 1개 레코드도 허용
+        """
+        if not tickers:
+            return {}
+        if self.source is not None:
+            return self._fetch_multiple_from_source(tickers, start_date, end_date)
+
+        start_str = start_date.strftime('%Y-%m-%d')
+        end_str = (end_date + pd.Timedelta(days=1)).strftime('%Y-%m-%d')  # 종료일 포함
+        logger.info(f"Yahoo Finance에서 일괄 다운로드: {len(tickers)}개 종목 ({start_str} -> {end_str})")
+
+        try:
+            metrics.inc('yfinance_calls_total', method='download_batch')
+            raw = yf.download(
+                [ticker.upper() for ticker in tickers], start=start_str, end=end_str,
+                auto_adjust=True, prepost=False, progress=False, threads=True, group_by='ticker'
+            )
+        except Exception as e:
+            logger.warning(f"일괄 다운로드 실패: {e}")
+            return {}
+        if raw is None or raw.empty:
+            return {}
+
+        available = set(raw.columns.get_level_values(0)) if isinstance(raw.columns, pd.MultiIndex) else set()
+        result: Dict[str, pd.DataFrame] = {}
+        for ticker in tickers:
+            symbol = ticker.upper()
+            if symbol not in available:
+                continue
+            try:
+                result[ticker] = self._validate_and_clean_data(
+                    raw[symbol].copy(), symbol, start_str, end_str, min_rows=1
+                )
+            except (DataNotFoundError, InvalidSymbolError) as e:
+                logger.warning(f"일괄 다운로드 결과 제외: {symbol}, {e}")
+        return result
+
+    def _fetch_multiple_from_source(
+        self,
+        tickers: List[str],
+        start_date: date,
+        end_date: date
+    ) -> Dict[str, pd.DataFrame]:
+        """교체된 데이터 소스에서 티커별 조회 (실패한 티커는 일괄 다운로드와 같이 제외)"""
+        result: Dict[str, pd.DataFrame] = {}
+        for ticker in tickers:
+            try:
+                data = self.source.get_stock_data(ticker.upper(), start_date, end_date)
+            except Exception as e:
+                logger.warning(f"일괄 조회 결과 제외: {ticker.upper()}, {e}")
+                continue
+            if data is not None and not data.empty:
+                result[ticker] = data
+        return result
+
     def _expand_date_range(self, start_str: str, end_str: str, days: int) -> tuple:
         """
         날짜 범위를 앞뒤로 확장합니다.
@@ -155,6 +251,7 @@ class DataFetcher:
         def _try_download(s_str, e_str, method='history'):
             nonlocal data
             try:
+                metrics.inc('yfinance_calls_total', method=method)
                 if method == 'history':
                     d = stock.history(start=s_str, end=e_str, auto_adjust=True, prepost=False)
                 else:
@@ -199,7 +296,7 @@ class DataFetcher:
 
         return data
 
-    def _validate_and_clean_data(self, data: pd.DataFrame, ticker: str, start_str: str, end_str: str) -> pd.DataFrame:
+    def _validate_and_clean_data(self, data: pd.DataFrame, ticker: str, start_str: str, end_str: str, min_rows: int = 2) -> pd.DataFrame:
         """
         데이터 검증 및 정리.
 
@@ -208,6 +305,7 @@ class DataFetcher:
             ticker: 티커 심볼
             start_str: 시작 날짜 (오류 메시지용)
             end_str: 종료 날짜 (오류 메시지용)
+            min_rows: 최소 레코드 수
 
         Returns:
             정리된 DataFrame
@@ -230,7 +328,7 @@ class DataFetcher:
             raise InvalidSymbolError(f"'{ticker}'는 유효하지 않은 종목 심볼입니다.")
 
         # 데이터가 너무 적은 경우 체크
-        if len(data) < 2:
+        if len(data) < min_rows:
             raise DataNotFoundError(f"'{ticker}' 종목의 데이터가 부족합니다. ({len(data)}개 레코드)")
 
         # MultiIndex 컬럼 처리 (yfinance는 때때로 MultiIndex를 반환)
@@ -295,11 +393,15 @@ class DataFetcher:
         Returns:
             유효성 여부
         """
+        if self.source is not None:
+            return self.source.validate_ticker(ticker.upper())
+
         try:
             ticker = ticker.upper()
             stock = yf.Ticker(ticker)
             
             # 기본 정보 조회 시도
+            metrics.inc('yfinance_calls_total', method='info')
             info = stock.info
             
             # 최소한의 유효성 확인
@@ -312,6 +414,7 @@ class DataFetcher:
                 return True
                 
             # 정보가 부족하면 실제 데이터 조회 시도
+            metrics.inc('yfinance_calls_total', method='history')
             hist = stock.history(period="5d")
             return not hist.empty
             
@@ -329,9 +432,13 @@ class DataFetcher:
         Returns:
             티커 정보 딕셔너리 (상장일 포함)
         """
+        if self.source is not None:
+            return self.source.get_ticker_info(ticker.upper())
+
         try:
             ticker = ticker.upper()
             stock = yf.Ticker(ticker)
+            metrics.inc('yfinance_calls_total', method='info')
             info = stock.info
             
             # 상장일 추출 (firstTradeDateMilliseconds - 밀리초 단위)
@@ -0,0 +1,209 @@
+"""
+티커별 병합 DataFrame LRU 캐시
+
+**역할**:
+- 티커당 날짜 인덱스 DataFrame 1개를 병합 보관하고 하위 구간은 슬라이스로 응답
+- 겹치는 구간 요청이 각각 전체 복사본을 저장하던 문자열 키 캐시를 대체
+- 실제 메모리 사용량(DataFrame.memory_usage(deep=True)) 기준 바이트 예산 LRU 제거
+
+**커버리지 모델**:
+- 티커별 [start, end] 구간 목록 (요청 구간 단위로 기록, 겹치거나 인접하면 병합)
+- 구간마다 만료 시각 보유 (구간 종료일 기준 동적 TTL, 병합 시 더 이른 만료 시각 유지)
+- 요청 구간이 만료되지 않은 단일 구간에 포함될 때만 히트
+
+**의존성**:
+- pandas: DataFrame 병합/슬라이스
+
+**연관 컴포넌트**:
+- Backend: app/repositories/data_repository.py (메모리 캐시 계층)
+- Backend: app/core/config.py (memory_cache_max_mb)
+"""
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import pandas as pd
+
+DateLike = Union[str, date, datetime, pd.Timestamp]
+
+
+def _to_date(value: DateLike) -> date:
+    """다양한 날짜 형식을 date 객체로 변환합니다."""
+    if isinstance(value, str):
+        return datetime.strptime(value, '%Y-%m-%d').date()
+    if isinstance(value, (pd.Timestamp, datetime)):
+        return value.date()
+    return value
+
+
+class _TickerEntry:
+    """티커 하나의 병합 프레임과 커버리지"""
+
+    __slots__ = ('frame', 'coverage', 'nbytes', 'created_at')
+
+    def __init__(self, frame: pd.DataFrame):
+        self.frame = frame
+        self.coverage: List[List[Any]] = []  # [start(date), end(date), expires_at(epoch)]
+        self.nbytes = 0
+        self.created_at = datetime.now()
+
+
+class TickerFrameCache:
+    """바이트 예산 기반 티커별 LRU 캐시"""
+
+    def __init__(self, max_bytes: int, ttl_resolver: Callable[[date], int]):
+        """
+        Args:
+            max_bytes: 캐시 전체 메모리 예산 (바이트)
+            ttl_resolver: 구간 종료일 → TTL(초)
+        """
+        self.max_bytes = max_bytes
+        self._ttl_resolver = ttl_resolver
+        self._entries: 'OrderedDict[str, _TickerEntry]' = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+    def get(self, ticker: str, start_date: DateLike, end_date: DateLike) -> Optional[pd.DataFrame]:
+        """요청 구간이 커버되면 슬라이스를 반환하고, 아니면 None을 반환합니다."""
+        start, end = _to_date(start_date), _to_date(end_date)
+        now = time.time()
+
+        with self._lock:
+            entry = self._entries.get(ticker)
+            if entry is not None and any(
+                s <= start and end <= e and expires_at > now for s, e, expires_at in entry.coverage
+            ):
+                self._entries.move_to_end(ticker)
+                self._stats['hits'] += 1
+                frame = entry.frame
+            else:
+                self._stats['misses'] += 1
+                return None
+
+        # 문자열 슬라이스: 시간대가 있는 인덱스에서도 동작하며 종료일 당일 전체 포함
+        return frame.loc[start.isoformat():end.isoformat()]
+
+    def put(
+        self,
+        ticker: str,
+        start_date: DateLike,
+        end_date: DateLike,
+        data: pd.DataFrame,
+        ttl_seconds: Optional[float] = None
+    ) -> None:
+        """
+        요청 구간의 조회 결과를 티커 프레임에 병합하고 구간을 커버리지로 기록합니다.
+
+        ttl_seconds를 지정하면 ttl_resolver 대신 사용합니다 (호출별 유효 시간).
+        """
+        if data is None or data.empty or not isinstance(data.index, pd.DatetimeIndex):
+            return
+
+        start, end = _to_date(start_date), _to_date(end_date)
+        if ttl_seconds is None:
+            ttl_seconds = self._ttl_resolver(end)
+        expires_at = time.time() + ttl_seconds
+
+        with self._lock:
+            entry = self._entries.get(ticker)
+            if entry is None:
+                entry = _TickerEntry(self._normalize(data))
+                self._entries[ticker] = entry
+            else:
+                if self._is_compatible(entry.frame, data):
+                    entry.frame = self._normalize(pd.concat([entry.frame, data]))
+                else:
+                    # 형식이 다른 결과(예: 다른 데이터 소스)는 섞지 않고 교체
+                    entry.frame = self._normalize(data)
+                    entry.coverage = []
+                self._entries.move_to_end(ticker)
+
+            entry.coverage = self._merge_coverage(entry.coverage, [start, end, expires_at])
+            self._total_bytes -= entry.nbytes
+            entry.nbytes = int(entry.frame.memory_usage(deep=True).sum())
+            self._total_bytes += entry.nbytes
+
+            self._evict()
+
+    def invalidate(self, ticker: str) -> bool:
+        """티커 캐시를 제거합니다. 제거된 항목이 있으면 True."""
+        with self._lock:
+            entry = self._entries.pop(ticker, None)
+            if entry is None:
+                return False
+            self._total_bytes -= entry.nbytes
+            return True
+
+    def clear(self) -> None:
+        """전체 캐시를 비웁니다."""
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """실측 바이트, 히트/미스/제거 횟수, 티커별 커버리지"""
+        with self._lock:
+            now = time.time()
+            tickers = {
+                ticker: {
+                    'rows': len(entry.frame),
+                    'bytes': entry.nbytes,
+                    'coverage': [
+                        {'start': s.isoformat(), 'end': e.isoformat(), 'expired': expires_at <= now}
+                        for s, e, expires_at in entry.coverage
+                    ],
+                }
+                for ticker, entry in self._entries.items()
+            }
+            created = [entry.created_at for entry in self._entries.values()]
+            return {
+                **self._stats,
+                'total_entries': len(self._entries),
+                'total_bytes': self._total_bytes,
+                'max_bytes': self.max_bytes,
+                'oldest_entry': min(created) if created else None,
+                'newest_entry': max(created) if created else None,
+                'tickers': tickers,
+            }
+
+    def hit_rate(self) -> float:
+        """히트율 (0~1)"""
+        total = self._stats['hits'] + self._stats['misses']
+        return self._stats['hits'] / total if total else 0.0
+
+    def _evict(self) -> None:
+        """예산을 넘으면 가장 오래 사용되지 않은 티커부터 제거합니다 (Lock 보유 상태에서 호출)."""
+        while self._entries and self._total_bytes > self.max_bytes:
+            _, entry = self._entries.popitem(last=False)
+            self._total_bytes -= entry.nbytes
+            self._stats['evictions'] += 1
+
+    @staticmethod
+    def _normalize(frame: pd.DataFrame) -> pd.DataFrame:
+        """날짜 오름차순, 중복 날짜 제거 (뒤의 행 우선)"""
+        if not frame.index.is_monotonic_increasing or frame.index.has_duplicates:
+            frame = frame[~frame.index.duplicated(keep='last')].sort_index()
+        return frame
+
+    @staticmethod
+    def _is_compatible(cached: pd.DataFrame, data: pd.DataFrame) -> bool:
+        """같은 열/dtype/시간대 형식이면 병합 가능"""
+        return (cached.columns.tolist() == data.columns.tolist()
+                and cached.index.tz == data.index.tz
+                and cached.dtypes.equals(data.dtypes))
+
+    @staticmethod
+    def _merge_coverage(coverage: List[List[Any]], interval: List[Any]) -> List[List[Any]]:
+        """만료 구간을 버리고, 겹치거나 인접한 구간을 병합합니다 (만료 시각은 더 이른 쪽)."""
+        now = time.time()
+        merged: List[List[Any]] = []
+        for start, end, expires_at in sorted(c for c in coverage + [interval] if c[2] > now):
+            if merged and start <= merged[-1][1] + timedelta(days=1):
+                merged[-1][1] = max(merged[-1][1], end)
+                merged[-1][2] = min(merged[-1][2], expires_at)
+                continue
+            merged.append([start, end, expires_at])
+        return merged
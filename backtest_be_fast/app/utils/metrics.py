@@ -0,0 +1,236 @@
+"""
+요청 단위 구간 시간 측정 및 Prometheus 메트릭
+
+**역할**:
+- 요청마다 단계별(span) 소요 시간을 모아 응답(Server-Timing 헤더)에 보고
+- 프로세스 전체 카운터/히스토그램을 Prometheus 텍스트 형식(/metrics)으로 제공
+
+**주요 기능**:
+1. span(stage): 단계 시간 측정 컨텍스트 매니저 (동기/비동기 코드 공용)
+   - 현재 요청의 RequestTimings에 누적 + backtest_stage_duration_seconds 히스토그램에 기록
+2. start_request_timings() / current_timings(): ContextVar 기반 요청 범위 (asyncio.to_thread로 전파)
+3. MetricsRegistry: inc() / observe() / register_collector() / render()
+
+**단계 이름** (STAGES):
+- data_load, gap_fill, fx_conversion, strategy_run, portfolio_simulation,
+  unified_data, news, serialization
+
+**사용 패턴**:
+```python
+from app.utils.metrics import metrics, span
+
+with span('strategy_run'):
+    stats = await engine.run(...)
+metrics.inc('yfinance_calls_total', method='history')
+```
+
+**의존성**:
+- 표준 라이브러리만 사용 (prometheus_client 미사용, 텍스트 형식 0.0.4 직접 출력)
+
+**연관 컴포넌트**:
+- Backend: app/main.py (요청 미들웨어, /metrics 엔드포인트)
+- Backend: app/services/database/connection_manager.py (DB 쿼리 수, 풀 대기 시간)
+- Backend: app/utils/data_fetcher.py (yfinance 호출 수)
+"""
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+STAGES = (
+    'data_load', 'gap_fill', 'fx_conversion', 'strategy_run',
+    'portfolio_simulation', 'unified_data', 'news', 'serialization',
+)
+
+# 초 단위 히스토그램 버킷 (풀 대기 1ms ~ 전체 요청 30s)
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# 메트릭 이름 → (유형, 설명)
+METRIC_HELP = {
+    'backtest_stage_duration_seconds': ('histogram', '요청 단계별 소요 시간 (span)'),
+    'http_request_duration_seconds': ('histogram', 'HTTP 요청 처리 시간'),
+    'yfinance_calls_total': ('counter', 'Yahoo Finance 호출 수'),
+    'db_queries_total': ('counter', '실행한 SQL 문 수'),
+    'db_pool_checkout_wait_seconds': ('histogram', '연결 풀 체크아웃 대기 시간'),
+    'cache_hits_total': ('counter', '캐시 적중 수'),
+    'cache_misses_total': ('counter', '캐시 미스 수'),
+}
+
+LabelKey = Tuple[Tuple[str, str], ...]
+Sample = Tuple[str, Dict[str, str], float]
+
+
+def _label_key(labels: Dict[str, str]) -> LabelKey:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _format_labels(key: Iterable[Tuple[str, str]]) -> str:
+    parts = [
+        '{}="{}"'.format(k, v.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+        for k, v in key
+    ]
+    return '{' + ','.join(parts) + '}' if parts else ''
+
+
+class _Histogram:
+    __slots__ = ('counts', 'sum', 'count')
+
+    def __init__(self, n_buckets: int):
+        self.counts = [0] * n_buckets
+        self.sum = 0.0
+        self.count = 0
+
+
+class MetricsRegistry:
+    """프로세스 전체 카운터/히스토그램 저장소 (스레드 안전)"""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[LabelKey, float]] = {}
+        self._histograms: Dict[str, Dict[LabelKey, _Histogram]] = {}
+        self._collectors: List[Callable[[], Iterable[Sample]]] = []
+
+    def inc(self, name: str, value: float = 1.0, **labels: str) -> None:
+        """카운터 증가"""
+        key = _label_key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0.0) + value
+
+    def observe(self, name: str, seconds: float, **labels: str) -> None:
+        """히스토그램에 관측값 기록"""
+        key = _label_key(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            hist = series.get(key)
+            if hist is None:
+                hist = series[key] = _Histogram(len(self.buckets))
+            index = bisect.bisect_left(self.buckets, seconds)
+            if index < len(self.buckets):
+                hist.counts[index] += 1
+            hist.sum += seconds
+            hist.count += 1
+
+    def register_collector(self, collector: Callable[[], Iterable[Sample]]) -> None:
+        """
+        스크레이프 시점에 값을 읽는 수집기 등록 (기존 get_stats()의 누적 값을 카운터로 노출)
+
+        collector는 (메트릭 이름, 라벨, 값) 목록을 반환합니다.
+        """
+        self._collectors.append(collector)
+
+    def get_counter(self, name: str, **labels: str) -> float:
+        with self._lock:
+            return self._counters.get(name, {}).get(_label_key(labels), 0.0)
+
+    def get_histogram(self, name: str, **labels: str) -> Tuple[int, float]:
+        """(관측 횟수, 합계)"""
+        with self._lock:
+            hist = self._histograms.get(name, {}).get(_label_key(labels))
+            return (hist.count, hist.sum) if hist else (0, 0.0)
+
+    def reset(self) -> None:
+        """모든 값 초기화 (테스트용, 수집기는 유지)"""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식 (version 0.0.4)"""
+        with self._lock:
+            counters = {name: dict(series) for name, series in self._counters.items()}
+            histograms = {
+                name: {key: (list(h.counts), h.sum, h.count) for key, h in series.items()}
+                for name, series in self._histograms.items()
+            }
+        for collector in self._collectors:
+            try:
+                for name, labels, value in collector():
+                    counters.setdefault(name, {})[_label_key(labels)] = float(value)
+            except Exception:
+                continue
+
+        lines: List[str] = []
+        for name in sorted(counters):
+            self._header(lines, name, 'counter')
+            for key, value in sorted(counters[name].items()):
+                lines.append(f'{name}{_format_labels(key)} {value:g}')
+        for name in sorted(histograms):
+            self._header(lines, name, 'histogram')
+            for key, (counts, total, count) in sorted(histograms[name].items()):
+                cumulative = 0
+                for bound, n in zip(self.buckets, counts):
+                    cumulative += n
+                    lines.append(f'{name}_bucket{_format_labels(key + (("le", f"{bound:g}"),))} {cumulative}')
+                lines.append(f'{name}_bucket{_format_labels(key + (("le", "+Inf"),))} {count}')
+                lines.append(f'{name}_sum{_format_labels(key)} {total:.6f}')
+                lines.append(f'{name}_count{_format_labels(key)} {count}')
+        return '\n'.join(lines) + '\n'
+
+    @staticmethod
+    def _header(lines: List[str], name: str, default_type: str) -> None:
+        metric_type, description = METRIC_HELP.get(name, (default_type, name))
+        lines.append(f'# HELP {name} {description}')
+        lines.append(f'# TYPE {name} {metric_type}')
+
+
+class RequestTimings:
+    """요청 1건의 단계별 누적 시간 (중첩/동시 실행 단계는 각각 누적되므로 합이 벽시계 시간보다 클 수 있음)"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self._lock = threading.Lock()
+        self._stages: Dict[str, float] = {}
+
+    def add(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            self._stages[stage] = self._stages.get(stage, 0.0) + seconds
+
+    def as_dict(self) -> Dict[str, float]:
+        """단계별 시간 (ms, 소수 1자리)"""
+        with self._lock:
+            return {stage: round(seconds * 1000, 1) for stage, seconds in self._stages.items()}
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def server_timing(self) -> str:
+        """Server-Timing 헤더 값 (단계별 + total)"""
+        parts = [f'{stage};dur={ms:.1f}' for stage, ms in self.as_dict().items()]
+        parts.append(f'total;dur={self.elapsed() * 1000:.1f}')
+        return ', '.join(parts)
+
+
+_current_timings: ContextVar[Optional[RequestTimings]] = ContextVar('request_timings', default=None)
+
+
+def start_request_timings() -> RequestTimings:
+    """현재 컨텍스트(요청)에 새 RequestTimings를 연결합니다."""
+    timings = RequestTimings()
+    _current_timings.set(timings)
+    return timings
+
+
+def current_timings() -> Optional[RequestTimings]:
+    return _current_timings.get()
+
+
+@contextmanager
+def span(stage: str) -> Iterator[None]:
+    """단계 시간 측정 (요청 밖에서 호출되면 히스토그램에만 기록)"""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        timings = _current_timings.get()
+        if timings is not None:
+            timings.add(stage, elapsed)
+        metrics.observe('backtest_stage_duration_seconds', elapsed, stage=stage)
+
+
+# 글로벌 인스턴스
+metrics = MetricsRegistry()
@@ -0,0 +1,72 @@
+"""
+비차단 재시도/백오프 스케줄러
+
+**역할**:
+- 실패한 비동기 작업을 선형 백오프로 재시도
+- 대기는 asyncio.sleep으로 수행하여 스레드 풀 워커를 점유하지 않음
+  (워커 스레드 안에서 time.sleep으로 대기하던 재시도 루프 대체)
+
+**사용 예**:
+```python
+from app.utils.retry import retry_async
+
+df = await retry_async(
+    lambda: asyncio.to_thread(load_once, ticker),
+    label=f"{ticker} 데이터 로드",
+)
+```
+
+**의존성**:
+- app/constants/data_loading.py: RetryConfig
+
+**연관 컴포넌트**:
+- Backend: app/repositories/stock_repository.py (load_stock_data_async)
+"""
+import asyncio
+import logging
+from typing import Awaitable, Callable, TypeVar
+
+from app.constants.data_loading import RetryConfig
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+async def retry_async(
+    operation: Callable[[], Awaitable[T]],
+    max_retries: int = RetryConfig.MAX_RETRIES,
+    retry_delay: float = RetryConfig.INITIAL_DELAY,
+    label: str = "작업"
+) -> T:
+    """
+    비동기 작업을 재시도합니다 (attempt회차 실패 후 retry_delay * attempt초 대기).
+
+    Args:
+        operation: 매 시도마다 새 awaitable을 만드는 함수
+        max_retries: 최대 시도 횟수
+        retry_delay: 기본 대기 시간 (초)
+        label: 로그용 작업 이름
+
+    Returns:
+        작업 결과
+
+    Raises:
+        Exception: 모든 시도가 실패하면 마지막 예외
+    """
+    last_exception: Exception = None
+
+    for attempt in range(1, max_retries + 1):
+        try:
+            return await operation()
+        except Exception as e:
+            logger.warning(f"[시도 {attempt}/{max_retries}] {label} 실패: {e}")
+            last_exception = e
+
+        if attempt < max_retries:
+            wait_time = retry_delay * attempt * RetryConfig.BACKOFF_MULTIPLIER
+            logger.info(f"[재시도 대기] {wait_time}초 후 {label} 재시도...")
+            await asyncio.sleep(wait_time)
+
+    logger.error(f"[실패] {label} (총 {max_retries}회 시도): {last_exception}")
+    raise last_exception
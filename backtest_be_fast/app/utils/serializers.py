@@ -8,12 +8,16 @@ JSON 직렬화 유틸리티
 
 **주요 기능**:
 - recursive_serialize(): 모든 타입의 객체를 JSON 호환 형식으로 변환
+- column_records(): DataFrame 열 배열로 [{'date': ..., 컬럼: 값}] 레코드 생성 (iterrows 없이)
+- date_value_dict(): 날짜 인덱스 Series → {'YYYY-MM-DD': 값}
+- encode_json(): orjson으로 응답 본문 바이트 생성 (numpy 배열/스칼라, Timestamp 직접 처리)
 
 **처리 타입**:
 - float: NaN → "NaN", Infinity → "Infinity"
 - pandas/numpy 타입: Python 네이티브 타입으로 변환
 - dict, list: 재귀적으로 모든 요소 직렬화
 - datetime: ISO 8601 문자열 변환
+- encode_json: NaN/Infinity는 null (orjson 기본 동작)
 
 **사용 사례**:
 - 백테스트 결과를 API 응답으로 변환
@@ -21,16 +25,23 @@ JSON 직렬화 유틸리티
 
 **의존성**:
 - pandas, numpy: 특수 타입 감지
+- orjson: 응답 JSON 인코딩
 
 **연관 컴포넌트**:
 - Backend: app/services/backtest_service.py (결과 직렬화)
 - Backend: app/api/v1/endpoints/backtest.py (응답 변환)
+- Backend: app/api/v1/responses.py (FastJSONResponse)
 """
 
-from typing import Any
+import math
+from typing import Any, Dict, List
+import orjson
 import pandas as pd
 import numpy as np
 
+_JSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
 def recursive_serialize(obj: Any) -> Any:
     """객체를 JSON 직렬화 가능한 형태로 변환"""
     # 기본 JSON 직렬화 가능한 타입이면 그대로 반환
@@ -38,9 +49,9 @@ def recursive_serialize(obj: Any) -> Any:
         return obj
     # Float 값 처리: inf, -inf, NaN 등을 문자열로 변환
     if isinstance(obj, float):
-        if pd.isna(obj) or np.isnan(obj):
+        if obj != obj:
             return "NaN"
-        if np.isinf(obj):
+        if math.isinf(obj):
             return "Infinity" if obj > 0 else "-Infinity"
         return obj
     # dict인 경우, 모든 값을 재귀적으로 직렬화
@@ -62,4 +73,53 @@ def recursive_serialize(obj: Any) -> Any:
     if hasattr(obj, "isoformat"):
         return obj.isoformat()
     # 위에 해당하지 않는 경우, str()로 변환
-    return str(obj) 
\ No newline at end of file
+    return str(obj) 
+
+
+def column_records(index: pd.Index, columns: Dict[str, Any], date_key: str = 'date') -> List[Dict[str, Any]]:
+    """
+    열 배열로 레코드 리스트를 생성합니다 (행 단위 iterrows/float() 변환 없음).
+
+    Args:
+        index: 날짜 인덱스 ('YYYY-MM-DD' 문자열로 변환)
+        columns: 출력 키 → 같은 길이의 배열/Series
+        date_key: 날짜 키 이름
+
+    Returns:
+        List[Dict]: [{date_key: 'YYYY-MM-DD', 키: 값, ...}] (numpy 값은 Python 타입)
+    """
+    keys = [date_key, *columns]
+    values = [pd.DatetimeIndex(index).strftime('%Y-%m-%d').tolist()]
+    values.extend(np.asarray(column).tolist() for column in columns.values())
+    return [dict(zip(keys, row)) for row in zip(*values)]
+
+
+def date_value_dict(series: pd.Series, scale: float = 1.0) -> Dict[str, float]:
+    """날짜 인덱스 Series → {'YYYY-MM-DD': 값 * scale}"""
+    values = series.to_numpy(dtype=float) * scale
+    return dict(zip(pd.DatetimeIndex(series.index).strftime('%Y-%m-%d').tolist(), values.tolist()))
+
+
+def _json_default(obj: Any) -> Any:
+    """orjson이 직접 처리하지 않는 타입 변환 (recursive_serialize와 같은 형태)"""
+    if isinstance(obj, pd.DataFrame):
+        return obj.reset_index(drop=True).to_dict(orient='records')
+    if isinstance(obj, (pd.Series, pd.Index)):
+        return obj.to_numpy()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if hasattr(obj, "isoformat"):
+        return obj.isoformat()
+    return str(obj)
+
+
+def encode_json(content: Any) -> bytes:
+    """
+    응답 본문을 orjson으로 인코딩합니다.
+
+    dict/list/float는 C 수준에서 한 번에 인코딩되고 numpy 배열은 배열 단위로 처리되므로
+    jsonable_encoder + json.dumps처럼 Python에서 원소마다 변환하지 않습니다.
+    """
+    return orjson.dumps(content, default=_json_default, option=_JSON_OPTIONS)
@@ -0,0 +1,264 @@
+"""
+거래소 거래일(세션) 캘린더
+
+**역할**:
+- 티커 접미사(.KS, .T, .L 등)로 거래소를 판별하고 거래소별 휴장일 규칙으로 세션 캘린더 생성
+- 세션 판별 / 구간 세션 목록 / 세션 수 / 세션 오프셋을 NumPy 벡터 연산으로 제공
+- 달력일(주말 포함) 기반 날짜 계산을 대체 (누락 구간 탐지, 벤치마크 정렬, 상장폐지 판단)
+
+**캘린더 구성**:
+- 휴장일 규칙을 HOLIDAY_YEARS 범위로 한 번 전개해 np.busdaycalendar로 보관 (거래소별 lru_cache)
+- 세션 계산은 np.is_busday / np.busday_count / np.busday_offset (날짜 배열 단위 벡터 연산)
+- 범위 밖 날짜는 평일 규칙만 적용
+
+**지원 거래소**:
+- XNYS: 미국 (접미사 없음, ^GSPC, ^IXIC 등) - NYSE 정규 휴장일 + 임시 휴장일
+- XKRX: 한국 (.KS, .KQ) - 양력 고정 휴장일 (설날/추석/부처님오신날 등 음력 휴장일과 대체휴일은 미반영)
+- XTKS: 일본 (.T) - 고정 휴장일 + 해피먼데이 + 춘분/추분 근사식
+- XLON: 영국 (.L) - 은행 휴일 규칙
+- 그 외 접미사와 환율(=X): 평일만 세션으로 취급
+
+**의존성**:
+- pandas.tseries.holiday: 휴장일 규칙 전개
+- numpy: 영업일 계산
+
+**연관 컴포넌트**:
+- Backend: app/services/yfinance_db.py (누락 구간 탐지, 마지막 완결 거래일)
+- Backend: app/services/unified_data_service.py (벤치마크 날짜 정렬)
+- Backend: app/services/portfolio/ (상장폐지 판단, 시뮬레이션 날짜)
+"""
+from datetime import date
+from functools import lru_cache
+from typing import Iterable, List, Union
+
+import numpy as np
+import pandas as pd
+from pandas.tseries.holiday import (
+    AbstractHolidayCalendar,
+    DateOffset,
+    EasterMonday,
+    GoodFriday,
+    Holiday,
+    MO,
+    USLaborDay,
+    USMemorialDay,
+    USPresidentsDay,
+    USThanksgivingDay,
+    nearest_workday,
+    next_monday,
+    next_monday_or_tuesday,
+    sunday_to_monday,
+)
+
+DateLike = Union[date, str, pd.Timestamp, np.datetime64]
+
+# 휴장일 규칙을 전개할 연도 범위
+HOLIDAY_YEARS = (1980, date.today().year + 2)
+# 세션 위치 계산 기준일
+_EPOCH = np.datetime64('1970-01-01', 'D')
+
+
+class _NYSEHolidays(AbstractHolidayCalendar):
+    rules = [
+        # 토요일 신정은 전날(12/31, 전년도 결산일)에 대체 휴장하지 않음
+        Holiday('NewYearsDay', month=1, day=1, observance=sunday_to_monday),
+        Holiday('MartinLutherKingJr', month=1, day=1, offset=DateOffset(weekday=MO(3)), start_date='1998-01-01'),
+        USPresidentsDay,
+        GoodFriday,
+        USMemorialDay,
+        Holiday('Juneteenth', month=6, day=19, start_date='2022-01-01', observance=nearest_workday),
+        Holiday('IndependenceDay', month=7, day=4, observance=nearest_workday),
+        USLaborDay,
+        USThanksgivingDay,
+        Holiday('Christmas', month=12, day=25, observance=nearest_workday),
+    ]
+
+
+# NYSE 임시 휴장일 (허리케인, 국가 애도일, 9/11)
+_NYSE_SPECIAL_CLOSURES = [
+    '1985-09-27', '1994-04-27', '2001-09-11', '2001-09-12', '2001-09-13', '2001-09-14',
+    '2004-06-11', '2007-01-02', '2012-10-29', '2012-10-30', '2018-12-05', '2025-01-09',
+]
+
+
+class _KRXHolidays(AbstractHolidayCalendar):
+    rules = [
+        Holiday('NewYearsDay', month=1, day=1),
+        Holiday('IndependenceMovementDay', month=3, day=1),
+        Holiday('LaborDay', month=5, day=1),
+        Holiday('ChildrensDay', month=5, day=5),
+        Holiday('MemorialDay', month=6, day=6),
+        Holiday('LiberationDay', month=8, day=15),
+        Holiday('NationalFoundationDay', month=10, day=3),
+        Holiday('HangulDay', month=10, day=9, start_date='2013-01-01'),
+        Holiday('Christmas', month=12, day=25),
+        Holiday('YearEndClosing', month=12, day=31),
+    ]
+
+
+class _TSEHolidays(AbstractHolidayCalendar):
+    rules = [
+        Holiday('NewYearsDay', month=1, day=1),
+        Holiday('NewYearHoliday2', month=1, day=2),
+        Holiday('NewYearHoliday3', month=1, day=3),
+        Holiday('ComingOfAgeDay', month=1, day=1, offset=DateOffset(weekday=MO(2)), start_date='2000-01-01'),
+        Holiday('NationalFoundationDay', month=2, day=11, observance=sunday_to_monday),
+        Holiday('EmperorsBirthday', month=2, day=23, start_date='2020-01-01', observance=sunday_to_monday),
+        Holiday('ShowaDay', month=4, day=29, observance=sunday_to_monday),
+        Holiday('ConstitutionDay', month=5, day=3),
+        Holiday('GreeneryDay', month=5, day=4),
+        Holiday('ChildrensDay', month=5, day=5, observance=sunday_to_monday),
+        Holiday('MarineDay', month=7, day=1, offset=DateOffset(weekday=MO(3)), start_date='2003-01-01'),
+        Holiday('RespectForTheAgedDay', month=9, day=1, offset=DateOffset(weekday=MO(3)), start_date='2003-01-01'),
+        Holiday('SportsDay', month=10, day=1, offset=DateOffset(weekday=MO(2)), start_date='2000-01-01'),
+        Holiday('CultureDay', month=11, day=3, observance=sunday_to_monday),
+        Holiday('LaborThanksgivingDay', month=11, day=23, observance=sunday_to_monday),
+        Holiday('EmperorsBirthdayHeisei', month=12, day=23, start_date='1989-01-01', end_date='2018-12-31',
+                observance=sunday_to_monday),
+        Holiday('YearEndClosing', month=12, day=31),
+    ]
+
+
+class _LSEHolidays(AbstractHolidayCalendar):
+    rules = [
+        Holiday('NewYearsDay', month=1, day=1, observance=next_monday),
+        GoodFriday,
+        EasterMonday,
+        Holiday('EarlyMayBankHoliday', month=5, day=1, offset=DateOffset(weekday=MO(1))),
+        Holiday('SpringBankHoliday', month=5, day=31, offset=DateOffset(weekday=MO(-1))),
+        Holiday('SummerBankHoliday', month=8, day=31, offset=DateOffset(weekday=MO(-1))),
+        Holiday('Christmas', month=12, day=25, observance=next_monday),
+        Holiday('BoxingDay', month=12, day=26, observance=next_monday_or_tuesday),
+    ]
+
+
+def _tse_equinoxes(first_year: int, last_year: int) -> List[str]:
+    """춘분/추분의 날 (1980~2099년 근사식, 일요일이면 월요일 대체)"""
+    days = []
+    for year in range(first_year, last_year + 1):
+        shift = 0.242194 * (year - 1980) - (year - 1980) // 4
+        for month, base in ((3, 20.8431), (9, 23.2488)):
+            day = pd.Timestamp(year, month, int(base + shift))
+            days.append(sunday_to_monday(day).strftime('%Y-%m-%d'))
+    return days
+
+
+_HOLIDAY_RULES = {
+    'XNYS': (_NYSEHolidays, _NYSE_SPECIAL_CLOSURES),
+    'XKRX': (_KRXHolidays, []),
+    'XTKS': (_TSEHolidays, _tse_equinoxes(*HOLIDAY_YEARS)),
+    'XLON': (_LSEHolidays, []),
+}
+
+# 티커 접미사 → 거래소 코드 (접미사가 없으면 미국)
+_SUFFIX_EXCHANGES = {
+    'KS': 'XKRX',
+    'KQ': 'XKRX',
+    'T': 'XTKS',
+    'L': 'XLON',
+}
+# 지수 티커 → 거래소 코드 (목록에 없는 ^ 지수는 미국)
+_INDEX_EXCHANGES = {
+    '^KS11': 'XKRX',
+    '^KQ11': 'XKRX',
+    '^N225': 'XTKS',
+    '^FTSE': 'XLON',
+}
+
+
+def _to_days(values) -> np.ndarray:
+    """날짜/날짜 배열을 일 단위 datetime64로 변환 (타임존은 현지 날짜 기준)"""
+    if isinstance(values, pd.DatetimeIndex):
+        if values.tz is not None:
+            values = values.tz_localize(None)
+        return values.values.astype('datetime64[D]')
+    if isinstance(values, (date, str, pd.Timestamp)):
+        return np.datetime64(pd.Timestamp(values).date(), 'D')
+    return np.asarray(values).astype('datetime64[D]')
+
+
+class TradingCalendar:
+    """거래소 세션 캘린더 (평일 - 휴장일)"""
+
+    def __init__(self, code: str, holidays: Iterable[DateLike] = ()):
+        self.code = code
+        self.holidays = np.unique(np.asarray(list(holidays), dtype='datetime64[D]'))
+        self.busdaycal = np.busdaycalendar(weekmask='1111100', holidays=self.holidays)
+
+    def __repr__(self) -> str:
+        return f"TradingCalendar({self.code!r}, holidays={len(self.holidays)})"
+
+    def is_session(self, days) -> Union[bool, np.ndarray]:
+        """세션 여부 (날짜 또는 날짜 배열)"""
+        return np.is_busday(_to_days(days), busdaycal=self.busdaycal)
+
+    def sessions(self, start: DateLike, end: DateLike) -> np.ndarray:
+        """[start, end] 구간의 세션 배열 (datetime64[D])"""
+        days = np.arange(_to_days(start), _to_days(end) + 1, dtype='datetime64[D]')
+        return days[np.is_busday(days, busdaycal=self.busdaycal)]
+
+    def session_index(self, start: DateLike, end: DateLike) -> pd.DatetimeIndex:
+        """[start, end] 구간의 세션 DatetimeIndex"""
+        return pd.DatetimeIndex(self.sessions(start, end))
+
+    def session_count(self, start, end) -> Union[int, np.ndarray]:
+        """[start, end] 구간의 세션 수 (배열을 넣으면 원소별 계산, start > end면 0)"""
+        start_days, end_days = _to_days(start), _to_days(end) + 1
+        counts = np.maximum(np.busday_count(start_days, end_days, busdaycal=self.busdaycal), 0)
+        return int(counts) if np.ndim(counts) == 0 else counts
+
+    def session_positions(self, days) -> np.ndarray:
+        """기준일부터 각 날짜(포함)까지의 세션 수 - 두 위치의 차가 그 사이 세션 수"""
+        return np.busday_count(_EPOCH, _to_days(days) + 1, busdaycal=self.busdaycal)
+
+    def previous_session(self, day: DateLike) -> date:
+        """day 이전(당일 제외) 마지막 세션"""
+        return np.busday_offset(_to_days(day) - 1, 0, roll='backward', busdaycal=self.busdaycal).astype(date)
+
+    def offset(self, day: DateLike, sessions: int) -> date:
+        """day(세션이 아니면 다음 세션)에서 sessions만큼 이동한 세션"""
+        return np.busday_offset(_to_days(day), sessions, roll='forward', busdaycal=self.busdaycal).astype(date)
+
+
+@lru_cache(maxsize=None)
+def get_calendar(code: str) -> TradingCalendar:
+    """거래소 코드별 캘린더 (휴장일 규칙이 없는 거래소는 평일 캘린더)"""
+    rules, extra = _HOLIDAY_RULES.get(code, (None, []))
+    holidays: List = list(extra)
+    if rules is not None:
+        first, last = HOLIDAY_YEARS
+        holidays.extend(rules().holidays(start=f'{first}-01-01', end=f'{last}-12-31').values)
+    return TradingCalendar(code, holidays)
+
+
+def exchange_for_ticker(ticker: str) -> str:
+    """
+    티커의 거래소 코드
+
+    Examples:
+        >>> exchange_for_ticker('005930.KS')
+        'XKRX'
+        >>> exchange_for_ticker('AAPL')
+        'XNYS'
+    """
+    ticker = ticker.upper()
+    if ticker.endswith('=X'):
+        return 'FX'
+    if ticker.startswith('^'):
+        return _INDEX_EXCHANGES.get(ticker, 'XNYS')
+    if '.' in ticker:
+        suffix = ticker.rsplit('.', 1)[1]
+        return _SUFFIX_EXCHANGES.get(suffix, suffix)
+    return 'XNYS'
+
+
+def calendar_for_ticker(ticker: str) -> TradingCalendar:
+    """티커가 상장된 거래소의 캘린더"""
+    return get_calendar(exchange_for_ticker(ticker))
+
+
+def union_sessions(tickers: Iterable[str], start: DateLike, end: DateLike) -> pd.DatetimeIndex:
+    """여러 티커 거래소 세션의 합집합 (다른 시장 종목과 날짜를 맞출 때 사용)"""
+    codes = sorted({exchange_for_ticker(ticker) for ticker in tickers}) or ['XNYS']
+    sessions = [get_calendar(code).sessions(start, end) for code in codes]
+    return pd.DatetimeIndex(np.unique(np.concatenate(sessions)))
@@ -0,0 +1,165 @@
+"""
+주가/메타데이터 조회 처리량 벤치마크 (스레드 풀 동기 저장소 vs 비동기 저장소)
+
+/api/v1/backtest 요청의 DB 읽기 구간(티커 메타데이터 배치 조회 + 주가 배치 조회)을
+동시 요청 N개로 반복 실행하고 처리량(req/s)과 지연 시간(p50/p95)을 비교합니다.
+
+- sync: StockRepository (asyncio.to_thread + 동기 엔진, 기존 경로)
+- async: AsyncStockRepository (AsyncEngine, settings.db_async_pool_size 풀)
+
+--database-url을 생략하면 임시 SQLite 파일에 합성 데이터를 만들고, --query-latency-ms로
+쿼리마다 DB 왕복 지연을 드라이버 스레드에서 모사합니다 (MySQL에서는 실제 네트워크 지연 사용).
+로컬 가격 저장소는 끄고 측정합니다.
+
+실행 방법:
+    python scripts/benchmark_async_repository.py --concurrency 50 200
+    docker exec -it backtest-be-fast-dev python scripts/benchmark_async_repository.py \\
+        --database-url "$DATABASE_URL" --tickers AAPL MSFT NVDA --start 2020-01-02 --end 2023-12-29
+"""
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import argparse
+import asyncio
+import logging
+import statistics
+import tempfile
+import time
+from typing import Dict, List
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.config import settings
+from app.repositories.async_stock_repository import AsyncStockRepository
+from app.repositories.stock_repository import StockRepository
+from app.services.database.database_config import DatabaseConfig
+from app.services.price_store import local_price_store
+
+logging.basicConfig(level=logging.WARNING)
+
+
+def _seed_sqlite(path: str, tickers: List[str], start: str, end: str) -> None:
+    """벤치마크용 SQLite 스키마와 합성 가격/워터마크 생성"""
+    engine = create_engine(f'sqlite:///{path}')
+    index = pd.bdate_range(start, end)
+    rng = np.random.default_rng(7)
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE stocks (id INTEGER PRIMARY KEY, ticker TEXT UNIQUE, info_json TEXT)"))
+        conn.execute(text(
+            "CREATE TABLE daily_prices (stock_id INTEGER, date TEXT, open REAL, high REAL, low REAL, "
+            "close REAL, adj_close REAL, volume INTEGER, PRIMARY KEY (stock_id, date))"
+        ))
+        conn.execute(text(
+            "CREATE TABLE price_coverage (stock_id INTEGER PRIMARY KEY, covered_from TEXT, covered_to TEXT, "
+            "last_refreshed_at TEXT)"
+        ))
+        for stock_id, ticker in enumerate(tickers, start=1):
+            info = '{"currency": "USD", "company_name": "%s", "exchange": "BENCH", "first_trade_date": "1990-01-02"}'
+            conn.execute(text("INSERT INTO stocks VALUES (:id, :t, :info)"),
+                         {'id': stock_id, 't': ticker, 'info': info % ticker})
+            close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, len(index))))
+            conn.execute(
+                text("INSERT INTO daily_prices VALUES (:sid, :d, :p, :p, :p, :p, :p, 1000)"),
+                [{'sid': stock_id, 'd': d.strftime('%Y-%m-%d'), 'p': float(p)} for d, p in zip(index, close)]
+            )
+            conn.execute(text("INSERT INTO price_coverage VALUES (:sid, :s, :e, :e)"),
+                         {'sid': stock_id, 's': start, 'e': end})
+    engine.dispose()
+
+
+def _add_query_latency(sync_engine, latency_ms: float) -> None:
+    """SQLite 쿼리마다 드라이버 스레드에서 latency_ms만큼 대기 (DB 왕복 모사)"""
+    if latency_ms <= 0:
+        return
+
+    @event.listens_for(sync_engine, 'connect')
+    def _register(dbapi_connection, _):
+        dbapi_connection.create_function('bench_sleep', 1, lambda ms: time.sleep(ms / 1000))
+
+    @event.listens_for(sync_engine, 'before_cursor_execute')
+    def _sleep(conn, cursor, statement, parameters, context, executemany):
+        cursor.execute('SELECT bench_sleep(?)', (latency_ms,))
+
+
+async def _run(label: str, request, concurrency: int, requests_per_worker: int) -> Dict[str, float]:
+    latencies: List[float] = []
+
+    async def worker():
+        for _ in range(requests_per_worker):
+            started = time.perf_counter()
+            await request()
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    stats = {
+        'rps': len(latencies) / elapsed,
+        'p50': statistics.median(latencies),
+        'p95': latencies[int(len(latencies) * 0.95) - 1],
+    }
+    print(f"{label:>5} c={concurrency:<4} {stats['rps']:8.1f} req/s  p50 {stats['p50']:8.1f} ms  p95 {stats['p95']:8.1f} ms")
+    return stats
+
+
+def _request_factory(repo: StockRepository, tickers: List[str], start: str, end: str):
+    async def request():
+        info = await repo.get_tickers_info_batch_async(tickers)
+        frames = await repo.load_stock_data_batch_async(tickers, start, end)
+        assert len(info) == len(tickers) and len(frames) == len(tickers), "조회 결과 누락"
+    return request
+
+
+async def _main(args) -> None:
+    local_price_store.enabled = False
+    sync_url = args.database_url
+    if sync_url is None:
+        sync_url = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.sqlite3')}"
+        _seed_sqlite(sync_url[len('sqlite:///'):], args.tickers, args.start, args.end)
+    async_url = DatabaseConfig(database_url=sync_url).get_async_url()
+
+    sync_engine = create_engine(sync_url, pool_size=settings.db_async_pool_size, max_overflow=settings.db_async_max_overflow)
+    async_engine = create_async_engine(
+        async_url, pool_size=settings.db_async_pool_size, max_overflow=settings.db_async_max_overflow
+    )
+    if sync_url.startswith('sqlite'):
+        _add_query_latency(sync_engine, args.query_latency_ms)
+        _add_query_latency(async_engine.sync_engine, args.query_latency_ms)
+
+    repos = {'sync': StockRepository(), 'async': AsyncStockRepository(engine=async_engine)}
+    print(f"{len(args.tickers)} tickers, {args.start} ~ {args.end}, query latency {args.query_latency_ms} ms, "
+          f"async pool {settings.db_async_pool_size}+{settings.db_async_max_overflow}")
+
+    results = {}
+    with patch('app.services.yfinance_db._get_engine', return_value=sync_engine):
+        for concurrency in args.concurrency:
+            for label, repo in repos.items():
+                request = _request_factory(repo, args.tickers, args.start, args.end)
+                await request()  # 연결/캐시 예열
+                results[label, concurrency] = await _run(label, request, concurrency, args.requests_per_worker)
+            print(f"speedup c={concurrency}: {results['async', concurrency]['rps'] / results['sync', concurrency]['rps']:.1f}x")
+
+    await async_engine.dispose()
+    sync_engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[50, 200])
+    parser.add_argument('--requests-per-worker', type=int, default=5)
+    parser.add_argument('--tickers', nargs='+', default=['AAPL', 'MSFT', 'NVDA', 'GOOGL', 'AMZN'])
+    parser.add_argument('--start', default='2021-01-04')
+    parser.add_argument('--end', default='2023-12-29')
+    parser.add_argument('--database-url', default=None, help='생략 시 임시 SQLite 파일 사용')
+    parser.add_argument('--query-latency-ms', type=float, default=2.0, help='SQLite 전용 쿼리당 지연 모사')
+    asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,138 @@
+"""
+주가 조회 지연 시간 벤치마크 (누락 구간 보완 유무 비교)
+
+yfinance 호출은 합성 데이터를 반환하는 대역으로 대체하고(--fetch-latency로 네트워크 지연 모사),
+설정된 DB에 벤치마크 전용 티커를 만들어 다음 두 경우의 요청당 지연 시간을 측정합니다.
+
+- covered: 요청 구간이 DB에 모두 있음 (조회만)
+- gap_fill: 요청 구간 뒤쪽 N일이 비어 있음 (yfinance 보완 → 저장 → 같은 연결로 조회)
+
+실행 방법:
+    docker exec -it backtest-be-fast-dev python scripts/benchmark_gap_fill.py --iterations 30
+"""
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import argparse
+import logging
+import statistics
+import time
+from datetime import date, timedelta
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import text
+
+from app.services import yfinance_db
+from app.services.price_store import local_price_store
+
+logging.basicConfig(level=logging.WARNING)
+logger = logging.getLogger(__name__)
+
+BENCH_TICKER = 'ZZBENCHGAP'
+
+
+def _synthetic_prices(start: date, end: date) -> pd.DataFrame:
+    """yfinance 형식 합성 OHLCV"""
+    index = pd.bdate_range(start, end, name='Date')
+    rng = np.random.default_rng(42)
+    close = 100 + rng.standard_normal(len(index)).cumsum()
+    return pd.DataFrame({
+        'Open': close, 'High': close + 1, 'Low': close - 1, 'Close': close,
+        'Adj Close': close, 'Volume': rng.integers(1_000, 1_000_000, len(index)),
+    }, index=index)
+
+
+class _FakeFetcher:
+    """data_fetcher 대역 (고정 지연 후 합성 데이터 반환)"""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    def fetch_stock_data(self, ticker, start_date, end_date, use_cache=True):
+        time.sleep(self.latency)
+        return _synthetic_prices(start_date, end_date)
+
+    def fetch_ticker_info(self, ticker):
+        return {'symbol': ticker, 'company_name': 'Benchmark', 'currency': 'USD', 'exchange': 'BENCH'}
+
+
+def _delete_after(cutoff: date) -> None:
+    with yfinance_db._get_engine().begin() as conn:
+        conn.execute(
+            text(
+                "DELETE dp FROM daily_prices dp JOIN stocks s ON s.id = dp.stock_id "
+                "WHERE s.ticker = :t AND dp.date > :d"
+            ),
+            {'t': BENCH_TICKER, 'd': str(cutoff)}
+        )
+
+
+def _cleanup() -> None:
+    with yfinance_db._get_engine().begin() as conn:
+        conn.execute(
+            text("DELETE dp FROM daily_prices dp JOIN stocks s ON s.id = dp.stock_id WHERE s.ticker = :t"),
+            {'t': BENCH_TICKER}
+        )
+        conn.execute(text("DELETE FROM stocks WHERE ticker = :t"), {'t': BENCH_TICKER})
+
+
+def _summary(samples: list) -> dict:
+    ordered = sorted(samples)
+    return {
+        'mean_ms': round(statistics.mean(ordered) * 1000, 2),
+        'p50_ms': round(ordered[len(ordered) // 2] * 1000, 2),
+        'p95_ms': round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000, 2),
+        'max_ms': round(ordered[-1] * 1000, 2),
+    }
+
+
+def run_benchmark(iterations: int, years: int, gap_days: int, fetch_latency: float) -> dict:
+    """covered / gap_fill 요청당 지연 시간 측정"""
+    end = date.today() - timedelta(days=1)
+    start = end - timedelta(days=365 * years)
+    cutoff = end - timedelta(days=gap_days)
+
+    local_price_store.enabled = False
+    results = {'covered': [], 'gap_fill': []}
+
+    with patch.object(yfinance_db, 'data_fetcher', _FakeFetcher(fetch_latency)):
+        _cleanup()
+        try:
+            # 초기 적재 (측정 제외)
+            yfinance_db.load_ticker_data(BENCH_TICKER, start, end, max_retries=1)
+
+            for _ in range(iterations):
+                began = time.perf_counter()
+                yfinance_db.load_ticker_data(BENCH_TICKER, start, end, max_retries=1)
+                results['covered'].append(time.perf_counter() - began)
+
+                _delete_after(cutoff)
+                began = time.perf_counter()
+                yfinance_db.load_ticker_data(BENCH_TICKER, start, end, max_retries=1)
+                results['gap_fill'].append(time.perf_counter() - began)
+        finally:
+            _cleanup()
+
+    return {name: _summary(samples) for name, samples in results.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="주가 조회 지연 시간 벤치마크 (누락 구간 보완 유무)")
+    parser.add_argument('--iterations', type=int, default=20)
+    parser.add_argument('--years', type=int, default=5, help="요청 구간 길이 (년)")
+    parser.add_argument('--gap-days', type=int, default=10, help="매 반복마다 비워 둘 최근 일수")
+    parser.add_argument('--fetch-latency', type=float, default=0.0, help="yfinance 대역 지연 (초)")
+    args = parser.parse_args()
+
+    report = run_benchmark(args.iterations, args.years, args.gap_days, args.fetch_latency)
+    print(f"{'case':<10} {'mean':>10} {'p50':>10} {'p95':>10} {'max':>10}  (ms, n={args.iterations})")
+    for name, summary in report.items():
+        print(f"{name:<10} {summary['mean_ms']:>10} {summary['p50_ms']:>10} "
+              f"{summary['p95_ms']:>10} {summary['max_ms']:>10}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,165 @@
+"""
+포트폴리오 백테스트 응답 페이로드 생성 벤치마크 (기존 경로 vs orjson 경로)
+
+합성 가격 데이터로 /api/v1/backtest 응답과 같은 구조(equity_curve, daily_returns, weight_history,
+종목별 stock_data, 벤치마크, 거래 로그)를 만들고, 응답 바이트를 얻기까지의 시간을 비교합니다.
+
+- legacy: iterrows 레코드 변환 → recursive_serialize(pd.isna) → jsonable_encoder → json.dumps
+- fast: column_records 변환 → recursive_serialize → encode_json (FastJSONResponse 경로)
+
+실행 방법:
+    python scripts/benchmark_response_encoding.py --assets 20 --years 10
+"""
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import argparse
+import json
+import statistics
+import time
+from typing import Any, Callable, Dict
+
+import numpy as np
+import pandas as pd
+from fastapi.encoders import jsonable_encoder
+
+from app.services.unified_data_service import UnifiedDataService
+from app.utils.serializers import column_records, encode_json, recursive_serialize
+
+
+def _legacy_serialize(obj: Any) -> Any:
+    """변경 전 recursive_serialize (float마다 pd.isna / np.isnan / np.isinf)"""
+    if isinstance(obj, (str, int, bool)) or obj is None:
+        return obj
+    if isinstance(obj, float):
+        if pd.isna(obj) or np.isnan(obj):
+            return "NaN"
+        if np.isinf(obj):
+            return "Infinity" if obj > 0 else "-Infinity"
+        return obj
+    if isinstance(obj, dict):
+        return {k: _legacy_serialize(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple, set)):
+        return [_legacy_serialize(v) for v in obj]
+    return str(obj)
+
+
+def _legacy_stock_data(df: pd.DataFrame):
+    return [
+        {
+            'date': date.strftime('%Y-%m-%d'),
+            'price': float(row['Close']),
+            'volume': int(row.get('Volume', 0)) if pd.notna(row.get('Volume', 0)) else 0
+        }
+        for date, row in df.iterrows()
+    ]
+
+
+def _legacy_benchmark(df: pd.DataFrame):
+    return [
+        {'date': date.strftime('%Y-%m-%d'), 'close': float(row['close']), 'return_pct': float(row['return_pct'])}
+        for date, row in df.iterrows()
+        if pd.notna(row['close'])
+    ]
+
+
+def _inputs(n_assets: int, years: int) -> Dict[str, Any]:
+    rng = np.random.default_rng(7)
+    index = pd.bdate_range('2010-01-04', periods=252 * years)
+    symbols = [f'SYM{i:02d}' for i in range(n_assets)]
+    frames = {}
+    for symbol in symbols:
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, len(index))))
+        frames[symbol] = pd.DataFrame(
+            {'Open': close, 'High': close, 'Low': close, 'Close': close,
+             'Volume': rng.integers(1_000, 1_000_000, len(index))},
+            index=index
+        )
+    benchmark = pd.DataFrame({'close': frames[symbols[0]]['Close'].to_numpy()}, index=index)
+    benchmark['return_pct'] = benchmark['close'].pct_change().fillna(0) * 100
+
+    dates = index.strftime('%Y-%m-%d').tolist()
+    weights = rng.dirichlet(np.ones(n_assets), len(index))
+    values = 10_000 * np.exp(np.cumsum(rng.normal(0, 0.01, len(index))))
+    backtest = {
+        'status': 'success',
+        'data': {
+            'portfolio_statistics': {'Total_Return': 123.4, 'Sharpe_Ratio': float('nan')},
+            'equity_curve': dict(zip(dates, values.tolist())),
+            'daily_returns': dict(zip(dates, (np.diff(values, prepend=values[0]) / values * 100).tolist())),
+            'weight_history': [dict(zip(['date', *symbols], row)) for row in zip(dates, *weights.T.tolist())],
+            'strategy_details': {
+                symbol: {'trade_log': [
+                    {'EntryTime': dates[i], 'EntryPrice': 100.0 + i, 'Size': 1.5, 'Type': 'BUY',
+                     'ExitTime': None, 'ExitPrice': None, 'PnL': None}
+                    for i in range(0, len(dates), 21)
+                ]}
+                for symbol in symbols
+            },
+        }
+    }
+    return {'frames': frames, 'benchmark': benchmark, 'backtest': backtest}
+
+
+def _legacy(inputs: Dict[str, Any]) -> bytes:
+    result = _legacy_serialize(inputs['backtest'])
+    result['data'].update({
+        'stock_data': {symbol: _legacy_stock_data(df) for symbol, df in inputs['frames'].items()},
+        'sp500_benchmark': _legacy_benchmark(inputs['benchmark']),
+        'nasdaq_benchmark': _legacy_benchmark(inputs['benchmark']),
+    })
+    # FastAPI 기본 경로: jsonable_encoder → JSONResponse(json.dumps)
+    return json.dumps(
+        jsonable_encoder(result), ensure_ascii=False, allow_nan=False, separators=(',', ':')
+    ).encode('utf-8')
+
+
+def _fast_benchmark(df: pd.DataFrame):
+    """UnifiedDataService._collect_single_benchmark의 레코드 변환 부분"""
+    return column_records(df.index, {
+        'close': df['close'].to_numpy(dtype=float),
+        'return_pct': df['return_pct'].to_numpy(dtype=float),
+    })
+
+
+def _fast(inputs: Dict[str, Any]) -> bytes:
+    service = UnifiedDataService()
+    result = recursive_serialize(inputs['backtest'])
+    result['data'].update({
+        'stock_data': {symbol: service._transform_stock_data(df) for symbol, df in inputs['frames'].items()},
+        'sp500_benchmark': _fast_benchmark(inputs['benchmark']),
+        'nasdaq_benchmark': _fast_benchmark(inputs['benchmark']),
+    })
+    # FastJSONResponse 경로: jsonable_encoder 없이 orjson 인코딩
+    return encode_json(result)
+
+
+def _measure(name: str, func: Callable[[Dict[str, Any]], bytes], inputs: Dict[str, Any], iterations: int) -> float:
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        body = func(inputs)
+        timings.append((time.perf_counter() - started) * 1000)
+    median = statistics.median(timings)
+    print(f"{name:>6}: median {median:8.1f} ms  min {min(timings):8.1f} ms  ({len(body) / 1024 / 1024:.1f} MB)")
+    return median
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--assets', type=int, default=20)
+    parser.add_argument('--years', type=int, default=10)
+    parser.add_argument('--iterations', type=int, default=5)
+    args = parser.parse_args()
+
+    inputs = _inputs(args.assets, args.years)
+    assert json.loads(_legacy(inputs)) == json.loads(_fast(inputs)), "두 경로의 응답 내용이 다릅니다"
+
+    legacy = _measure('legacy', _legacy, inputs, args.iterations)
+    fast = _measure('fast', _fast, inputs, args.iterations)
+    print(f"speedup: {legacy / fast:.1f}x ({args.assets} assets, {args.years} years)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,415 @@
+"""
+핫 패스 오프라인 벤치마크 스위트 (결과 JSON 저장 + 기준 결과 대비 회귀 판정)
+
+고정 시드 합성 데이터(여러 해 OHLCV, 1~50개 종목, USD/KRW/EUR/JPY/GBP 혼합)로 다음 경로의
+실행 시간을 측정합니다. 네트워크/MySQL 없이 실행되며, 같은 인자면 같은 입력이 만들어집니다.
+
+- portfolio_dca: PortfolioService.calculate_dca_portfolio_returns (vectorized, loop는 --loop-max-tickers 이하만)
+- convert_to_usd: CurrencyConverter.convert_dataframe_to_usd (직접 환율 KRW, USD 환율 EUR)
+- chart_data: ChartDataService.generate_chart_data (전략별)
+- backtest_engine: BacktestEngine.run_backtest (전략별, settings.strategy_backtest_engine)
+- recursive_serialize: 포트폴리오 응답 구조 직렬화
+- query_prices: yfinance_db._query_and_format_dataframe (SQLite 파일로 daily_prices 대체)
+
+저장소/환율 조회는 합성 데이터를 돌려주는 대역(_OfflineStockRepository)으로 바꾸고,
+요청 검증의 티커 존재 확인(yfinance)은 통과로 고정합니다.
+결과 JSON에는 환경 정보(파이썬/라이브러리 버전, CPU 수, 엔진 설정)와 케이스별 median/min/mean/stdev(ms)가
+기록되며, --baseline을 주면 median이 threshold(기본 20%)와 --min-delta-ms를 모두 넘게 느려진
+케이스를 회귀로 표시하고 종료 코드 1을 반환합니다.
+
+실행 방법:
+    python scripts/benchmark_suite.py --output bench/base.json
+    python scripts/benchmark_suite.py --baseline bench/base.json --output bench/head.json
+    python scripts/benchmark_suite.py --quick --only portfolio_dca convert_to_usd
+"""
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import statistics
+import tempfile
+import time
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import create_engine, text
+
+from app.core.config import settings
+from app.schemas.requests import BacktestRequest
+from app.services import yfinance_db
+from app.services.backtest_engine import BacktestEngine
+from app.services.chart_data_service import ChartDataService
+from app.services.portfolio_service import PortfolioService
+from app.services.price_store import local_price_store
+from app.services.strategy_service import strategy_service
+from app.utils.currency_converter import currency_converter
+from app.utils.data_fetcher import data_fetcher
+from app.utils.serializers import recursive_serialize
+
+logging.basicConfig(level=logging.WARNING)
+logging.getLogger('app').setLevel(logging.WARNING)
+
+RESULT_VERSION = 1
+START_DATE = '2014-01-02'
+CURRENCY_CYCLE = ('USD', 'KRW', 'EUR', 'JPY', 'GBP')
+# 환율 대역의 기준값 (직접 환율: 1 USD = X, USD 환율: 1 통화 = X USD)
+FX_BASE = {
+    'KRW=X': 1200.0, 'JPY=X': 120.0, 'EURUSD=X': 1.1, 'GBPUSD=X': 1.3, 'CNY=X': 6.8, 'HKD=X': 7.8,
+    'TWD=X': 30.0, 'SGD=X': 1.35, 'AUDUSD=X': 0.7, 'CADUSD=X': 0.75, 'CHFUSD=X': 1.05, 'INR=X': 75.0,
+}
+BENCHMARK_TICKERS = ('^GSPC', '^IXIC')
+
+
+# ============================================================================
+# 합성 데이터 / 오프라인 대역
+# ============================================================================
+
+class SyntheticMarket:
+    """고정 시드 합성 시장 데이터 (종목 OHLCV, 환율, 벤치마크 지수)"""
+
+    def __init__(self, n_tickers: int, years: int, seed: int = 7):
+        self.index = pd.bdate_range(START_DATE, periods=252 * years)
+        self.start_date = self.index[0].strftime('%Y-%m-%d')
+        self.end_date = self.index[-1].strftime('%Y-%m-%d')
+        rng = np.random.default_rng(seed)
+        self.currencies = {f'T{i:02d}': CURRENCY_CYCLE[i % len(CURRENCY_CYCLE)] for i in range(n_tickers)}
+        self.frames: Dict[str, pd.DataFrame] = {}
+        for ticker, currency in self.currencies.items():
+            index = self.index
+            if currency != 'USD':
+                # 비미국 거래소: 휴장일이 다른 캘린더 (약 2% 결측)
+                index = index[rng.random(len(index)) > 0.02]
+            start_price = 50_000.0 if currency in ('KRW', 'JPY') else 100.0
+            self.frames[ticker] = self._ohlcv(rng, index, start_price, 0.02)
+        for ticker, base in FX_BASE.items():
+            self.frames[ticker] = self._ohlcv(rng, self.index, base, 0.004)
+        for ticker in BENCHMARK_TICKERS:
+            self.frames[ticker] = self._ohlcv(rng, self.index, 3000.0, 0.01)
+
+    @staticmethod
+    def _ohlcv(rng, index: pd.DatetimeIndex, start_price: float, volatility: float) -> pd.DataFrame:
+        close = start_price * np.exp(np.cumsum(rng.normal(0.0003, volatility, len(index))))
+        spread = np.abs(rng.normal(0, volatility / 2, len(index)))
+        return pd.DataFrame({
+            'Open': close * (1 + rng.normal(0, volatility / 4, len(index))),
+            'High': close * (1 + spread),
+            'Low': close * (1 - spread),
+            'Close': close,
+            'Volume': rng.integers(1_000, 1_000_000, len(index)),
+        }, index=index)
+
+    def frame(self, ticker: str, start_date=None, end_date=None) -> pd.DataFrame:
+        df = self.frames[ticker]
+        return df.loc[pd.Timestamp(start_date or df.index[0]):pd.Timestamp(end_date or df.index[-1])].copy()
+
+
+class _OfflineStockRepository:
+    """StockRepository / DataRepository 대역 (합성 데이터 반환, I/O 없음)"""
+
+    def __init__(self, market: SyntheticMarket):
+        self.market = market
+
+    async def get_stock_data(self, ticker, start_date, end_date):
+        return self.market.frame(ticker, start_date, end_date)
+
+    async def load_stock_data_async(self, ticker, start_date=None, end_date=None, *args, **kwargs):
+        return self.market.frame(ticker, start_date, end_date)
+
+    async def load_stock_data_batch_async(self, tickers, start_date=None, end_date=None):
+        return {ticker: self.market.frame(ticker, start_date, end_date) for ticker in tickers}
+
+    async def get_tickers_info_batch_async(self, tickers):
+        return {ticker: await self.get_ticker_info_async(ticker) for ticker in tickers}
+
+    async def get_ticker_info_async(self, ticker):
+        return {'symbol': ticker, 'currency': self.market.currencies.get(ticker, 'USD'), 'exchange': 'BENCH'}
+
+
+def _dca_inputs(market: SyntheticMarket) -> Tuple[Dict[str, pd.DataFrame], Dict[str, float], Dict[str, Dict]]:
+    """calculate_dca_portfolio_returns 입력 (짝수 번째 종목 일시불, 홀수 번째 월간 DCA 12회)"""
+    portfolio_data, amounts, dca_info = {}, {}, {}
+    for i, ticker in enumerate(market.currencies):
+        dca = i % 2 == 1
+        portfolio_data[ticker] = market.frame(ticker)
+        amounts[ticker] = 1_000.0 * 12 if dca else 10_000.0
+        dca_info[ticker] = {
+            'symbol': ticker,
+            'investment_type': 'dca' if dca else 'lump_sum',
+            'dca_frequency': 'monthly_1',
+            'dca_periods': 12 if dca else 1,
+            'monthly_amount': 1_000.0 if dca else 10_000.0,
+            'asset_type': 'stock',
+            'executed_count': 0,
+            'last_dca_date': None,
+            'original_nth_weekday': None,
+        }
+    return portfolio_data, amounts, dca_info
+
+
+def _response_payload(market: SyntheticMarket) -> Dict[str, Any]:
+    """/api/v1/backtest 응답과 같은 구조 (recursive_serialize 입력)"""
+    rng = np.random.default_rng(11)
+    tickers = [t for t in market.currencies]
+    dates = market.index.strftime('%Y-%m-%d').tolist()
+    values = 10_000 * np.exp(np.cumsum(rng.normal(0, 0.01, len(dates))))
+    weights = rng.dirichlet(np.ones(len(tickers)), len(dates))
+    return {
+        'status': 'success',
+        'data': {
+            'portfolio_statistics': {'Total_Return': 123.4, 'Sharpe_Ratio': float('nan'), 'Profit_Factor': float('inf')},
+            'equity_curve': dict(zip(dates, values.tolist())),
+            'daily_returns': dict(zip(dates, (np.diff(values, prepend=values[0]) / values * 100).tolist())),
+            'weight_history': [dict(zip(['date', *tickers], row)) for row in zip(dates, *weights.T.tolist())],
+            'strategy_details': {
+                ticker: {'trade_log': [
+                    {'EntryTime': dates[i], 'EntryPrice': 100.0 + i, 'Size': 1.5, 'PnL': None}
+                    for i in range(0, len(dates), 21)
+                ]}
+                for ticker in tickers
+            },
+        },
+    }
+
+
+def _seed_price_db(path: str, market: SyntheticMarket, ticker: str) -> None:
+    """daily_prices 대체 SQLite 파일 (stock_id=1)"""
+    engine = create_engine(f'sqlite:///{path}')
+    df = market.frame(ticker)
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE TABLE daily_prices (stock_id INTEGER, date TEXT, open REAL, high REAL, low REAL, "
+            "close REAL, adj_close REAL, volume INTEGER, PRIMARY KEY (stock_id, date))"
+        ))
+        conn.execute(
+            text("INSERT INTO daily_prices VALUES (1, :d, :o, :h, :l, :c, :c, :v)"),
+            [
+                {'d': d.strftime('%Y-%m-%d'), 'o': float(o), 'h': float(h), 'l': float(lo), 'c': float(c), 'v': int(v)}
+                for d, o, h, lo, c, v in zip(df.index, df['Open'], df['High'], df['Low'], df['Close'], df['Volume'])
+            ]
+        )
+    engine.dispose()
+
+
+# ============================================================================
+# 측정
+# ============================================================================
+
+Case = Tuple[str, Dict[str, Any], Callable[[], Awaitable[Any]]]
+
+
+def _cases(args, workdir: str) -> List[Case]:
+    """(케이스 이름, 파라미터, 1회 실행 코루틴 팩토리) 목록"""
+    cases: List[Case] = []
+    strategies = sorted(strategy_service.get_all_strategies())
+    single = SyntheticMarket(1, args.years, args.seed)
+
+    def add(group: str, params: Dict[str, Any], run: Callable[[], Awaitable[Any]]):
+        label = ','.join(f'{k}={v}' for k, v in params.items())
+        cases.append((f'{group}[{label}]', {'group': group, **params}, run))
+
+    for n_tickers in args.tickers:
+        market = SyntheticMarket(n_tickers, args.years, args.seed)
+        portfolio_data, amounts, dca_info = _dca_inputs(market)
+        service = PortfolioService()
+        service.stock_repository = _OfflineStockRepository(market)
+        engines = ('loop', 'vectorized') if n_tickers <= args.loop_max_tickers else ('vectorized',)
+        for engine in engines:
+            def run(service=service, market=market, engine=engine, inputs=(portfolio_data, amounts, dca_info)):
+                data, amt, info = inputs
+                return service.calculate_dca_portfolio_returns(
+                    data, dict(amt), {k: dict(v) for k, v in info.items()},
+                    market.start_date, market.end_date, 'monthly_1', 0.002, engine=engine
+                )
+            add('portfolio_dca', {'tickers': n_tickers, 'years': args.years, 'engine': engine}, run)
+
+        payload = _response_payload(market)
+
+        async def serialize(payload=payload):
+            return recursive_serialize(payload)
+        add('recursive_serialize', {'tickers': n_tickers, 'years': args.years}, serialize)
+
+    fx_market = SyntheticMarket(len(CURRENCY_CYCLE), args.years, args.seed)
+    for ticker, currency in fx_market.currencies.items():
+        if currency not in ('KRW', 'EUR'):
+            continue
+
+        def convert(ticker=ticker, currency=currency, df=fx_market.frame(ticker)):
+            return currency_converter.convert_dataframe_to_usd(
+                ticker, df, fx_market.start_date, fx_market.end_date, currency=currency
+            )
+        add('convert_to_usd', {'currency': currency, 'years': args.years}, convert)
+
+    repository = _OfflineStockRepository(single)
+    engine = BacktestEngine(data_repository=repository)
+    chart_service = ChartDataService(data_repository=repository)
+    for strategy in strategies:
+        request = BacktestRequest(
+            ticker='T00', start_date=single.start_date, end_date=single.end_date,
+            initial_cash=10_000.0, strategy=strategy,
+        )
+        add('backtest_engine', {'strategy': strategy, 'years': args.years},
+            lambda request=request: engine.run_backtest(request))
+        add('chart_data', {'strategy': strategy, 'years': args.years},
+            lambda request=request: chart_service.generate_chart_data(request))
+
+    db_path = os.path.join(workdir, 'prices.sqlite3')
+    _seed_price_db(db_path, single, 'T00')
+    db_engine = create_engine(f'sqlite:///{db_path}')
+
+    async def query(start=single.index[0].date(), end=single.index[-1].date()):
+        with db_engine.connect() as conn:
+            return yfinance_db._query_and_format_dataframe(conn, 1, 'T00', start, end)
+    add('query_prices', {'years': args.years}, query)
+
+    if args.only:
+        cases = [case for case in cases if case[1]['group'] in args.only]
+    return cases
+
+
+async def _measure(run: Callable[[], Awaitable[Any]], iterations: int, warmup: int) -> Dict[str, float]:
+    for _ in range(warmup):
+        await run()
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        await run()
+        timings.append((time.perf_counter() - started) * 1000)
+    return {
+        'median_ms': round(statistics.median(timings), 3),
+        'min_ms': round(min(timings), 3),
+        'mean_ms': round(statistics.fmean(timings), 3),
+        'stdev_ms': round(statistics.stdev(timings), 3) if len(timings) > 1 else 0.0,
+        'iterations': iterations,
+    }
+
+
+def _environment() -> Dict[str, Any]:
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'strategy_backtest_engine': settings.strategy_backtest_engine,
+        'portfolio_simulation_engine': settings.portfolio_simulation_engine,
+    }
+
+
+async def run_suite(args) -> Dict[str, Any]:
+    local_price_store.enabled = False
+    results: Dict[str, Any] = {}
+    fx_repository = _OfflineStockRepository(SyntheticMarket(len(CURRENCY_CYCLE), args.years, args.seed))
+    with tempfile.TemporaryDirectory() as workdir, \
+            patch.object(currency_converter, 'stock_repository', fx_repository), \
+            patch.object(data_fetcher, 'validate_ticker', return_value=True):
+        for name, params, run in _cases(args, workdir):
+            stats = await _measure(run, args.iterations, args.warmup)
+            results[name] = {**params, **stats}
+            print(f"{name:<60} median {stats['median_ms']:10.2f} ms  min {stats['min_ms']:10.2f} ms")
+    return {
+        'version': RESULT_VERSION,
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'environment': _environment(),
+        'config': {'tickers': args.tickers, 'years': args.years, 'seed': args.seed,
+                   'iterations': args.iterations, 'warmup': args.warmup, 'loop_max_tickers': args.loop_max_tickers},
+        'results': results,
+    }
+
+
+# ============================================================================
+# 기준 결과 비교
+# ============================================================================
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float, min_delta_ms: float) -> List[Dict[str, Any]]:
+    """
+    케이스별 median 비교
+
+    Returns:
+        공통 케이스별 {name, baseline_ms, current_ms, ratio, regression} 목록
+        (regression: ratio > 1 + threshold 이고 증가폭 > min_delta_ms)
+    """
+    rows = []
+    for name, result in current['results'].items():
+        base = baseline['results'].get(name)
+        if base is None:
+            continue
+        base_ms, cur_ms = base['median_ms'], result['median_ms']
+        ratio = cur_ms / base_ms if base_ms > 0 else float('inf')
+        rows.append({
+            'name': name,
+            'baseline_ms': base_ms,
+            'current_ms': cur_ms,
+            'ratio': round(ratio, 3),
+            'regression': ratio > 1 + threshold and cur_ms - base_ms > min_delta_ms,
+        })
+    return rows
+
+
+def _report(rows: List[Dict[str, Any]], current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> int:
+    if current['environment'] != baseline['environment']:
+        print("경고: 기준 결과와 실행 환경이 다릅니다 (비교 결과 해석 주의)")
+        for key, value in current['environment'].items():
+            if baseline['environment'].get(key) != value:
+                print(f"  {key}: {baseline['environment'].get(key)} -> {value}")
+    if current['config'] != baseline['config']:
+        print(f"경고: 기준 결과와 설정이 다릅니다 {baseline['config']} -> {current['config']}")
+
+    print(f"\n기준 결과 대비 (회귀 기준 +{threshold:.0%}):")
+    for row in rows:
+        flag = 'REGRESSION' if row['regression'] else ''
+        print(f"{row['name']:<60} {row['baseline_ms']:10.2f} -> {row['current_ms']:10.2f} ms  x{row['ratio']:.2f}  {flag}")
+    missing = sorted(set(baseline['results']) - set(current['results']))
+    if missing:
+        print(f"이번 실행에 없는 기준 케이스 {len(missing)}개: {', '.join(missing)}")
+
+    regressions = [row for row in rows if row['regression']]
+    print(f"\n회귀 {len(regressions)}건 / 비교 {len(rows)}건")
+    return 1 if regressions else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--tickers', type=int, nargs='+', default=[1, 10, 50], help='포트폴리오 종목 수')
+    parser.add_argument('--years', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--loop-max-tickers', type=int, default=10,
+                        help='loop 엔진을 측정할 최대 종목 수 (50종목 loop는 회당 수십 초)')
+    parser.add_argument('--iterations', type=int, default=5)
+    parser.add_argument('--warmup', type=int, default=1)
+    parser.add_argument('--only', nargs='+', default=None,
+                        help='실행할 그룹 (portfolio_dca, convert_to_usd, chart_data, backtest_engine, '
+                             'recursive_serialize, query_prices)')
+    parser.add_argument('--quick', action='store_true', help='종목 수 1, 5 / 3년 / 3회 (CI 점검용)')
+    parser.add_argument('--output', default=None, help='결과 JSON 저장 경로')
+    parser.add_argument('--baseline', default=None, help='비교할 기준 결과 JSON')
+    parser.add_argument('--threshold', type=float, default=0.2, help='회귀 판정 비율 (0.2 = 20%% 느려짐)')
+    parser.add_argument('--min-delta-ms', type=float, default=1.0, help='회귀 판정 최소 증가폭 (ms, 측정 잡음 제외)')
+    args = parser.parse_args(argv)
+    if args.quick:
+        args.tickers, args.years, args.iterations = [1, 5], 3, 3
+
+    current = asyncio.run(run_suite(args))
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(current, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        return _report(compare(current, baseline, args.threshold, args.min_delta_ms), current, baseline, args.threshold)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,35 @@
+"""
+장 마감 후 가격 증분 갱신 (커버리지 워터마크 이후 봉만 수집)
+
+앱 내장 스케줄러(EOD_REFRESH_ENABLED) 대신 cron 등 외부 스케줄러에서 실행할 때 사용합니다.
+
+실행 방법:
+    docker exec -it backtest-be-fast-dev python scripts/refresh_prices_eod.py
+    docker exec -it backtest-be-fast-dev python scripts/refresh_prices_eod.py --as-of 2024-03-15
+"""
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import argparse
+import logging
+from datetime import date
+
+from app.services.price_refresh_service import price_refresh_service
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="가격 데이터 EOD 증분 갱신")
+    parser.add_argument('--as-of', type=date.fromisoformat, default=None,
+                        help="장 마감이 끝난 기준일 (YYYY-MM-DD, 기본: 오늘)")
+    args = parser.parse_args()
+
+    summary = price_refresh_service.refresh_all(args.as_of)
+    logger.info(f"갱신 결과: {summary}")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,14 +7,18 @@ Pytest Configuration and Global Fixtures
 
 import pytest
 import asyncio
-from typing import AsyncGenerator
-from unittest.mock import Mock, AsyncMock
+from typing import AsyncGenerator, Dict, Iterable, Optional, Tuple
+from unittest.mock import Mock, AsyncMock, patch
 from decimal import Decimal
 from datetime import datetime
 
+import pandas as pd
+
 # Optional imports for integration tests
 try:
+    from sqlalchemy import create_engine, text
     from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+    from sqlalchemy.pool import StaticPool
     HAS_SQLALCHEMY = True
 except ImportError:
     HAS_SQLALCHEMY = False
@@ -91,6 +95,73 @@ async def db_session(db_engine) -> AsyncGenerator:
             await session.rollback()  # 테스트 후 롤백
 
 
+# ============================================================================
+# SQLite 가격 DB Fixtures (yfinance_db 단위 테스트, MySQL 스키마 축약본)
+# ============================================================================
+
+@pytest.fixture
+def sqlite_price_engine():
+    """
+    stocks / daily_prices / price_coverage 테이블을 가진 SQLite 인메모리 엔진 팩토리
+
+    make({'AAPL': days}, coverage={'AAPL': ('2024-03-01', '2024-03-28')})
+    - stock_id는 티커 순서대로 1부터, 가격은 100 * stock_id + n, 거래량은 1000 + n (n: 티커 내 순번)
+    """
+    if not HAS_SQLALCHEMY:
+        pytest.skip("SQLAlchemy not installed")
+
+    def make(
+        prices: Dict[str, Iterable],
+        coverage: Optional[Dict[str, Tuple[str, str]]] = None
+    ):
+        engine = create_engine('sqlite://', poolclass=StaticPool, connect_args={'check_same_thread': False})
+        with engine.begin() as conn:
+            conn.execute(text("CREATE TABLE stocks (id INTEGER PRIMARY KEY, ticker TEXT)"))
+            conn.execute(text(
+                "CREATE TABLE daily_prices (stock_id INTEGER, date TEXT, open REAL, high REAL, low REAL, "
+                "close REAL, adj_close REAL, volume INTEGER)"
+            ))
+            conn.execute(text(
+                "CREATE TABLE price_coverage (stock_id INTEGER PRIMARY KEY, covered_from TEXT, covered_to TEXT, "
+                "last_refreshed_at TEXT)"
+            ))
+            for stock_id, (ticker, days) in enumerate(prices.items(), start=1):
+                conn.execute(text("INSERT INTO stocks (id, ticker) VALUES (:i, :t)"), {'i': stock_id, 't': ticker})
+                for n, day in enumerate(days):
+                    conn.execute(
+                        text("INSERT INTO daily_prices VALUES (:s, :d, :p, :p, :p, :p, :p, :v)"),
+                        {'s': stock_id, 'd': pd.Timestamp(day).strftime('%Y-%m-%d'),
+                         'p': 100.0 * stock_id + n, 'v': 1000 + n}
+                    )
+                if coverage and ticker in coverage:
+                    conn.execute(
+                        text("INSERT INTO price_coverage VALUES (:s, :f, :t, '2024-01-01 00:00:00')"),
+                        {'s': stock_id, 'f': coverage[ticker][0], 't': coverage[ticker][1]}
+                    )
+        return engine
+
+    return make
+
+
+def _sqlite_save_and_commit(conn, ticker, df):
+    """yfinance_db._save_and_commit 대역 (MySQL 전용 upsert 구문 대신 일반 INSERT, 가격 2 / 거래량 200)"""
+    stock_id = conn.execute(text("SELECT id FROM stocks WHERE ticker = :t"), {'t': ticker}).scalar()
+    for day in df.index:
+        conn.execute(
+            text("INSERT INTO daily_prices VALUES (:s, :d, 2, 2, 2, 2, 2, 200)"),
+            {'s': stock_id, 'd': day.strftime('%Y-%m-%d')}
+        )
+    conn.commit()
+    return len(df)
+
+
+@pytest.fixture
+def sqlite_save():
+    """yfinance_db._save_and_commit을 SQLite 대역으로 교체 (호출 확인용 mock 반환)"""
+    with patch('app.services.yfinance_db._save_and_commit', side_effect=_sqlite_save_and_commit) as save:
+        yield save
+
+
 # ============================================================================
 # HTTP Client Fixtures (Integration Tests Only)
 # ============================================================================
@@ -243,6 +314,18 @@ def reset_mocks(request):
     # 테스트 후 정리 작업
 
 
+@pytest.fixture(autouse=True)
+def disable_local_price_store(monkeypatch):
+    """전역 로컬 가격 저장소 비활성화 (mock 데이터가 디스크에 남지 않도록)"""
+    try:
+        from app.services.price_store import local_price_store
+    except ImportError:
+        yield
+        return
+    monkeypatch.setattr(local_price_store, "enabled", False)
+    yield
+
+
 @pytest.fixture(autouse=True)
 def log_test_name(request):
     """테스트 이름 로깅 (verbose 모드에서만)"""
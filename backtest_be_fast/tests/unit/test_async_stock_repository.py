@@ -0,0 +1,218 @@
+"""
+비동기 DB 계층 단위 테스트
+
+**테스트 범위**:
+- AsyncStockRepository.load_stock_data_async: 워터마크 안쪽은 비동기 연결로 조회 (동기 경로와 같은 결과),
+  워터마크 밖/없는 티커는 동기 경로 위임
+- load_stock_data_batch_async: 비동기 조회 + 나머지 티커만 동기 경로(단일 비행),
+  DataFrame 변환/로컬 가격 저장소 읽기·반영은 스레드 호출 1회씩
+- 메타데이터/뉴스: 동기 함수와 같은 결과
+- get_stock_repository: settings.db_async_enabled로 구현 선택
+- DatabaseConfig.get_async_url: 동기 드라이버 → 비동기 드라이버
+
+**테스트 원칙**:
+- MySQL 대신 SQLite 파일 (동기: pysqlite, 비동기: aiosqlite) 사용, yfinance 호출 없음
+"""
+import asyncio
+import json
+import threading
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.repositories import stock_repository as stock_repository_module
+from app.repositories import async_stock_repository as async_repository_module
+from app.repositories.async_stock_repository import AsyncStockRepository
+from app.repositories.stock_repository import StockRepository, get_stock_repository
+from app.services import yfinance_db
+from app.services.database.database_config import DatabaseConfig
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / 'prices.sqlite3'
+    engine = create_engine(f'sqlite:///{path}')
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE stocks (id INTEGER PRIMARY KEY, ticker TEXT, info_json TEXT)"))
+        conn.execute(text(
+            "CREATE TABLE daily_prices (stock_id INTEGER, date TEXT, open REAL, high REAL, low REAL, "
+            "close REAL, adj_close REAL, volume INTEGER)"
+        ))
+        conn.execute(text(
+            "CREATE TABLE price_coverage (stock_id INTEGER PRIMARY KEY, covered_from TEXT, covered_to TEXT, "
+            "last_refreshed_at TEXT)"
+        ))
+        conn.execute(text(
+            "CREATE TABLE stock_news (ticker TEXT, title TEXT, link TEXT, description TEXT, news_date TEXT, "
+            "created_at TIMESTAMP)"
+        ))
+        info = {'currency': 'USD', 'company_name': 'Apple', 'exchange': 'NMS', 'first_trade_date': '1980-12-12'}
+        conn.execute(text("INSERT INTO stocks VALUES (1, 'AAPL', :info), (2, 'MSFT', NULL)"),
+                     {'info': json.dumps(info)})
+        for stock_id in (1, 2):
+            for i, day in enumerate(pd.bdate_range('2023-01-03', '2023-01-31')):
+                conn.execute(
+                    text("INSERT INTO daily_prices VALUES (:sid, :d, :p, :p, :p, :p, :p, 100)"),
+                    {'sid': stock_id, 'd': day.strftime('%Y-%m-%d'), 'p': 100.0 + i}
+                )
+        # AAPL만 워터마크 있음 (MSFT는 수집 확인 전 레거시 데이터)
+        conn.execute(text("INSERT INTO price_coverage VALUES (1, '2023-01-03', '2023-01-31', '2023-02-01')"))
+        conn.execute(text("INSERT INTO stock_news VALUES ('AAPL', 'title', 'link', NULL, '2023-01-31', :now)"),
+                     {'now': datetime.now()})
+    engine.dispose()
+    return path
+
+
+@pytest.fixture
+def sync_engine(db_path):
+    engine = create_engine(f'sqlite:///{db_path}')
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def repo(db_path):
+    # NullPool: 테스트마다 다른 이벤트 루프를 쓰므로 연결을 풀에 남기지 않음
+    return AsyncStockRepository(engine=create_async_engine(f'sqlite+aiosqlite:///{db_path}', poolclass=NullPool))
+
+
+class TestLoadStockDataAsync:
+    """주가 조회"""
+
+    @pytest.mark.asyncio
+    async def test_covered_request_is_read_natively(self, repo, sync_engine):
+        """Given: 워터마크가 요청 구간을 포함 When: 비동기 조회
+        Then: 동기 경로를 거치지 않고 동기 조회와 같은 DataFrame"""
+        with patch('app.services.yfinance_db._get_engine', return_value=sync_engine):
+            expected = yfinance_db._load_ticker_data_internal('AAPL', '2023-01-09', '2023-01-20')
+
+        with patch.object(StockRepository, 'load_stock_data_async', new=AsyncMock()) as sync_path:
+            df = await repo.load_stock_data_async('AAPL', '2023-01-09', '2023-01-20')
+
+        pd.testing.assert_frame_equal(df, expected)
+        sync_path.assert_not_awaited()
+        assert repo.get_load_stats()['async_native'] == 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('ticker, start, end', [
+        ('MSFT', '2023-01-09', '2023-01-20'),  # 워터마크 없음
+        ('AAPL', '2023-01-09', '2023-02-10'),  # 워터마크 밖 구간
+        ('NVDA', '2023-01-09', '2023-01-20'),  # DB에 없는 티커
+    ])
+    async def test_uncovered_request_falls_back_to_sync_path(self, repo, ticker, start, end):
+        """Given: 수집이 필요한 요청 When: 비동기 조회 Then: 동기 경로(누락 구간 보완)에 위임"""
+        sentinel = pd.DataFrame({'Close': [1.0]})
+        with patch.object(StockRepository, 'load_stock_data_async', new=AsyncMock(return_value=sentinel)) as sync_path:
+            df = await repo.load_stock_data_async(ticker, start, end)
+
+        assert df is sentinel
+        sync_path.assert_awaited_once()
+        assert repo.get_load_stats()['async_fallback'] == 1
+
+    @pytest.mark.asyncio
+    async def test_batch_delegates_only_uncovered_tickers(self, repo):
+        """Given: AAPL(워터마크 안), MSFT(워터마크 없음), NVDA(로드 실패) When: 배치 조회
+        Then: AAPL은 비동기 조회, MSFT/NVDA만 동기 경로(티커별), 실패 티커는 제외"""
+        msft = pd.DataFrame({'Close': [1.0]})
+
+        async def single(ticker, start, end):
+            if ticker == 'NVDA':
+                raise ValueError("데이터 없음")
+            return msft
+
+        with patch.object(StockRepository, 'load_stock_data_async', new=AsyncMock(side_effect=single)) as sync_path:
+            result = await repo.load_stock_data_batch_async(['AAPL', 'MSFT', 'NVDA'], '2023-01-09', '2023-01-20')
+
+        assert sorted(call.args for call in sync_path.await_args_list) == [
+            ('MSFT', '2023-01-09', '2023-01-20'), ('NVDA', '2023-01-09', '2023-01-20'),
+        ]
+        assert set(result) == {'AAPL', 'MSFT'}
+        assert result['MSFT'] is msft
+        assert len(result['AAPL']) == 10
+
+
+    @pytest.mark.asyncio
+    async def test_batch_builds_frames_off_the_event_loop(self, repo):
+        """Given: 로컬 가격 저장소에 없는 AAPL(워터마크 안), MSFT(워터마크 없음) When: 배치 조회
+        Then: 스레드 호출은 로컬 읽기/DataFrame 변환/로컬 반영 1회씩, DataFrame 변환은 이벤트 루프 밖"""
+        real_to_thread = asyncio.to_thread
+        offloaded = []
+        frame_threads = []
+        build_frames = yfinance_db._price_frames_from_rows
+
+        async def spy_to_thread(func, *args):
+            offloaded.append(func)
+            return await real_to_thread(func, *args)
+
+        def spy_build(*args):
+            frame_threads.append(threading.current_thread())
+            return build_frames(*args)
+
+        with patch.object(async_repository_module, 'local_price_store') as store, \
+                patch.object(async_repository_module.asyncio, 'to_thread', side_effect=spy_to_thread), \
+                patch.object(yfinance_db, '_price_frames_from_rows', side_effect=spy_build) as frames, \
+                patch.object(StockRepository, 'load_stock_data_async', new=AsyncMock(return_value=pd.DataFrame())):
+            store.read.return_value = None
+            result = await repo.load_stock_data_batch_async(['AAPL', 'MSFT'], '2023-01-09', '2023-01-20')
+
+        assert len(result['AAPL']) == 10
+        assert store.read.call_count == 2
+        assert offloaded == [
+            async_repository_module._read_local, frames,
+            async_repository_module._record_local,
+        ]
+        assert frame_threads and threading.main_thread() not in frame_threads
+
+
+class TestMetadataAndNews:
+    """메타데이터 / 뉴스"""
+
+    @pytest.mark.asyncio
+    async def test_matches_sync_functions(self, repo, sync_engine):
+        """Given: 같은 DB When: 비동기/동기 조회 Then: 같은 결과 (없는 티커는 기본값)"""
+        with patch('app.services.yfinance_db._get_engine', return_value=sync_engine):
+            expected_info = yfinance_db.get_ticker_info_batch_from_db(['aapl', 'MSFT', 'NONE'])
+            expected_news = yfinance_db.load_news_from_db('AAPL', max_age_hours=3)
+
+        assert await repo.get_tickers_info_batch_async(['aapl', 'MSFT', 'NONE']) == expected_info
+        assert await repo.load_ticker_news_async('AAPL', max_age_hours=3) == expected_news
+        assert expected_news[0]['title'] == 'title'
+        assert (await repo.get_ticker_info_async('AAPL'))['first_trade_date'] == '1980-12-12'
+
+    @pytest.mark.asyncio
+    async def test_missing_listing_date_uses_sync_path(self, repo):
+        """Given: info_json 없는 티커 When: 단건 메타데이터 조회 Then: 동기 경로(상장일 보완)"""
+        with patch.object(repo, 'get_ticker_info', return_value={'symbol': 'MSFT'}) as sync_info:
+            assert await repo.get_ticker_info_async('MSFT') == {'symbol': 'MSFT'}
+        sync_info.assert_called_once_with('MSFT')
+
+
+class TestSelection:
+    """구현 선택 / URL 변환"""
+
+    @pytest.mark.parametrize('enabled, expected', [(True, AsyncStockRepository), (False, StockRepository)])
+    def test_get_stock_repository_follows_setting(self, monkeypatch, enabled, expected):
+        """Given: DB_ASYNC_ENABLED When: 싱글톤 생성 Then: 해당 구현"""
+        monkeypatch.setattr(stock_repository_module, '_stock_repository_instance', None)
+        monkeypatch.setattr('app.core.config.settings.db_async_enabled', enabled)
+
+        assert type(get_stock_repository()) is expected
+
+    @pytest.mark.parametrize('url, expected', [
+        ('mysql+pymysql://u:p@db:3306/stock_data_cache', 'mysql+aiomysql://u:p@db:3306/stock_data_cache'),
+        ('mysql+aiomysql://u:p@db/x', 'mysql+aiomysql://u:p@db/x'),
+        ('sqlite:///cache.sqlite3', 'sqlite+aiosqlite:///cache.sqlite3'),
+    ])
+    def test_async_url(self, url, expected):
+        """Given: 동기 드라이버 URL When: get_async_url Then: 비동기 드라이버 (비밀번호 유지)"""
+        assert DatabaseConfig(database_url=url).get_async_url() == expected
+
+    def test_async_url_rejects_unknown_driver(self):
+        """Given: 비동기 드라이버가 없는 방언 When: get_async_url Then: ValueError"""
+        with pytest.raises(ValueError):
+            DatabaseConfig(database_url='oracle://u:p@db/x').get_async_url()
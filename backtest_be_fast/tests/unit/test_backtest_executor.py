@@ -0,0 +1,112 @@
+"""
+백테스트 프로세스 풀 실행기 단위 테스트
+
+**테스트 범위**:
+- 공유 메모리 DataFrame 전달 (인덱스 타임존, 정수 열 dtype 보존)
+- 동적 생성 전략 클래스 분해
+- 프로세스 풀 실행 결과가 스레드 실행과 동일한지
+
+**테스트 원칙**:
+- DB 없이 실행 (합성 가격 데이터)
+"""
+import asyncio
+
+import numpy as np
+import pandas as pd
+import pytest
+from backtesting import Backtest
+
+from app.services.backtest_executor import (
+    BacktestProcessExecutor,
+    _attach_frame,
+    _portable_strategy,
+    _share_frame,
+    run_backtest_with_fallback,
+)
+from app.strategies.strategies import SmaCrossStrategy
+
+
+def _ohlcv(periods: int = 300, tz=None) -> pd.DataFrame:
+    rng = np.random.default_rng(42)
+    index = pd.bdate_range('2022-01-03', periods=periods, tz=tz, name='Date')
+    close = 100 + rng.normal(0, 1, periods).cumsum()
+    return pd.DataFrame({
+        'Open': close + rng.normal(0, 0.3, periods),
+        'High': close + 1,
+        'Low': close - 1,
+        'Close': close,
+        'Volume': rng.integers(1_000, 10_000, periods).astype('int64'),
+    }, index=index)
+
+
+class TestSharedMemoryFrame:
+    """공유 메모리 왕복"""
+
+    @pytest.mark.parametrize("tz", [None, 'Asia/Seoul'])
+    def test_round_trip_preserves_frame(self, tz):
+        """Given: OHLCV DataFrame When: 공유 메모리 복사 후 복원 Then: 값/dtype/인덱스 동일"""
+        data = _ohlcv(tz=tz)
+        shm, meta = _share_frame(data)
+        try:
+            restored = _attach_frame(meta)
+        finally:
+            shm.close()
+            shm.unlink()
+
+        pd.testing.assert_frame_equal(restored, data, check_freq=False)
+
+    def test_non_numeric_frame_is_sent_as_is(self):
+        """Given: object 열 포함 When: 공유 Then: 공유 메모리 없이 원본 전달"""
+        data = _ohlcv(10).assign(Note='x')
+        shm, meta = _share_frame(data)
+
+        assert shm is None
+        assert meta['frame'] is data
+
+
+class TestPortableStrategy:
+    """전략 클래스 분해"""
+
+    def test_configured_class_is_split_into_base_and_overrides(self):
+        """Given: 파라미터 오버라이드 동적 클래스 When: 분해 Then: 기본 클래스 + 오버라이드"""
+        configured = type('SmaCrossStrategyConfigured_test', (SmaCrossStrategy,), {'short_window': 5})
+
+        base, overrides = _portable_strategy(configured)
+
+        assert base is SmaCrossStrategy
+        assert overrides == {'short_window': 5}
+
+    def test_importable_class_is_sent_as_is(self):
+        assert _portable_strategy(SmaCrossStrategy) == (SmaCrossStrategy, {})
+
+
+class TestProcessExecution:
+    """프로세스 풀 실행"""
+
+    @pytest.mark.asyncio
+    async def test_process_results_match_in_thread_results(self):
+        """Given: 같은 데이터/전략 When: 프로세스 풀과 현재 프로세스에서 실행 Then: 통계 동일"""
+        data = _ohlcv()
+        configured = type('SmaCrossStrategyConfigured_test', (SmaCrossStrategy,),
+                          {'short_window': 5, 'long_window': 20})
+        expected = run_backtest_with_fallback(Backtest(data, configured, cash=10_000, commission=0.002), {})
+
+        executor = BacktestProcessExecutor(max_workers=2, timeout_seconds=120)
+        try:
+            results = await asyncio.gather(*[
+                executor.run(data, configured, {'cash': 10_000, 'commission': 0.002}, {})
+                for _ in range(2)
+            ])
+        finally:
+            executor.shutdown()
+
+        for result in results:
+            for key in ['# Trades', 'Equity Final [$]', 'Return [%]', 'Max. Drawdown [%]']:
+                assert result[key] == expected[key]
+            pd.testing.assert_frame_equal(result['_equity_curve'], expected['_equity_curve'], check_freq=False)
+            assert isinstance(result['_strategy'], str)
+        assert executor.get_stats()['completed'] == 2
+
+    def test_single_worker_is_disabled(self):
+        """Given: 워커 1개 When: 생성 Then: 프로세스 풀 미사용"""
+        assert BacktestProcessExecutor(max_workers=1).enabled is False
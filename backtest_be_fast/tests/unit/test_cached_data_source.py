@@ -0,0 +1,192 @@
+"""
+2계층 캐시 데이터 소스 단위 테스트
+
+**테스트 범위**:
+- CachedDataSource.get_stock_data: 메모리 적중, 디스크 적중(새 인스턴스), 구간 병합
+- TTL: 오늘을 포함하는 구간, use_cache=False / cache_hours=0 우회
+- 종목 정보 / 티커 검증 캐시와 유효하지 않은 티커 음성 캐시
+
+**테스트 원칙**:
+- 원본 소스는 호출 횟수를 세는 메모리 가짜 구현 (외부 네트워크 호출 없음)
+- 디스크 계층은 tmp_path 사용
+"""
+import time
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.constants.data_loading import CacheConfig
+from app.interfaces.data_source import CachedDataSource, DataSource
+from app.utils.data_fetcher import InvalidSymbolError
+
+
+class CountingSource(DataSource):
+    """2023년 1월 영업일 주가를 반환하고 호출을 기록하는 메모리 소스 (BAD는 유효하지 않은 티커)"""
+
+    def __init__(self):
+        index = pd.bdate_range('2023-01-02', '2023-01-31', tz='America/New_York', name='Date')
+        self.frame = pd.DataFrame({
+            'Open': np.linspace(100, 120, len(index)),
+            'Close': np.linspace(100.5, 120.5, len(index)),
+            'Volume': np.arange(len(index), dtype='int64') * 1000,
+        }, index=index)
+        self.calls = []
+
+    def get_stock_data(self, ticker, start_date, end_date, use_cache=True, cache_hours=24):
+        self.calls.append(('prices', ticker, str(start_date), str(end_date)))
+        if ticker == 'BAD':
+            raise InvalidSymbolError(ticker)
+        local = self.frame.index.tz_localize(None)
+        mask = (local >= pd.Timestamp(start_date)) & (local <= pd.Timestamp(end_date))
+        return self.frame.loc[mask].copy()
+
+    def validate_ticker(self, ticker):
+        self.calls.append(('validate', ticker))
+        return ticker != 'BAD'
+
+    def get_ticker_info(self, ticker):
+        self.calls.append(('info', ticker))
+        if ticker == 'BAD':
+            return {'symbol': ticker, 'error': 'not found'}
+        return {'symbol': ticker, 'currency': 'USD'}
+
+
+@pytest.fixture
+def source():
+    return CountingSource()
+
+
+def _price_calls(source):
+    return [call for call in source.calls if call[0] == 'prices']
+
+
+class TestStockDataTiers:
+    """주가 2계층 캐시"""
+
+    def test_memory_hit_serves_sub_range(self, source, tmp_path):
+        """Given: 1월 전체 조회 When: 같은 구간, 안쪽 구간 재조회
+        Then: 원본 1회 호출, 안쪽 구간은 종료일 포함 슬라이스"""
+        cached = CachedDataSource(source, cache_dir=str(tmp_path))
+
+        first = cached.get_stock_data('aapl', date(2023, 1, 2), date(2023, 1, 31))
+        again = cached.get_stock_data('AAPL', date(2023, 1, 2), date(2023, 1, 31))
+        inner = cached.get_stock_data('AAPL', '2023-01-10', '2023-01-13')
+
+        assert len(_price_calls(source)) == 1
+        pd.testing.assert_frame_equal(again, first)
+        assert [d.day for d in inner.index] == [10, 11, 12, 13]
+
+    def test_disk_tier_survives_new_instance(self, source, tmp_path):
+        """Given: 한 인스턴스가 조회한 결과 When: 같은 디렉터리의 새 인스턴스로 조회 (2회)
+        Then: 원본 미호출, 값/타임존 동일, 첫 조회만 디스크 적중 (이후 메모리)"""
+        expected = CachedDataSource(source, cache_dir=str(tmp_path)).get_stock_data(
+            'AAPL', date(2023, 1, 2), date(2023, 1, 31)
+        )
+        reopened = CachedDataSource(source, cache_dir=str(tmp_path))
+
+        replayed = reopened.get_stock_data('AAPL', date(2023, 1, 2), date(2023, 1, 31))
+        reopened.get_stock_data('AAPL', date(2023, 1, 3), date(2023, 1, 6))
+
+        assert len(_price_calls(source)) == 1
+        pd.testing.assert_frame_equal(replayed, expected, check_freq=False)
+        assert str(replayed.index.tz) == 'America/New_York'
+        assert reopened.get_stats()['disk_hits'] == 1
+
+    def test_adjacent_ranges_merge(self, source, tmp_path):
+        """Given: 1월 전반부, 후반부 조회 When: 전체 구간 조회 (메모리, 새 인스턴스 디스크)
+        Then: 전체 구간은 원본 호출 없이 병합 결과로 응답"""
+        cached = CachedDataSource(source, cache_dir=str(tmp_path))
+        cached.get_stock_data('AAPL', date(2023, 1, 2), date(2023, 1, 15))
+        cached.get_stock_data('AAPL', date(2023, 1, 16), date(2023, 1, 31))
+
+        full = cached.get_stock_data('AAPL', date(2023, 1, 2), date(2023, 1, 31))
+        from_disk = CachedDataSource(source, cache_dir=str(tmp_path)).get_stock_data(
+            'AAPL', date(2023, 1, 2), date(2023, 1, 31)
+        )
+
+        assert len(_price_calls(source)) == 2
+        pd.testing.assert_frame_equal(full, source.frame, check_freq=False)
+        pd.testing.assert_frame_equal(from_disk, source.frame, check_freq=False)
+
+    def test_use_cache_false_and_zero_hours_bypass(self, source, tmp_path):
+        """Given: 캐시된 구간 When: use_cache=False, cache_hours=0으로 조회
+        Then: 매번 원본 호출"""
+        cached = CachedDataSource(source, cache_dir=str(tmp_path))
+        cached.get_stock_data('AAPL', date(2023, 1, 2), date(2023, 1, 31))
+
+        cached.get_stock_data('AAPL', date(2023, 1, 2), date(2023, 1, 31), use_cache=False)
+        cached.get_stock_data('AAPL', date(2023, 1, 2), date(2023, 1, 31), cache_hours=0)
+
+        assert len(_price_calls(source)) == 3
+
+    def test_expired_disk_range_is_refetched(self, source, tmp_path):
+        """Given: 1시간 유효로 저장된 구간 When: 2시간 뒤 새 인스턴스로 조회 Then: 원본 재호출"""
+        CachedDataSource(source, cache_dir=str(tmp_path)).get_stock_data(
+            'AAPL', date(2023, 1, 2), date(2023, 1, 31), cache_hours=1
+        )
+        later = time.time() + 7200
+
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(time, 'time', lambda: later)
+            CachedDataSource(source, cache_dir=str(tmp_path)).get_stock_data(
+                'AAPL', date(2023, 1, 2), date(2023, 1, 31)
+            )
+
+        assert len(_price_calls(source)) == 2
+
+    def test_ttl_depends_on_today(self):
+        """Given: cache_hours 24 When: 과거 구간 / 오늘을 포함하는 구간 TTL
+        Then: 과거는 24시간, 오늘 포함은 MEMORY_TTL_RECENT로 제한"""
+        today = date.today()
+
+        assert CachedDataSource._ttl_seconds(today - timedelta(days=1), 24) == 24 * 3600
+        assert CachedDataSource._ttl_seconds(today, 24) == CacheConfig.MEMORY_TTL_RECENT
+        assert CachedDataSource._ttl_seconds(today, 0.1) == 360
+
+
+class TestInfoAndNegativeCache:
+    """종목 정보 / 검증 / 음성 캐시"""
+
+    def test_info_and_validation_are_cached(self, source, tmp_path):
+        """Given: 유효한 티커 When: 정보/검증 2회씩 조회 Then: 원본 각 1회 호출"""
+        cached = CachedDataSource(source, cache_dir=str(tmp_path))
+
+        infos = [cached.get_ticker_info('aapl') for _ in range(2)]
+        valid = [cached.validate_ticker('AAPL') for _ in range(2)]
+
+        assert infos[0] == infos[1] == {'symbol': 'AAPL', 'currency': 'USD'}
+        assert valid == [True, True]
+        assert source.calls == [('info', 'AAPL'), ('validate', 'AAPL')]
+
+    def test_invalid_symbol_is_negatively_cached(self, source, tmp_path):
+        """Given: InvalidSymbolError를 내는 티커 When: 주가 2회, 검증, 정보 2회 조회
+        Then: 주가 원본 1회 후 캐시된 InvalidSymbolError, 검증은 원본 없이 False, 오류 정보도 캐시"""
+        cached = CachedDataSource(source, cache_dir=str(tmp_path))
+
+        for _ in range(2):
+            with pytest.raises(InvalidSymbolError):
+                cached.get_stock_data('BAD', date(2023, 1, 2), date(2023, 1, 31))
+        valid = cached.validate_ticker('BAD')
+        infos = [cached.get_ticker_info('BAD') for _ in range(2)]
+
+        assert valid is False
+        assert all('error' in info for info in infos)
+        assert source.calls == [('prices', 'BAD', '2023-01-02', '2023-01-31'), ('info', 'BAD')]
+        assert cached.get_stats()['negative_hits'] == 3
+
+    def test_negative_cache_expires_sooner(self, source, tmp_path):
+        """Given: negative_cache_hours=1, 검증 실패 캐시 When: 2시간 뒤 검증
+        Then: 원본 재호출"""
+        cached = CachedDataSource(source, cache_dir=str(tmp_path), negative_cache_hours=1)
+        cached.validate_ticker('BAD')
+        later = time.time() + 7200
+
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(time, 'time', lambda: later)
+            cached.validate_ticker('BAD')
+            cached.validate_ticker('AAPL')
+            cached.validate_ticker('AAPL')
+
+        assert source.calls == [('validate', 'BAD'), ('validate', 'BAD'), ('validate', 'AAPL')]
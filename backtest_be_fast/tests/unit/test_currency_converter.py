@@ -0,0 +1,110 @@
+"""
+CurrencyConverter.convert_dataframe_to_usd 단위 테스트
+
+**테스트 범위**:
+- 벡터화 변환 결과가 기존 행 단위 변환과 동일한지 (직접 환율 KRW=X, USD 환율 EURUSD=X)
+- 타임존이 있는 가격 인덱스, 환율 결측 구간
+
+**테스트 원칙**:
+- DB 없이 실행 (stock_repository mock)
+"""
+from unittest.mock import AsyncMock, Mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.utils.currency_converter import CurrencyConverter
+
+
+def _legacy_convert(converter: CurrencyConverter, data: pd.DataFrame, exchange_data: pd.DataFrame,
+                    currency: str) -> pd.DataFrame:
+    """기존 행 단위 변환 구현 (비교 기준)"""
+    converted = data.copy()
+    for idx in converted.index:
+        idx_no_tz = converter._remove_timezone(pd.DatetimeIndex([idx]))[0]
+        if idx_no_tz in exchange_data.index and pd.notna(exchange_data.loc[idx_no_tz, 'Close']):
+            multiplier = converter.get_conversion_multiplier(currency, exchange_data.loc[idx_no_tz, 'Close'])
+            for col in ['Open', 'High', 'Low', 'Close']:
+                if col in converted.columns:
+                    converted.loc[idx, col] *= multiplier
+    return converted
+
+
+def _price_frame(index: pd.DatetimeIndex) -> pd.DataFrame:
+    rng = np.random.default_rng(7)
+    close = 50000 + rng.normal(0, 500, len(index)).cumsum()
+    return pd.DataFrame({
+        'Open': close * 0.99, 'High': close * 1.01, 'Low': close * 0.98, 'Close': close,
+        'Volume': rng.integers(1000, 5000, len(index)),
+    }, index=index)
+
+
+def _fx_frame(start: str, end: str, level: float, missing: slice = None) -> pd.DataFrame:
+    index = pd.DatetimeIndex(pd.bdate_range(start, end), name='date')
+    close = level + np.sin(np.arange(len(index)) / 10)
+    if missing is not None:
+        close[missing] = np.nan
+    return pd.DataFrame({'Close': close}, index=index)
+
+
+@pytest.fixture
+def converter():
+    converter = CurrencyConverter()
+    converter.stock_repository = Mock()
+    return converter
+
+
+class TestConvertDataFrameToUsd:
+    """벡터화 변환 동등성"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("currency,level", [('KRW', 1300.0), ('JPY', 140.0), ('EUR', 1.1)])
+    async def test_matches_row_by_row_conversion(self, converter, currency, level):
+        """Given: 타임존 있는 가격 데이터와 환율
+        When: USD 변환
+        Then: 기존 행 단위 변환과 동일"""
+        index = pd.bdate_range('2023-01-02', '2023-12-29', tz='Asia/Seoul', name='Date')
+        data = _price_frame(index)
+        converter.stock_repository.load_stock_data_async = AsyncMock(
+            return_value=_fx_frame('2022-11-01', '2023-12-29', level)
+        )
+
+        result = await converter.convert_dataframe_to_usd(
+            'TEST', data, '2023-01-02', '2023-12-29', currency=currency
+        )
+
+        exchange_data = await converter.load_and_prepare_exchange_rates(
+            currency, '2023-01-02', '2023-12-29', target_date_range=data.index
+        )
+        expected = _legacy_convert(converter, data, exchange_data, currency)
+        pd.testing.assert_frame_equal(result, expected, check_exact=True)
+        assert result['Volume'].equals(data['Volume'])
+
+    @pytest.mark.asyncio
+    async def test_dates_without_rate_are_unchanged(self, converter):
+        """Given: 앞부분 환율이 결측인 환율 데이터
+        When: USD 변환
+        Then: 환율 없는 날짜는 원본 유지, 나머지는 행 단위 변환과 동일"""
+        index = pd.bdate_range('2023-01-02', '2023-03-31', name='Date')
+        data = _price_frame(index)
+        exchange_data = _fx_frame('2023-01-02', '2023-03-31', 1300.0, missing=slice(0, 10))
+        converter.load_and_prepare_exchange_rates = Mock(side_effect=_async_return(exchange_data))
+
+        result = await converter.convert_dataframe_to_usd('TEST', data, '2023-01-02', '2023-03-31', currency='KRW')
+
+        pd.testing.assert_frame_equal(result.iloc[:10], data.iloc[:10])
+        pd.testing.assert_frame_equal(result, _legacy_convert(converter, data, exchange_data, 'KRW'))
+
+    @pytest.mark.asyncio
+    async def test_usd_returns_input(self, converter):
+        """Given: USD 통화 When: 변환 Then: 원본 그대로"""
+        data = _price_frame(pd.bdate_range('2023-01-02', periods=5))
+        result = await converter.convert_dataframe_to_usd('AAPL', data, '2023-01-02', '2023-01-06', currency='USD')
+        assert result is data
+
+
+def _async_return(value):
+    async def _inner(*args, **kwargs):
+        return value
+    return _inner
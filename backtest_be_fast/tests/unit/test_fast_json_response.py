@@ -0,0 +1,111 @@
+"""
+orjson 응답 인코딩 경로 단위 테스트
+
+**테스트 범위**:
+- encode_json: numpy 배열/스칼라, Timestamp, NaN 처리, 기존 json 출력과 같은 내용
+- column_records / date_value_dict: 행 단위 변환과 같은 레코드
+- UnifiedDataService._transform_stock_data: Volume 누락/NaN은 0
+- FastJSONResponse: Server-Timing payload 헤더, 인코딩된 bytes 그대로 전송
+
+**테스트 원칙**:
+- 기존 iterrows / json.dumps 결과를 기준 결과로 사용
+"""
+import json
+
+import numpy as np
+import orjson
+import pandas as pd
+
+from app.api.v1.responses import FastJSONResponse
+from app.services.unified_data_service import UnifiedDataService
+from app.utils.serializers import column_records, date_value_dict, encode_json, recursive_serialize
+
+
+def _frame(volume=None) -> pd.DataFrame:
+    index = pd.bdate_range('2024-01-02', periods=5)
+    frame = pd.DataFrame({'Close': [10.0, 10.5, np.nan, 11.0, 11.25]}, index=index)
+    if volume is not None:
+        frame['Volume'] = volume
+    return frame
+
+
+class TestEncodeJson:
+    """orjson 인코딩"""
+
+    def test_matches_json_dumps_for_serialized_result(self):
+        """Given: recursive_serialize 결과 (NaN/Infinity 문자열, 한글) When: 인코딩
+        Then: json.dumps와 같은 내용"""
+        result = recursive_serialize({
+            'status': 'success',
+            'data': {'stats': {'Sharpe': float('nan'), 'PF': float('inf')}, 'name': '삼성전자', 'n': [1, 2.5, None]},
+        })
+
+        assert orjson.loads(encode_json(result)) == json.loads(json.dumps(result))
+        assert result['data']['stats'] == {'Sharpe': 'NaN', 'PF': 'Infinity'}
+
+    def test_numpy_pandas_values(self):
+        """Given: numpy 배열/스칼라, Series, Timestamp, 비문자열 키 When: 인코딩
+        Then: 배열 단위 변환, NaN은 null"""
+        body = encode_json({
+            'array': np.array([1.0, np.nan]),
+            'scalar': np.int64(3),
+            'series': pd.Series([0.5, 1.5]),
+            'when': pd.Timestamp('2024-01-02'),
+            1: 'int key',
+        })
+
+        assert orjson.loads(body) == {
+            'array': [1.0, None], 'scalar': 3, 'series': [0.5, 1.5], 'when': '2024-01-02T00:00:00', '1': 'int key'
+        }
+
+
+class TestColumnRecords:
+    """열 단위 레코드 변환"""
+
+    def test_column_records_match_iterrows(self):
+        """Given: 가격 DataFrame When: 열 단위 변환 Then: iterrows 변환과 같은 레코드 (Python 타입)"""
+        frame = _frame(volume=np.arange(5, dtype=np.int64))
+
+        records = column_records(frame.index, {'close': frame['Close'], 'volume': frame['Volume']})
+
+        expected = [
+            {'date': d.strftime('%Y-%m-%d'), 'close': float(row['Close']), 'volume': int(row['Volume'])}
+            for d, row in frame.iterrows()
+        ]
+        assert json.dumps(records) == json.dumps(expected)
+        assert type(records[0]['volume']) is int
+
+    def test_date_value_dict_scales(self):
+        """Given: 날짜 Series When: scale 적용 Then: {'YYYY-MM-DD': 값 * scale}"""
+        series = pd.Series([0.01, -0.02], index=pd.DatetimeIndex(['2024-01-02', '2024-01-03']))
+
+        assert date_value_dict(series, 100) == {'2024-01-02': 1.0, '2024-01-03': -2.0}
+
+    def test_stock_data_volume_defaults_to_zero(self):
+        """Given: Volume 열 없음 / NaN 포함 When: 주가 데이터 변환 Then: 0"""
+        service = UnifiedDataService()
+
+        without_volume = service._transform_stock_data(_frame())
+        with_nan = service._transform_stock_data(_frame(volume=[100.0, np.nan, 300.0, 400.0, 500.0]))
+
+        assert [row['volume'] for row in without_volume] == [0] * 5
+        assert [row['volume'] for row in with_nan] == [100, 0, 300, 400, 500]
+        assert with_nan[1] == {'date': '2024-01-03', 'price': 10.5, 'volume': 0}
+
+
+class TestFastJSONResponse:
+    """응답 클래스"""
+
+    def test_encodes_and_reports_payload_time(self):
+        """Given: numpy 값이 있는 응답 When: FastJSONResponse Then: orjson 본문과 Server-Timing 헤더"""
+        response = FastJSONResponse({'values': np.array([1.0, 2.0])})
+
+        assert response.body == b'{"values":[1.0,2.0]}'
+        assert response.headers['content-type'] == 'application/json'
+        assert response.headers['server-timing'].startswith('payload;dur=')
+
+    def test_bytes_content_is_sent_as_is(self):
+        """Given: 이미 인코딩된 본문 (결과 캐시) When: FastJSONResponse Then: 재인코딩 없이 그대로"""
+        body = '{"status":"success","name":"삼성전자"}'.encode('utf-8')
+
+        assert FastJSONResponse(body).body == body
@@ -0,0 +1,122 @@
+"""
+티커별 병합 LRU 캐시 단위 테스트
+
+**테스트 범위**:
+- 하위 구간 슬라이스 응답, 겹치는 구간 병합
+- 커버리지 TTL 만료
+- 바이트 예산 기반 LRU 제거 및 통계
+- YfinanceDataRepository 메모리 캐시 계층
+
+**테스트 원칙**:
+- DB/네트워크 없이 실행
+"""
+import time
+from unittest.mock import AsyncMock, Mock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.utils.frame_cache import TickerFrameCache
+
+
+def _frame(start: str, periods: int) -> pd.DataFrame:
+    index = pd.DatetimeIndex(pd.bdate_range(start, periods=periods), name='date')
+    close = np.arange(periods, dtype=float) + 100
+    return pd.DataFrame({'Close': close, 'Volume': np.arange(periods, dtype='int64')}, index=index)
+
+
+def _cache(max_bytes: int = 10 * 1024 * 1024, ttl: int = 3600) -> TickerFrameCache:
+    return TickerFrameCache(max_bytes=max_bytes, ttl_resolver=lambda end: ttl)
+
+
+class TestTickerFrameCache:
+    """캐시 동작"""
+
+    def test_sub_range_is_sliced(self):
+        """Given: 1월 전체 캐시 When: 중간 구간 조회 Then: 해당 행만 반환"""
+        cache = _cache()
+        df = _frame('2023-01-02', 22)
+        cache.put('AAPL', '2023-01-01', '2023-01-31', df)
+
+        result = cache.get('AAPL', '2023-01-10', '2023-01-20')
+
+        pd.testing.assert_frame_equal(result, df.loc['2023-01-10':'2023-01-20'])
+
+    def test_uncovered_range_is_miss(self):
+        """Given: 1월 캐시 When: 1~2월 조회 Then: None, 미스 집계"""
+        cache = _cache()
+        cache.put('AAPL', '2023-01-01', '2023-01-31', _frame('2023-01-02', 22))
+
+        assert cache.get('AAPL', '2023-01-15', '2023-02-15') is None
+        assert cache.get_stats()['misses'] == 1
+
+    def test_overlapping_ranges_merge_into_one_frame(self):
+        """Given: 겹치는 두 구간 When: 병합 Then: 중복 없는 단일 프레임, 합친 구간 히트"""
+        cache = _cache()
+        cache.put('AAPL', '2023-01-01', '2023-01-31', _frame('2023-01-02', 22))
+        cache.put('AAPL', '2023-01-15', '2023-02-28', _frame('2023-01-16', 32))
+
+        stats = cache.get_stats()
+        assert stats['total_entries'] == 1
+        assert stats['tickers']['AAPL']['coverage'] == [
+            {'start': '2023-01-01', 'end': '2023-02-28', 'expired': False}
+        ]
+        result = cache.get('AAPL', '2023-01-01', '2023-02-28')
+        assert result.index.is_unique and result.index.is_monotonic_increasing
+        assert stats['tickers']['AAPL']['rows'] == len(result)
+
+    def test_expired_coverage_is_miss(self):
+        """Given: TTL 경과 When: 조회 Then: None"""
+        cache = _cache(ttl=60)
+        cache.put('AAPL', '2023-01-01', '2023-01-31', _frame('2023-01-02', 22))
+
+        with patch('app.utils.frame_cache.time.time', return_value=time.time() + 120):
+            assert cache.get('AAPL', '2023-01-02', '2023-01-10') is None
+
+    def test_lru_eviction_under_byte_budget(self):
+        """Given: 두 티커 분량 예산 When: 세 번째 티커 추가 Then: 가장 오래 미사용 티커 제거"""
+        nbytes = int(_frame('2023-01-02', 100).memory_usage(deep=True).sum())
+        cache = _cache(max_bytes=nbytes * 2)
+
+        cache.put('A', '2023-01-01', '2023-06-30', _frame('2023-01-02', 100))
+        cache.put('B', '2023-01-01', '2023-06-30', _frame('2023-01-02', 100))
+        cache.get('A', '2023-01-02', '2023-01-10')  # A 최근 사용
+        cache.put('C', '2023-01-01', '2023-06-30', _frame('2023-01-02', 100))
+
+        stats = cache.get_stats()
+        assert set(stats['tickers']) == {'A', 'C'}
+        assert stats['evictions'] == 1
+        assert stats['total_bytes'] == nbytes * 2
+
+    def test_invalidate_releases_bytes(self):
+        """Given: 캐시된 티커 When: 무효화 Then: 바이트 0"""
+        cache = _cache()
+        cache.put('AAPL', '2023-01-01', '2023-01-31', _frame('2023-01-02', 22))
+
+        assert cache.invalidate('AAPL') is True
+        assert cache.get_stats()['total_bytes'] == 0
+
+
+class TestDataRepositoryMemoryCache:
+    """YfinanceDataRepository 메모리 계층"""
+
+    @pytest.mark.asyncio
+    async def test_sub_range_served_from_memory(self):
+        """Given: 넓은 구간 조회 후 When: 하위 구간 조회 Then: DB 재조회 없음, 통계 반영"""
+        from app.repositories.data_repository import YfinanceDataRepository
+
+        repo = YfinanceDataRepository()
+        df = _frame('2023-01-02', 22)
+        nbytes = int(df.memory_usage(deep=True).sum())
+        repo.stock_repository = Mock()
+        repo.stock_repository.load_stock_data_async = AsyncMock(return_value=df)
+
+        await repo.get_stock_data('AAPL', '2023-01-01', '2023-01-31')
+        result = await repo.get_stock_data('AAPL', '2023-01-05', '2023-01-12')
+
+        assert repo.stock_repository.load_stock_data_async.await_count == 1
+        assert len(result) == 6
+        stats = await repo.get_cache_stats()
+        assert stats['memory_cache']['memory_usage_bytes'] == nbytes
+        assert stats['cache_hit_rate'] == 0.5
@@ -0,0 +1,138 @@
+"""
+누락 구간 보완(gap fill) 작업 단위 및 비차단 재시도 단위 테스트
+
+**테스트 범위**:
+- 누락 구간 저장과 최종 조회가 같은 연결에서 수행 (재연결/sleep 없음)
+- retry_async: 선형 백오프, 마지막 예외 전파, 대기 중 워커 스레드 비점유
+- StockRepository.load_stock_data_async: 시도당 1회 조회 + 이벤트 루프 대기
+
+**테스트 원칙**:
+- MySQL 대신 SQLite 인메모리 엔진 사용 (tests/conftest.py: sqlite_price_engine, sqlite_save), yfinance 호출은 mock
+"""
+import asyncio
+import threading
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from app.repositories.stock_repository import StockRepository
+from app.services import yfinance_db
+from app.utils.retry import retry_async
+
+
+@pytest.fixture
+def engine(sqlite_price_engine):
+    return sqlite_price_engine({'AAPL': pd.bdate_range('2023-01-02', '2023-01-31')})
+
+
+class TestGapFillUnitOfWork:
+    """누락 구간 보완 후 같은 연결로 조회"""
+
+    def test_fill_and_read_on_single_connection(self, engine, sqlite_save):
+        """Given: DB에 1월만 있음
+        When: 1~2월 조회
+        Then: 2월을 저장한 같은 연결로 전체 구간 조회, 재연결/대기 없음"""
+        february = pd.DataFrame({'Close': 2.0}, index=pd.bdate_range('2023-01-26', '2023-03-03'))
+        connects = []
+        original_connect = engine.connect
+
+        def counting_connect():
+            connects.append(1)
+            return original_connect()
+
+        with patch('app.services.yfinance_db._get_engine', return_value=engine), \
+                patch.object(engine, 'connect', side_effect=counting_connect), \
+                patch('app.services.yfinance_db.data_fetcher') as fetcher, \
+                patch('app.services.yfinance_db.time.sleep') as sleep:
+            fetcher.fetch_stock_data.return_value = february.loc['2023-02-01':]
+            df = yfinance_db._load_ticker_data_internal('AAPL', '2023-01-02', '2023-02-28')
+
+        assert len(connects) == 1
+        sleep.assert_not_called()
+        sqlite_save.assert_called_once()
+        assert df.index.min() == pd.Timestamp('2023-01-02')
+        assert df.index.max() == pd.Timestamp('2023-02-28')
+        assert (df.loc['2023-02-01':, 'Close'] == 2).all()
+
+
+class TestRetryAsync:
+    """비차단 재시도 스케줄러"""
+
+    @pytest.mark.asyncio
+    async def test_backoff_then_success(self):
+        """Given: 두 번 실패 후 성공하는 작업 When: retry_async Then: 2, 4초 대기 후 결과"""
+        attempts = []
+
+        async def operation():
+            attempts.append(1)
+            if len(attempts) < 3:
+                raise ValueError("일시 오류")
+            return 'ok'
+
+        with patch('app.utils.retry.asyncio.sleep') as sleep:
+            result = await retry_async(operation, max_retries=3, retry_delay=2.0)
+
+        assert result == 'ok'
+        assert [call.args[0] for call in sleep.await_args_list] == [2.0, 4.0]
+
+    @pytest.mark.asyncio
+    async def test_last_exception_is_raised(self):
+        """Given: 항상 실패 When: retry_async Then: 마지막 예외 전파, 마지막 시도 후 대기 없음"""
+        async def operation():
+            raise ValueError("데이터 없음")
+
+        with patch('app.utils.retry.asyncio.sleep') as sleep:
+            with pytest.raises(ValueError, match="데이터 없음"):
+                await retry_async(operation, max_retries=2, retry_delay=0.5)
+
+        assert sleep.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_worker_is_released_during_backoff(self):
+        """Given: 워커 스레드에서 실패하는 조회 When: 백오프 대기 중 Then: 스레드에서 실행 중인 작업 없음"""
+        running = []
+        attempts = []
+
+        def blocking_load():
+            running.append(threading.get_ident())
+            attempts.append(1)
+            try:
+                if len(attempts) == 1:
+                    raise ValueError("일시 오류")
+                return 'ok'
+            finally:
+                running.pop()
+
+        task = asyncio.create_task(
+            retry_async(lambda: asyncio.to_thread(blocking_load), max_retries=2, retry_delay=0.2)
+        )
+        await asyncio.sleep(0.1)
+        assert len(attempts) == 1
+        assert running == []
+        assert await task == 'ok'
+
+
+class TestLoadStockDataAsync:
+    """Repository 비동기 조회"""
+
+    @pytest.mark.asyncio
+    async def test_each_attempt_is_single_shot(self):
+        """Given: 첫 시도 실패 When: load_stock_data_async Then: 시도마다 max_retries=1 조회, 두 번째에 성공"""
+        repo = StockRepository()
+        frame = pd.DataFrame({'Close': [1.0]}, index=pd.DatetimeIndex(['2023-01-03'], name='date'))
+        calls = []
+
+        def load(ticker, start_date, end_date, max_retries, retry_delay):
+            calls.append((max_retries, retry_delay))
+            if len(calls) == 1:
+                raise ValueError("AAPL 데이터가 비어있습니다")
+            return frame
+
+        with patch('app.repositories.stock_repository.yfinance_db.load_ticker_data', side_effect=load), \
+                patch('app.utils.retry.asyncio.sleep') as sleep:
+            result = await repo.load_stock_data_async('AAPL', '2023-01-01', '2023-01-31')
+
+        assert result is frame
+        assert calls == [(1, 0.0), (1, 0.0)]
+        sleep.assert_awaited_once_with(2.0)
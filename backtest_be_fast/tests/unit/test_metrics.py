@@ -0,0 +1,166 @@
+"""
+요청 시간 측정 / Prometheus 메트릭 단위 테스트
+
+**테스트 범위**:
+- MetricsRegistry.render: 카운터/히스토그램 텍스트 형식, 라벨 이스케이프, 수집기 값
+- span: 요청 RequestTimings 누적 (asyncio.to_thread 전파), 요청 밖에서는 히스토그램만 기록
+- connection_manager 계측: db_queries_total, db_pool_checkout_wait_seconds
+- BacktestEngine: execution_time_seconds가 실제 경과 시간
+- app.main: Server-Timing 헤더, /metrics 엔드포인트
+
+**테스트 원칙**:
+- 전역 metrics는 테스트마다 reset (수집기는 유지)
+- DB는 SQLite 파일, 외부 네트워크 호출 없음
+"""
+import asyncio
+import time
+from datetime import datetime
+
+import pandas as pd
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from app.main import app
+from app.schemas.requests import BacktestRequest
+from app.services.backtest_engine import BacktestEngine
+from app.services.database.connection_manager import TimedQueuePool, instrument_engine
+from app.utils.metrics import MetricsRegistry, current_timings, metrics, span, start_request_timings
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+class TestRegistry:
+    """레지스트리 / 텍스트 형식"""
+
+    def test_render_counters_and_histograms(self):
+        """Given: 카운터 2회, 히스토그램 관측 2개 When: render
+        Then: HELP/TYPE 헤더, 누적 버킷, +Inf/_sum/_count"""
+        registry = MetricsRegistry(buckets=(0.1, 1.0))
+        registry.inc('yfinance_calls_total', method='history')
+        registry.inc('yfinance_calls_total', method='history')
+        registry.observe('backtest_stage_duration_seconds', 0.05, stage='data_load')
+        registry.observe('backtest_stage_duration_seconds', 0.5, stage='data_load')
+
+        lines = registry.render().splitlines()
+
+        assert '# TYPE yfinance_calls_total counter' in lines
+        assert 'yfinance_calls_total{method="history"} 2' in lines
+        assert '# TYPE backtest_stage_duration_seconds histogram' in lines
+        assert 'backtest_stage_duration_seconds_bucket{stage="data_load",le="0.1"} 1' in lines
+        assert 'backtest_stage_duration_seconds_bucket{stage="data_load",le="1"} 2' in lines
+        assert 'backtest_stage_duration_seconds_bucket{stage="data_load",le="+Inf"} 2' in lines
+        assert 'backtest_stage_duration_seconds_sum{stage="data_load"} 0.550000' in lines
+        assert 'backtest_stage_duration_seconds_count{stage="data_load"} 2' in lines
+
+    def test_collector_values_and_label_escaping(self):
+        """Given: get_stats 수집기, 따옴표가 있는 라벨 When: render
+        Then: 수집기 값이 카운터로 노출, 라벨 값 이스케이프, 실패한 수집기는 무시"""
+        registry = MetricsRegistry()
+        registry.register_collector(lambda: [('cache_hits_total', {'cache': 'result'}, 3)])
+        registry.register_collector(lambda: 1 / 0)
+        registry.inc('db_queries_total', engine='a"b')
+
+        body = registry.render()
+
+        assert 'cache_hits_total{cache="result"} 3' in body
+        assert 'db_queries_total{engine="a\\"b"} 1' in body
+
+
+class TestSpan:
+    """단계 시간 측정"""
+
+    @pytest.mark.asyncio
+    async def test_span_accumulates_into_request_timings(self):
+        """Given: 요청 RequestTimings When: 같은 단계 2회 + to_thread 안의 단계
+        Then: 단계별 누적, Server-Timing 값에 total 포함, 히스토그램에도 기록"""
+        timings = start_request_timings()
+
+        def encode():
+            with span('serialization'):
+                time.sleep(0.01)
+
+        with span('data_load'):
+            await asyncio.sleep(0.01)
+        with span('data_load'):
+            pass
+        await asyncio.to_thread(encode)
+
+        stages = timings.as_dict()
+        assert set(stages) == {'data_load', 'serialization'}
+        assert stages['serialization'] >= 10
+        header = timings.server_timing().split(', ')
+        assert header[0].startswith('data_load;dur=') and header[-1].startswith('total;dur=')
+        assert metrics.get_histogram('backtest_stage_duration_seconds', stage='data_load')[0] == 2
+
+    def test_span_outside_request_only_observes(self):
+        """Given: 요청 컨텍스트 없음 When: span Then: 예외 없이 히스토그램만 기록"""
+        assert current_timings() is None
+
+        with span('gap_fill'):
+            pass
+
+        assert metrics.get_histogram('backtest_stage_duration_seconds', stage='gap_fill')[0] == 1
+
+
+class TestDatabaseInstrumentation:
+    """DB 계측"""
+
+    def test_queries_and_checkout_wait_are_recorded(self, tmp_path):
+        """Given: TimedQueuePool + instrument_engine SQLite 엔진 When: 쿼리 2회
+        Then: db_queries_total 2, 체크아웃 관측 2회"""
+        engine = instrument_engine(
+            create_engine(f"sqlite:///{tmp_path / 'm.sqlite3'}", poolclass=TimedQueuePool, pool_size=1),
+            'sync',
+        )
+        try:
+            for _ in range(2):
+                with engine.connect() as conn:
+                    conn.execute(text('SELECT 1'))
+        finally:
+            engine.dispose()
+
+        assert metrics.get_counter('db_queries_total', engine='sync') == 2
+        assert metrics.get_histogram('db_pool_checkout_wait_seconds', engine='sync')[0] == 2
+
+
+class TestExecutionTime:
+    """BacktestEngine 실행 시간"""
+
+    def test_execution_time_is_measured(self):
+        """Given: 0.2초 전에 시작한 실행 When: fallback 결과 생성
+        Then: execution_time_seconds가 하드코딩 값이 아닌 실제 경과 시간"""
+        request = BacktestRequest(
+            ticker='AAPL', start_date='2023-01-03', end_date='2023-01-31',
+            initial_cash=10000, strategy='buy_hold_strategy',
+        )
+        index = pd.bdate_range('2023-01-03', periods=20)
+        data = pd.DataFrame({'Open': 100.0, 'High': 101.0, 'Low': 99.0, 'Close': 100.0, 'Volume': 1}, index=index)
+
+        result = BacktestEngine()._create_fallback_result(data, request, started=time.perf_counter() - 0.2)
+
+        assert 0.2 <= result.execution_time_seconds < 5
+        assert result.timestamp <= datetime.now()
+
+
+class TestEndpoints:
+    """미들웨어 / /metrics"""
+
+    def test_server_timing_header_and_metrics_endpoint(self):
+        """Given: 앱 When: /health 후 /metrics 조회
+        Then: Server-Timing total 헤더, Prometheus 텍스트에 요청 히스토그램과 캐시 카운터"""
+        client = TestClient(app)
+
+        health = client.get('/health')
+        scrape = client.get('/metrics')
+
+        assert health.headers['server-timing'].startswith('total;dur=')
+        assert scrape.headers['content-type'].startswith('text/plain; version=0.0.4')
+        assert 'http_request_duration_seconds_count{method="GET",path="/health"} 1' in scrape.text
+        assert 'cache_hits_total{cache="result"}' in scrape.text
+        assert 'cache_misses_total{cache="frame"}' in scrape.text
@@ -0,0 +1,125 @@
+"""
+전략 파라미터 최적화 서비스 단위 테스트
+
+**테스트 범위**:
+- build_combinations: 제약 조건 가지치기, grid 상한, 시드 고정 random 표본
+- run_optimization: 가격 데이터 1회 조회, 지표 순위, 히트맵 행렬, 진행률
+
+**테스트 원칙**:
+- 합성 가격 데이터 사용 (DB/yfinance 호출 없음)
+- 가격 로더만 mock, 조합 실행은 실제 BacktestEngine 경로 (프로세스 풀 비활성화)
+"""
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.core.exceptions import ValidationError
+from app.schemas.requests import OptimizationRequest
+from app.services.backtest_engine import BacktestEngine
+from app.services.optimization_service import ParameterOptimizationService
+
+
+@pytest.fixture
+def price_data():
+    index = pd.bdate_range('2022-01-03', periods=300)
+    rng = np.random.default_rng(7)
+    close = 100 * np.exp(np.cumsum(rng.normal(0.0005, 0.015, len(index))))
+    return pd.DataFrame({
+        'Open': close, 'High': close * 1.01, 'Low': close * 0.99, 'Close': close,
+        'Volume': 1_000_000,
+    }, index=index)
+
+
+@pytest.fixture
+def service(price_data):
+    engine = BacktestEngine(data_repository=MagicMock(), executor=MagicMock(enabled=False))
+    engine._get_price_data = AsyncMock(return_value=price_data)
+    engine._convert_to_usd = AsyncMock(side_effect=lambda ticker, data, start, end: data)
+    return ParameterOptimizationService(engine=engine)
+
+
+class TestBuildCombinations:
+    """조합 생성"""
+
+    def test_constraint_violations_are_pruned(self, service):
+        """Given: short_window >= long_window 조합 포함 When: grid 생성 Then: 위반 조합 제거"""
+        combos, total, pruned = service.build_combinations(
+            'sma_strategy', {'short_window': [10, 20, 30], 'long_window': [20, 30]}
+        )
+
+        assert total == 6
+        assert pruned == 3
+        assert all(c['short_window'] < c['long_window'] for c in combos)
+
+    def test_grid_over_cap_is_rejected(self, service):
+        """Given: 조합 수가 상한 초과 When: grid 생성 Then: ValidationError"""
+        with pytest.raises(ValidationError):
+            service.build_combinations(
+                'sma_strategy',
+                {'short_window': [2, 3, 4], 'long_window': [50, 60]},
+                max_combinations=5,
+            )
+
+    def test_unknown_parameter_is_rejected(self, service):
+        """Given: 전략에 없는 파라미터 When: 생성 Then: ValidationError"""
+        with pytest.raises(ValidationError):
+            service.build_combinations('sma_strategy', {'window': [5, 10]})
+
+    def test_random_sampling_is_seeded(self, service):
+        """Given: 같은 시드 When: random 표본 두 번 Then: 같은 조합, 요청 표본 수 이하"""
+        grid = {'short_window': list(range(2, 12)), 'long_window': list(range(100, 200, 10))}
+
+        first, total, _ = service.build_combinations('sma_strategy', grid, search_mode='random', n_samples=15, seed=3)
+        second, _, _ = service.build_combinations('sma_strategy', grid, search_mode='random', n_samples=15, seed=3)
+
+        assert total == 100
+        assert first == second
+        assert len(first) == 15
+
+
+class TestRunOptimization:
+    """조합 평가"""
+
+    @pytest.mark.asyncio
+    async def test_ranking_heatmap_and_progress(self, service):
+        """Given: 2x2 유효 조합 When: 최적화 실행 Then: 순위 내림차순, 2x2 히트맵, 진행률 완료"""
+        request = OptimizationRequest(
+            ticker='AAPL', start_date='2022-01-03', end_date='2023-02-24', strategy='sma_strategy',
+            param_grid={'short_window': [5, 10], 'long_window': [20, 40]},
+            rank_by='total_return_pct', job_id='job-1',
+        )
+
+        result = await service.run_optimization(request)
+
+        service.engine._get_price_data.assert_awaited_once()
+        assert result['evaluated'] == 4
+        assert result['failed'] == 0
+        returns = [row['metrics']['total_return_pct'] for row in result['results']]
+        assert returns == sorted(returns, reverse=True)
+        assert result['best'] == result['results'][0]
+        assert [row['rank'] for row in result['results']] == [1, 2, 3, 4]
+
+        heatmap = result['heatmap']
+        assert heatmap['x_param'] == 'short_window'
+        assert heatmap['x_values'] == [5, 10]
+        assert heatmap['y_values'] == [20, 40]
+        assert all(value is not None for row in heatmap['values'] for value in row)
+
+        progress = service.get_progress('job-1')
+        assert progress['status'] == 'completed'
+        assert progress['completed'] == progress['total'] == 4
+
+    @pytest.mark.asyncio
+    async def test_unknown_rank_metric_is_rejected(self, service):
+        """Given: 지원하지 않는 순위 지표 When: 실행 Then: 데이터 조회 전에 ValidationError"""
+        request = OptimizationRequest(
+            ticker='AAPL', start_date='2022-01-03', end_date='2023-02-24', strategy='sma_strategy',
+            param_grid={'short_window': [5]}, rank_by='alpha',
+        )
+
+        with pytest.raises(ValidationError):
+            await service.run_optimization(request)
+
+        service.engine._get_price_data.assert_not_awaited()
@@ -0,0 +1,98 @@
+"""
+포트폴리오 계산 서비스 단위 테스트
+
+**테스트 범위**:
+- _calculate_realistic_equity_curve: 종목 equity 합산, 거래일이 다른 종목 정렬, 현금 고정값, 비중 히스토리
+- _get_max_consecutive: run-length 기반 최대 연속 길이
+
+**테스트 원칙**:
+- 손으로 계산 가능한 작은 equity curve 사용
+- 출력 형식(equity_curve / daily_returns / weight_history) 유지 확인
+"""
+import pandas as pd
+import pytest
+
+from app.services.portfolio_calculator_service import PortfolioCalculator
+
+
+def _result(amount, curve=None):
+    final_value = list(curve.values())[-1] if curve else amount
+    return {
+        'amount': amount,
+        'final_value': final_value,
+        'strategy_stats': {'equity_curve': curve} if curve else {},
+    }
+
+
+class TestRealisticEquityCurve:
+    """종목 equity curve 합산"""
+
+    @pytest.mark.asyncio
+    async def test_sum_returns_and_weights(self):
+        """Given: 두 종목 + 현금 When: 합산 Then: 일자별 합계, 백분율 수익률, 비중(date 키 우선)"""
+        portfolio_results = {
+            'AAPL': _result(100.0, {'2024-01-02': 100.0, '2024-01-03': 110.0, '2024-01-04': 121.0}),
+            'MSFT': _result(100.0, {'2024-01-02': 100.0, '2024-01-03': 90.0, '2024-01-04': 99.0}),
+            'CASH': _result(50.0),
+        }
+
+        equity_curve, daily_returns, weight_history = await PortfolioCalculator()._calculate_realistic_equity_curve(
+            None, portfolio_results, 250.0
+        )
+
+        assert equity_curve == {'2024-01-02': 250.0, '2024-01-03': 250.0, '2024-01-04': 270.0}
+        assert daily_returns == {'2024-01-02': 0.0, '2024-01-03': 0.0, '2024-01-04': pytest.approx(8.0)}
+        assert list(weight_history[0]) == ['date', 'AAPL', 'MSFT', 'CASH']
+        assert weight_history[2] == {
+            'date': '2024-01-04',
+            'AAPL': pytest.approx(121 / 270),
+            'MSFT': pytest.approx(99 / 270),
+            'CASH': pytest.approx(50 / 270),
+        }
+
+    @pytest.mark.asyncio
+    async def test_calendar_gaps_forward_fill(self):
+        """Given: 다른 거래일(휴장일) 종목, 늦게 시작하는 종목
+        When: 합산 Then: 휴장일은 직전 값 유지, 시작 전 구간은 초기 투자금"""
+        portfolio_results = {
+            'AAPL': _result(100.0, {'2024-01-02': 100.0, '2024-01-03': 105.0, '2024-01-05': 120.0}),
+            '005930.KS': _result(200.0, {'2024-01-04': 210.0, '2024-01-05': 220.0}),
+        }
+
+        equity_curve, _, _ = await PortfolioCalculator()._calculate_realistic_equity_curve(
+            None, portfolio_results, 300.0
+        )
+
+        assert equity_curve == {
+            '2024-01-02': 300.0,
+            '2024-01-03': 305.0,
+            '2024-01-04': 315.0,  # AAPL 휴장 → 105 유지
+            '2024-01-05': 340.0,
+        }
+
+    @pytest.mark.asyncio
+    async def test_zero_value_day_has_zero_weights(self):
+        """Given: 합계가 0인 날 When: 합산 Then: 비중 0, 다음 날 수익률 0"""
+        portfolio_results = {'AAPL': _result(100.0, {'2024-01-02': 0.0, '2024-01-03': 10.0})}
+
+        _, daily_returns, weight_history = await PortfolioCalculator()._calculate_realistic_equity_curve(
+            None, portfolio_results, 100.0
+        )
+
+        assert weight_history[0]['AAPL'] == 0
+        assert daily_returns['2024-01-03'] == 0.0
+
+
+class TestMaxConsecutive:
+    """최대 연속 길이"""
+
+    @pytest.mark.parametrize('values, target, expected', [
+        ([True, True, False, True, True, True, False], True, 3),
+        ([True, True, False, True, True, True, False], False, 1),
+        ([False, False, False], True, 0),
+        ([], True, 0),
+        ([True], True, 1),
+    ])
+    def test_run_lengths(self, values, target, expected):
+        """Given: 부울 시리즈 When: 최대 연속 길이 Then: 가장 긴 target 구간 길이"""
+        assert PortfolioCalculator._get_max_consecutive(pd.Series(values, dtype=bool), target) == expected
@@ -0,0 +1,143 @@
+"""
+포트폴리오 몬테카를로 시뮬레이션 단위 테스트
+
+**테스트 범위**:
+- resample_indices: bootstrap / block 인덱스 형태, block 연속성
+- path_statistics: 단일 경로 CAGR / 최대 낙폭 / 샤프 비율 수식
+- simulate_returns: 시드 재현성, 청크 크기 불변성, 분포 요약
+- PortfolioService.run_monte_carlo: 백테스트 결과(daily_returns, trade_log) 연결
+- PortfolioService.run_portfolio_backtest: 시뮬레이션 실패 시 백테스트 결과 유지
+
+**테스트 원칙**:
+- 합성 수익률 사용 (DB 없음)
+- 결과 값은 직접 계산한 기대값과 비교
+"""
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+import pytest
+
+from app.schemas.schemas import MonteCarloOptions, PortfolioBacktestRequest
+from app.services.portfolio.portfolio_monte_carlo import PortfolioMonteCarlo
+from app.services.portfolio_service import PortfolioService
+
+
+@pytest.fixture
+def daily_returns():
+    return np.random.default_rng(0).normal(0.0004, 0.012, 756)
+
+
+class TestResampleIndices:
+    """재표본 인덱스"""
+
+    def test_block_indices_are_contiguous_and_wrap(self):
+        """Given: block_size 5 When: block 인덱스 생성 Then: 블록 내부는 +1씩 순환 증가, 길이 = 일수"""
+        rng = np.random.default_rng(1)
+
+        indices = PortfolioMonteCarlo.resample_indices(rng, 50, 23, method='block', block_size=5)
+
+        assert indices.shape == (50, 23)
+        blocks = indices[:, :20].reshape(50, 4, 5)
+        assert np.all(np.diff(blocks, axis=2) % 23 == 1)
+
+    def test_bootstrap_indices_within_range(self):
+        """Given: bootstrap When: 인덱스 생성 Then: 0 <= idx < 일수"""
+        indices = PortfolioMonteCarlo.resample_indices(np.random.default_rng(1), 10, 30)
+
+        assert indices.shape == (10, 30)
+        assert indices.min() >= 0 and indices.max() < 30
+
+
+class TestPathStatistics:
+    """경로별 지표"""
+
+    def test_single_path_metrics(self):
+        """Given: +10%, -20%, +5% When: 지표 계산 Then: 낙폭은 고점 대비, CAGR은 252일 연환산"""
+        returns = np.array([[0.10, -0.20, 0.05]])
+
+        stats = PortfolioMonteCarlo.path_statistics(returns)
+
+        final = 1.1 * 0.8 * 1.05
+        assert stats['final_multiple'][0] == pytest.approx(final)
+        assert stats['max_drawdown_pct'][0] == pytest.approx(-20.0)
+        assert stats['cagr_pct'][0] == pytest.approx((final ** (252 / 3) - 1) * 100)
+        assert stats['sharpe_ratio'][0] == pytest.approx(returns.mean() / returns.std(ddof=1) * np.sqrt(252))
+
+    def test_drawdown_from_first_day_loss(self):
+        """Given: 첫날부터 하락 When: 지표 계산 Then: 시작 자산 1.0 기준 낙폭"""
+        stats = PortfolioMonteCarlo.path_statistics(np.array([[-0.1, 0.0]]))
+
+        assert stats['max_drawdown_pct'][0] == pytest.approx(-10.0)
+
+
+class TestSimulateReturns:
+    """일일 수익률 시뮬레이션"""
+
+    def test_seed_is_reproducible_across_chunk_sizes(self, daily_returns):
+        """Given: 같은 시드, 다른 청크 크기 When: block 시뮬레이션 Then: 같은 결과"""
+        small_chunks = PortfolioMonteCarlo(chunk_cells=10_000).simulate_returns(
+            daily_returns, n_paths=300, method='block', block_size=10, seed=7
+        )
+        single_chunk = PortfolioMonteCarlo().simulate_returns(
+            daily_returns, n_paths=300, method='block', block_size=10, seed=7
+        )
+
+        assert small_chunks == single_chunk
+
+    def test_distribution_summary(self, daily_returns):
+        """Given: 양의 기대수익 수익률 When: 시뮬레이션 Then: 백분위 단조 증가, 실제 값과 백분위 순위 포함"""
+        result = PortfolioMonteCarlo().simulate_returns(daily_returns, n_paths=2000, seed=1)
+
+        cagr = result['metrics']['cagr_pct']
+        assert cagr['p5'] <= cagr['p25'] <= cagr['p50'] <= cagr['p75'] <= cagr['p95']
+        assert 0 <= cagr['actual_percentile'] <= 100
+        assert result['metrics']['max_drawdown_pct']['p95'] <= 0
+        assert 0 <= result['probability_of_loss_pct'] <= 100
+        assert result['n_days'] == 756
+
+    def test_too_few_returns_is_rejected(self):
+        """Given: 수익률 1개 When: 시뮬레이션 Then: ValueError"""
+        with pytest.raises(ValueError):
+            PortfolioMonteCarlo().simulate_returns(np.array([0.01, np.nan]), n_paths=100)
+
+
+class TestRunMonteCarlo:
+    """백테스트 결과 연결"""
+
+    def test_uses_daily_returns_and_trade_log(self, daily_returns):
+        """Given: 백분율 daily_returns + ReturnPct가 있는 거래 로그 When: run_monte_carlo
+        Then: 소수로 변환해 시뮬레이션, ReturnPct 없는 거래(B&H 매수 기록)는 제외"""
+        service = PortfolioService()
+        data = {
+            'daily_returns': {f'd{i}': r * 100 for i, r in enumerate(daily_returns)},
+            'strategy_details': {
+                'AAPL': {'trade_log': [{'ReturnPct': 0.05}, {'ReturnPct': -0.02}, {'ReturnPct': 0.03}]},
+                'MSFT': {'trade_log': [{'ReturnPct': None}]},
+            },
+        }
+
+        result = service.run_monte_carlo(data, MonteCarloOptions(n_paths=200, seed=3))
+
+        expected = PortfolioMonteCarlo().simulate_returns(daily_returns, n_paths=200, seed=3)
+        assert result['daily']['metrics']['cagr_pct']['actual'] == pytest.approx(
+            expected['metrics']['cagr_pct']['actual']
+        )
+        assert result['trades']['n_trades'] == 3
+
+    @pytest.mark.asyncio
+    async def test_simulation_failure_keeps_backtest_result(self):
+        """Given: 일일 수익률이 1개뿐인 짧은 구간 백테스트 + monte_carlo 옵션
+        When: run_portfolio_backtest Then: 성공 결과 유지, monte_carlo에 오류만 기록"""
+        request = PortfolioBacktestRequest(
+            portfolio=[{'symbol': 'AAPL', 'amount': 10000.0}], start_date='2024-01-02', end_date='2024-01-03',
+            strategy='buy_hold_strategy', monte_carlo={'n_paths': 100, 'seed': 1},
+        )
+        backtest = {'status': 'success', 'data': {'daily_returns': {'2024-01-03': 0.5}, 'portfolio_statistics': {}}}
+
+        with patch.object(PortfolioService, 'run_buy_and_hold_portfolio_backtest',
+                          AsyncMock(return_value=backtest)):
+            result = await PortfolioService().run_portfolio_backtest(request)
+
+        assert result['status'] == 'success'
+        assert result['data']['portfolio_statistics'] == {}
+        assert 'error' in result['data']['monte_carlo']
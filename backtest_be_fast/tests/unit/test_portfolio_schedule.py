@@ -0,0 +1,127 @@
+"""
+리밸런싱 / DCA 일정 사전 계산 단위 테스트
+
+**테스트 범위**:
+- get_weekday_occurrence: 월 내 N번째 요일 계산
+- build_schedule_rows: is_rebalance_date() 일별 판단과 같은 실행 행, 회차 제한, 실행 가능 행 이동
+- PortfolioSchedule.build: 리밸런싱 마스크, 종목 거래소 휴장일을 피한 DCA 실행 행
+
+**테스트 원칙**:
+- 기존 일별 판단(RebalanceHelper.is_rebalance_date)을 기준 결과로 사용
+"""
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services.portfolio.portfolio_schedule import PortfolioSchedule
+from app.services.rebalance_helper import RebalanceHelper, build_schedule_rows, get_weekday_occurrence
+
+
+def _daily_rows(sessions: pd.DatetimeIndex, start: datetime, frequency: str, original_nth: int) -> list:
+    """is_rebalance_date()를 매일 호출하는 기존 방식의 실행 행"""
+    rows, last = [], None
+    for row in range(1, len(sessions)):
+        if RebalanceHelper.is_rebalance_date(sessions[row], sessions[row - 1], frequency, start, last, original_nth):
+            rows.append(row)
+            last = sessions[row]
+    return rows
+
+
+def _dca_entry(symbol: str, frequency: str = 'monthly_1', periods: int = 12) -> dict:
+    return {
+        'symbol': symbol,
+        'investment_type': 'dca',
+        'dca_frequency': frequency,
+        'dca_periods': periods,
+        'monthly_amount': 100.0,
+        'executed_count': 0,
+        'last_dca_date': None,
+        'original_nth_weekday': None,
+    }
+
+
+def test_weekday_occurrence_matches_day_scan():
+    """Given: 2024년 전체 날짜 When: N번째 요일 Then: 1일부터 같은 요일을 센 값과 일치"""
+    for day in pd.date_range('2024-01-01', '2024-12-31'):
+        scanned = sum(1 for d in range(1, day.day + 1) if day.replace(day=d).weekday() == day.weekday())
+        assert get_weekday_occurrence(day) == scanned
+
+
+class TestBuildScheduleRows:
+    """실행 행 계산"""
+
+    @pytest.mark.parametrize('frequency', ['weekly_1', 'weekly_2', 'monthly_1', 'monthly_3', 'monthly_12'])
+    @pytest.mark.parametrize('start', ['2020-01-04', '2020-01-31', '2020-02-29', '2020-07-03'])
+    def test_matches_daily_check(self, frequency, start):
+        """Given: 평일 세션, 주말/월말/5번째 요일 시작일 When: 일정 계산
+        Then: 매일 is_rebalance_date()로 판단한 행과 일치"""
+        start_date = datetime.strptime(start, '%Y-%m-%d')
+        sessions = pd.bdate_range(start_date, '2024-12-31')
+        original_nth = get_weekday_occurrence(start_date)
+
+        rows = build_schedule_rows(sessions, start_date, frequency, original_nth)
+
+        assert rows.tolist() == _daily_rows(sessions, start_date, frequency, original_nth)
+
+    def test_max_events_and_unknown_frequency(self):
+        """Given: 회차 제한 3, 알 수 없는 주기 When: 일정 계산 Then: 3개, 빈 배열"""
+        sessions = pd.bdate_range('2024-01-02', '2024-12-31')
+
+        assert len(build_schedule_rows(sessions, datetime(2024, 1, 2), 'weekly_1', max_events=3)) == 3
+        assert build_schedule_rows(sessions, datetime(2024, 1, 2), 'weekly_4').size == 0
+
+    def test_past_due_first_date_stops_schedule(self):
+        """Given: 첫 예정일이 첫 세션 이전 (데이터가 늦게 시작) When: 일정 계산 Then: 실행 없음"""
+        sessions = pd.bdate_range('2024-03-01', '2024-12-31')
+
+        assert build_schedule_rows(sessions, datetime(2024, 1, 2), 'monthly_1', 1).size == 0
+
+    def test_eligible_moves_to_next_allowed_row(self):
+        """Given: 예정일(1/16 화)이 실행 불가 행 When: 일정 계산
+        Then: 다음 가능 행(1/17)에서 실행, 다음 예정일은 실행일 기준 1주 후"""
+        sessions = pd.bdate_range('2024-01-09', '2024-01-31')
+        eligible = sessions != pd.Timestamp('2024-01-16')
+
+        rows = build_schedule_rows(sessions, datetime(2024, 1, 9), 'weekly_1', max_events=2, eligible=eligible)
+
+        assert [sessions[r].strftime('%Y-%m-%d') for r in rows] == ['2024-01-17', '2024-01-24']
+
+
+class TestPortfolioSchedule:
+    """포트폴리오 일정"""
+
+    def test_dca_skips_exchange_holiday_and_sets_nth(self):
+        """Given: 미국/한국 종목 합집합 날짜, 한국 종목 월간 DCA 예정일이 광복절(8/15)
+        When: 일정 계산
+        Then: 한국 종목은 8/16(금)에 매수하고 다음 회차는 실행일 기준(9월 3번째 금요일), original_nth 설정"""
+        sim_dates = pd.bdate_range('2024-07-15', '2024-09-30')
+        dca_info = {'SPY': _dca_entry('SPY', periods=2), '005930.KS': _dca_entry('005930.KS', periods=2)}
+
+        schedule = PortfolioSchedule.build(
+            sim_dates, ['SPY', '005930.KS'], dca_info, datetime(2024, 7, 18), 'monthly_1', can_rebalance=True
+        )
+
+        dates = lambda rows: [sim_dates[r].strftime('%Y-%m-%d') for r in rows]
+        assert dates(schedule.dca_rows['SPY']) == ['2024-08-15', '2024-09-19']
+        assert dates(schedule.dca_rows['005930.KS']) == ['2024-08-16', '2024-09-20']
+        assert dates(schedule.rebalance_rows) == ['2024-08-15', '2024-09-19']
+        assert dca_info['SPY']['original_nth_weekday'] == 3
+
+        row = int(np.flatnonzero(sim_dates == '2024-08-15')[0])
+        assert schedule.rebalance_mask[row]
+        assert schedule.dca_keys_at(row) == ['SPY']
+        assert schedule.event_rows.tolist() == sorted(set(schedule.event_rows.tolist()))
+
+    def test_no_rebalance_and_completed_dca(self):
+        """Given: 리밸런싱 불가, 회차를 모두 마친 DCA When: 일정 계산 Then: 이벤트 없음"""
+        sim_dates = pd.bdate_range('2024-01-02', '2024-06-28')
+        dca_info = {'AAA': dict(_dca_entry('AAA', periods=3), executed_count=3)}
+
+        schedule = PortfolioSchedule.build(
+            sim_dates, ['AAA'], dca_info, datetime(2024, 1, 2), 'monthly_1', can_rebalance=False
+        )
+
+        assert schedule.event_rows.size == 0
+        assert not schedule.rebalance_mask.any()
@@ -0,0 +1,292 @@
+"""
+포트폴리오 벡터화 엔진 패리티 테스트
+
+**테스트 범위**:
+- PortfolioVectorEngine 결과가 기존 일별 루프와 일치하는지 검증
+- 일시불 / DCA / 현금 / 리밸런싱 / 상장폐지 / 다중 통화 조합
+- 가격 행렬 정렬, 상장폐지 마스크 계산
+
+**테스트 원칙**:
+- DB 없이 실행 (Repository, 환율 로더는 Mock)
+- 동일 입력을 두 엔진에 넣고 Portfolio_Value / Daily_Return / attrs 비교
+"""
+import copy
+from datetime import date, datetime
+from unittest.mock import AsyncMock, Mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services.portfolio.portfolio_vector_engine import PortfolioVectorEngine
+from app.services.portfolio_service import PortfolioService
+from app.utils.trading_calendar import TradingCalendar, get_calendar
+
+
+def _price_frame(dates: pd.DatetimeIndex, seed: int, start_price: float = 100.0) -> pd.DataFrame:
+    """랜덤워크 OHLCV 데이터 생성"""
+    rng = np.random.default_rng(seed)
+    close = start_price * np.cumprod(1 + rng.normal(0.0005, 0.02, len(dates)))
+    return pd.DataFrame({
+        'Open': close,
+        'High': close * 1.01,
+        'Low': close * 0.99,
+        'Close': close,
+        'Volume': rng.integers(1_000, 10_000, len(dates)),
+    }, index=dates)
+
+
+def _dca_entry(symbol: str, investment_type: str = 'lump_sum', amount: float = 10000.0,
+               dca_frequency: str = 'monthly_1', dca_periods: int = 1, asset_type: str = 'stock') -> dict:
+    return {
+        'symbol': symbol,
+        'investment_type': investment_type,
+        'dca_frequency': dca_frequency,
+        'dca_periods': dca_periods,
+        'monthly_amount': amount,
+        'asset_type': asset_type,
+        'executed_count': 0,
+        'last_dca_date': None,
+        'original_nth_weekday': None,
+    }
+
+
+def _make_service(currencies: dict, exchange_rates: dict, monkeypatch) -> PortfolioService:
+    service = PortfolioService()
+    service.stock_repository = Mock()
+    service.stock_repository.get_tickers_info_batch_async = AsyncMock(return_value={
+        symbol: {'currency': currency} for symbol, currency in currencies.items()
+    })
+    monkeypatch.setattr(
+        'app.services.portfolio_service.currency_converter.load_multiple_exchange_rates',
+        AsyncMock(return_value=exchange_rates)
+    )
+    return service
+
+
+async def _run_both(service, portfolio_data, amounts, dca_info, start, end, frequency, commission):
+    results = {}
+    for engine in ('loop', 'vectorized'):
+        results[engine] = await service.calculate_dca_portfolio_returns(
+            portfolio_data=portfolio_data,
+            amounts=dict(amounts),
+            dca_info=copy.deepcopy(dca_info),
+            start_date=start,
+            end_date=end,
+            rebalance_frequency=frequency,
+            commission=commission,
+            engine=engine
+        )
+    return results['loop'], results['vectorized']
+
+
+def _assert_same_result(expected: pd.DataFrame, actual: pd.DataFrame):
+    assert list(actual.index) == list(expected.index)
+    assert list(actual.columns) == list(expected.columns)
+    np.testing.assert_allclose(actual['Portfolio_Value'], expected['Portfolio_Value'], rtol=1e-12)
+    np.testing.assert_allclose(actual['Daily_Return'], expected['Daily_Return'], rtol=1e-9, atol=1e-15)
+    np.testing.assert_allclose(actual['Cumulative_Return'], expected['Cumulative_Return'], rtol=1e-9, atol=1e-12)
+
+    assert actual.attrs['total_trades'] == expected.attrs['total_trades']
+
+    expected_history = expected.attrs['rebalance_history']
+    actual_history = actual.attrs['rebalance_history']
+    assert [h['date'] for h in actual_history] == [h['date'] for h in expected_history]
+    for exp, act in zip(expected_history, actual_history):
+        assert len(act['trades']) == len(exp['trades'])
+        assert act['commission_cost'] == pytest.approx(exp['commission_cost'], rel=1e-9)
+        assert act['weights_after'] == pytest.approx(exp['weights_after'], rel=1e-9)
+
+    expected_weights = expected.attrs['weight_history']
+    actual_weights = actual.attrs['weight_history']
+    assert len(actual_weights) == len(expected_weights)
+    for exp, act in zip(expected_weights, actual_weights):
+        assert act.keys() == exp.keys()
+        assert act['date'] == exp['date']
+        for key in exp:
+            if key != 'date':
+                assert act[key] == pytest.approx(exp[key], rel=1e-9)
+
+
+class TestVectorEngineParity:
+    """기존 일별 루프와 결과 일치 검증"""
+
+    @pytest.mark.asyncio
+    async def test_lump_sum_with_monthly_rebalance(self, monkeypatch):
+        """Given: 일시불 2종목 + 현금, 월간 리밸런싱
+        When: 두 엔진으로 계산
+        Then: 결과가 일치"""
+        dates = pd.bdate_range('2022-01-03', '2023-06-30')
+        portfolio_data = {
+            'AAA': _price_frame(dates, seed=1),
+            'BBB': _price_frame(dates, seed=2, start_price=50.0),
+        }
+        amounts = {'AAA': 6000.0, 'BBB': 3000.0, 'CASH': 1000.0}
+        dca_info = {
+            'AAA': _dca_entry('AAA', amount=6000.0),
+            'BBB': _dca_entry('BBB', amount=3000.0),
+            'CASH': _dca_entry('CASH', amount=1000.0, asset_type='cash'),
+        }
+        service = _make_service({'AAA': 'USD', 'BBB': 'USD'}, {}, monkeypatch)
+
+        expected, actual = await _run_both(
+            service, portfolio_data, amounts, dca_info, '2022-01-03', '2023-06-30', 'monthly_1', 0.002
+        )
+
+        assert len(expected.attrs['rebalance_history']) > 10
+        _assert_same_result(expected, actual)
+
+    @pytest.mark.asyncio
+    async def test_dca_with_mixed_calendars_and_currency(self, monkeypatch):
+        """Given: DCA + 일시불, 거래일이 다른 KRW 종목, 주간 리밸런싱
+        When: 두 엔진으로 계산
+        Then: 결과가 일치"""
+        us_dates = pd.bdate_range('2021-03-01', '2022-03-31')
+        kr_dates = us_dates[us_dates.dayofweek != 4]  # 금요일 휴장 가정 (캘린더 불일치)
+        portfolio_data = {
+            'SPY': _price_frame(us_dates, seed=3, start_price=400.0),
+            '005930.KS': _price_frame(kr_dates, seed=4, start_price=80000.0),
+        }
+        amounts = {'SPY': 500.0 * 12, '005930.KS': 5000.0}
+        dca_info = {
+            'SPY': _dca_entry('SPY', investment_type='dca', amount=500.0, dca_frequency='weekly_2', dca_periods=12),
+            '005930.KS': _dca_entry('005930.KS', amount=5000.0),
+        }
+        all_dates = us_dates.union(kr_dates)
+        rng = np.random.default_rng(5)
+        krw_rates = {d.date(): float(1200 + rng.normal(0, 10)) for d in all_dates if d.day != 15}
+        service = _make_service({'SPY': 'USD', '005930.KS': 'KRW'}, {'KRW': krw_rates}, monkeypatch)
+
+        expected, actual = await _run_both(
+            service, portfolio_data, amounts, dca_info, '2021-03-01', '2022-03-31', 'weekly_2', 0.001
+        )
+
+        assert expected.attrs['total_trades'] > 12
+        _assert_same_result(expected, actual)
+
+    @pytest.mark.asyncio
+    async def test_delisted_stock_keeps_last_price(self, monkeypatch):
+        """Given: 중간에 데이터가 끊기는 종목 (EUR) + 환율 공백
+        When: 두 엔진으로 계산
+        Then: 상장폐지 처리 포함 결과가 일치"""
+        dates = pd.bdate_range('2020-01-02', '2021-12-31')
+        portfolio_data = {
+            'AAA': _price_frame(dates, seed=6),
+            'EUX': _price_frame(dates, seed=7, start_price=30.0),
+            'DLS': _price_frame(dates[dates < '2021-02-01'], seed=8, start_price=20.0),
+        }
+        amounts = {'AAA': 4000.0, 'EUX': 3000.0, 'DLS': 3000.0}
+        dca_info = {
+            'AAA': _dca_entry('AAA', amount=4000.0),
+            'EUX': _dca_entry('EUX', amount=3000.0),
+            'DLS': _dca_entry('DLS', amount=3000.0),
+        }
+        # EUR 환율 40일 공백 → 해당 기간 EUX도 상장폐지로 감지되었다가 복원
+        eur_rates = {
+            d.date(): 1.1 for d in dates
+            if not (date(2020, 6, 1) <= d.date() <= date(2020, 7, 15))
+        }
+        service = _make_service({'AAA': 'USD', 'EUX': 'EUR', 'DLS': 'USD'}, {'EUR': eur_rates}, monkeypatch)
+
+        expected, actual = await _run_both(
+            service, portfolio_data, amounts, dca_info, '2020-01-02', '2021-12-31', 'monthly_3', 0.002
+        )
+
+        _assert_same_result(expected, actual)
+
+    @pytest.mark.asyncio
+    async def test_start_date_on_weekend_and_no_rebalance(self, monkeypatch):
+        """Given: 주말 시작일, 리밸런싱 없음, 월간 DCA
+        When: 두 엔진으로 계산
+        Then: 결과가 일치"""
+        dates = pd.bdate_range('2023-01-02', '2024-12-31')
+        portfolio_data = {
+            'AAA': _price_frame(dates, seed=9),
+            'BBB': _price_frame(dates, seed=10),
+        }
+        amounts = {'AAA': 300.0 * 24, 'BBB': 200.0 * 10}
+        dca_info = {
+            'AAA': _dca_entry('AAA', investment_type='dca', amount=300.0, dca_frequency='monthly_1', dca_periods=24),
+            'BBB': _dca_entry('BBB', investment_type='dca', amount=200.0, dca_frequency='monthly_2', dca_periods=10),
+        }
+        service = _make_service({'AAA': 'USD', 'BBB': 'USD'}, {}, monkeypatch)
+
+        expected, actual = await _run_both(
+            service, portfolio_data, amounts, dca_info, '2023-01-07', '2024-12-31', 'none', 0.0
+        )
+
+        assert expected.attrs['rebalance_history'] == []
+        _assert_same_result(expected, actual)
+
+
+class TestVectorEngineMatrices:
+    """가격 행렬 / 상장폐지 마스크 검증"""
+
+    def test_build_price_matrix_uses_last_row_on_or_before_date(self):
+        """Given: 종목 거래일이 시뮬레이션 날짜와 다름
+        When: 가격 행렬 생성
+        Then: 해당 날짜 이하의 마지막 종가 사용, 첫 거래일 이전은 가격 없음"""
+        engine = PortfolioVectorEngine()
+        sim_dates = pd.DatetimeIndex(['2024-01-01', '2024-01-02', '2024-01-03', '2024-01-04'])
+        df = pd.DataFrame({'Close': [10.0, 12.0]}, index=pd.DatetimeIndex(['2024-01-02', '2024-01-04']))
+
+        prices, available = engine.build_price_matrix(
+            sim_dates, ['X'], {'X': df}, {'X': {'symbol': 'X'}}, {'X': 'USD'}, {}
+        )
+
+        assert available[:, 0].tolist() == [False, True, True, True]
+        assert prices[1:, 0].tolist() == [10.0, 10.0, 12.0]
+
+    def test_build_price_matrix_converts_direct_and_usd_quoted_currency(self):
+        """Given: KRW(직접 환율), EUR(USD 환율) 종목
+        When: 가격 행렬 생성
+        Then: KRW는 나누기, EUR은 곱하기, 환율 없는 날은 가격 없음"""
+        engine = PortfolioVectorEngine()
+        sim_dates = pd.DatetimeIndex(['2024-01-02', '2024-01-03'])
+        df = pd.DataFrame({'Close': [1000.0, 1000.0]}, index=sim_dates)
+        rates = {
+            'KRW': {date(2024, 1, 2): 1250.0, date(2024, 1, 3): 1300.0},
+            'EUR': {date(2024, 1, 2): 1.1},
+        }
+        dca_info = {'K': {'symbol': 'KR'}, 'E': {'symbol': 'EU'}}
+
+        prices, available = engine.build_price_matrix(
+            sim_dates, ['K', 'E'], {'KR': df, 'EU': df}, dca_info, {'K': 'KRW', 'E': 'EUR'}, rates
+        )
+
+        assert prices[:, 0] == pytest.approx([0.8, 1000.0 / 1300.0])
+        assert prices[0, 1] == pytest.approx(1100.0)
+        assert available[:, 1].tolist() == [True, False]
+
+    def test_apply_delisting_after_threshold(self):
+        """Given: 26세션 동안 가격 없음 (평일 캘린더)
+        When: 상장폐지 마스크 계산
+        Then: 21세션째부터 상장폐지, 마지막 가격 유지"""
+        sim_dates = pd.bdate_range('2024-01-01', periods=40)
+        prices = np.full((40, 1), 5.0)
+        available = np.ones((40, 1), dtype=bool)
+        available[5:31, 0] = False  # 마지막 가격일: 1월 5일
+
+        effective, present, delisted = PortfolioVectorEngine.apply_delisting(
+            sim_dates, prices, available, [TradingCalendar('WEEKDAYS')]
+        )
+
+        assert not delisted[24, 0]  # 20세션 경과
+        assert delisted[25, 0]  # 21세션 경과
+        assert not delisted[31, 0]  # 가격 재등장
+        assert effective[25, 0] == 5.0
+        assert present[:, 0].tolist() == [True] * 5 + [False] * 20 + [True] * 15
+
+    def test_apply_delisting_skips_exchange_holidays(self):
+        """Given: 같은 날짜 행렬, NYSE 캘린더 (1/15 MLK, 2/19 Presidents Day 휴장)
+        When: 상장폐지 마스크 계산 Then: 휴장일은 세지 않아 평일 캘린더보다 하루 늦게 상장폐지"""
+        sim_dates = pd.bdate_range('2024-01-01', periods=40)
+        prices = np.full((40, 1), 5.0)
+        available = np.ones((40, 1), dtype=bool)
+        available[5:31, 0] = False
+
+        _, _, delisted = PortfolioVectorEngine.apply_delisting(
+            sim_dates, prices, available, [get_calendar('XNYS')]
+        )
+
+        assert not delisted[25, 0] and delisted[26, 0]
@@ -0,0 +1,165 @@
+"""
+가격 커버리지 워터마크 및 EOD 증분 갱신 단위 테스트
+
+**테스트 범위**:
+- _missing_ranges / _last_complete_session: 주말·장 마감 전 당일만 남은 구간 제외
+- _load_ticker_data_internal: 워터마크 안쪽 요청은 수집 없음, 수집 후 워터마크 기록, 기존 데이터 내부 구멍 보완
+- PriceRefreshService.refresh_all: 워터마크별 일괄 다운로드, 누락 티커 개별 수집, 워터마크 없는 티커 초기화
+- PriceRefreshScheduler.next_run: 다음 평일 실행 시각
+
+**테스트 원칙**:
+- MySQL 대신 SQLite 인메모리 엔진 사용 (tests/conftest.py: sqlite_price_engine, sqlite_save), yfinance 호출은 mock
+"""
+from datetime import date, datetime
+from unittest.mock import patch
+from zoneinfo import ZoneInfo
+
+import pandas as pd
+import pytest
+from sqlalchemy import text
+
+from app.services import yfinance_db
+from app.services.price_refresh_service import PriceRefreshScheduler, PriceRefreshService
+
+
+def _coverage(engine):
+    with engine.connect() as conn:
+        return conn.execute(text("SELECT covered_from, covered_to FROM price_coverage WHERE stock_id = 1")).fetchone()
+
+
+def _load(engine, start, end, fetched=None, last_session=date(2024, 3, 28)):
+    with patch('app.services.yfinance_db._get_engine', return_value=engine), \
+            patch('app.services.yfinance_db._last_complete_session', return_value=last_session), \
+            patch('app.services.yfinance_db.data_fetcher') as fetcher:
+        fetcher.fetch_stock_data.side_effect = lambda ticker, s, e, use_cache=True: fetched.loc[str(s):str(e)]
+        df = yfinance_db._load_ticker_data_internal('AAPL', start, end)
+    return df, fetcher.fetch_stock_data
+
+
+class TestMissingRanges:
+    """누락 구간 계산"""
+
+    def test_today_and_weekend_tail_is_skipped(self):
+        """Given: 저장 범위가 금요일까지, 요청 끝이 다음 주 월요일(오늘) When: 누락 구간 Then: 없음"""
+        last_session = yfinance_db._last_complete_session(date(2024, 3, 25))
+
+        ranges = yfinance_db._missing_ranges(
+            date(2024, 3, 1), date(2024, 3, 25), date(2024, 3, 1), date(2024, 3, 22), last_session
+        )
+
+        assert last_session == date(2024, 3, 22)
+        assert ranges == []
+
+    def test_head_and_tail_ranges(self):
+        """Given: 저장 범위 양쪽 밖 평일 When: 누락 구간 Then: 앞/뒤 구간"""
+        ranges = yfinance_db._missing_ranges(
+            date(2024, 3, 1), date(2024, 3, 28), date(2024, 3, 5), date(2024, 3, 20), date(2024, 3, 28)
+        )
+
+        assert ranges == [(date(2024, 3, 1), date(2024, 3, 4)), (date(2024, 3, 21), date(2024, 3, 28))]
+
+
+@pytest.fixture
+def make_engine(sqlite_price_engine):
+    """AAPL 1종목 (stock_id 1) 엔진 팩토리"""
+    def make(days, coverage=None):
+        return sqlite_price_engine({'AAPL': days}, coverage={'AAPL': coverage} if coverage else None)
+    return make
+
+
+@pytest.mark.usefixtures('sqlite_save')
+class TestWatermarkLoad:
+    """워터마크 기반 조회"""
+
+    def test_request_inside_watermark_does_not_fetch(self, make_engine):
+        """Given: 행 사이에 구멍이 있어도 워터마크가 요청 구간을 포함 (휴장 등)
+        When: 조회 Then: yfinance 호출 없음"""
+        days = [d for d in pd.bdate_range('2024-03-01', '2024-03-28') if d.day not in range(11, 16)]
+        engine = make_engine(days, coverage=('2024-03-01', '2024-03-28'))
+
+        df, fetch = _load(engine, '2024-03-01', '2024-03-28')
+
+        fetch.assert_not_called()
+        assert len(df) == len(days)
+
+    def test_fill_extends_watermark_to_last_saved_bar(self, make_engine):
+        """Given: 워터마크가 3/15까지 When: 3/28까지 조회
+        Then: 뒤쪽 구간만 수집, 워터마크는 받은 마지막 봉까지"""
+        engine = make_engine(pd.bdate_range('2024-03-01', '2024-03-15'), coverage=('2024-03-01', '2024-03-15'))
+        fetched = pd.DataFrame({'Close': 2.0}, index=pd.bdate_range('2024-03-12', '2024-03-27'))
+
+        df, fetch = _load(engine, '2024-03-01', '2024-03-28', fetched)
+
+        fetch.assert_called_once()
+        assert df.index.max() == pd.Timestamp('2024-03-27')
+        assert _coverage(engine) == ('2024-03-01', '2024-03-27')
+
+    def test_legacy_interior_hole_is_filled(self, make_engine):
+        """Given: 워터마크 없는 기존 데이터 중간에 2주 구멍 When: 조회
+        Then: 구멍만 수집 후 요청 구간을 워터마크로 기록"""
+        days = [d for d in pd.bdate_range('2024-01-02', '2024-03-28') if not ('2024-02-05' <= str(d.date()) <= '2024-02-16')]
+        engine = make_engine(days)
+        fetched = pd.DataFrame({'Close': 2.0}, index=pd.bdate_range('2024-02-05', '2024-02-16'))
+
+        df, fetch = _load(engine, '2024-01-02', '2024-03-28', fetched)
+
+        # 마지막 행 다음날 ~ 다음 행 전날 (2/3~2/18) + 앞쪽 2세션
+        fetch.assert_called_once()
+        assert fetch.call_args.args[1:3] == (date(2024, 2, 1), date(2024, 2, 18))
+        assert len(df) == len(pd.bdate_range('2024-01-02', '2024-03-28'))
+        assert _coverage(engine) == ('2024-01-02', '2024-03-28')
+
+    def test_failed_fill_keeps_watermark(self, make_engine):
+        """Given: 뒤쪽 구간 수집 실패 When: 조회 Then: 워터마크 유지"""
+        engine = make_engine(pd.bdate_range('2024-03-01', '2024-03-15'), coverage=('2024-03-01', '2024-03-15'))
+
+        _load(engine, '2024-03-01', '2024-03-28', pd.DataFrame({'Close': []}, index=pd.DatetimeIndex([])))
+
+        assert _coverage(engine) == ('2024-03-01', '2024-03-15')
+
+
+class TestPriceRefreshService:
+    """EOD 증분 갱신"""
+
+    def test_groups_by_watermark_and_falls_back(self):
+        """Given: 최신 티커, 같은 워터마크 티커 2개(하나는 일괄 결과 없음), 워터마크 없는 티커
+        When: refresh_all Then: 일괄 다운로드 1회, 누락/미검증 티커만 개별 수집"""
+        watermarks = {
+            'AAPL': {'db_min': date(2020, 1, 2), 'covered_to': date(2024, 3, 20)},
+            'MSFT': {'db_min': date(2020, 1, 2), 'covered_to': date(2024, 3, 20)},
+            'SPY': {'db_min': date(2020, 1, 2), 'covered_to': date(2024, 3, 22)},
+            'OLD': {'db_min': date(2019, 1, 2), 'covered_to': None},
+        }
+        frame = pd.DataFrame({'Close': [1.0, 2.0]}, index=pd.DatetimeIndex(['2024-03-21', '2024-03-22']))
+
+        with patch('app.services.price_refresh_service.get_price_watermarks', return_value=watermarks), \
+                patch('app.services.price_refresh_service.data_fetcher') as fetcher, \
+                patch('app.services.price_refresh_service.save_incremental_prices') as save, \
+                patch('app.services.price_refresh_service.sync_ticker_prices') as sync:
+            fetcher.fetch_multiple_stock_data.return_value = {'AAPL': frame}
+            summary = PriceRefreshService(batch_size=10).refresh_all(date(2024, 3, 22))
+
+        fetcher.fetch_multiple_stock_data.assert_called_once_with(
+            ['AAPL', 'MSFT'], date(2024, 3, 21), date(2024, 3, 22)
+        )
+        save.assert_called_once()
+        ticker, saved, covered_from = save.call_args.args
+        assert (ticker, covered_from) == ('AAPL', date(2024, 3, 20))
+        pd.testing.assert_frame_equal(saved, frame)
+        assert [call.args for call in sync.call_args_list] == [
+            ('OLD', date(2019, 1, 2), date(2024, 3, 22), date(2024, 3, 22)),
+            ('MSFT', date(2024, 3, 21), date(2024, 3, 22), date(2024, 3, 22)),
+        ]
+        assert summary == {'as_of': '2024-03-22', 'up_to_date': 1, 'refreshed': 1,
+                           'bootstrapped': 1, 'fallback': 1, 'failed': 0}
+
+    @pytest.mark.parametrize('now, expected', [
+        (datetime(2024, 3, 20, 9, 0), datetime(2024, 3, 20, 18, 30)),
+        (datetime(2024, 3, 20, 19, 0), datetime(2024, 3, 21, 18, 30)),
+        (datetime(2024, 3, 22, 19, 0), datetime(2024, 3, 25, 18, 30)),
+    ])
+    def test_next_run_skips_weekends(self, now, expected):
+        """Given: 현재 시각 When: 다음 실행 시각 Then: 오늘 실행 전이면 오늘, 아니면 다음 평일"""
+        tz = ZoneInfo('America/New_York')
+
+        assert PriceRefreshScheduler.next_run(now.replace(tzinfo=tz), '18:30') == expected.replace(tzinfo=tz)
@@ -0,0 +1,159 @@
+"""
+로컬 가격 저장소 단위 테스트
+
+**테스트 범위**:
+- 커버리지 기록 및 범위 조회 (이진 탐색 슬라이스)
+- save_ticker_data 행(dict) write-through 병합
+- 최근 구간 TTL, 파일 교체 후 재매핑
+- StockRepository의 저장소 우선 조회
+
+**테스트 원칙**:
+- DB 없이 실행 (임시 디렉터리 사용)
+"""
+import time
+from datetime import date, timedelta
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services.price_store import LocalPriceStore
+
+
+def _db_frame(start: str, periods: int) -> pd.DataFrame:
+    """DB 조회 결과와 같은 형식의 DataFrame"""
+    index = pd.DatetimeIndex(pd.bdate_range(start, periods=periods), name='date')
+    close = np.linspace(100.0, 100.0 + periods - 1, periods)
+    return pd.DataFrame({
+        'Open': close - 1,
+        'High': close + 1,
+        'Low': close - 2,
+        'Close': close,
+        'Adj Close': close,
+        'Volume': np.arange(periods, dtype='int64') * 10,
+    }, index=index)
+
+
+@pytest.fixture
+def store(tmp_path):
+    return LocalPriceStore(base_dir=str(tmp_path), enabled=True)
+
+
+class TestLocalPriceStoreRead:
+    """커버리지 기반 조회"""
+
+    def test_uncovered_range_returns_none(self, store):
+        """Given: 기록 없음 When: 조회 Then: None (DB 경로 사용)"""
+        assert store.read('AAPL', '2023-01-02', '2023-01-31') is None
+
+    def test_sub_range_is_sliced_from_recorded_load(self, store):
+        """Given: 1~3월 DB 조회 결과 기록
+        When: 2월 구간 조회
+        Then: 해당 구간 행만 DB 형식 그대로 반환"""
+        df = _db_frame('2023-01-02', 64)
+        store.record_load('AAPL', df, '2023-01-01', '2023-03-31')
+
+        result = store.read('AAPL', '2023-02-01', '2023-02-28')
+
+        expected = df.loc['2023-02-01':'2023-02-28']
+        pd.testing.assert_frame_equal(result, expected, check_index_type=False, check_freq=False)
+        assert result.index.name == 'date'
+        assert result['Volume'].dtype == np.int64
+
+    def test_range_outside_coverage_returns_none(self, store):
+        """Given: 1~3월 기록 When: 3~4월 조회 Then: None"""
+        store.record_load('AAPL', _db_frame('2023-01-02', 64), '2023-01-01', '2023-03-31')
+
+        assert store.read('AAPL', '2023-03-01', '2023-04-30') is None
+
+    def test_adjacent_loads_merge_coverage(self, store):
+        """Given: 연속된 두 구간 기록 When: 두 구간에 걸친 조회 Then: 저장소에서 반환"""
+        store.record_load('MSFT', _db_frame('2023-01-02', 21), '2023-01-01', '2023-01-31')
+        store.record_load('MSFT', _db_frame('2023-02-01', 20), '2023-02-01', '2023-02-28')
+
+        result = store.read('MSFT', '2023-01-15', '2023-02-15')
+
+        assert result is not None
+        assert result.index.min() >= pd.Timestamp('2023-01-15')
+        assert result.index.max() <= pd.Timestamp('2023-02-15')
+
+    def test_recent_range_expires_after_ttl(self, store):
+        """Given: 종료일이 오늘이고 마지막 행이 그 이전
+        When: TTL 경과 후 조회
+        Then: None (신규 봉 확인을 위해 DB 경로 사용)"""
+        today = date.today()
+        df = _db_frame((today - timedelta(days=20)).isoformat(), 5)
+        store.record_load('NVDA', df, today - timedelta(days=20), today)
+
+        assert store.read('NVDA', today - timedelta(days=20), today) is not None
+
+        with patch('app.services.price_store.time.time', return_value=time.time() + 10 ** 6):
+            assert store.read('NVDA', today - timedelta(days=20), today) is None
+
+    def test_special_character_tickers(self, store):
+        """Given: ^GSPC, KRW=X 티커 When: 기록/조회 Then: 정상 동작"""
+        for ticker in ['^GSPC', 'KRW=X']:
+            store.record_load(ticker, _db_frame('2023-01-02', 10), '2023-01-02', '2023-01-13')
+            assert len(store.read(ticker, '2023-01-02', '2023-01-13')) == 10
+
+
+class TestLocalPriceStoreWrite:
+    """write-through 병합"""
+
+    def test_upsert_records_overrides_same_date_and_rounds(self, store):
+        """Given: 기록된 구간 When: save_ticker_data 행으로 같은 날짜 갱신
+        Then: 새 값(DB 정밀도 반올림) 반영, 다른 날짜 유지"""
+        df = _db_frame('2023-01-02', 10)
+        store.record_load('AAPL', df, '2023-01-02', '2023-01-13')
+
+        store.upsert_records('AAPL', [{
+            'stock_id': 1, 'date': '2023-01-04', 'open': 1.0, 'high': 2.0, 'low': 0.5,
+            'close': 1.234567, 'adj_close': None, 'volume': 7,
+        }])
+
+        result = store.read('AAPL', '2023-01-02', '2023-01-13')
+        assert len(result) == 10
+        row = result.loc['2023-01-04']
+        assert row['Close'] == pytest.approx(1.2346)
+        assert np.isnan(row['Adj Close'])
+        assert row['Volume'] == 7
+        assert result.loc['2023-01-05', 'Close'] == df.loc['2023-01-05', 'Close']
+
+    def test_reader_sees_replaced_file(self, store):
+        """Given: 조회로 매핑된 파일 When: 파일 교체 Then: 새 내용으로 재매핑"""
+        store.record_load('AAPL', _db_frame('2023-01-02', 10), '2023-01-02', '2023-01-13')
+        store.read('AAPL', '2023-01-02', '2023-01-13')
+
+        store.upsert_frame('AAPL', _db_frame('2023-01-02', 10) * 0 + 5)
+
+        assert (store.read('AAPL', '2023-01-02', '2023-01-13')['Close'] == 5).all()
+
+    def test_disabled_store_is_noop(self, tmp_path):
+        """Given: 비활성화 When: 기록/조회 Then: 항상 None"""
+        store = LocalPriceStore(base_dir=str(tmp_path), enabled=False)
+        store.record_load('AAPL', _db_frame('2023-01-02', 10), '2023-01-02', '2023-01-13')
+
+        assert store.read('AAPL', '2023-01-02', '2023-01-13') is None
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestStockRepositoryUsesStore:
+    """StockRepository 저장소 우선 조회"""
+
+    def test_second_load_skips_db(self, store):
+        """Given: 첫 조회는 DB When: 같은 구간 재조회 Then: DB 미호출"""
+        from app.repositories.stock_repository import StockRepository
+
+        df = _db_frame('2023-01-02', 21)
+        with patch('app.repositories.stock_repository.local_price_store', store), \
+                patch('app.repositories.stock_repository.yfinance_db.load_ticker_data', return_value=df) as db_load:
+            repo = StockRepository()
+            first = repo.load_stock_data('AAPL', '2023-01-01', '2023-01-31')
+            second = repo.load_stock_data('AAPL', '2023-01-03', '2023-01-20')
+
+        assert db_load.call_count == 1
+        assert first is df
+        pd.testing.assert_frame_equal(
+            second, df.loc['2023-01-03':'2023-01-20'], check_index_type=False, check_freq=False
+        )
@@ -0,0 +1,152 @@
+"""
+yfinance 기록/재생 데이터 소스 단위 테스트
+
+**테스트 범위**:
+- RecordReplayDataSource: record → replay 왕복 (값, dtype, 타임존 인덱스 보존)
+- 재생 구간 자르기, 기록되지 않은 구간 (replay: DataNotFoundError, auto: 기록)
+- 종목 정보 / 티커 검증 기록
+- ServiceContainer.set_data_source: 전역 data_fetcher 위임과 reset 복귀
+
+**테스트 원칙**:
+- 내부 소스는 메모리 가짜 구현 (외부 네트워크 호출 없음)
+- 기록 파일은 tmp_path 사용
+"""
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.di.container import ServiceContainer
+from app.interfaces.data_source import DataSource, RecordReplayDataSource
+from app.utils.data_fetcher import DataNotFoundError, data_fetcher
+
+
+class FakeSource(DataSource):
+    """2023년 1월 영업일 주가를 반환하는 메모리 소스 (호출 기록)"""
+
+    def __init__(self):
+        index = pd.bdate_range('2023-01-02', '2023-01-31', tz='America/New_York', name='Date')
+        self.frame = pd.DataFrame({
+            'Open': np.linspace(100, 120, len(index)),
+            'High': np.linspace(101, 121, len(index)),
+            'Low': np.linspace(99, 119, len(index)),
+            'Close': np.linspace(100.5, 120.5, len(index)),
+            'Volume': np.arange(len(index), dtype='int64') * 1000,
+        }, index=index)
+        self.calls = []
+
+    def get_stock_data(self, ticker, start_date, end_date, use_cache=True, cache_hours=24):
+        self.calls.append(('prices', ticker, start_date, end_date))
+        local = self.frame.index.tz_localize(None)
+        mask = (local >= pd.Timestamp(start_date)) & (local <= pd.Timestamp(end_date))
+        return self.frame.loc[mask].copy()
+
+    def validate_ticker(self, ticker):
+        self.calls.append(('validate', ticker))
+        return True
+
+    def get_ticker_info(self, ticker):
+        self.calls.append(('info', ticker))
+        return {'symbol': ticker, 'currency': 'USD', 'first_trade_date': '1980-12-12'}
+
+
+class OfflineSource(DataSource):
+    """호출되면 실패하는 소스 (재생이 네트워크를 쓰지 않는지 확인)"""
+
+    def get_stock_data(self, *args, **kwargs):
+        raise AssertionError('재생 중 내부 소스 호출')
+
+    validate_ticker = get_ticker_info = get_stock_data
+
+
+class TestRecordReplay:
+    """기록/재생"""
+
+    def test_recorded_frames_replay_identically(self, tmp_path):
+        """Given: record 모드로 1월 전체 기록 When: 새 인스턴스 replay 모드로 같은 구간 조회
+        Then: 값/dtype/타임존 인덱스까지 동일, 내부 소스 미호출, 압축 파일 생성"""
+        source = FakeSource()
+        recorded = RecordReplayDataSource(str(tmp_path), mode='record', data_source=source).get_stock_data(
+            'aapl', date(2023, 1, 2), date(2023, 1, 31)
+        )
+
+        replay = RecordReplayDataSource(str(tmp_path), mode='replay', data_source=OfflineSource())
+        replayed = replay.get_stock_data('AAPL', date(2023, 1, 2), date(2023, 1, 31))
+
+        pd.testing.assert_frame_equal(replayed, recorded, check_freq=False)
+        assert str(replayed.index.tz) == 'America/New_York'
+        assert (tmp_path / 'prices' / 'AAPL.json.gz').exists()
+        assert replay.get_stats()['replayed'] == 1
+
+    def test_replay_slices_inner_range_and_rejects_uncovered(self, tmp_path):
+        """Given: 1/2~1/31 기록 When: 1/10~1/13, 1/20~2/10 재생 조회
+        Then: 안쪽 구간은 종료일 포함으로 잘라 반환, 기록 밖 구간은 DataNotFoundError"""
+        RecordReplayDataSource(str(tmp_path), mode='record', data_source=FakeSource()).get_stock_data(
+            'AAPL', date(2023, 1, 2), date(2023, 1, 31)
+        )
+        replay = RecordReplayDataSource(str(tmp_path), mode='replay', data_source=OfflineSource())
+
+        sliced = replay.get_stock_data('AAPL', '2023-01-10', '2023-01-13')
+
+        assert [d.day for d in sliced.index] == [10, 11, 12, 13]
+        with pytest.raises(DataNotFoundError):
+            replay.get_stock_data('AAPL', date(2023, 1, 20), date(2023, 2, 10))
+        assert replay.get_stats()['misses'] == 1
+
+    def test_auto_mode_records_only_uncovered_requests(self, tmp_path):
+        """Given: auto 모드 When: 1월 전반부 → 후반부 → 전체 구간 조회
+        Then: 전반부/후반부만 내부 소스 호출, 병합된 기록으로 전체 구간 재생"""
+        source = FakeSource()
+        auto = RecordReplayDataSource(str(tmp_path), mode='auto', data_source=source)
+
+        auto.get_stock_data('AAPL', date(2023, 1, 2), date(2023, 1, 15))
+        auto.get_stock_data('AAPL', date(2023, 1, 16), date(2023, 1, 31))
+        full = auto.get_stock_data('AAPL', date(2023, 1, 2), date(2023, 1, 31))
+
+        assert len(source.calls) == 2
+        pd.testing.assert_frame_equal(full, source.frame, check_freq=False)
+
+    def test_ticker_info_and_validation_round_trip(self, tmp_path):
+        """Given: record 모드로 종목 정보/검증 기록 When: replay 모드 조회
+        Then: 같은 정보 반환, 기록 없는 티커는 DataFetcher 실패 응답 형식"""
+        recorder = RecordReplayDataSource(str(tmp_path), mode='record', data_source=FakeSource())
+        info = recorder.get_ticker_info('AAPL')
+        recorder.validate_ticker('AAPL')
+
+        replay = RecordReplayDataSource(str(tmp_path), mode='replay', data_source=OfflineSource())
+
+        assert replay.get_ticker_info('AAPL') == info
+        assert replay.validate_ticker('AAPL') is True
+        assert 'error' in replay.get_ticker_info('MSFT')
+        assert replay.validate_ticker('MSFT') is False
+
+    def test_invalid_mode(self, tmp_path):
+        """Given: 지원하지 않는 모드 When: 생성 Then: ValueError"""
+        with pytest.raises(ValueError):
+            RecordReplayDataSource(str(tmp_path), mode='live')
+
+
+class TestContainerRouting:
+    """ServiceContainer 연결"""
+
+    def test_set_data_source_routes_global_fetcher(self, tmp_path):
+        """Given: 기록이 있는 replay 소스를 컨테이너에 설정 When: 전역 data_fetcher로 조회
+        Then: 단건/일괄/정보 조회 모두 재생 (실패 티커는 일괄 결과에서 제외), reset 후 yfinance로 복귀"""
+        recorder = RecordReplayDataSource(str(tmp_path), mode='record', data_source=FakeSource())
+        recorder.get_stock_data('AAPL', date(2023, 1, 2), date(2023, 1, 31))
+        recorder.get_ticker_info('AAPL')
+        container = ServiceContainer()
+
+        container.set_data_source(RecordReplayDataSource(str(tmp_path), mode='replay', data_source=OfflineSource()))
+        try:
+            single = data_fetcher.fetch_stock_data('AAPL', date(2023, 1, 3), date(2023, 1, 6))
+            batch = data_fetcher.fetch_multiple_stock_data(['AAPL', 'MSFT'], date(2023, 1, 3), date(2023, 1, 6))
+            info = data_fetcher.fetch_ticker_info('aapl')
+        finally:
+            container.reset()
+
+        assert len(single) == 4
+        assert list(batch) == ['AAPL']
+        assert info['first_trade_date'] == '1980-12-12'
+        assert data_fetcher.source is None
@@ -0,0 +1,194 @@
+"""
+백테스트 결과 캐시 단위 테스트
+
+**테스트 범위**:
+- BacktestResultCache.make_key: 포트폴리오 순서 무관, 데이터 버전 변경 시 다른 키
+- 메모리 계층: LRU 제거, TTL 만료, 티커/구간 겹침 무효화
+- SqlResultStore: SQLite 파일 계층 저장/조회/무효화, 메모리 계층 승격
+- scope: 종료일이 확정되지 않은 요청, 시드 없는 몬테카를로 제외, 환율/벤치마크 티커 포함
+- get_price_versions: 구간 안의 행이 바뀌면 스탬프 변경
+
+**테스트 원칙**:
+- MySQL 대신 SQLite 엔진 사용, 실제 백테스트는 실행하지 않음
+"""
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+
+from app.schemas.schemas import PortfolioBacktestRequest
+from app.services import yfinance_db
+from app.services.result_cache import BacktestResultCache, ResultCacheScope, SqlResultStore
+
+
+def _request(portfolio=None, end_date='2024-06-28', **kwargs) -> PortfolioBacktestRequest:
+    portfolio = portfolio or [{'symbol': 'AAPL', 'amount': 5000.0}, {'symbol': 'MSFT', 'amount': 5000.0}]
+    return PortfolioBacktestRequest(portfolio=portfolio, start_date='2024-01-02', end_date=end_date, **kwargs)
+
+
+def _scope(*tickers, start=date(2024, 1, 1), end=date(2024, 6, 30)) -> ResultCacheScope:
+    return ResultCacheScope(tuple(tickers), start, end)
+
+
+class TestCacheKey:
+    """캐시 키"""
+
+    def test_portfolio_order_does_not_change_key(self):
+        """Given: 종목 순서만 다른 요청 When: 키 계산 Then: 같은 키"""
+        versions = {'AAPL': 'v1', 'MSFT': 'v1'}
+        reordered = _request([{'symbol': 'MSFT', 'amount': 5000.0}, {'symbol': 'AAPL', 'amount': 5000.0}])
+
+        assert BacktestResultCache.make_key(_request(), versions) == BacktestResultCache.make_key(reordered, versions)
+
+    def test_data_version_or_parameter_changes_key(self):
+        """Given: 같은 요청 When: 데이터 버전/수수료 변경 Then: 다른 키"""
+        key = BacktestResultCache.make_key(_request(), {'AAPL': 'v1'})
+
+        assert BacktestResultCache.make_key(_request(), {'AAPL': 'v2'}) != key
+        assert BacktestResultCache.make_key(_request(commission=0.01), {'AAPL': 'v1'}) != key
+
+
+class TestMemoryTier:
+    """메모리 계층"""
+
+    def test_lru_eviction(self):
+        """Given: 최대 2개 When: a 조회 후 c 저장 Then: 가장 오래 안 쓴 b 제거"""
+        cache = BacktestResultCache(max_entries=2, ttl_seconds=60)
+        for key in 'abc':
+            if key == 'c':
+                cache.get('a')
+            cache.put(key, _scope('AAPL'), key.encode())
+
+        assert cache.get('b') is None
+        assert cache.get('a') == b'a'
+        assert cache.get('c') == b'c'
+
+    def test_ttl_expiry(self):
+        """Given: TTL 60초 When: 61초 후 조회 Then: 만료"""
+        cache = BacktestResultCache(max_entries=4, ttl_seconds=60)
+        with patch('app.services.result_cache.time.time', return_value=1000.0):
+            cache.put('k', _scope('AAPL'), b'{}')
+        with patch('app.services.result_cache.time.time', return_value=1061.0):
+            assert cache.get('k') is None
+
+    def test_invalidate_only_overlapping_entries(self):
+        """Given: AAPL 상반기, AAPL 하반기, MSFT 상반기 결과 When: AAPL 3월 저장 무효화
+        Then: AAPL 상반기만 제거"""
+        cache = BacktestResultCache(max_entries=8, ttl_seconds=60)
+        cache.put('aapl_h1', _scope('AAPL', '^GSPC'), b'{}')
+        cache.put('aapl_h2', _scope('AAPL', start=date(2024, 7, 1), end=date(2024, 12, 31)), b'{}')
+        cache.put('msft_h1', _scope('MSFT'), b'{}')
+
+        removed = cache.invalidate('aapl', date(2024, 3, 1), date(2024, 3, 29))
+
+        assert removed == 1
+        assert cache.get('aapl_h1') is None
+        assert cache.get('aapl_h2') == b'{}'
+        assert cache.get('msft_h1') == b'{}'
+
+
+class TestSqlStore:
+    """SQL 계층 (SQLite 파일)"""
+
+    def test_round_trip_promotes_and_invalidates(self, tmp_path):
+        """Given: SQLite 계층에 저장 후 메모리 비움 When: 조회/무효화
+        Then: SQL 계층에서 읽어 메모리에 승격, 무효화 후에는 미스"""
+        store = SqlResultStore(create_engine(f"sqlite:///{tmp_path / 'cache.sqlite3'}"), create_table=True)
+        cache = BacktestResultCache(max_entries=4, ttl_seconds=60, store=store)
+        value = '{"status":"success","data":{"name":"삼성전자"}}'.encode('utf-8')
+        cache.put('k', _scope('AAPL', '^GSPC'), value)
+        cache._entries.clear()
+
+        assert cache.get('k') == value
+        assert cache.get_stats()['store_hits'] == 1
+        assert 'k' in cache._entries
+
+        cache.invalidate('^GSPC', date(2024, 6, 1), date(2024, 6, 30))
+        cache._entries.clear()
+
+        assert cache.get('k') is None
+
+    def test_missing_table_is_a_miss(self):
+        """Given: 테이블이 없는 DB When: 저장/조회 Then: 예외 없이 메모리 계층만 사용"""
+        store = SqlResultStore(create_engine('sqlite://'))
+        cache = BacktestResultCache(max_entries=4, ttl_seconds=60, store=store)
+
+        cache.put('k', _scope('AAPL'), b'{}')
+        cache._entries.clear()
+
+        assert cache.get('k') is None
+        assert cache.get_stats()['errors'] == 2
+
+
+class TestScope:
+    """캐시 대상 판단"""
+
+    def test_includes_fx_and_benchmarks(self):
+        """Given: 미국/한국 종목 When: scope Then: 종목 + 환율 + 벤치마크 티커, 환율 조회 여유 구간 포함"""
+        cache = BacktestResultCache(max_entries=4, ttl_seconds=60)
+        request = _request([{'symbol': 'AAPL', 'amount': 5000.0}, {'symbol': '005930.KS', 'amount': 5000.0}])
+
+        scope = cache.scope(request, ['AAPL', '005930.KS'], {'AAPL': 'USD', '005930.KS': 'KRW'}, today=date(2024, 7, 10))
+
+        assert scope.tickers == ('005930.KS', 'AAPL', 'KRW=X', '^GSPC', '^IXIC')
+        assert scope.start < date(2024, 1, 2)
+        assert scope.end == date(2024, 6, 28)
+
+    @pytest.mark.parametrize('end_date, today', [
+        ('2024-06-28', date(2024, 6, 28)),  # 종료일 당일 (봉 미확정)
+        ('2024-07-05', date(2024, 7, 5)),
+    ])
+    def test_unsettled_end_date_is_not_cached(self, end_date, today):
+        """Given: 종료일이 마지막 완결 거래일 이후 When: scope Then: None"""
+        cache = BacktestResultCache(max_entries=4, ttl_seconds=60)
+
+        assert cache.scope(_request(end_date=end_date), ['AAPL', 'MSFT'], {}, today=today) is None
+
+    def test_unseeded_monte_carlo_or_disabled_is_not_cached(self):
+        """Given: 시드 없는 몬테카를로, 비활성 캐시 When: scope Then: None, 시드가 있으면 대상"""
+        cache = BacktestResultCache(max_entries=4, ttl_seconds=60)
+        today = date(2024, 7, 10)
+
+        assert cache.scope(_request(monte_carlo={'n_paths': 100}), ['AAPL'], {}, today=today) is None
+        assert cache.scope(_request(monte_carlo={'n_paths': 100, 'seed': 7}), ['AAPL'], {}, today=today) is not None
+        disabled = BacktestResultCache(max_entries=4, ttl_seconds=60, enabled=False)
+        assert disabled.scope(_request(), ['AAPL'], {}, today=today) is None
+
+
+class TestPriceVersions:
+    """가격 데이터 버전 스탬프"""
+
+    @pytest.fixture
+    def engine(self):
+        engine = create_engine('sqlite://', poolclass=StaticPool, connect_args={'check_same_thread': False})
+        with engine.begin() as conn:
+            conn.execute(text("CREATE TABLE stocks (id INTEGER PRIMARY KEY, ticker TEXT)"))
+            conn.execute(text(
+                "CREATE TABLE daily_prices (stock_id INTEGER, date TEXT, close REAL, adj_close REAL, volume INTEGER)"
+            ))
+            conn.execute(text("INSERT INTO stocks VALUES (1, 'AAPL'), (2, 'MSFT')"))
+            conn.execute(text(
+                "INSERT INTO daily_prices VALUES (1, '2024-01-02', 10, 10, 100), (1, '2024-01-03', 11, 11, 100)"
+            ))
+        return engine
+
+    def _versions(self, engine):
+        with patch('app.services.yfinance_db._get_engine', return_value=engine):
+            return yfinance_db.get_price_versions(['aapl', 'MSFT', 'NONE'], date(2024, 1, 1), date(2024, 1, 31))
+
+    def test_stamp_changes_with_rows_in_range(self, engine):
+        """Given: AAPL 2행, MSFT 0행 When: 구간 안 값 수정 / 구간 밖 행 추가
+        Then: 구간 안 수정만 스탬프 변경, 없는 티커는 'none'"""
+        before = self._versions(engine)
+        assert before['NONE'] == 'none'
+        assert before['MSFT'] != before['AAPL']
+
+        with engine.begin() as conn:
+            conn.execute(text("INSERT INTO daily_prices VALUES (1, '2024-02-01', 12, 12, 100)"))
+        assert self._versions(engine) == before
+
+        with engine.begin() as conn:
+            conn.execute(text("UPDATE daily_prices SET adj_close = 9.5 WHERE date = '2024-01-02'"))
+        assert self._versions(engine)['AAPL'] != before['AAPL']
@@ -0,0 +1,139 @@
+"""
+StockRepository 단일 비행(single-flight) 단위 테스트
+
+**테스트 범위**:
+- 같은 티커·포함 구간 동시 조회 합류 (DB 조회 1회)
+- 겹치는 구간 조회 직렬화
+- 선행 조회 실패 전파
+- 통계 (loads/coalesced/serialized)
+
+**테스트 원칙**:
+- DB 없이 실행 (yfinance_db.load_ticker_data mock)
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.repositories.stock_repository import StockRepository
+
+
+def _frame(start: str, end: str) -> pd.DataFrame:
+    index = pd.DatetimeIndex(pd.bdate_range(start, end), name='date')
+    return pd.DataFrame({'Close': np.arange(len(index), dtype=float)}, index=index)
+
+
+class _BlockingLoader:
+    """첫 호출을 release 전까지 붙잡아 두는 load_ticker_data 대역"""
+
+    def __init__(self, error: Exception = None):
+        self.release = threading.Event()
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+        self.error = error
+        self._lock = threading.Lock()
+
+    def __call__(self, ticker, start_date, end_date, max_retries, retry_delay):
+        with self._lock:
+            self.calls.append((start_date, end_date))
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        self.release.wait(timeout=5)
+        with self._lock:
+            self.active -= 1
+        if self.error is not None:
+            raise self.error
+        return _frame(start_date, end_date)
+
+
+def _wait_until(predicate, timeout: float = 5.0) -> None:
+    deadline = time.time() + timeout
+    while not predicate():
+        if time.time() > deadline:
+            raise AssertionError("timeout")
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def repo():
+    return StockRepository()
+
+
+class TestSingleFlight:
+    """동시 조회 합치기"""
+
+    def test_concurrent_contained_loads_share_one_db_call(self, repo):
+        """Given: 1년 구간 조회 진행 중
+        When: 같은 구간 3건, 하위 구간 1건이 동시에 요청
+        Then: DB 조회 1회, 하위 구간은 슬라이스로 반환"""
+        loader = _BlockingLoader()
+        with patch('app.repositories.stock_repository.yfinance_db.load_ticker_data', side_effect=loader), \
+                ThreadPoolExecutor(max_workers=5) as pool:
+            first = pool.submit(repo.load_stock_data, 'AAPL', '2023-01-01', '2023-12-31')
+            _wait_until(lambda: len(loader.calls) == 1)
+            same = [pool.submit(repo.load_stock_data, 'AAPL', '2023-01-01', '2023-12-31') for _ in range(3)]
+            sub = pool.submit(repo.load_stock_data, 'AAPL', '2023-03-01', '2023-03-31')
+            _wait_until(lambda: repo.get_load_stats()['coalesced'] == 4)
+            loader.release.set()
+
+            results = [f.result(timeout=5) for f in [first] + same]
+            sub_result = sub.result(timeout=5)
+
+        assert len(loader.calls) == 1
+        for result in results[1:]:
+            pd.testing.assert_frame_equal(result, results[0])
+            assert result is not results[0]
+        pd.testing.assert_frame_equal(sub_result, results[0].loc['2023-03-01':'2023-03-31'])
+        assert repo.get_load_stats() == {'loads': 1, 'coalesced': 4, 'serialized': 0, 'in_flight': 0}
+
+    def test_overlapping_load_waits_for_in_flight(self, repo):
+        """Given: 상반기 조회 진행 중 When: 겹치는 2~9월 조회 Then: 선행 조회 종료 후 실행 (동시 실행 없음)"""
+        loader = _BlockingLoader()
+        with patch('app.repositories.stock_repository.yfinance_db.load_ticker_data', side_effect=loader), \
+                ThreadPoolExecutor(max_workers=2) as pool:
+            first = pool.submit(repo.load_stock_data, 'AAPL', '2023-01-01', '2023-06-30')
+            _wait_until(lambda: len(loader.calls) == 1)
+            second = pool.submit(repo.load_stock_data, 'AAPL', '2023-02-01', '2023-09-30')
+            _wait_until(lambda: repo.get_load_stats()['serialized'] == 1)
+            assert len(loader.calls) == 1
+            loader.release.set()
+            first.result(timeout=5)
+            second.result(timeout=5)
+
+        assert loader.calls == [('2023-01-01', '2023-06-30'), ('2023-02-01', '2023-09-30')]
+        assert loader.max_active == 1
+
+    def test_other_tickers_are_not_blocked(self, repo):
+        """Given: AAPL 조회 진행 중 When: MSFT 조회 Then: 기다리지 않고 별도 실행"""
+        loader = _BlockingLoader()
+        with patch('app.repositories.stock_repository.yfinance_db.load_ticker_data', side_effect=loader), \
+                ThreadPoolExecutor(max_workers=2) as pool:
+            pool.submit(repo.load_stock_data, 'AAPL', '2023-01-01', '2023-06-30')
+            pool.submit(repo.load_stock_data, 'MSFT', '2023-01-01', '2023-06-30')
+            _wait_until(lambda: loader.active == 2)
+            loader.release.set()
+
+        assert repo.get_load_stats()['loads'] == 2
+
+    def test_leader_error_is_propagated_to_followers(self, repo):
+        """Given: 선행 조회 실패 When: 합류한 요청 Then: 같은 예외, 진행 중 목록 정리"""
+        loader = _BlockingLoader(error=ValueError("AAPL 데이터가 비어있습니다"))
+        with patch('app.repositories.stock_repository.yfinance_db.load_ticker_data', side_effect=loader), \
+                ThreadPoolExecutor(max_workers=2) as pool:
+            first = pool.submit(repo.load_stock_data, 'AAPL', '2023-01-01', '2023-06-30')
+            _wait_until(lambda: len(loader.calls) == 1)
+            follower = pool.submit(repo.load_stock_data, 'AAPL', '2023-01-01', '2023-06-30')
+            _wait_until(lambda: repo.get_load_stats()['coalesced'] == 1)
+            loader.release.set()
+
+            with pytest.raises(ValueError):
+                first.result(timeout=5)
+            with pytest.raises(ValueError):
+                follower.result(timeout=5)
+
+        assert repo.get_load_stats()['in_flight'] == 0
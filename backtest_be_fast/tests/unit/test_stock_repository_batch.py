@@ -0,0 +1,182 @@
+"""
+다중 티커 주가 일괄 조회 단위 테스트
+
+**테스트 범위**:
+- yfinance_db.load_ticker_data_batch: 티커 수와 무관한 쿼리 횟수, stock_id별 분할, 누락 구간이 있는 티커 제외
+- StockRepository.load_stock_data_batch: 로컬 가격 저장소 우선, 배치 누락 티커는 단일 비행 경로로 동시 조회
+
+**테스트 원칙**:
+- MySQL 대신 SQLite 인메모리 엔진 사용 (tests/conftest.py: sqlite_price_engine)
+- yfinance 호출은 mock
+"""
+import threading
+import time
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+from sqlalchemy import event
+
+from app.repositories.stock_repository import StockRepository
+from app.services import yfinance_db
+
+
+@pytest.fixture
+def engine(sqlite_price_engine):
+    days = [d.strftime('%Y-%m-%d') for d in pd.bdate_range('2023-01-02', '2023-03-31')]
+    return sqlite_price_engine({'AAPL': days, 'MSFT': days, 'GOOGL': days[:20]})
+
+
+@pytest.fixture
+def statements(engine):
+    executed = []
+    event.listen(engine, 'before_cursor_execute', lambda *args: executed.append(args[2]))
+    return executed
+
+
+class TestLoadTickerDataBatch:
+    """DB 일괄 조회"""
+
+    def test_splits_rows_with_constant_query_count(self, engine, statements):
+        """Given: DB에 충분한 구간이 있는 티커 2개
+        When: 일괄 조회
+        Then: 쿼리 3회, 티커별 프레임이 개별 조회와 같은 형식"""
+        with patch('app.services.yfinance_db._get_engine', return_value=engine), \
+                patch('app.services.yfinance_db.data_fetcher') as fetcher:
+            result = yfinance_db.load_ticker_data_batch(['AAPL', 'MSFT'], '2023-02-01', '2023-02-28')
+
+        fetcher.fetch_stock_data.assert_not_called()
+        assert len(statements) == 3
+        assert set(result) == {'AAPL', 'MSFT'}
+
+        aapl = result['AAPL']
+        assert aapl.index.name == 'date'
+        assert list(aapl.columns) == ['Open', 'High', 'Low', 'Close', 'Adj Close', 'Volume']
+        assert aapl['Volume'].dtype == 'int64'
+        assert aapl.index.min() >= pd.Timestamp('2023-02-01')
+        assert aapl.index.max() <= pd.Timestamp('2023-02-28')
+        assert (result['MSFT']['Close'] > 200).all() and (aapl['Close'] < 200).all()
+
+    def test_tickers_needing_gap_fill_are_excluded(self, engine):
+        """Given: GOOGL만 요청 구간 뒤쪽이 비어 있음
+        When: 일괄 조회
+        Then: 누락 구간 보완 없이 GOOGL만 결과에서 제외"""
+        with patch('app.services.yfinance_db._get_engine', return_value=engine), \
+                patch('app.services.yfinance_db._fetch_and_save_missing_data') as fill:
+            result = yfinance_db.load_ticker_data_batch(['AAPL', 'GOOGL'], '2023-01-02', '2023-03-31')
+
+        fill.assert_not_called()
+        assert set(result) == {'AAPL'}
+
+    def test_unknown_ticker_is_excluded(self, engine):
+        """Given: DB에 없는 티커
+        When: 일괄 조회
+        Then: yfinance 수집/종목 생성 없이 해당 티커만 결과에서 제외"""
+        with patch('app.services.yfinance_db._get_engine', return_value=engine), \
+                patch('app.services.yfinance_db.data_fetcher') as fetcher:
+            result = yfinance_db.load_ticker_data_batch(['AAPL', 'NOPE'], '2023-02-01', '2023-02-28')
+
+        fetcher.fetch_stock_data.assert_not_called()
+        fetcher.fetch_ticker_info.assert_not_called()
+        assert set(result) == {'AAPL'}
+
+
+class TestStockRepositoryBatch:
+    """Repository 일괄 조회"""
+
+    def test_missing_tickers_fall_back_to_single_load(self):
+        """Given: 배치 결과에서 빠진 티커
+        When: load_stock_data_batch
+        Then: 그 티커만 개별 조회, 개별 조회도 실패하면 제외"""
+        repo = StockRepository()
+        frame = pd.DataFrame({'Close': [1.0]}, index=pd.DatetimeIndex(['2023-01-03'], name='date'))
+
+        def single(ticker, **kwargs):
+            if ticker == 'BAD':
+                raise ValueError("데이터 없음")
+            return frame
+
+        with patch('app.repositories.stock_repository.yfinance_db.load_ticker_data_batch',
+                   return_value={'AAPL': frame}) as batch, \
+                patch('app.repositories.stock_repository.yfinance_db.load_ticker_data',
+                      side_effect=single) as single_load:
+            result = repo.load_stock_data_batch(['AAPL', 'MSFT', 'BAD'], '2023-01-01', '2023-01-31')
+
+        batch.assert_called_once_with(['AAPL', 'MSFT', 'BAD'], '2023-01-01', '2023-01-31')
+        assert sorted(call.kwargs['ticker'] for call in single_load.call_args_list) == ['BAD', 'MSFT']
+        assert set(result) == {'AAPL', 'MSFT'}
+
+    def test_local_store_hits_skip_db(self):
+        """Given: 로컬 가격 저장소에 있는 티커
+        When: load_stock_data_batch
+        Then: 나머지 티커만 배치 조회"""
+        repo = StockRepository()
+        frame = pd.DataFrame({'Close': [1.0]}, index=pd.DatetimeIndex(['2023-01-03'], name='date'))
+
+        with patch('app.repositories.stock_repository.local_price_store') as store, \
+                patch('app.repositories.stock_repository.yfinance_db.load_ticker_data_batch',
+                      return_value={'MSFT': frame}) as batch:
+            store.read.side_effect = lambda ticker, start, end: frame if ticker == 'AAPL' else None
+            result = repo.load_stock_data_batch(['AAPL', 'MSFT'], '2023-01-01', '2023-01-31')
+
+        batch.assert_called_once_with(['MSFT'], '2023-01-01', '2023-01-31')
+        store.record_load.assert_called_once_with('MSFT', frame, '2023-01-01', '2023-01-31')
+        assert set(result) == {'AAPL', 'MSFT'}
+
+    def test_gap_fill_tickers_load_concurrently(self):
+        """Given: 배치 결과에서 빠진 티커 2개 (서로의 조회가 시작되어야 끝나는 로더)
+        When: load_stock_data_batch
+        Then: 두 티커의 개별 조회가 동시에 진행되어 모두 반환"""
+        repo = StockRepository()
+        frame = pd.DataFrame({'Close': [1.0]}, index=pd.DatetimeIndex(['2023-01-03'], name='date'))
+        barrier = threading.Barrier(2, timeout=5)
+
+        def single(ticker, **kwargs):
+            barrier.wait()
+            return frame
+
+        with patch('app.repositories.stock_repository.local_price_store') as store, \
+                patch('app.repositories.stock_repository.yfinance_db.load_ticker_data_batch', return_value={}), \
+                patch('app.repositories.stock_repository.yfinance_db.load_ticker_data', side_effect=single):
+            store.read.return_value = None
+            result = repo.load_stock_data_batch(['MSFT', 'GOOGL'], '2023-01-01', '2023-01-31')
+
+        assert set(result) == {'MSFT', 'GOOGL'}
+
+    def test_gap_fill_joins_in_flight_load(self):
+        """Given: 배치의 MSFT 보완 조회가 진행 중
+        When: 같은 구간 MSFT를 단건 조회
+        Then: 진행 중인 조회에 합류 (DB/yfinance 조회 1회)"""
+        repo = StockRepository()
+        frame = pd.DataFrame({'Close': [1.0]}, index=pd.DatetimeIndex(['2023-01-03'], name='date'))
+        started, release = threading.Event(), threading.Event()
+        results = {}
+
+        def single(ticker, **kwargs):
+            started.set()
+            release.wait(5)
+            return frame
+
+        with patch('app.repositories.stock_repository.local_price_store') as store, \
+                patch('app.repositories.stock_repository.yfinance_db.load_ticker_data_batch', return_value={}), \
+                patch('app.repositories.stock_repository.yfinance_db.load_ticker_data',
+                      side_effect=single) as single_load:
+            store.read.return_value = None
+            batch = threading.Thread(target=lambda: results.update(
+                repo.load_stock_data_batch(['MSFT'], '2023-01-01', '2023-01-31')
+            ))
+            batch.start()
+            assert started.wait(5)
+            follower = threading.Thread(target=lambda: results.update(
+                single=repo.load_stock_data('MSFT', '2023-01-01', '2023-01-31')
+            ))
+            follower.start()
+            deadline = time.monotonic() + 5
+            while repo.get_load_stats()['coalesced'] == 0 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            release.set()
+            batch.join(5)
+            follower.join(5)
+
+        single_load.assert_called_once()
+        assert set(results) == {'MSFT', 'single'}
@@ -0,0 +1,203 @@
+"""
+전략 벡터화 엔진 패리티 테스트
+
+**테스트 범위**:
+- StrategyVectorEngine 결과가 backtesting.py Backtest.run()과 일치하는지 검증
+- 6개 기본 전략 × 수수료/스프레드 조합, position_size 오버라이드, 증거금 부족 주문 취소
+- BacktestEngine의 전략별 엔진 선택
+
+**테스트 원칙**:
+- 같은 픽스처 데이터를 두 엔진에 넣고 거래 내역 / 자산 곡선 / 통계 비교
+- 시가 갭이 있는 랜덤워크 데이터로 체결가(다음 봉 시가)와 주문 취소 경로까지 검증
+"""
+import warnings
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+from backtesting import Backtest
+
+from app.schemas.requests import BacktestRequest
+from app.services.backtest_engine import BacktestEngine
+from app.services.strategy_vector_engine import StrategyVectorEngine
+from app.strategies.strategies import (
+    BollingerBandsStrategy,
+    BuyAndHoldStrategy,
+    EmaStrategy,
+    MacdStrategy,
+    RsiStrategy,
+    SmaCrossStrategy,
+)
+
+STRATEGY_CLASSES = [
+    SmaCrossStrategy,
+    EmaStrategy,
+    RsiStrategy,
+    BollingerBandsStrategy,
+    MacdStrategy,
+    BuyAndHoldStrategy,
+]
+
+TRADE_COLUMNS = ['Size', 'EntryBar', 'ExitBar', 'EntryPrice', 'ExitPrice', 'PnL', 'Commission', 'ReturnPct']
+
+STAT_KEYS = [
+    'Exposure Time [%]', 'Equity Final [$]', 'Equity Peak [$]', 'Return [%]', 'Buy & Hold Return [%]',
+    'Return (Ann.) [%]', 'Volatility (Ann.) [%]', 'CAGR [%]', 'Sharpe Ratio', 'Sortino Ratio',
+    'Calmar Ratio', 'Alpha [%]', 'Beta', 'Max. Drawdown [%]', 'Avg. Drawdown [%]', '# Trades',
+    'Win Rate [%]', 'Best Trade [%]', 'Worst Trade [%]', 'Avg. Trade [%]', 'Profit Factor',
+    'Expectancy [%]', 'SQN', 'Kelly Criterion',
+]
+
+
+def _price_frame(periods: int = 1200, seed: int = 1, gap: float = 0.01) -> pd.DataFrame:
+    """시가 갭이 있는 랜덤워크 OHLCV"""
+    index = pd.bdate_range('2018-01-01', periods=periods)
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0.0003, 0.02, periods)))
+    open_ = close * (1 + rng.normal(0, gap, periods))
+    return pd.DataFrame({
+        'Open': open_,
+        'High': np.maximum(open_, close) * 1.01,
+        'Low': np.minimum(open_, close) * 0.99,
+        'Close': close,
+        'Volume': rng.integers(1_000, 10_000, periods),
+    }, index=index)
+
+
+def _run_both(data, strategy_class, cash=10000.0, commission=0.0, spread=0.0):
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        expected = Backtest(data, strategy_class, cash=cash, commission=commission, spread=spread).run()
+    actual = StrategyVectorEngine().run(data, strategy_class, cash=cash, commission=commission, spread=spread)
+    return expected, actual
+
+
+def _assert_parity(expected, actual):
+    np.testing.assert_allclose(
+        actual['_equity_curve']['Equity'].to_numpy(),
+        expected['_equity_curve']['Equity'].to_numpy(),
+        rtol=1e-12,
+    )
+    expected_trades = expected['_trades'][TRADE_COLUMNS].reset_index(drop=True)
+    actual_trades = actual['_trades'][TRADE_COLUMNS].reset_index(drop=True)
+    assert len(actual_trades) == len(expected_trades)
+    np.testing.assert_allclose(
+        actual_trades.to_numpy(dtype=float), expected_trades.to_numpy(dtype=float), rtol=1e-12
+    )
+    for key in STAT_KEYS:
+        np.testing.assert_allclose(float(actual[key]), float(expected[key]), rtol=1e-9, err_msg=key)
+    for key in ('Max. Drawdown Duration', 'Avg. Drawdown Duration', 'Max. Trade Duration'):
+        assert actual[key] == expected[key] or (pd.isna(actual[key]) and pd.isna(expected[key])), key
+
+
+class TestParity:
+    """backtesting.py와 결과 일치"""
+
+    @pytest.mark.parametrize('strategy_class', STRATEGY_CLASSES, ids=lambda cls: cls.__name__)
+    @pytest.mark.parametrize('commission, spread', [(0.0, 0.0), (0.002, 0.0), (0.002, 0.001)])
+    @pytest.mark.parametrize('cash', [10000.0, 1e6])
+    def test_builtin_strategies_match(self, strategy_class, commission, spread, cash):
+        """Given: 기본 전략 (큰 현금에서는 기본 주문 비율 1 - eps의 1주 차이까지 드러남)
+        When: 두 엔진으로 실행 Then: 거래/자산 곡선/통계 일치"""
+        expected, actual = _run_both(
+            _price_frame(), strategy_class, cash=cash, commission=commission, spread=spread
+        )
+
+        _assert_parity(expected, actual)
+
+    def test_parameter_overrides_match(self):
+        """Given: 파라미터 오버라이드 서브클래스 (BacktestEngine._build_strategy 형태)
+        When: 두 엔진으로 실행 Then: 일치"""
+        configured = type('MacdStrategyConfigured', (MacdStrategy,), {
+            'fast_period': 5, 'slow_period': 15, 'signal_period': 4, 'position_size': 0.5,
+        })
+
+        expected, actual = _run_both(_price_frame(seed=3), configured, commission=0.001)
+
+        assert actual['# Trades'] > 10
+        _assert_parity(expected, actual)
+
+    def test_insufficient_margin_orders_are_canceled(self):
+        """Given: position_size=1.0 + 큰 시가 갭 (다음 봉 시가가 오르면 증거금 부족)
+        When: 두 엔진으로 실행 Then: 같은 주문이 취소되어 일치"""
+        configured = type('EmaStrategyConfigured', (EmaStrategy,), {
+            'fast_window': 5, 'slow_window': 12, 'position_size': 1.0,
+        })
+
+        expected, actual = _run_both(_price_frame(seed=5, gap=0.03), configured, commission=0.002)
+
+        _assert_parity(expected, actual)
+
+    def test_data_shorter_than_warmup(self):
+        """Given: 장기 이동평균 기간보다 짧은 데이터 When: 실행 Then: 거래 없음, 자산 곡선 일치"""
+        expected, actual = _run_both(_price_frame(periods=15), SmaCrossStrategy)
+
+        assert actual['# Trades'] == 0
+        _assert_parity(expected, actual)
+
+
+class TestSupports:
+    """엔진 지원 여부"""
+
+    def test_configured_subclass_is_supported(self):
+        """Given: 속성만 오버라이드한 서브클래스 When: supports Then: True"""
+        configured = type('SmaCrossStrategyConfigured', (SmaCrossStrategy,), {'sma_short': 5})
+
+        assert StrategyVectorEngine().supports(configured, _price_frame(periods=50))
+
+    def test_custom_next_is_not_supported(self):
+        """Given: next()를 재정의한 서브클래스 When: supports Then: False"""
+        class Custom(SmaCrossStrategy):
+            def next(self):
+                pass
+
+        assert not StrategyVectorEngine().supports(Custom, _price_frame(periods=50))
+
+
+class TestEngineSelection:
+    """BacktestEngine 전략별 엔진 선택"""
+
+    @pytest.fixture
+    def engine(self):
+        return BacktestEngine(
+            data_repository=MagicMock(),
+            executor=MagicMock(enabled=False),
+            vector_engine=StrategyVectorEngine(),
+        )
+
+    @pytest.fixture
+    def request_model(self):
+        return BacktestRequest(
+            ticker='AAPL', start_date='2018-01-01', end_date='2022-08-01', strategy='sma_strategy',
+            commission=0.002,
+        )
+
+    @pytest.mark.asyncio
+    async def test_builtin_strategy_uses_vector_engine(self, engine, request_model):
+        """Given: 기본 전략 When: _run_strategy Then: 벡터화 엔진 실행, bt.run() 미호출"""
+        with patch.object(engine, '_execute_backtest') as execute:
+            stats = await engine._run_strategy(_price_frame(), SmaCrossStrategy, request_model)
+
+        execute.assert_not_called()
+        assert stats['# Trades'] > 0
+
+    @pytest.mark.asyncio
+    async def test_backtesting_setting_and_custom_strategy_fall_back(self, engine, request_model):
+        """Given: 엔진 설정 backtesting 또는 지원하지 않는 전략 When: _run_strategy Then: bt.run() 경로"""
+        class Custom(SmaCrossStrategy):
+            def next(self):
+                super().next()
+
+        data = _price_frame()
+        engine.vector_engine.run = MagicMock(side_effect=AssertionError("벡터화 엔진 호출"))
+
+        with patch('app.services.backtest_engine.settings.strategy_backtest_engine', 'backtesting'):
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                by_setting = await engine._run_strategy(data, SmaCrossStrategy, request_model)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            by_strategy = await engine._run_strategy(data, Custom, request_model)
+
+        assert by_setting['# Trades'] == by_strategy['# Trades'] > 0
@@ -0,0 +1,144 @@
+"""
+거래소 거래일 캘린더 단위 테스트
+
+**테스트 범위**:
+- TradingCalendar: 세션 판별/개수/오프셋, 배열 단위 세션 수
+- get_calendar: NYSE 연간 세션 수와 휴장일
+- exchange_for_ticker / union_sessions: 티커 접미사별 거래소, 시장 간 세션 합집합
+- UnifiedDataService._collect_single_benchmark: 주말 행 없이 종목 세션에 맞춘 벤치마크
+
+**테스트 원칙**:
+- 공개된 NYSE 휴장일로 검증 가능한 날짜 사용
+- 데이터 조회는 mock
+"""
+from datetime import date
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services.unified_data_service import UnifiedDataService
+from app.utils.trading_calendar import (
+    TradingCalendar,
+    calendar_for_ticker,
+    exchange_for_ticker,
+    get_calendar,
+    union_sessions,
+)
+
+
+class TestNyseCalendar:
+    """NYSE 캘린더"""
+
+    @pytest.mark.parametrize('year, expected', [(2023, 250), (2024, 252)])
+    def test_yearly_session_count(self, year, expected):
+        """Given: NYSE 캘린더 When: 연간 세션 수 Then: 공식 거래일 수와 일치"""
+        assert get_calendar('XNYS').session_count(date(year, 1, 1), date(year, 12, 31)) == expected
+
+    @pytest.mark.parametrize('day', [
+        date(2024, 1, 15),   # Martin Luther King Jr. Day
+        date(2024, 3, 29),   # Good Friday
+        date(2024, 6, 19),   # Juneteenth
+        date(2024, 7, 4),
+        date(2024, 11, 28),  # Thanksgiving
+        date(2024, 12, 25),
+    ])
+    def test_holidays_are_not_sessions(self, day):
+        """Given: NYSE 휴장일 When: 세션 판별 Then: 세션 아님"""
+        assert not get_calendar('XNYS').is_session(day)
+
+    def test_previous_session_and_offset_skip_holidays(self):
+        """Given: 부활절 연휴(3/29 Good Friday) When: 이전 세션/오프셋 Then: 휴장일과 주말 건너뜀"""
+        calendar = get_calendar('XNYS')
+
+        assert calendar.previous_session(date(2024, 4, 1)) == date(2024, 3, 28)
+        assert calendar.offset(date(2024, 3, 28), 1) == date(2024, 4, 1)
+        assert calendar.offset(date(2024, 3, 30), 0) == date(2024, 4, 1)
+        assert calendar.offset(date(2024, 4, 1), -2) == date(2024, 3, 27)
+
+
+class TestTradingCalendar:
+    """세션 계산 공통 동작"""
+
+    def test_session_count_is_vectorized_and_clipped(self):
+        """Given: 시작/끝 날짜 배열 When: 세션 수 Then: 원소별 개수, start > end는 0"""
+        calendar = TradingCalendar('WEEKDAYS')
+        starts = pd.DatetimeIndex(['2024-03-01', '2024-03-09', '2024-03-20'])
+        ends = pd.DatetimeIndex(['2024-03-08', '2024-03-10', '2024-03-18'])
+
+        counts = calendar.session_count(starts, ends)
+
+        assert counts.tolist() == [6, 0, 0]
+
+    def test_session_positions_difference_equals_count(self):
+        """Given: 날짜 배열 When: 세션 위치 Then: 위치 차 = (앞 날짜 다음날 ~ 뒤 날짜) 세션 수"""
+        calendar = get_calendar('XNYS')
+        days = pd.DatetimeIndex(['2024-03-27', '2024-04-05'])
+
+        positions = calendar.session_positions(days)
+
+        assert positions[1] - positions[0] == calendar.session_count(date(2024, 3, 28), date(2024, 4, 5))
+
+    def test_explicit_holidays(self):
+        """Given: 휴장일을 지정한 캘린더 When: 구간 세션 Then: 휴장일 제외"""
+        calendar = TradingCalendar('TEST', ['2024-03-06'])
+
+        sessions = calendar.sessions('2024-03-04', '2024-03-10')
+
+        assert sessions.tolist() == [date(2024, 3, 4), date(2024, 3, 5), date(2024, 3, 7), date(2024, 3, 8)]
+
+
+class TestExchangeForTicker:
+    """티커별 거래소"""
+
+    @pytest.mark.parametrize('ticker, expected', [
+        ('AAPL', 'XNYS'),
+        ('BRK.B', 'B'),
+        ('^GSPC', 'XNYS'),
+        ('^KS11', 'XKRX'),
+        ('005930.KS', 'XKRX'),
+        ('035720.kq', 'XKRX'),
+        ('7203.T', 'XTKS'),
+        ('VOD.L', 'XLON'),
+        ('KRW=X', 'FX'),
+    ])
+    def test_suffix_mapping(self, ticker, expected):
+        """Given: 티커 When: 거래소 판별 Then: 접미사/지수별 거래소 코드"""
+        assert exchange_for_ticker(ticker) == expected
+
+    def test_korean_holiday_is_us_session(self):
+        """Given: 한국 광복절(8/15, 목) When: 각 거래소 세션 판별 Then: KRX 휴장, NYSE 개장"""
+        assert not calendar_for_ticker('005930.KS').is_session(date(2024, 8, 15))
+        assert calendar_for_ticker('AAPL').is_session(date(2024, 8, 15))
+
+    def test_union_sessions_covers_both_markets(self):
+        """Given: 미국/한국 종목 When: 세션 합집합 Then: 어느 한쪽이라도 열린 날 포함, 주말 제외"""
+        sessions = union_sessions(['AAPL', '005930.KS'], '2024-07-01', '2024-07-07')
+
+        assert sessions.strftime('%Y-%m-%d').tolist() == [
+            '2024-07-01', '2024-07-02', '2024-07-03', '2024-07-04', '2024-07-05'
+        ]
+        assert np.all(sessions.dayofweek < 5)
+
+
+class TestBenchmarkAlignment:
+    """벤치마크 날짜 정렬"""
+
+    def test_benchmark_has_no_weekend_rows(self):
+        """Given: 벤치마크 데이터에 7/4(미국 휴장) 없음, 한국 종목 포함
+        When: 벤치마크 수집 Then: 7/4는 전일 값으로 채우고 주말 행은 만들지 않음"""
+        index = pd.DatetimeIndex(['2024-07-01', '2024-07-02', '2024-07-03', '2024-07-05', '2024-07-08'])
+        benchmark = pd.DataFrame({'Close': [100.0, 101.0, 102.0, 103.0, 104.0]}, index=index)
+
+        with patch('app.services.unified_data_service.data_service') as data_service:
+            data_service.get_ticker_data_sync.return_value = benchmark
+            result = UnifiedDataService()._collect_single_benchmark(
+                '^GSPC', '2024-07-01', '2024-07-08', symbols=['005930.KS']
+            )
+
+        assert [row['date'] for row in result] == [
+            '2024-07-01', '2024-07-02', '2024-07-03', '2024-07-04', '2024-07-05', '2024-07-08'
+        ]
+        assert result[3]['close'] == 102.0
+        assert result[3]['return_pct'] == 0.0
@@ -0,0 +1,113 @@
+"""
+UnifiedDataService 비동기 통합 데이터 수집 단위 테스트
+
+**테스트 범위**:
+- 비동기 수집 결과가 동기 수집 결과와 동일한지
+- 백테스트에서 로드한 가격 데이터 재사용 (재조회 없음)
+- 나머지 종목은 1회만 조회
+
+**테스트 원칙**:
+- DB/외부 API 없이 실행 (data_service, yfinance_db 함수 mock)
+"""
+from unittest.mock import AsyncMock, Mock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services.unified_data_service import UnifiedDataService
+
+
+def _frame(seed: int, start: str = '2023-01-02', end: str = '2023-03-31') -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    index = pd.DatetimeIndex(pd.bdate_range(start, end), name='date')
+    close = 100 * np.exp(rng.normal(0, 0.04, len(index)).cumsum())
+    return pd.DataFrame({
+        'Open': close, 'High': close, 'Low': close, 'Close': close, 'Adj Close': close,
+        'Volume': rng.integers(100, 1000, len(index)).astype('int64'),
+    }, index=index)
+
+
+FRAMES = {
+    'AAPL': _frame(1),
+    'MSFT': _frame(2),
+    'KRW=X': _frame(3),
+    '^GSPC': _frame(4),
+    '^IXIC': _frame(5),
+}
+
+
+@pytest.fixture
+def service():
+    news_service = Mock()
+    news_service.get_ticker_query.side_effect = lambda symbol: symbol
+    news_service.search_news.side_effect = lambda query, display: [{'title': f'{query} news'}]
+    return UnifiedDataService(news_service=news_service)
+
+
+@pytest.fixture
+def patched_sources():
+    sync_loader = Mock(side_effect=lambda ticker, start, end: FRAMES[ticker])
+    async_loader = AsyncMock(side_effect=lambda ticker, start, end: FRAMES[ticker])
+    with patch('app.services.unified_data_service.data_service.get_ticker_data_sync', sync_loader), \
+            patch('app.services.unified_data_service.data_service.get_ticker_data', async_loader), \
+            patch('app.services.unified_data_service.get_ticker_info_batch_from_db',
+                  side_effect=lambda symbols: {s: {'symbol': s, 'currency': 'USD'} for s in symbols}), \
+            patch('app.services.unified_data_service.load_news_from_db', return_value=None), \
+            patch('app.services.unified_data_service.save_news_to_db'), \
+            patch('app.services.unified_data_service.settings.exchange_rate_ticker', 'KRW=X'):
+        yield sync_loader, async_loader
+
+
+class TestCollectAllUnifiedDataAsync:
+    """비동기 통합 데이터 수집"""
+
+    @pytest.mark.asyncio
+    async def test_matches_sync_collection(self, service, patched_sources):
+        """Given: 같은 데이터 소스 When: 동기/비동기 수집 Then: 결과 동일"""
+        symbols = ['AAPL', 'MSFT']
+
+        expected = service.collect_all_unified_data(symbols, '2023-01-02', '2023-03-31', news_display_count=15)
+        result = await service.collect_all_unified_data_async(
+            symbols, '2023-01-02', '2023-03-31', news_display_count=15
+        )
+
+        assert result == expected
+
+    @pytest.mark.asyncio
+    async def test_preloaded_frames_are_not_reloaded(self, service, patched_sources):
+        """Given: AAPL은 백테스트에서 로드됨
+        When: 비동기 수집
+        Then: AAPL은 재조회 없음, MSFT는 1회만 조회 (주가/급등락 공용)"""
+        sync_loader, async_loader = patched_sources
+
+        result = await service.collect_all_unified_data_async(
+            ['AAPL', 'MSFT'], '2023-01-02', '2023-03-31', include_news=False,
+            preloaded_data={'AAPL': FRAMES['AAPL']}
+        )
+
+        loaded_tickers = [c.args[0] for c in async_loader.call_args_list + sync_loader.call_args_list]
+        assert 'AAPL' not in loaded_tickers
+        assert loaded_tickers.count('MSFT') == 1
+        assert len(result['stock_data']['AAPL']) == len(FRAMES['AAPL'])
+        assert result['latest_news'] == {}
+
+    @pytest.mark.asyncio
+    async def test_failed_symbol_returns_empty_lists(self, service, patched_sources):
+        """Given: 조회 실패 종목 When: 비동기 수집 Then: 해당 종목만 빈 리스트"""
+        _, async_loader = patched_sources
+
+        def load(ticker, start, end):
+            if ticker == 'MSFT':
+                raise ValueError("no data")
+            return FRAMES[ticker]
+
+        async_loader.side_effect = load
+
+        result = await service.collect_all_unified_data_async(
+            ['AAPL', 'MSFT'], '2023-01-02', '2023-03-31', include_news=False
+        )
+
+        assert result['stock_data']['MSFT'] == []
+        assert result['volatility_events']['MSFT'] == []
+        assert len(result['stock_data']['AAPL']) > 0
@@ -0,0 +1,171 @@
+"""
+워크포워드 분석 서비스 단위 테스트
+
+**테스트 범위**:
+- build_windows: 롤링/확장 윈도우 경계, 마지막 짧은 검증 구간, 데이터 부족
+- run_walk_forward: 가격 데이터 1회 조회, 윈도우별 최적 파라미터, 검증 구간 자산 곡선 연결
+- 검증 구간 지표 워밍업: 직전 in-sample 봉으로 워밍업 후 검증 구간만 잘라 환산
+
+**테스트 원칙**:
+- 합성 가격 데이터 사용 (DB/yfinance 호출 없음)
+- 가격 로더만 mock, 조합 실행은 실제 BacktestEngine 경로 (프로세스 풀 비활성화)
+"""
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.core.exceptions import ValidationError
+from app.schemas.requests import WalkForwardRequest
+from app.services.backtest_engine import BacktestEngine
+from app.services.optimization_service import ParameterOptimizationService
+from app.services.walk_forward_service import WalkForwardService
+
+
+@pytest.fixture
+def price_data():
+    index = pd.bdate_range('2021-01-04', periods=400)
+    rng = np.random.default_rng(11)
+    close = 100 * np.exp(np.cumsum(rng.normal(0.0004, 0.015, len(index))))
+    return pd.DataFrame({
+        'Open': close, 'High': close * 1.01, 'Low': close * 0.99, 'Close': close,
+        'Volume': 1_000_000,
+    }, index=index)
+
+
+@pytest.fixture
+def service(price_data):
+    engine = BacktestEngine(data_repository=MagicMock(), executor=MagicMock(enabled=False))
+    engine._get_price_data = AsyncMock(return_value=price_data)
+    engine._convert_to_usd = AsyncMock(side_effect=lambda ticker, data, start, end: data)
+    return WalkForwardService(optimizer=ParameterOptimizationService(engine=engine))
+
+
+def _request(**overrides):
+    fields = dict(
+        ticker='AAPL', start_date='2021-01-04', end_date='2022-07-15', strategy='ema_strategy',
+        param_grid={'fast_window': [5, 10], 'slow_window': [20, 30]},
+        rank_by='total_return_pct', in_sample_bars=150, out_of_sample_bars=60,
+    )
+    fields.update(overrides)
+    return WalkForwardRequest(**fields)
+
+
+class TestBuildWindows:
+    """윈도우 경계"""
+
+    def test_rolling_windows_step_by_out_of_sample(self):
+        """Given: 400봉, IS 150 / OOS 60 When: 롤링 윈도우 Then: 5개, 마지막 검증 구간은 남은 10봉"""
+        windows = WalkForwardService.build_windows(400, 150, 60, anchored=False)
+
+        assert windows == [
+            (0, 150, 210), (60, 210, 270), (120, 270, 330), (180, 330, 390), (240, 390, 400),
+        ]
+
+    def test_anchored_windows_start_at_first_bar(self):
+        """Given: anchored When: 윈도우 생성 Then: in-sample 시작은 항상 0"""
+        windows = WalkForwardService.build_windows(400, 150, 60, anchored=True)
+
+        assert [w[0] for w in windows] == [0] * 5
+        assert [w[1] for w in windows] == [150, 210, 270, 330, 390]
+
+    def test_too_few_bars_is_rejected(self):
+        """Given: in-sample 길이보다 짧은 데이터 When: 윈도우 생성 Then: ValidationError"""
+        with pytest.raises(ValidationError):
+            WalkForwardService.build_windows(100, 150, 60, anchored=False)
+
+
+class TestRunWalkForward:
+    """워크포워드 실행"""
+
+    @pytest.mark.asyncio
+    async def test_windows_and_stitched_equity_curve(self, service, price_data):
+        """Given: 400봉, 4개 유효 조합 When: 워크포워드 실행
+        Then: 가격 1회 조회, 윈도우별 최적 파라미터, 검증 구간 길이 합 = 자산 곡선 길이"""
+        result = await service.run_walk_forward(_request())
+
+        service.engine._get_price_data.assert_awaited_once()
+        windows = result['windows']
+        assert len(windows) == 5
+        assert all(w['evaluated'] == 4 and w['failed'] == 0 for w in windows)
+        assert all(set(w['best_params']) == {'fast_window', 'slow_window'} for w in windows)
+        assert windows[0]['out_of_sample']['start_date'] == price_data.index[150].strftime('%Y-%m-%d')
+
+        combined = result['combined']
+        assert len(combined['equity_curve']) == sum(w['out_of_sample']['bars'] for w in windows) == 250
+        first_value = next(iter(combined['equity_curve'].values()))
+        assert first_value == pytest.approx(10000.0)
+        assert combined['final_equity'] == pytest.approx(list(combined['equity_curve'].values())[-1])
+
+    @pytest.mark.asyncio
+    async def test_out_of_sample_cash_is_chained(self, service):
+        """Given: 여러 윈도우 When: 실행
+        Then: 각 검증 구간 실행은 워밍업 봉 포함, 초기 자본 = 직전 구간 최종 자산"""
+        request = _request()
+        original = service.engine._run_strategy
+        oos_runs = []
+
+        async def spy(data, strategy_class, req):
+            if len(data) > request.in_sample_bars:
+                oos_runs.append((data.index[0], req.initial_cash))
+            return await original(data, strategy_class, req)
+
+        with patch.object(service.engine, '_run_strategy', side_effect=spy):
+            result = await service.run_walk_forward(request)
+
+        windows = result['windows']
+        curve = result['combined']['equity_curve']
+        assert [start.strftime('%Y-%m-%d') for start, _ in oos_runs] == [w['in_sample']['start_date'] for w in windows]
+        assert oos_runs[0][1] == request.initial_cash
+        for window, (_, next_cash) in zip(windows, oos_runs[1:]):
+            assert next_cash == pytest.approx(curve[window['out_of_sample']['end_date']])
+
+    @pytest.mark.asyncio
+    async def test_long_window_strategy_trades_out_of_sample(self, service, price_data):
+        """Given: 장기 이동평균(50봉)보다 짧은 40봉 검증 구간 When: 워크포워드 실행
+        Then: 직전 in-sample 봉으로 워밍업해 검증 구간에서 거래 발생, 거래/자산은 검증 구간 안"""
+        request = _request(
+            strategy='sma_strategy', param_grid={'short_window': [10], 'long_window': [50]},
+            in_sample_bars=150, out_of_sample_bars=40,
+        )
+
+        result = await service.run_walk_forward(request)
+
+        windows = result['windows']
+        assert result['combined']['total_trades'] > 0
+        assert sum(1 for w in windows if w['out_of_sample_metrics']['total_trades'] > 0) > 1
+        assert len(result['combined']['equity_curve']) == len(price_data) - request.in_sample_bars
+        first_value = next(iter(result['combined']['equity_curve'].values()))
+        assert first_value == pytest.approx(request.initial_cash, rel=0.05)
+
+    def test_out_of_sample_stats_are_trimmed_and_rebased(self, price_data):
+        """Given: 워밍업 100봉 포함 실행 결과 When: 검증 구간으로 자르기
+        Then: 워밍업 마지막 봉 자산이 cash가 되도록 환산, 검증 구간에 청산된 거래만 남음"""
+        data = price_data.iloc[:160]
+        trades = pd.DataFrame({
+            'EntryBar': [10, 90, 120], 'ExitBar': [50, 110, 150], 'PnL': [1.0, 2.0, -1.0],
+            'Commission': [0.0, 0.0, 0.0], 'ReturnPct': [0.01, 0.02, -0.01],
+        })
+        trades['Duration'] = data.index[trades['ExitBar']] - data.index[trades['EntryBar']]
+        equity = np.linspace(10000, 12000, len(data))
+        stats = pd.Series({
+            '_equity_curve': pd.DataFrame({'Equity': equity}, index=data.index),
+            '_trades': trades, '_strategy': None,
+        })
+
+        trimmed = WalkForwardService._out_of_sample_stats(stats, data, 100, 5000.0)
+
+        scale = 5000.0 / equity[99]
+        np.testing.assert_allclose(trimmed['_equity_curve']['Equity'].to_numpy(), equity[100:] * scale)
+        assert trimmed['_equity_curve'].index[0] == data.index[100]
+        assert trimmed['_trades']['EntryBar'].tolist() == [0, 20]
+        assert trimmed['_trades']['ExitBar'].tolist() == [10, 50]
+        assert trimmed['# Trades'] == 2
+
+    @pytest.mark.asyncio
+    async def test_window_limit_is_enforced(self, service):
+        """Given: 윈도우 수가 상한 초과 When: 실행 Then: ValidationError"""
+        with patch('app.services.walk_forward_service.settings.walk_forward_max_windows', 3):
+            with pytest.raises(ValidationError):
+                await service.run_walk_forward(_request())
@@ -0,0 +1,150 @@
+"""
+save_ticker_data 열 단위 upsert 단위 테스트
+
+**테스트 범위**:
+- 열 배열 변환이 기존 iterrows 행 변환과 동일한 값 생성 (NaN → NULL, 거래량 0 대체, 현지 날짜)
+- 다중 행 INSERT 청크 분할
+- 티커 메타데이터는 오래된 경우에만 yfinance info 재조회
+
+**테스트 원칙**:
+- DB 없이 실행 (SQL 실행을 기록하는 연결 대역 사용)
+"""
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services import yfinance_db
+
+
+def _legacy_rows(df: pd.DataFrame, stock_id: int) -> list:
+    """기존 save_ticker_data의 행 단위 변환"""
+    rows = []
+    df_proc = df.copy()
+    if 'Date' in df_proc.columns:
+        df_proc['date'] = pd.to_datetime(df_proc['Date']).dt.date
+    else:
+        df_proc = df_proc.reset_index()
+        df_proc['date'] = pd.to_datetime(df_proc[df_proc.columns[0]]).dt.date
+    for _, r in df_proc.iterrows():
+        ac = r.get('Adj Close')
+        rows.append((
+            stock_id,
+            r['date'].isoformat(),
+            None if pd.isna(r.get('Open')) else float(r.get('Open')),
+            None if pd.isna(r.get('High')) else float(r.get('High')),
+            None if pd.isna(r.get('Low')) else float(r.get('Low')),
+            None if pd.isna(r.get('Close')) else float(r.get('Close')),
+            None if pd.isna(ac) else float(ac),
+            0 if pd.isna(r.get('Volume')) else int(r.get('Volume')),
+        ))
+    return rows
+
+
+def _yf_frame(n: int, tz=None) -> pd.DataFrame:
+    index = pd.date_range('2023-01-02 09:30', periods=n, freq='B', tz=tz, name='Date')
+    rng = np.random.default_rng(0)
+    close = 100 + rng.standard_normal(n).cumsum()
+    df = pd.DataFrame({
+        'Open': close - 0.5,
+        'High': close + 1,
+        'Low': close - 1,
+        'Close': close,
+        'Adj Close': close * 0.98,
+        'Volume': rng.integers(1_000, 1_000_000, n).astype(float),
+    }, index=index)
+    df.iloc[3, 0] = np.nan
+    df.iloc[5, 5] = np.nan
+    return df
+
+
+class _RecordingConn:
+    """실행된 문장과 파라미터를 기록하는 연결 대역"""
+
+    def __init__(self, stock_row=None):
+        self.stock_row = stock_row
+        self.executed = []
+
+    def execute(self, statement, params=None):
+        self.executed.append((str(statement), params))
+        result = MagicMock()
+        result.fetchone.return_value = self.stock_row
+        return result
+
+
+def _rows_from_params(params: dict) -> list:
+    n = len(params) // len(yfinance_db._UPSERT_BIND_NAMES)
+    return [tuple(params[f'{name}{i}'] for name in yfinance_db._UPSERT_BIND_NAMES) for i in range(n)]
+
+
+class TestColumnarUpsert:
+    """열 단위 변환 및 다중 행 INSERT"""
+
+    @pytest.mark.parametrize("tz", [None, 'Asia/Seoul'])
+    def test_rows_match_legacy_conversion(self, tz):
+        """Given: NaN 가격/거래량이 섞인 yfinance 프레임
+        When: 열 단위 upsert
+        Then: 기존 iterrows 변환과 같은 행"""
+        df = _yf_frame(30, tz=tz)
+        conn = _RecordingConn()
+
+        days, prices, volume = yfinance_db._price_columns_from_frame(df)
+        total = yfinance_db._upsert_daily_prices(conn, 7, days, prices, volume)
+
+        assert total == 30
+        assert len(conn.executed) == 1
+        assert _rows_from_params(conn.executed[0][1]) == _legacy_rows(df, 7)
+
+    def test_date_column_frame_and_chunking(self, monkeypatch):
+        """Given: 'Date' 컬럼 프레임, 청크 크기 4
+        When: 열 단위 upsert
+        Then: 4/4/2행 문장 3개, 합치면 기존 변환과 동일"""
+        monkeypatch.setattr(yfinance_db.IngestionConfig, 'UPSERT_CHUNK_ROWS', 4)
+        df = _yf_frame(10).reset_index()
+        conn = _RecordingConn()
+
+        total = yfinance_db._upsert_daily_prices(conn, 1, *yfinance_db._price_columns_from_frame(df))
+
+        assert total == 10
+        assert [len(params) // 8 for _, params in conn.executed] == [4, 4, 2]
+        rows = [row for _, params in conn.executed for row in _rows_from_params(params)]
+        assert rows == _legacy_rows(df, 1)
+
+
+class TestStockMetadataRefresh:
+    """티커 메타데이터 갱신 주기"""
+
+    def test_fresh_metadata_skips_info_fetch(self):
+        """Given: 최근 갱신된 stocks 행 When: 저장 Then: yfinance info 미조회, stocks 미갱신"""
+        conn = _RecordingConn(stock_row=(3, datetime.utcnow() - timedelta(hours=1)))
+        with patch('app.services.yfinance_db.data_fetcher') as fetcher:
+            stock_id = yfinance_db._upsert_stock_metadata(conn, 'AAPL')
+
+        assert stock_id == 3
+        fetcher.fetch_ticker_info.assert_not_called()
+        assert len(conn.executed) == 1
+
+    def test_stale_metadata_is_refreshed(self):
+        """Given: 갱신 주기가 지난 stocks 행 When: 저장 Then: info 재조회 후 stocks upsert"""
+        stale = datetime.utcnow() - timedelta(hours=yfinance_db.IngestionConfig.TICKER_INFO_REFRESH_HOURS + 1)
+        conn = _RecordingConn(stock_row=(3, stale))
+        with patch('app.services.yfinance_db.data_fetcher') as fetcher:
+            fetcher.fetch_ticker_info.return_value = {'company_name': 'Apple', 'currency': 'USD'}
+            stock_id = yfinance_db._upsert_stock_metadata(conn, 'AAPL')
+
+        assert stock_id == 3
+        fetcher.fetch_ticker_info.assert_called_once_with('AAPL')
+        assert 'INSERT INTO stocks' in conn.executed[1][0]
+        assert conn.executed[1][1]['name'] == 'Apple'
+
+    def test_failed_refresh_keeps_existing_metadata(self):
+        """Given: 오래된 행, info 조회 실패 When: 저장 Then: 기존 메타데이터 유지"""
+        conn = _RecordingConn(stock_row=(3, None))
+        with patch('app.services.yfinance_db.data_fetcher') as fetcher:
+            fetcher.fetch_ticker_info.return_value = {'symbol': 'AAPL', 'error': 'rate limited'}
+            stock_id = yfinance_db._upsert_stock_metadata(conn, 'AAPL')
+
+        assert stock_id == 3
+        assert len(conn.executed) == 1
@@ -0,0 +1,20 @@
+-- backtest_result_cache 테이블 추가 마이그레이션 (기존 DB용)
+-- schema.sql로 새로 만든 DB에는 이미 포함되어 있습니다.
+--
+-- RESULT_CACHE_BACKEND=mysql일 때만 사용합니다 (기본값 memory는 프로세스 내 LRU만 사용).
+
+USE stock_data_cache;
+
+-- === `backtest_result_cache` 테이블: 포트폴리오 백테스트 결과 캐시 (RESULT_CACHE_BACKEND=mysql) ===
+-- 종료일이 지난 요청의 전체 응답을 (정규화된 요청 + 티커별 가격 데이터 버전) 해시 키로 저장합니다.
+-- 가격 데이터가 바뀌면 키가 달라지므로 오래된 결과는 조회되지 않으며,
+-- save_ticker_data()가 저장 구간과 겹치는 행(tickers, start_date~end_date)을 삭제합니다.
+CREATE TABLE IF NOT EXISTS backtest_result_cache (
+    cache_key CHAR(64) NOT NULL PRIMARY KEY,      -- SHA-256 (요청 + 데이터 버전)
+    tickers VARCHAR(1024) NOT NULL,               -- ',AAPL,MSFT,' 형식 (무효화 검색용)
+    start_date DATE NOT NULL,                     -- 데이터 버전 구간 시작일
+    end_date DATE NOT NULL,                       -- 데이터 버전 구간 종료일
+    payload LONGBLOB NOT NULL,                    -- zlib 압축 JSON 응답
+    created_at BIGINT NOT NULL,                   -- 저장 시각 (epoch 초, TTL 판단용)
+    INDEX idx_result_cache_range (end_date, start_date)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci COMMENT '포트폴리오 백테스트 결과 캐시';
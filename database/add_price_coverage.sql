@@ -0,0 +1,20 @@
+-- price_coverage 테이블 추가 마이그레이션 (기존 DB용)
+-- schema.sql로 새로 만든 DB에는 이미 포함되어 있습니다.
+--
+-- 적용 전에는 백엔드가 MIN/MAX(date) 범위로만 누락 구간을 판단합니다.
+-- 적용 후 기존 종목은 다음 조회 또는 EOD 갱신(scripts/refresh_prices_eod.py) 시 워터마크가 생성됩니다.
+
+USE stock_data_cache;
+
+-- === `price_coverage` 테이블: 종목별 가격 데이터 커버리지 워터마크 ===
+-- yfinance에서 빠짐없이 수집된 것이 확인된 연속 구간 [covered_from, covered_to]를 기록합니다.
+-- 요청 구간이 이 범위 안이면 daily_prices 행 수와 무관하게 외부 API를 호출하지 않습니다.
+-- (MIN/MAX(date)만으로는 중간 구멍과 휴장일을 구분할 수 없음)
+CREATE TABLE IF NOT EXISTS price_coverage (
+    stock_id INT NOT NULL PRIMARY KEY,            -- stocks 테이블의 ID (Foreign Key)
+    covered_from DATE NOT NULL,                   -- 연속 수집 확인 시작일
+    covered_to DATE NOT NULL,                     -- 연속 수집 확인 종료일 (마지막 완결 거래일)
+    last_refreshed_at DATETIME NOT NULL,          -- 마지막 갱신 시각 (UTC)
+    FOREIGN KEY (stock_id) REFERENCES stocks(id) ON DELETE CASCADE,
+    CONSTRAINT chk_coverage_range CHECK (covered_from <= covered_to)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci COMMENT '가격 데이터 커버리지 워터마크';
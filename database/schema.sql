@@ -15,6 +15,8 @@ USE stock_data_cache;
 -- 3. 테이블 생성
 -- 실행 시 오류를 방지하기 위해 기존 테이블이 있다면 삭제 후 재생성합니다.
 
+DROP TABLE IF EXISTS backtest_result_cache;
+DROP TABLE IF EXISTS price_coverage;
 DROP TABLE IF EXISTS stock_news;
 DROP TABLE IF EXISTS daily_prices;
 DROP TABLE IF EXISTS stocks;
@@ -69,6 +71,35 @@ CREATE TABLE daily_prices (
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci COMMENT '일별 주가 정보 (OHLCV)';
 
 
+-- === `price_coverage` 테이블: 종목별 가격 데이터 커버리지 워터마크 ===
+-- yfinance에서 빠짐없이 수집된 것이 확인된 연속 구간 [covered_from, covered_to]를 기록합니다.
+-- 요청 구간이 이 범위 안이면 daily_prices 행 수와 무관하게 외부 API를 호출하지 않습니다.
+-- (MIN/MAX(date)만으로는 중간 구멍과 휴장일을 구분할 수 없음)
+CREATE TABLE price_coverage (
+    stock_id INT NOT NULL PRIMARY KEY,            -- stocks 테이블의 ID (Foreign Key)
+    covered_from DATE NOT NULL,                   -- 연속 수집 확인 시작일
+    covered_to DATE NOT NULL,                     -- 연속 수집 확인 종료일 (마지막 완결 거래일)
+    last_refreshed_at DATETIME NOT NULL,          -- 마지막 갱신 시각 (UTC)
+    FOREIGN KEY (stock_id) REFERENCES stocks(id) ON DELETE CASCADE,
+    CONSTRAINT chk_coverage_range CHECK (covered_from <= covered_to)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci COMMENT '가격 데이터 커버리지 워터마크';
+
+
+-- === `backtest_result_cache` 테이블: 포트폴리오 백테스트 결과 캐시 (RESULT_CACHE_BACKEND=mysql) ===
+-- 종료일이 지난 요청의 전체 응답을 (정규화된 요청 + 티커별 가격 데이터 버전) 해시 키로 저장합니다.
+-- 가격 데이터가 바뀌면 키가 달라지므로 오래된 결과는 조회되지 않으며,
+-- save_ticker_data()가 저장 구간과 겹치는 행(tickers, start_date~end_date)을 삭제합니다.
+CREATE TABLE backtest_result_cache (
+    cache_key CHAR(64) NOT NULL PRIMARY KEY,      -- SHA-256 (요청 + 데이터 버전)
+    tickers VARCHAR(1024) NOT NULL,               -- ',AAPL,MSFT,' 형식 (무효화 검색용)
+    start_date DATE NOT NULL,                     -- 데이터 버전 구간 시작일
+    end_date DATE NOT NULL,                       -- 데이터 버전 구간 종료일
+    payload LONGBLOB NOT NULL,                    -- zlib 압축 JSON 응답
+    created_at BIGINT NOT NULL,                   -- 저장 시각 (epoch 초, TTL 판단용)
+    INDEX idx_result_cache_range (end_date, start_date)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci COMMENT '포트폴리오 백테스트 결과 캐시';
+
+
 -- === `stock_news` 테이블: 종목별 뉴스 정보 ===
 -- 네이버 뉴스 API 등에서 가져온 종목 관련 뉴스를 캐싱합니다.
 CREATE TABLE stock_news (